@@ -26,9 +26,17 @@ __version__ = "1.1.3"
 __author__ = "Jeremie Rouzet"
 __email__ = "jeremie.rouzet@netalps.fr"
 
-# Import main modules to make them available at package level
-from . import parsers
-from . import utils
-from . import test_suite
+# The subpackages are imported on first access (PEP 562), so that 'import jeypyats' alone is cheap
+import importlib
 
 __all__ = ['parsers', 'utils', 'test_suite']
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -19,13 +19,23 @@ __contact__ = 'jeremie.rouzet@netalps.fr'
 __copyright__ = 'Netalps, 2026'
 __license__ = "Netalps, Copyright 2026. All rights reserved."
 
-import xmltodict
-from genie.utils import Dq
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from ...utils import sanitize_xml
 from ...utils import BASE_RPC
+from ...utils.filters import SubtreeFilter
+from ...utils.schemas import ExtractionSchema
+
+XR_L2VPN_OPER_NS = 'http://cisco.com/ns/yang/Cisco-IOS-XR-l2vpn-oper'
+
+
+# Extraction schema, compiled once at import
+BRIDGE_DOMAIN_SCHEMA = ExtractionSchema(
+    'l2vpnv2/nodes/node/bridge-domains/bridge-domain',
+    {'name': 'bridge-domain-name', 'state': 'bridge-domain-info/bridge-state'},
+    namespace=XR_L2VPN_OPER_NS,
+)
 
 
 class ParsersMixin:
@@ -38,22 +48,10 @@ class ParsersMixin:
         Returns:
             dict: Dictionary containing bridge domain information
         """
-        xml_rpc = """
-        <l2vpnv2 xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-l2vpn-oper">
-          <nodes>
-            <node>
-              <node-id>0/RP0/CPU0</node-id>
-              <bridge-domains>
-                <bridge-domain>
-                  <bridge-domain-info>
-                    <bridge-state/>
-                  </bridge-domain-info>
-                </bridge-domain>
-              </bridge-domains>
-            </node>
-          </nodes>
-        </l2vpnv2>
-        """
+        xml_rpc = SubtreeFilter(
+            XR_L2VPN_OPER_NS, 'l2vpnv2/nodes/node/bridge-domains/bridge-domain',
+            keys={'node/node-id': '0/RP0/CPU0'}, leaves=['bridge-domain-name', 'bridge-domain-info/bridge-state'],
+        ).subtree()
 
         rpc_msg = BASE_RPC.format(xml_rpc=xml_rpc)
         rpc_msg = sanitize_xml(rpc_msg)
@@ -63,36 +61,10 @@ class ParsersMixin:
         if not reply.ok:
             return {}
 
-        # Parse the XML response
-        reply_dict = xmltodict.parse(reply.xml)
-
         # Extract bridge domain information
         result = {}
-        rpc_reply = reply_dict.get("rpc-reply")
-        if not rpc_reply:
-            return result
-        data = rpc_reply.get("data")
-        if data is None or not isinstance(data, dict):
-            return result
-        l2vpn_data = data.get("l2vpnv2", {}).get("nodes", {}).get("node", {}).get("bridge-domains") or {}
-        l2vpn_data = l2vpn_data.get("bridge-domain", []) if isinstance(l2vpn_data, dict) else []
-
-        # Handle case where bridge-domains might be None or missing
-        if l2vpn_data is None:
-            bridge_domains = []
-        elif isinstance(l2vpn_data, list):
-            bridge_domains = l2vpn_data
-        else:
-            # Single bridge domain
-            bridge_domains = [l2vpn_data]
-
-        for bd in bridge_domains:
-            if isinstance(bd, dict):
-                bd_name = bd.get("bridge-domain-name")
-                bd_info = bd.get("bridge-domain-info", {})
-                bd_state = bd_info.get("bridge-state")
-
-                if bd_name and bd_state:
-                    result[bd_name] = {"state": bd_state}
+        for bd in BRIDGE_DOMAIN_SCHEMA.iter_extract(reply.xml):
+            if bd["name"] and bd["state"]:
+                result[bd["name"]] = {"state": bd["state"]}
 
         return result
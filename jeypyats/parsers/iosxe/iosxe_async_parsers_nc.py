@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+# This file is a part of Netalps.fr.
+#
+# Created: 17.10.2026 15:18:40
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 15:18:40
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+Pyats IOS XE asyncio parsers using Netconf
+This module provides a coroutine '<method>_async' for every method of the IOS-XE parser mixins,
+e.g. await device.get_track_states_async(), and IOSXENetconfSession, which runs the parsers on a
+pooled ncclient session without a pyATS device, for fleet-wide collection with gather_fleet().
+'''
+from ...utils.async_netconf import asyncify, acquire_session_async, offload
+from ...utils.netconf_connector import default_pool
+from .iosxe_routing_parsers_nc import IOSXERoutingParsersMixin
+from .iosxe_interface_parsers_nc import IOSXEInterfacesParsersMixin
+from .iosxe_eem_parsers_nc import IOSXEEEMParsersMixin
+from .iosxe_syslog_parsers_nc import IOSXESyslogParsersMixin
+from .iosxe_ip_sla_parsers_nc import IOSXEIPSLAParsersMixin
+from .iosxe_track_parsers_nc import IOSXETrackParsersMixin
+from .iosxe_cellular_parsers_nc import IOSXECellularParsersMixin
+from .iosxe_collect_parsers_nc import IOSXECollectParsersMixin
+from ..libs.iosxe.waits import WaitsMixin
+
+IOSXE_NETCONF_PARSER_MIXINS = (
+    IOSXERoutingParsersMixin,
+    IOSXEInterfacesParsersMixin,
+    IOSXEEEMParsersMixin,
+    IOSXESyslogParsersMixin,
+    IOSXEIPSLAParsersMixin,
+    IOSXETrackParsersMixin,
+    IOSXECellularParsersMixin,
+    IOSXECollectParsersMixin,
+    WaitsMixin,
+)
+
+# get_track_states_async, collect_async, ... one coroutine per parser method
+IOSXEAsyncParsersMixin = asyncify(*IOSXE_NETCONF_PARSER_MIXINS, name='IOSXEAsyncParsersMixin')
+
+
+class IOSXENetconfSession(*IOSXE_NETCONF_PARSER_MIXINS, IOSXEAsyncParsersMixin):
+    '''
+    IOS-XE NETCONF parsers bound to a pooled ncclient session
+
+    Args:
+        name (str): device name
+        nc (ncclient.manager.Manager): session drawn from pool
+        pool (NetconfSessionPool, optional): pool owning the session (default: the process-wide pool)
+
+    Example:
+        async def poll(host):
+            session = await IOSXENetconfSession.connect_async(host, host, 830, user, password)
+            try:
+                return await session.collect_async(['default_routes', 'tracks'])
+            finally:
+                await session.close_async()
+    '''
+
+    def __init__(self, name, nc, pool=None):
+        self.name = name
+        self.nc = nc
+        self.pool = default_pool if pool is None else pool
+
+    @classmethod
+    async def connect_async(cls, name, host, port, username, password, device_params=None, pool=None):
+        '''
+        Opens (or reuses) a pooled session to the device without blocking the event loop
+
+        Returns:
+            IOSXENetconfSession: parsers bound to the session
+        '''
+        nc = await acquire_session_async(host, port, username, password, device_params, pool)
+        return cls(name, nc, pool)
+
+    def netconf_get(self, filter=None):
+        return self.nc.get(filter=filter) if filter else None
+
+    def close(self):
+        '''Hands the session back to the pool'''
+        if self.nc is not None:
+            self.pool.release(self.nc)
+            self.nc = None
+
+    async def close_async(self):
+        await offload(self.close)
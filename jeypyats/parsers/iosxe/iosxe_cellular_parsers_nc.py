@@ -22,11 +22,68 @@ Pyats IOS XE Cellular parsers using Netconf
 This module contains parsers to retrieve Cellular information from Cisco IOS XE devices via Netconf.
 '''
 import logging
-import xml.etree.ElementTree as ET
+from ...utils.filters import SubtreeFilter
+from ...utils.schemas import ExtractionSchema
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
 logger = logging.getLogger(__name__)
 
+IOSXE_CELLULAR_OPER_NS = 'http://cisco.com/ns/yang/Cisco-IOS-XE-cellular-oper'
+
+# Extraction schema, compiled once at import.
+# No namespace: the parser reads response.data_xml, whose namespace declarations vary between releases
+SIM_SCHEMA = ExtractionSchema(
+    'interface/sim',
+    {'slot': ('slot', int), 'data_profile': ('data-profile', int)},
+    keys={'interface': 'interface/name'},
+    include_keys=True,
+)
+
+
+def cellular_sim_config_filter(interface):
+    '''
+    Builds the subtree filter of get_cellular_sim_config
+
+    Args:
+        interface (str): Cellular interface name, e.g., 'Cellular0/2/0'
+
+    Returns:
+        SubtreeFilter: SIM container of the interface
+    '''
+    return SubtreeFilter(IOSXE_CELLULAR_OPER_NS, 'cellular/cellular/interface', keys={'name': interface}, leaves=['sim'])
+
+
+def parse_cellular_sim_config(response, interface):
+    '''
+    Parses the SIM config of a cellular interface out of a NETCONF reply
+
+    Args:
+        response: NETCONF reply of a <get> including the cellular_sim_config_filter(interface) subtree
+        interface (str): Cellular interface name, e.g., 'Cellular0/2/0'
+
+    Returns:
+        dict: SIM config with slot and data_profile.
+    '''
+    # Check if response is valid
+    if not response or not hasattr(response, 'data_xml') or response.data_xml is None:
+        logger.warning(f"NETCONF response is invalid or empty for cellular SIM config on {interface}")
+        return {'slot': None, 'data_profile': None}
+
+    # Check for RPC errors
+    if hasattr(response, 'xml') and response.xml and '<rpc-error>' in response.xml:
+        logger.error(f"NETCONF RPC error in cellular response: {response.xml}")
+        return {'slot': None, 'data_profile': None}
+
+    try:
+        # a batched reply may hold the SIM config of several interfaces
+        for sim_config in SIM_SCHEMA.iter_extract(response.data_xml):
+            if sim_config.pop('interface') in (interface, None):
+                return sim_config
+        return {'slot': None, 'data_profile': None}
+    except Exception as e:
+        logger.error(f"Error parsing cellular SIM config response for {interface}: {e}")
+        return {'slot': None, 'data_profile': None}
+
+
 class IOSXECellularParsersMixin:
     '''
     Collection of RPCs for parsing Cellular information on IOS-XE devices
@@ -41,46 +98,8 @@ class IOSXECellularParsersMixin:
         Returns:
             dict: SIM config with slot and data_profile.
         '''
-        cellular_filter = f'''
-        <filter>
-            <cellular xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-cellular-oper">
-                <cellular>
-                    <interface>
-                        <name>{interface}</name>
-                        <sim/>
-                    </interface>
-                </cellular>
-            </cellular>
-        </filter>
-        '''
-        response = self.netconf_get(filter=cellular_filter)
-
-        # Check if response is valid
-        if not response or not hasattr(response, 'data_xml') or response.data_xml is None:
-            logger.warning(f"NETCONF response is invalid or empty for cellular SIM config on {interface}")
-            return {'slot': None, 'data_profile': None}
-
-        # Check for RPC errors
-        if hasattr(response, 'xml') and response.xml and '<rpc-error>' in response.xml:
-            logger.error(f"NETCONF RPC error in cellular response: {response.xml}")
-            return {'slot': None, 'data_profile': None}
-
-        try:
-            data = response.data_xml
-            root = ET.fromstring(data)
-            sim_config = {'slot': None, 'data_profile': None}
-            sim = root.find('.//sim')
-            if sim is not None:
-                slot_elem = sim.find('slot')
-                data_profile_elem = sim.find('data-profile')
-                slot_text = slot_elem.text if slot_elem is not None else None
-                data_profile_text = data_profile_elem.text if data_profile_elem is not None else None
-                sim_config['slot'] = int(slot_text) if slot_text is not None else None
-                sim_config['data_profile'] = int(data_profile_text) if data_profile_text is not None else None
-            return sim_config
-        except Exception as e:
-            logger.error(f"Error parsing cellular SIM config response for {interface}: {e}")
-            return {'slot': None, 'data_profile': None}
+        response = self.netconf_get(filter=cellular_sim_config_filter(interface).to_xml())
+        return parse_cellular_sim_config(response, interface)
 
     @classmethod
     def bind_to_device(cls, device):
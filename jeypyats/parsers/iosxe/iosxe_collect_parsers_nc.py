@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+# This file is a part of Netalps.fr.
+#
+# Created: 17.10.2026 13:10:22
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 13:10:22
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+Pyats IOS XE batched state collection using Netconf
+This module merges the subtree filters of several parsers into a single <get>,
+sends one RPC and hands the reply to the post-processor of each parser.
+Over high-latency links this replaces one round trip per parser by a single round trip.
+
+Queries are written 'name' or 'name:argument', e.g.:
+    device.collect(['default_routes', 'ip_sla', 'tracks', 'sim:Cellular0/2/0', 'interface:Cellular0/2/0'])
+'''
+import functools
+import logging
+from ...utils.filters import merge_filters
+from ...utils.utils import JeyPyatsValueError
+from .iosxe_routing_parsers_nc import default_routes_filter, parse_default_routes
+from .iosxe_ip_sla_parsers_nc import ip_sla_states_filter, parse_ip_sla_states
+from .iosxe_track_parsers_nc import track_states_filter, parse_track_states
+from .iosxe_cellular_parsers_nc import cellular_sim_config_filter, parse_cellular_sim_config
+from .iosxe_interface_parsers_nc import interface_status_filter, parse_interface_status
+from .iosxe_syslog_parsers_nc import syslog_messages_filter, parse_syslog_messages
+from .iosxe_eem_parsers_nc import eem_event_history_filter, parse_eem_event_history
+
+logger = logging.getLogger(__name__)
+
+# query name -> (filter builder, reply parser, argument required)
+# The argument of the query, if any, is passed to both the filter builder and the reply parser.
+COLLECT_QUERIES = {
+    'default_routes': (default_routes_filter, parse_default_routes, False),
+    'default_routes6': (functools.partial(default_routes_filter, 6), functools.partial(parse_default_routes, version=6),
+                        False),
+    'ip_sla': (ip_sla_states_filter, parse_ip_sla_states, False),
+    'tracks': (track_states_filter, parse_track_states, False),
+    'sim': (cellular_sim_config_filter, parse_cellular_sim_config, True),
+    'interface': (interface_status_filter, parse_interface_status, True),
+    'syslog': (syslog_messages_filter, parse_syslog_messages, False),
+    'eem': (eem_event_history_filter, parse_eem_event_history, False),
+}
+
+
+def parse_query(query):
+    '''
+    Splits a collect query into its name and argument
+
+    Args:
+        query (str): 'name' or 'name:argument'
+
+    Returns:
+        tuple: (name, argument list)
+
+    Raises:
+        JeyPyatsValueError: unknown query name or missing argument
+    '''
+    name, _, argument = query.partition(':')
+    name = name.strip()
+    if name not in COLLECT_QUERIES:
+        raise JeyPyatsValueError(f"Unknown collect query '{name}', expected one of {sorted(COLLECT_QUERIES)}")
+    _, _, argument_required = COLLECT_QUERIES[name]
+    if argument_required and not argument:
+        raise JeyPyatsValueError(f"Collect query '{name}' requires an argument, e.g. '{name}:Cellular0/2/0'")
+    return name, [argument] if argument else []
+
+
+def _batch_failed(response):
+    # with ncclient's default raise mode an <rpc-error> raises RPCError, otherwise the reply is not ok
+    return not response or getattr(response, 'xml', None) is None or getattr(response, 'ok', True) is False
+
+
+def _get(device, filter_xml):
+    # reply of the <get>, None when the device rejects it
+    # ncclient is only imported when a query is sent, the parsers are imported without it
+    from ncclient.operations.rpc import RPCError
+    try:
+        response = device.netconf_get(filter=filter_xml)
+    except RPCError as e:
+        logger.warning(f"NETCONF get rejected: {e}")
+        return None
+    return None if _batch_failed(response) else response
+
+
+class IOSXECollectParsersMixin:
+    '''
+    Batched state collection on IOS-XE devices
+    '''
+    def collect(self, queries):
+        '''
+        Collects the state of several parsers with a single NETCONF <get>
+
+        Args:
+            queries (list): queries written 'name' or 'name:argument'. Known names are
+                            default_routes, default_routes6, ip_sla, tracks, sim:<interface>, interface:<interface>,
+                            syslog[:<filter text>] and eem
+
+        Returns:
+            dict: query -> result of the matching parser, e.g. result['sim:Cellular0/2/0']
+
+        Raises:
+            JeyPyatsValueError: unknown query name or missing argument
+
+        If the device rejects the merged filter (e.g. one of the YANG models is not supported),
+        every query is retried with its own <get> so that a single failing model does not hide the others.
+        The result of a query whose own <get> is rejected as well is None.
+        '''
+        parsed_queries = [(query, *parse_query(query)) for query in queries]
+        if not parsed_queries:
+            return {}
+
+        filters = [COLLECT_QUERIES[name][0](*arguments) for _, name, arguments in parsed_queries]
+        response = _get(self, merge_filters(filters))
+
+        if response is None:
+            logger.warning("Batched NETCONF get failed, collecting every query with its own get")
+            result = {}
+            for (query, name, arguments), subtree_filter in zip(parsed_queries, filters):
+                single_response = _get(self, subtree_filter.to_xml())
+                result[query] = None if single_response is None else \
+                    COLLECT_QUERIES[name][1](single_response, *arguments)
+            return result
+
+        return {
+            query: COLLECT_QUERIES[name][1](response, *arguments)
+            for query, name, arguments in parsed_queries
+        }
+
+    @classmethod
+    def bind_to_device(cls, device):
+        setattr(device, 'collect', cls.collect.__get__(device, type(device)))
@@ -23,26 +23,49 @@ This module contains parsers to retrieve EEM (Embedded Event Manager) informatio
 It includes functions to get EEM event logs and history.
 The parsers utilize XML filters to query the device and parse the XML responses into structured data.
 Each function is designed to handle specific EEM operations and return relevant information in a user-friendly format.
-The module leverages the Genie and lxml libraries for XML parsing and data extraction.
+The module leverages the lxml library for XML parsing and data extraction.
 '''
 import logging
-import xmltodict
-from genie.utils import Dq
-from lxml import etree
-from ...utils import BASE_RPC
-from packaging import version
-import json
+from ...utils.debug_dump import dump_payload
+from ...utils.filters import SubtreeFilter
+from ...utils.schemas import ExtractionSchema
 
 
-
-logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
 logger = logging.getLogger(__name__)
 
-parser = etree.XMLParser()
-parser.set_element_class_lookup(
-    etree.ElementDefaultClassLookup(element=etree.ElementBase)
+IOSXE_EEM_NS = 'http://cisco.com/ns/yang/Cisco-IOS-XE-eem'
+
+# Extraction schema, compiled once at import
+EEM_EVENT_SCHEMA = ExtractionSchema(
+    'event-history/event',
+    {'name': 'name', 'type': 'type', 'time': 'time', 'description': 'description'},
+    namespace=IOSXE_EEM_NS,
 )
 
+
+def eem_event_history_filter():
+    '''
+    Builds the subtree filter of get_eem_event_history
+
+    Returns:
+        SubtreeFilter: EEM event history entries
+    '''
+    return SubtreeFilter(IOSXE_EEM_NS, 'event-history/event', leaves=['name', 'type', 'time', 'description'])
+
+
+def parse_eem_event_history(response):
+    '''
+    Parses the EEM event history out of a NETCONF reply
+
+    Args:
+        response: NETCONF reply of a <get> including the eem_event_history_filter() subtree
+
+    Returns:
+        list: List of EEM event history entries
+    '''
+    return EEM_EVENT_SCHEMA.extract(response.xml)
+
+
 class IOSXEEEMParsersMixin:
     '''
     Collection of RPCs for parsing EEM information on IOS-XE devices
@@ -53,42 +76,10 @@ class IOSXEEEMParsersMixin:
         Returns:
             list: List of EEM event history entries
         '''
-        filter_xml = '''
-            <filter>
-                <event-history xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-eem">
-                </event-history>
-            </filter>
-        '''
-        response = self.netconf_get(filter=filter_xml)
-        # Remove XML declaration if present
-        xml_content = response.xml
-        if xml_content.startswith('<?xml'):
-            xml_content = xml_content.split('?>', 1)[1].strip()
-        xml_data = etree.fromstring(xml_content.encode('utf-8'), parser)
-        data_dict = xmltodict.parse(etree.tostring(xml_data))
-
-        print(f"DEBUG EEM: data_dict = {json.dumps(data_dict, indent=2)}")  # Debug print
-
-        # Navigate to EEM event history
-        event_history_data = data_dict.get('rpc-reply', {}).get('data', {}).get('event-history', {})
-        events = event_history_data.get('event', [])
-
-        # Handle both single event (dict) and multiple events (list)
-        if isinstance(events, dict):
-            events = [events]
-
-        parsed_events = []
-
-        for event in events:
-            parsed_event = {
-                'name': event.get('name'),
-                'type': event.get('type'),
-                'time': event.get('time'),
-                'description': event.get('description'),
-            }
-            parsed_events.append(parsed_event)
-
-        return parsed_events
+        response = self.netconf_get(filter=eem_event_history_filter().to_xml())
+        events = parse_eem_event_history(response)
+        dump_payload(logger, "EEM events", events, device=self)
+        return events
 
     @classmethod
     def bind_to_device(cls, device):
@@ -23,165 +23,313 @@ This module contains parsers to retrieve interface status from IOS XE devices vi
 It includes functions to get interface status using both OpenConfig and Cisco IOS XE YANG models.
 The parsers utilize XML filters to query the device and parse the XML responses into structured data.
 Each function is designed to handle specific YANG models and return relevant information in a user-friendly format.
-The module leverages the Genie and lxml libraries for XML parsing and data extraction.
+The module leverages the lxml library for XML parsing and data extraction.
+collect_interface_table() reads the three models with a single <get> into an InterfaceTable, the
+status functions given this table answer from it without any RPC, with the records of their own
+model so that they return the same values as when they query the device.
+get_interface_counters() reads the octet, error and discard counters, get_interface_rates() turns
+successive counter samples into rates with a CounterSampler.
 '''
 import logging
-import xmltodict
-from genie.utils import Dq
-from lxml import etree
-from ...utils import BASE_RPC
-from packaging import version
-import json
+from ...utils.filters import SubtreeFilter, merge_filters
+from ...utils.interface_counters import COUNTER_FIELDS, CounterSampler
+from ...utils.interface_table import InterfaceTable
+from ...utils.schemas import ExtractionSchema
+from ...utils.utils import JeyPyatsValueError
 
 
-
-logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
 logger = logging.getLogger(__name__)
 
-parser = etree.XMLParser()
-parser.set_element_class_lookup(
-    etree.ElementDefaultClassLookup(element=etree.ElementBase)
+OPENCONFIG_INTERFACES_NS = 'http://openconfig.net/yang/interfaces'
+IOSXE_INTERFACES_OPER_NS = 'http://cisco.com/ns/yang/Cisco-IOS-XE-interfaces-oper'
+IETF_INTERFACES_NS = 'urn:ietf:params:xml:ns:yang:ietf-interfaces'
+
+# Extraction schemas, compiled once at import, one per model: the status parsers and the
+# interface table read a model with the same schema, a model only fills the leaves it reports
+IETF_STATUS_SCHEMA = ExtractionSchema(
+    'interfaces-state/interface',
+    {'name': 'name', 'oper_status': 'oper-status', 'admin_status': 'admin-status'},
+    namespace=IETF_INTERFACES_NS,
+)
+
+OPENCONFIG_STATUS_SCHEMA = ExtractionSchema(
+    'interfaces/interface',
+    {'name': 'name', 'oper_status': 'state/oper-status', 'admin_status': 'state/admin-status',
+     'description': 'state/description'},
+    namespace=OPENCONFIG_INTERFACES_NS,
+)
+
+IOSXE_OPER_STATUS_SCHEMA = ExtractionSchema(
+    'interfaces/interface',
+    {'name': 'name', 'oper_status': 'oper-status', 'admin_status': 'admin-status', 'description': 'description'},
+    namespace=IOSXE_INTERFACES_OPER_NS,
 )
 
+INTERFACE_TABLE_SCHEMAS = (
+    ('ietf', IETF_STATUS_SCHEMA),
+    ('openconfig', OPENCONFIG_STATUS_SCHEMA),
+    ('iosxe', IOSXE_OPER_STATUS_SCHEMA),
+)
+
+# Counter leaves, the IETF statistics and the OpenConfig counters share their names
+COUNTER_LEAVES = {field: field.replace('_', '-') for field in COUNTER_FIELDS}
+
+# source -> (namespace, list path, counters container, discontinuity leaf)
+COUNTER_MODELS = {
+    'ietf': (IETF_INTERFACES_NS, 'interfaces-state/interface', 'statistics', 'discontinuity-time'),
+    'openconfig': (OPENCONFIG_INTERFACES_NS, 'interfaces/interface', 'state/counters', 'last-clear'),
+}
+
+COUNTER_SCHEMAS = {
+    source: ExtractionSchema(
+        path,
+        {'name': 'name',
+         **{field: (f'{container}/{leaf}', int) for field, leaf in COUNTER_LEAVES.items()},
+         'discontinuity_time': f'{container}/{discontinuity}'},
+        namespace=namespace,
+    )
+    for source, (namespace, path, container, discontinuity) in COUNTER_MODELS.items()
+}
+
+
+def interface_counters_filter(interface_name=None, source='ietf'):
+    '''
+    Builds the subtree filter of get_interface_counters
+
+    Args:
+        interface_name (str, optional): only this interface, every interface if None
+        source (str): 'ietf' (ietf-interfaces statistics) or 'openconfig' (openconfig-interfaces counters)
+
+    Returns:
+        SubtreeFilter: name and counter leaves of the interfaces
+
+    Raises:
+        JeyPyatsValueError: unknown source
+    '''
+    if source not in COUNTER_MODELS:
+        raise JeyPyatsValueError(f"Unknown counter source '{source}', expected one of {', '.join(COUNTER_MODELS)}")
+    namespace, path, container, discontinuity = COUNTER_MODELS[source]
+    leaves = [f'{container}/{leaf}' for leaf in (*COUNTER_LEAVES.values(), discontinuity)]
+    return SubtreeFilter(namespace, path, keys={'name': interface_name}, leaves=['name', *leaves])
+
+
+def parse_interface_counters(response, source='ietf'):
+    '''
+    Parses the interface counters out of a NETCONF reply
+
+    Returns:
+        list: [{'name', 'in_octets', 'out_octets', 'in_errors', 'out_errors', 'in_discards', 'out_discards',
+               'discontinuity_time'}], counters as int, None when the device does not report one
+    '''
+    return COUNTER_SCHEMAS[source].extract(response.xml)
+
+
+def interface_table_filter():
+    '''
+    Builds the filter of collect_interface_table, the state leaves of every interface in the three models
+
+    Returns:
+        str: '<filter>...</filter>' XML
+    '''
+    return merge_filters([
+        SubtreeFilter(IETF_INTERFACES_NS, 'interfaces-state/interface',
+                      leaves=['name', 'oper-status', 'admin-status']),
+        SubtreeFilter(OPENCONFIG_INTERFACES_NS, 'interfaces/interface',
+                      leaves=['name', 'state/oper-status', 'state/admin-status', 'state/description']),
+        SubtreeFilter(IOSXE_INTERFACES_OPER_NS, 'interfaces/interface',
+                      leaves=['name', 'oper-status', 'admin-status', 'description']),
+    ])
+
+
+def parse_interface_table(response):
+    '''
+    Parses the interface states of every model out of a NETCONF reply
+
+    Args:
+        response: NETCONF reply of a <get> with the interface_table_filter()
+
+    Returns:
+        InterfaceTable: one row per interface, IETF first, then OpenConfig and IOS-XE native
+    '''
+    table = InterfaceTable()
+    for source, schema in INTERFACE_TABLE_SCHEMAS:
+        for record in schema.iter_extract(response.xml):
+            table.add(record, source)
+    return table
+
+
+def _status(record):
+    return {
+        'oper_status': record.get('oper_status') or 'unknown',
+        'admin_status': record.get('admin_status') or 'unknown',
+    }
+
+
+def _cellular_statuses(records, interface_name=None):
+    return {record['name']: _status(record) for record in records
+            if record['name'] and 'Cellular' in record['name']
+            and (interface_name is None or record['name'] == interface_name)}
+
+
+def interface_status_filter(interface):
+    '''
+    Builds the subtree filter of get_interface_status
+
+    Args:
+        interface (str): Interface name to query.
+
+    Returns:
+        SubtreeFilter: name and status leaves of the interface
+    '''
+    # Only the requested interface and leaves are transferred
+    return SubtreeFilter(
+        IETF_INTERFACES_NS, 'interfaces-state/interface',
+        keys={'name': interface}, leaves=['name', 'oper-status', 'admin-status'],
+    )
+
+
+def parse_interface_status(response, interface):
+    '''
+    Parses the status of an interface out of a NETCONF reply
+
+    Args:
+        response: NETCONF reply of a <get> including the interface_status_filter(interface) subtree
+        interface (str): Interface name to query.
+
+    Returns:
+        dict: Parsed interface status information.
+    '''
+    for intf in IETF_STATUS_SCHEMA.iter_extract(response.xml):
+        if intf['name'] == interface:
+            logger.info(f"Interface {interface} status retrieved successfully")
+            return _status(intf)
+
+    # Interface not found
+    logger.info(f"Interface {interface} not found in NETCONF reply")
+    return {'oper_status': 'unknown', 'admin_status': 'unknown'}
+
+
 class IOSXEInterfacesParsersMixin:
     """ Parsers for IOS XE Interfaces using Netconf """
 
-    def get_interfaces_status_openconfig(self, interface_name=None):
+    def collect_interface_table(self):
+        """ Get the state of every interface in the OpenConfig, IETF and IOS XE models with a single get
+
+            Returns:
+                InterfaceTable: interface states, also stored as self.interface_table
+        """
+        logger.info("Retrieving the interface table")
+        response = self.netconf_get(filter=interface_table_filter())
+        table = parse_interface_table(response)
+        self.interface_table = table
+        logger.info(f"Interface table retrieved successfully, {len(table)} interfaces")
+        return table
+
+    def get_interface_counters(self, interface_name=None, source='ietf'):
+        """ Get the octet, error and discard counters of the interfaces
+
+            Args:
+                interface_name (str, optional): Specific interface name to query. If None, all interfaces are queried.
+                source (str): 'ietf' (default) or 'openconfig' model
+
+            Returns:
+                list: counters of each interface, see parse_interface_counters()
+        """
+        logger.info(f"Retrieving interface counters using the {source} model")
+        response = self.netconf_get(filter=interface_counters_filter(interface_name, source).to_xml())
+        counters = parse_interface_counters(response, source)
+        logger.info(f"Interface counters retrieved successfully, {len(counters)} interfaces")
+        return counters
+
+    def get_interface_rates(self, interface_name=None, source='ietf', sampler=None):
+        """ Sample the interface counters and get the rates since the previous sample
+
+            Args:
+                interface_name (str, optional): Specific interface name to query. If None, all interfaces are queried.
+                source (str): 'ietf' (default) or 'openconfig' model
+                sampler (CounterSampler, optional): sampler keeping the previous samples, by default the one of
+                    the device (self.interface_counter_sampler), created on the first call
+
+            Returns:
+                dict: interface name -> {counter: rate per second}, empty on the first sample
+        """
+        if sampler is None:
+            sampler = getattr(self, 'interface_counter_sampler', None)
+            if not isinstance(sampler, CounterSampler):
+                sampler = self.interface_counter_sampler = CounterSampler()
+        return sampler.update(self.get_interface_counters(interface_name, source))
+
+    def get_interfaces_status_openconfig(self, interface_name=None, table=None):
         """ Get interface status using OpenConfig YANG model
 
             Args:
                 interface_name (str, optional): Specific interface name to query. If None, all interfaces are queried.
+                table (InterfaceTable, optional): answer from this table instead of querying the device
 
             Returns:
                 dict: Parsed interface status information.
         """
+        if table is not None:
+            return {record['name']: _status(record) for record in table.records('openconfig', interface_name)}
+
         logger.info("Retrieving interface status using OpenConfig model")
-        filter = """
-            <filter>
-                <interfaces xmlns="http://openconfig.net/yang/interfaces">
-                    <interface>
-                        {interface_name}
-                    </interface>
-                </interfaces>
-            </filter>
-        """.format(
-            interface_name=f"<name>{interface_name}</name>" if interface_name else ""
-        )
+        filter = SubtreeFilter(
+            OPENCONFIG_INTERFACES_NS, 'interfaces/interface',
+            keys={'name': interface_name}, leaves=['name', 'state/oper-status', 'state/admin-status'],
+        ).to_xml()
 
         response = self.netconf_get(filter=filter)
-        xml_data = etree.fromstring(response.xml, parser)
-
-        interfaces_data = xmltodict.parse(etree.tostring(xml_data))['rpc-reply']['data']['interfaces']['interface']
-        if not isinstance(interfaces_data, list):
-            interfaces_data = [interfaces_data]
-
-        result = {}
-        for intf in interfaces_data:
-            name = intf['name']
-            oper_status = intf.get('state', {}).get('oper-status', 'unknown')
-            admin_status = intf.get('state', {}).get('admin-status', 'unknown')
-            result[name] = {
-                'oper_status': oper_status,
-                'admin_status': admin_status
-            }
+
+        result = {intf['name']: _status(intf) for intf in OPENCONFIG_STATUS_SCHEMA.iter_extract(response.xml)}
 
         logger.info("Interface status retrieved successfully")
         return result
 
-    def get_interfaces_cellular_status(self, interface_name=None):
+    def get_interfaces_cellular_status(self, interface_name=None, table=None):
         """ Get cellular interface status using Cisco IOS XE YANG model
 
             Args:
                 interface_name (str, optional): Specific cellular interface name to query. If None, all cellular interfaces are queried.
+                table (InterfaceTable, optional): answer from this table instead of querying the device
 
             Returns:
                 dict: Parsed cellular interface status information.
         """
+        if table is not None:
+            return _cellular_statuses(table.records('iosxe'), interface_name)
+
         logger.info("Retrieving cellular interface status using Cisco IOS XE model")
-        filter = """
-            <filter>
-                <interfaces-state xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-interfaces-oper">
-                    <interface>
-                        {interface_name}
-                    </interface>
-                </interfaces-state>
-            </filter>
-        """.format(
-            interface_name=f"<name>{interface_name}</name>" if interface_name else ""
-        )
+        filter = SubtreeFilter(
+            IOSXE_INTERFACES_OPER_NS, 'interfaces/interface',
+            keys={'name': interface_name}, leaves=['name', 'oper-status', 'admin-status'],
+        ).to_xml()
 
         response = self.netconf_get(filter=filter)
-        xml_data = etree.fromstring(response.xml, parser)
-
-        interfaces_data = xmltodict.parse(etree.tostring(xml_data))['rpc-reply']['data']['interfaces-state']['interface']
-        if not isinstance(interfaces_data, list):
-            interfaces_data = [interfaces_data]
-
-        result = {}
-        for intf in interfaces_data:
-            name = intf['name']
-            if 'Cellular' in name:
-                oper_status = intf.get('oper-status', 'unknown')
-                admin_status = intf.get('admin-status', 'unknown')
-                result[name] = {
-                    'oper_status': oper_status,
-                    'admin_status': admin_status
-                }
+
+        result = _cellular_statuses(IOSXE_OPER_STATUS_SCHEMA.iter_extract(response.xml), interface_name)
 
         logger.info("Cellular interface status retrieved successfully")
         return result
 
-    def get_interface_status(self, interface):
+    def get_interface_status(self, interface, table=None):
         """ Get status of a specific interface
 
             Args:
                 interface (str): Interface name to query.
+                table (InterfaceTable, optional): answer from this table instead of querying the device
 
             Returns:
                 dict: Parsed interface status information.
         """
-        logger.info(f"Retrieving status for interface {interface}")
-        filter_xml = """
-            <filter>
-                <interfaces-state xmlns="urn:ietf:params:xml:ns:yang:ietf-interfaces">
-                </interfaces-state>
-            </filter>
-        """
-
-        response = self.netconf_get(filter=filter_xml)
-        # Remove XML declaration if present
-        xml_content = response.xml
-        if xml_content.startswith('<?xml'):
-            xml_content = xml_content.split('?>', 1)[1].strip()
-        xml_data = etree.fromstring(xml_content.encode('utf-8'), parser)
-
-        data_dict = xmltodict.parse(etree.tostring(xml_data))
-        if 'rpc-reply' not in data_dict or 'data' not in data_dict['rpc-reply'] or data_dict['rpc-reply']['data'] is None:
-            return {'oper_status': 'unknown', 'admin_status': 'unknown'}
+        if table is not None:
+            records = table.records('ietf', interface)
+            return _status(records[0]) if records else {'oper_status': 'unknown', 'admin_status': 'unknown'}
 
-        interfaces_state = data_dict['rpc-reply']['data'].get('interfaces-state', {})
-        interfaces = interfaces_state.get('interface', [])
-
-        # Handle single interface (dict) or multiple (list)
-        if isinstance(interfaces, dict):
-            interfaces = [interfaces]
-
-        logger.info(f"DEBUG: interfaces found: {json.dumps(interfaces, indent=2)}")
-
-        for intf in interfaces:
-            if intf.get('name') == interface:
-                oper_status = intf.get('oper-status', 'unknown')
-                admin_status = intf.get('admin-status', 'unknown')
-                result = {
-                    'oper_status': oper_status,
-                    'admin_status': admin_status
-                }
-                logger.info(f"Interface {interface} status retrieved successfully")
-                return result
-
-        # Interface not found
-        return {'oper_status': 'unknown', 'admin_status': 'unknown'}
+        logger.info(f"Retrieving status for interface {interface}")
+        response = self.netconf_get(filter=interface_status_filter(interface).to_xml())
+        return parse_interface_status(response, interface)
 
     @classmethod
     def bind_to_device(cls, device):
-        setattr(device, 'get_interface_status', cls.get_interface_status.__get__(device, type(device)))
+        for name in ('get_interface_status', 'collect_interface_table', 'get_interface_counters', 'get_interface_rates'):
+            setattr(device, name, getattr(cls, name).__get__(device, type(device)))
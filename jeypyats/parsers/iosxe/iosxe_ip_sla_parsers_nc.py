@@ -22,18 +22,62 @@ Pyats IOS XE IP SLA parsers using Netconf
 This module contains parsers to retrieve IP SLA information from Cisco IOS XE devices via Netconf.
 '''
 import logging
-import xmltodict
-from lxml import etree
-from ...utils import BASE_RPC
+from ...utils.filters import SubtreeFilter
+from ...utils.schemas import ExtractionSchema
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
 logger = logging.getLogger(__name__)
 
-parser = etree.XMLParser()
-parser.set_element_class_lookup(
-    etree.ElementDefaultClassLookup(element=etree.ElementBase)
+IOSXE_IP_SLA_OPER_NS = 'http://cisco.com/ns/yang/Cisco-IOS-XE-ip-sla-oper'
+
+# Extraction schema, compiled once at import
+IP_SLA_STAT_SCHEMA = ExtractionSchema(
+    'ip-sla-stats/ip-sla-stat',
+    {'sla_id': 'sla-index', 'oper_state': 'oper-state'},
+    namespace=IOSXE_IP_SLA_OPER_NS,
 )
 
+
+def ip_sla_states_filter():
+    '''
+    Builds the subtree filter of get_ip_sla_states
+
+    Returns:
+        SubtreeFilter: index and operational state of every IP SLA
+    '''
+    return SubtreeFilter(IOSXE_IP_SLA_OPER_NS, 'ip-sla-stats/ip-sla-stat', leaves=['sla-index', 'oper-state'])
+
+
+def parse_ip_sla_states(response):
+    '''
+    Parses the IP SLA states out of a NETCONF reply
+
+    Args:
+        response: NETCONF reply of a <get> including the ip_sla_states_filter() subtree
+
+    Returns:
+        dict: Dictionary of SLA IDs and their states.
+    '''
+    # Check if response is valid
+    if not response or not hasattr(response, 'xml') or response.xml is None:
+        logger.warning("NETCONF response is invalid or empty for IP SLA states")
+        return {}
+
+    # Check for RPC errors
+    if '<rpc-error>' in response.xml:
+        logger.error(f"NETCONF RPC error in IP SLA response: {response.xml}")
+        return {}
+
+    try:
+        sla_states = {}
+        for sla in IP_SLA_STAT_SCHEMA.iter_extract(response.xml):
+            if sla['sla_id']:
+                sla_states[sla['sla_id']] = {'oper_state': sla['oper_state']}
+        return sla_states
+    except Exception as e:
+        logger.error(f"Error parsing IP SLA response: {e}")
+        return {}
+
+
 class IOSXEIPSLAParsersMixin:
     '''
     Collection of RPCs for parsing IP SLA information on IOS-XE devices
@@ -45,48 +89,9 @@ class IOSXEIPSLAParsersMixin:
         Returns:
             dict: Dictionary of SLA IDs and their states.
         '''
-        sla_filter = '''
-        <filter>
-            <ip-sla-stats xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-ip-sla-oper">
-                <ip-sla-stat/>
-            </ip-sla-stats>
-        </filter>
-        '''
-        response = self.netconf_get(filter=sla_filter)
-
-        # Check if response is valid
-        if not response or not hasattr(response, 'xml') or response.xml is None:
-            logger.warning("NETCONF response is invalid or empty for IP SLA states")
-            return {}
-
-        # Check for RPC errors
-        if '<rpc-error>' in response.xml:
-            logger.error(f"NETCONF RPC error in IP SLA response: {response.xml}")
-            return {}
-
-        try:
-            # Remove XML declaration if present
-            xml_content = response.xml
-            if xml_content.startswith('<?xml'):
-                xml_content = xml_content.split('?>', 1)[1].strip()
-            xml_data = etree.fromstring(xml_content.encode('utf-8'), parser)
-            data_dict = xmltodict.parse(etree.tostring(xml_data))
-
-            if data_dict is None:
-                logger.warning("Failed to parse XML response for IP SLA states")
-                return {}
-
-            sla_states = {}
-            ip_sla_stats = data_dict.get('rpc-reply', {}).get('data', {}).get('ip-sla-stats', {})
-            ip_sla_stat_list = ip_sla_stats.get('ip-sla-stat', [])
-            if isinstance(ip_sla_stat_list, dict):
-                ip_sla_stat_list = [ip_sla_stat_list]
-            for sla in ip_sla_stat_list:
-                sla_id = sla.get('sla-index')
-                oper_state = sla.get('oper-state')
-                if sla_id:
-                    sla_states[str(sla_id)] = {'oper_state': oper_state}
-            return sla_states
-        except Exception as e:
-            logger.error(f"Error parsing IP SLA response: {e}")
-            return {}
+        response = self.netconf_get(filter=ip_sla_states_filter().to_xml())
+        return parse_ip_sla_states(response)
+
+    @classmethod
+    def bind_to_device(cls, device):
+        setattr(device, 'get_ip_sla_states', cls.get_ip_sla_states.__get__(device, type(device)))
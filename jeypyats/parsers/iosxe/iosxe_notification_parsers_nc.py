@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+# This file is a part of Netalps.fr.
+#
+# Created: 17.10.2026 18:41:07
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 18:41:07
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+Pyats IOS XE event notifications using Netconf
+This module subscribes IOS-XE devices to a NETCONF notification stream carrying syslog and EEM
+events, on a dedicated pooled session, and waits for messages in the received events.
+Without subscription, or once it stopped, wait_for_message() falls back to polling the buffered syslog
+messages.
+'''
+import logging
+import re
+import time
+from ...utils.notifications import NotificationSubscription
+from ...utils.reply_cache import fresh_reads
+from ...utils.utils import JeyPyatsStateError
+from ..libs.iosxe.waits import poll_until
+
+logger = logging.getLogger(__name__)
+
+
+class IOSXENotificationParsersMixin:
+    '''
+    Collection of notification subscriptions on IOS-XE devices
+    '''
+    def subscribe_events(self, stream=None, filter=None, xpath=None, protocol='rfc5277', buffer_size=1000):
+        '''
+        Subscribes to a notification stream, received events are kept in a ring buffer
+        Args:
+            stream (str): stream name, the NETCONF stream by default
+            filter (str): RFC 5277 '<filter>' on the notification content
+            xpath (str): RFC 8639 stream-xpath-filter
+            protocol (str): 'rfc5277' (create-subscription) or 'rfc8639' (establish-subscription)
+            buffer_size (int): number of kept events
+        Returns:
+            NotificationSubscription: running subscription, also stored as self.event_subscription
+        '''
+        if getattr(self, 'event_subscription', None) is not None:
+            return self.event_subscription
+        nc = self.netconf_open_session()
+        subscription = NotificationSubscription(nc, buffer_size=buffer_size, on_close=self.netconf_release_session)
+        try:
+            subscription.start(stream=stream, filter=filter, xpath=xpath, protocol=protocol)
+        except Exception:
+            subscription.stop()
+            raise
+        self.event_subscription = subscription
+        return subscription
+
+    def wait_for_message(self, pattern, timeout=60, since=None, kind=None):
+        '''
+        Waits for a syslog or EEM message matching a pattern
+        Args:
+            pattern (str): regular expression searched in the message text
+            timeout (float): seconds to wait
+            since (int): only events received after this sequence number, by default the events received
+                after the call. Without subscription, any since also searches the messages already logged.
+            kind (str): only events of this kind, e.g. 'syslog' or 'eem' (subscription only)
+        Returns:
+            dict: matching event, or syslog message without subscription. None on timeout.
+        '''
+        deadline = time.monotonic() + timeout
+        subscription = getattr(self, 'event_subscription', None)
+        if subscription is not None and subscription.active:
+            event = subscription.wait_for_message(
+                pattern, timeout=timeout, since=subscription.buffer.last_seq if since is None else since, kind=kind,
+            )
+            if event is not None or subscription.active:
+                return event
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                return None
+        if subscription is not None:
+            logger.warning("The event subscription stopped, polling the syslog buffer")
+        else:
+            logger.debug("No event subscription, polling the syslog buffer")
+
+        regex = re.compile(pattern)
+        with fresh_reads():
+            if since is None:
+                # moves the syslog cursor to the end, only the messages logged after the call are searched
+                self.get_syslog_messages(new_only=True)
+            else:
+                matches = [message for message in self.get_syslog_messages() if regex.search(message['text'])]
+                if matches:
+                    return matches[0]
+        try:
+            result = poll_until(
+                lambda: [message for message in self.get_syslog_messages(new_only=True)
+                         if regex.search(message['text'])],
+                bool, timeout=timeout, description=f"syslog message '{pattern}'",
+            )
+        except JeyPyatsStateError:
+            return None
+        return result.value[0]
+
+    def unsubscribe_events(self):
+        '''
+        Stops the subscription and hands its session back to the pool
+        '''
+        subscription = getattr(self, 'event_subscription', None)
+        if subscription is not None:
+            subscription.stop()
+            self.event_subscription = None
+
+    @classmethod
+    def bind_to_device(cls, device):
+        for name in ('subscribe_events', 'wait_for_message', 'unsubscribe_events'):
+            setattr(device, name, getattr(cls, name).__get__(device, type(device)))
@@ -21,82 +21,520 @@ __license__ = "Netalps, Copyright 2026. All rights reserved."
 Pyats IOS XE Routing parsers using Netconf
 This module contains parsers to retrieve routing information from Cisco IOS XE devices via Netconf.
 It includes functions to get routing table entries, OSPF routes, and BGP routes.
+The iter_* variants yield the routes while the reply is decoded, for tables too large to be held in memory.
 The parsers utilize XML filters to query the device and parse the XML responses into structured data.
 Each function is designed to handle specific routing protocols and return relevant information in a user-friendly format.
-The module leverages the Genie and lxml libraries for XML parsing and data extraction.
+The module leverages the lxml library for XML parsing and data extraction.
 '''
+import ipaddress
 import logging
-import xmltodict
-from genie.utils import Dq
-from lxml import etree
-from ...utils import BASE_RPC
-from packaging import version
+from ...utils.filters import SubtreeFilter, merge_filters
+from ...utils.prefix_index import PrefixIndex
+from ...utils.reply_decoder import iter_elements
+from ...utils.schemas import ExtractionSchema
+from ...utils.route_table import build_routes, iter_routes, route_record_class
+from ...utils.utils import JeyPyatsStateError, JeyPyatsValueError
 
 
-
-logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
 logger = logging.getLogger(__name__)
 
-parser = etree.XMLParser()
-parser.set_element_class_lookup(
-    etree.ElementDefaultClassLookup(element=etree.ElementBase)
+IOSXE_RPC_NS = 'http://cisco.com/ns/yang/Cisco-IOS-XE-rpc'
+IETF_ROUTING_NS = 'urn:ietf:params:xml:ns:yang:ietf-routing'
+IOSXE_NATIVE_NS = 'http://cisco.com/ns/yang/Cisco-IOS-XE-native'
+
+# IP version -> default route prefix and rib of the default instance
+DEFAULT_PREFIXES = {4: '0.0.0.0/0', 6: '::/0'}
+DEFAULT_RIBS = {4: 'ipv4-default', 6: 'ipv6-default'}
+DEFAULT_ROUTE_SOURCES = ('ietf', 'native')
+ROUTING_TABLES_MODES = ('bulk', 'concurrent')
+
+# Extraction schemas, compiled once at import
+RT_ENTRY_SCHEMA = ExtractionSchema(
+    'routing-table/rt-entry',
+    {
+        'prefix': 'destination',
+        'protocol': 'protocol',
+        'next_hop': 'gateway',
+        'metric': 'metric',
+        'interface': 'interface',
+    },
+    namespace=IOSXE_RPC_NS,
+)
+
+OSPF_ROUTE_SCHEMA = ExtractionSchema(
+    'ospf-routes/ospf-route',
+    {
+        'prefix': 'prefix',
+        'area': 'area-id',
+        'next_hop': 'next-hop',
+        'metric': 'metric',
+    },
+    namespace=IOSXE_RPC_NS,
+)
+
+BGP_ROUTE_SCHEMA = ExtractionSchema(
+    'bgp-routes/bgp-route',
+    {
+        'prefix': 'prefix',
+        'next_hop': 'next-hop',
+        'as_path': 'as-path',
+        'local_pref': 'local-pref',
+    },
+    namespace=IOSXE_RPC_NS,
+)
+
+IETF_RIB_FIELDS = {
+    'prefix': 'destination-prefix',
+    'protocol': 'source-protocol',
+    'next_hop': 'next-hop/next-hop-address',
+    'metric': 'metric',
+    'interface': 'next-hop/outgoing-interface',
+}
+
+IETF_DEFAULT_RIB_SCHEMA = ExtractionSchema(
+    'routing-state/routing-instance/ribs/rib/routes/route',
+    IETF_RIB_FIELDS,
+    namespace=IETF_ROUTING_NS,
+    keys={'instance': 'routing-instance/name', 'rib': 'rib/name'},
+    where={'instance': 'default', 'rib': 'ipv4-default'},
+)
+
+IETF_DEFAULT_RIB6_SCHEMA = ExtractionSchema(
+    'routing-state/routing-instance/ribs/rib/routes/route',
+    IETF_RIB_FIELDS,
+    namespace=IETF_ROUTING_NS,
+    keys={'instance': 'routing-instance/name', 'rib': 'rib/name'},
+    where={'instance': 'default', 'rib': 'ipv6-default'},
+)
+
+IETF_RIB_SCHEMAS = {4: IETF_DEFAULT_RIB_SCHEMA, 6: IETF_DEFAULT_RIB6_SCHEMA}
+
+# ipv4 routes of every routing instance (VRF), grouped by instance by parse_routing_tables()
+IETF_INSTANCE_RIB_SCHEMA = ExtractionSchema(
+    'routing-state/routing-instance/ribs/rib/routes/route',
+    IETF_RIB_FIELDS,
+    namespace=IETF_ROUTING_NS,
+    keys={'instance': 'routing-instance/name', 'rib': 'rib/name'},
+    where={'rib': 'ipv4-default'},
+)
+
+VRF_NAMES_SCHEMA = ExtractionSchema('native/vrf/definition', {'name': 'name'}, namespace=IOSXE_NATIVE_NS)
+
+# Static default routes of the native model ('ip route 0.0.0.0 0.0.0.0 <fwd>'), one record per forwarding entry
+NATIVE_DEFAULT_ROUTE_SCHEMA = ExtractionSchema(
+    'native/ip/route/ip-route-interface-forwarding-list/fwd-list',
+    {'fwd': 'fwd', 'next_hop': 'interface-next-hop/ip-address', 'metric': 'metric'},
+    namespace=IOSXE_NATIVE_NS,
+    keys={'prefix': 'ip-route-interface-forwarding-list/prefix', 'mask': 'ip-route-interface-forwarding-list/mask'},
+    where={'prefix': '0.0.0.0', 'mask': '0.0.0.0'},
+)
+
+NATIVE_DEFAULT_ROUTE6_SCHEMA = ExtractionSchema(
+    'native/ipv6/route/ipv6-route-list/ipv6-fwd-list',
+    {'fwd': 'ipv6-fwd', 'next_hop': 'interface-next-hop/ipv6-address', 'metric': 'metric'},
+    namespace=IOSXE_NATIVE_NS,
+    keys={'prefix': 'ipv6-route-list/prefix'},
+    where={'prefix': '::/0'},
 )
 
+NATIVE_ROUTE_SCHEMAS = {4: NATIVE_DEFAULT_ROUTE_SCHEMA, 6: NATIVE_DEFAULT_ROUTE6_SCHEMA}
+
+# Compact route records ('record' and 'table' outputs), the integer fields are converted to int
+RouteEntry = route_record_class('RouteEntry', RT_ENTRY_SCHEMA.fields, ('metric',))
+OSPFRoute = route_record_class('OSPFRoute', OSPF_ROUTE_SCHEMA.fields, ('metric',))
+BGPRoute = route_record_class('BGPRoute', BGP_ROUTE_SCHEMA.fields, ('local_pref',))
+
+
+def routing_table_rpc(vrf='default'):
+    '''
+    Builds the get-routing-table RPC of a VRF
+    '''
+    return f'''
+            <get-routing-table xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-rpc">
+                <vrf-name>{vrf}</vrf-name>
+            </get-routing-table>
+        '''
+
+
+def bgp_routes_rpc(vrf='default'):
+    '''
+    Builds the get-bgp-routes RPC of a VRF
+    '''
+    return f'''
+            <get-bgp-routes xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-rpc">
+                <vrf-name>{vrf}</vrf-name>
+            </get-bgp-routes>
+        '''
+
+
+def _check_version(version):
+    if version not in DEFAULT_PREFIXES:
+        raise JeyPyatsValueError(f"Unknown IP version '{version}', expected 4 or 6")
+
+
+def default_routes_filter(version=4):
+    '''
+    Builds the subtree filter of get_routing_table_default_routes
+
+    Args:
+        version (int): IP version, 4 or 6
+
+    Returns:
+        SubtreeFilter: default routes of the ipv4-default (or ipv6-default) rib of the default instance
+    '''
+    _check_version(version)
+    # Only the default routes are transferred, the server matches the instance, the rib and the prefix
+    return SubtreeFilter(
+        IETF_ROUTING_NS, 'routing-state/routing-instance/ribs/rib/routes/route',
+        keys={
+            'routing-instance/name': 'default',
+            'rib/name': DEFAULT_RIBS[version],
+            'destination-prefix': DEFAULT_PREFIXES[version],
+        },
+    )
+
+
+def native_default_routes_filter(version=4):
+    '''
+    Builds the subtree filter of the static default routes of the IOS-XE native model
+
+    Args:
+        version (int): IP version, 4 or 6
+
+    Returns:
+        SubtreeFilter: 'ip route 0.0.0.0 0.0.0.0' (or 'ipv6 route ::/0') entries
+    '''
+    _check_version(version)
+    if version == 4:
+        return SubtreeFilter(
+            IOSXE_NATIVE_NS, 'native/ip/route/ip-route-interface-forwarding-list',
+            keys={'prefix': '0.0.0.0', 'mask': '0.0.0.0'},
+        )
+    return SubtreeFilter(IOSXE_NATIVE_NS, 'native/ipv6/route/ipv6-route-list', keys={'prefix': '::/0'})
+
+
+def covering_routes_filter(address):
+    '''
+    Builds a subtree filter returning the routes of the default instance which may contain an address
+
+    Every prefix containing the address (one per prefix length, the default route excluded) is
+    a content match, so that the server only returns the candidates of the longest prefix match.
+
+    Args:
+        address (str): IP address, e.g. '82.66.83.254'
+
+    Returns:
+        str: '<filter>...</filter>' XML
+
+    Raises:
+        ValueError: address is not an IP address
+    '''
+    address = ipaddress.ip_address(address)
+    width = address.max_prefixlen
+    return merge_filters(
+        SubtreeFilter(
+            IETF_ROUTING_NS, 'routing-state/routing-instance/ribs/rib/routes/route',
+            keys={
+                'routing-instance/name': 'default',
+                'rib/name': DEFAULT_RIBS[address.version],
+                'destination-prefix': str(ipaddress.ip_network((address, length), strict=False)),
+            },
+        )
+        for length in range(width, 0, -1)
+    )
+
+
+def vrf_names_filter():
+    '''
+    Builds the subtree filter of get_vrf_names
+
+    Returns:
+        SubtreeFilter: names of the 'vrf definition' entries of the native configuration
+    '''
+    return SubtreeFilter(IOSXE_NATIVE_NS, 'native/vrf/definition', leaves=['name'])
+
+
+def parse_vrf_names(response):
+    '''
+    Parses the VRF names out of a NETCONF reply
+
+    Returns:
+        list: VRF names, in configuration order
+    '''
+    return [entry['name'] for entry in VRF_NAMES_SCHEMA.iter_extract(response.xml) if entry['name']]
+
+
+def routing_tables_filter(vrfs=None):
+    '''
+    Builds the subtree filter of the ipv4 routes of several routing instances, for a single <get>
+
+    Args:
+        vrfs (list, optional): VRF names, every routing instance by default
+
+    Returns:
+        str: '<filter>...</filter>' XML
+    '''
+    path = 'routing-state/routing-instance/ribs/rib/routes/route'
+    if vrfs is None:
+        return SubtreeFilter(IETF_ROUTING_NS, path, keys={'rib/name': 'ipv4-default'}).to_xml()
+    return merge_filters(
+        SubtreeFilter(IETF_ROUTING_NS, path, keys={'routing-instance/name': vrf, 'rib/name': 'ipv4-default'})
+        for vrf in vrfs
+    )
+
+
+def parse_routing_tables(response, vrfs=None, output='dict'):
+    '''
+    Parses the ipv4 routes of several routing instances out of a NETCONF reply
+
+    Args:
+        response: NETCONF reply of a <get> including the routing_tables_filter() subtree
+        vrfs (list, optional): expected VRF names, reported even without routes
+        output (str): 'dict', 'record' (RouteEntry records) or 'table' (RouteTable)
+
+    Returns:
+        dict: VRF name -> routes
+    '''
+    routes = {vrf: [] for vrf in vrfs or ()}
+    schema = IETF_INSTANCE_RIB_SCHEMA
+    for element, key_values in iter_elements(response.xml, schema.path, schema.keys):
+        entry = schema.extract_element(element, key_values)
+        if entry is not None:
+            routes.setdefault(key_values['instance'], []).append(entry)
+    return {vrf: build_routes(entries, RouteEntry, output) for vrf, entries in routes.items()}
+
+
+def fetch_routing_table(device, vrf, output='dict', timeout=None):
+    '''
+    Fetches the routing table of a VRF on a pooled session of its own
+
+    The RPC goes through device.netconf_get(), so that the reconnection, the reply cache and the RPC
+    timing of the device apply to it.
+
+    Args:
+        device: connected device with netconf_get() and netconf_pooled_session()
+        vrf (str): VRF name
+        output (str): see get_routing_table
+        timeout (float, optional): seconds to wait for a free pooled session (default: the connect timeout of the pool)
+
+    Returns:
+        list | RouteTable: routing table entries
+
+    Raises:
+        JeyPyatsNotConnectedError: no pooled session was released in time
+    '''
+    with device.netconf_pooled_session(timeout):
+        response = device.netconf_get(routing_table_rpc(vrf))
+    return build_routes(RT_ENTRY_SCHEMA.iter_extract(response.xml), RouteEntry, output)
+
+
+def index_routes(routes):
+    '''
+    Indexes routes by prefix for longest prefix match lookups
+
+    Args:
+        routes (iterable): route dicts or records with a 'prefix'
+
+    Returns:
+        PrefixIndex: list of the routes of every prefix, ECMP routes share a prefix
+    '''
+    index = PrefixIndex()
+    for route in routes:
+        try:
+            index.setdefault(route['prefix'], []).append(route)
+        except ValueError:
+            logger.debug(f"Route with an invalid prefix not indexed: {route['prefix']}")
+    return index
+
+
+def parse_default_routes(response, version=4):
+    '''
+    Parses the default routes out of a NETCONF reply
+
+    Args:
+        response: NETCONF reply of a <get> including the default_routes_filter() subtree
+        version (int): IP version, 4 or 6
+
+    Returns:
+        list: List of default route entries, the interface of a route having only a next hop is None
+    '''
+    default_prefix = DEFAULT_PREFIXES[version]
+    return [route for route in IETF_RIB_SCHEMAS[version].iter_extract(response.xml) if route['prefix'] == default_prefix]
+
+
+def parse_native_default_routes(response, version=4):
+    '''
+    Parses the static default routes of the IOS-XE native model out of a NETCONF reply
+
+    Args:
+        response: NETCONF reply of a <get> including the native_default_routes_filter() subtree
+        version (int): IP version, 4 or 6
+
+    Returns:
+        list: default route entries, in the format of parse_default_routes()
+    '''
+    parsed_entries = []
+    for entry in NATIVE_ROUTE_SCHEMAS[version].iter_extract(response.xml):
+        forward, next_hop, interface = entry['fwd'], entry['next_hop'], None
+        try:
+            ipaddress.ip_address(forward)
+            next_hop = forward
+        except ValueError:
+            interface = forward
+        parsed_entries.append({
+            'prefix': DEFAULT_PREFIXES[version],
+            'protocol': 'static',
+            'next_hop': next_hop,
+            'metric': entry['metric'],
+            'interface': interface,
+        })
+    return parsed_entries
+
+
+def query_next_hop_interface(device, next_hop, max_depth=8):
+    '''
+    Resolves a next hop to its outgoing interface with targeted queries of the rib
+
+    Every step fetches the routes which may contain the address (see covering_routes_filter()),
+    takes the longest prefix match and follows its next hop when it has no outgoing interface.
+    The first next hop of ECMP routes is followed.
+
+    Args:
+        device: device with a netconf_get(filter) method
+        next_hop (str): next hop address
+        max_depth (int): maximum number of queries
+
+    Returns:
+        str: outgoing interface, None if the next hop cannot be resolved
+    '''
+    visited = set()
+    address = next_hop
+    for _ in range(max_depth):
+        try:
+            version = ipaddress.ip_address(address).version
+        except ValueError:
+            return None
+        response = device.netconf_get(filter=covering_routes_filter(address))
+        index = index_routes(IETF_RIB_SCHEMAS[version].iter_extract(response.xml))
+        prefix = index.lookup_prefix(address)
+        if prefix is None or prefix in visited:
+            return None
+        visited.add(prefix)
+        routes = index.exact(prefix)
+        for route in routes:
+            if route['interface']:
+                return route['interface']
+        next_hops = [route['next_hop'] for route in routes if route['next_hop']]
+        if not next_hops:
+            return None
+        address = next_hops[0]
+    return None
+
+
 class IOSXERoutingParsersMixin:
     '''
     Collection of RPCs for parsing routing information on IOS-XE devices
     '''
-    def get_routing_table(self, vrf='default'):
+    def get_routing_table(self, vrf='default', output='dict'):
         '''
         Get routing table entries for a specified VRF
         Args:
             vrf (str): VRF name (default is 'default')
+            output (str): 'dict', 'record' (RouteEntry records) or 'table' (RouteTable)
         Returns:
-            dict: Parsed routing table entries
+            list | RouteTable: Parsed routing table entries
         Similar cli command:
             show ip route vrf {vrf}
         '''
-        rpc = f'''
-            <get-routing-table xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-rpc">
-                <vrf-name>{vrf}</vrf-name>
-            </get-routing-table>
-        '''
-        response = self.netconf_get(rpc)
-        xml_data = etree.fromstring(response.xml, parser)
-        data_dict = xmltodict.parse(etree.tostring(xml_data))
-
-        # Navigate to routing table entries
-        rpc_reply = data_dict.get("rpc-reply", {})
-        routing_table = rpc_reply.get("routing-table", {})
-        rt_entries = routing_table.get("rt-entry", [])
-
-        # Handle both single entry (dict) and multiple entries (list)
-        if isinstance(rt_entries, dict):
-            routing_entries = [rt_entries]
-        else:
-            routing_entries = rt_entries
-
-        parsed_entries = []
+        response = self.netconf_get(routing_table_rpc(vrf))
+        return build_routes(RT_ENTRY_SCHEMA.iter_extract(response.xml), RouteEntry, output)
 
-        for entry in routing_entries:
-            parsed_entry = {
-                'prefix': entry.get('destination'),
-                'protocol': entry.get('protocol'),
-                'next_hop': entry.get('gateway'),
-                'metric': entry.get('metric'),
-                'interface': entry.get('interface'),
-            }
-            parsed_entries.append(parsed_entry)
+    def iter_routing_table(self, vrf='default', output='dict'):
+        '''
+        Yield routing table entries for a specified VRF while the reply is decoded
+        Args:
+            vrf (str): VRF name (default is 'default')
+            output (str): 'dict' or 'record' (RouteEntry records)
+        Returns:
+            iterator: routing table entries, each decoded when requested
+        Similar cli command:
+            show ip route vrf {vrf}
+        '''
+        response = self.netconf_get(routing_table_rpc(vrf))
+        return iter_routes(RT_ENTRY_SCHEMA.iter_extract(response.xml), RouteEntry, output)
 
-        return parsed_entries
+    def get_vrf_names(self):
+        '''
+        Get the names of the VRFs, the default VRF first
+        Returns:
+            list: VRF names
+        Similar cli command:
+            show vrf
+        '''
+        response = self.netconf_get(filter=vrf_names_filter().to_xml())
+        return ['default'] + parse_vrf_names(response)
 
-    def get_ospf_routes(self, vrf='default'):
+    def get_routing_tables(self, vrfs=None, mode='bulk', concurrency=4, output='dict', timeout=300):
+        '''
+        Get the routing table entries of several VRFs
+        Args:
+            vrfs (list, optional): VRF names, every VRF by default
+            mode (str): 'bulk' (a single <get> of the ietf-routing routes of the VRFs) or 'concurrent'
+                        (one get-routing-table RPC per VRF, over concurrent pooled sessions)
+            concurrency (int): maximum number of VRFs fetched at the same time in concurrent mode (default 4),
+                               capped at the free sessions of the pool: the session of the connection and
+                               the session of a notification subscription count against its limit.
+            output (str): 'dict', 'record' (RouteEntry records) or 'table' (RouteTable)
+            timeout (float): per-VRF timeout in seconds in concurrent mode (default 300)
+        Returns:
+            dict: VRF name -> routing table entries
+        Raises:
+            JeyPyatsValueError: unknown mode
+            JeyPyatsStateError: a VRF could not be fetched in concurrent mode, or the pool has no free session
+        Similar cli command:
+            show ip route vrf *
+        '''
+        if mode == 'bulk':
+            response = self.netconf_get(filter=routing_tables_filter(vrfs))
+            return parse_routing_tables(response, vrfs, output)
+        if mode != 'concurrent':
+            raise JeyPyatsValueError(
+                f"Unknown routing tables mode '{mode}', expected one of {', '.join(ROUTING_TABLES_MODES)}")
+
+        # asyncio is only imported when the concurrent mode is used
+        from ...utils.async_netconf import offload, run_fleet
+
+        free_sessions = vars(self).get('netconf_free_sessions')
+        if free_sessions is not None:
+            available = free_sessions()
+            if available < 1:
+                raise JeyPyatsStateError(
+                    "No free pooled NETCONF session for the concurrent mode, every session allowed by "
+                    "max_sessions_per_device is in use: use mode='bulk' or raise max_sessions_per_device")
+            concurrency = min(concurrency, available)
+
+        if vrfs is None:
+            vrfs = IOSXERoutingParsersMixin.get_vrf_names(self)
+
+        async def fetch(vrf):
+            return await offload(fetch_routing_table, self, vrf, output)
+
+        results = run_fleet({vrf: vrf for vrf in vrfs}, fetch, concurrency=concurrency, timeout=timeout)
+        failed = {vrf: result.error for vrf, result in results.items() if not result.ok}
+        if failed:
+            raise JeyPyatsStateError(
+                f"Failed to fetch the routing table of {len(failed)} VRF(s): "
+                + ', '.join(f"{vrf} ({type(error).__name__}: {error})" for vrf, error in failed.items()))
+        return {vrf: result.result for vrf, result in results.items()}
+
+    def get_ospf_routes(self, vrf='default', output='dict'):
         '''
         Get OSPF routes for a specified VRF
         Args:
             vrf (str): VRF name (default is 'default')
+            output (str): 'dict', 'record' (OSPFRoute records) or 'table' (RouteTable)
         Returns:
-            dict: Parsed OSPF routes
+            list | RouteTable: Parsed OSPF routes
         Similar cli command:
             show ip ospf route vrf {vrf}
         '''
@@ -106,77 +544,45 @@ class IOSXERoutingParsersMixin:
             </get-ospf-routes>
         '''
         response = self.netconf_get(rpc)
-        xml_data = etree.fromstring(response.xml, parser)
-        data_dict = xmltodict.parse(etree.tostring(xml_data))
-        # Navigate to OSPF routes
-        ospf_routes_data = data_dict.get("ospf-routes", {})
-        ospf_route_entries = ospf_routes_data.get("ospf-route", [])
-
-        # Handle both single route (dict) and multiple routes (list)
-        if isinstance(ospf_route_entries, dict):
-            ospf_routes = [ospf_route_entries]
-        else:
-            ospf_routes = ospf_route_entries
-
-        parsed_routes = []
-
-        for route in ospf_routes:
-            parsed_route = {
-                'prefix': route.get('prefix'),
-                'area': route.get('area-id'),
-                'next_hop': route.get('next-hop'),
-                'metric': route.get('metric'),
-            }
-            parsed_routes.append(parsed_route)
+        return build_routes(OSPF_ROUTE_SCHEMA.iter_extract(response.xml), OSPFRoute, output)
 
-        return parsed_routes
-
-    def get_bgp_routes(self, vrf='default'):
+    def get_bgp_routes(self, vrf='default', output='dict'):
         '''
         Get BGP routes for a specified VRF
         Args:
             vrf (str): VRF name (default is 'default')
+            output (str): 'dict', 'record' (BGPRoute records) or 'table' (RouteTable)
         Returns:
-            dict: Parsed BGP routes
+            list | RouteTable: Parsed BGP routes
         Similar cli command:
             show ip bgp vrf {vrf}
         '''
-        rpc = f'''
-            <get-bgp-routes xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-rpc">
-                <vrf-name>{vrf}</vrf-name>
-            </get-bgp-routes>
-        '''
-        response = self.netconf_get(rpc)
-        xml_data = etree.fromstring(response.xml, parser)
-        data_dict = xmltodict.parse(etree.tostring(xml_data))
-        # Navigate to BGP routes
-        bgp_routes_data = data_dict.get("bgp-routes", {})
-        bgp_route_entries = bgp_routes_data.get("bgp-route", [])
-
-        # Handle both single route (dict) and multiple routes (list)
-        if isinstance(bgp_route_entries, dict):
-            bgp_routes = [bgp_route_entries]
-        else:
-            bgp_routes = bgp_route_entries
+        response = self.netconf_get(bgp_routes_rpc(vrf))
+        return build_routes(BGP_ROUTE_SCHEMA.iter_extract(response.xml), BGPRoute, output)
 
-        parsed_routes = []
-
-        for route in bgp_routes:
-            parsed_route = {
-                'prefix': route.get('prefix'),
-                'next_hop': route.get('next-hop'),
-                'as_path': route.get('as-path'),
-                'local_pref': route.get('local-pref'),
-            }
-            parsed_routes.append(parsed_route)
-
-        return parsed_routes
+    def iter_bgp_routes(self, vrf='default', output='dict'):
+        '''
+        Yield BGP routes for a specified VRF while the reply is decoded
+        Args:
+            vrf (str): VRF name (default is 'default')
+            output (str): 'dict' or 'record' (BGPRoute records)
+        Returns:
+            iterator: BGP routes, each decoded when requested
+        Example:
+            best = sum(1 for route in device.iter_bgp_routes() if route['local_pref'] == '200')
+        Similar cli command:
+            show ip bgp vrf {vrf}
+        '''
+        response = self.netconf_get(bgp_routes_rpc(vrf))
+        return iter_routes(BGP_ROUTE_SCHEMA.iter_extract(response.xml), BGPRoute, output)
 
-    def get_routing_table_global(self):
+    def get_routing_table_global(self, output='dict'):
         '''
         Get global routing table entries
+        Args:
+            output (str): 'dict', 'record' (RouteEntry records) or 'table' (RouteTable)
         Returns:
-            dict: Parsed global routing table entries
+            list | RouteTable: Parsed global routing table entries
         Similar cli command:
             show ip route
         '''
@@ -186,150 +592,55 @@ class IOSXERoutingParsersMixin:
             </get-routing-table>
         '''
         response = self.netconf_get(rpc)
-        xml_data = etree.fromstring(response.xml, parser)
-        data_dict = xmltodict.parse(etree.tostring(xml_data))
-
-        # Navigate to routing table entries
-        rpc_reply = data_dict.get("rpc-reply", {})
-        routing_table = rpc_reply.get("routing-table", {})
-        rt_entries = routing_table.get("rt-entry", [])
-
-        # Handle both single entry (dict) and multiple entries (list)
-        if isinstance(rt_entries, dict):
-            routing_entries = [rt_entries]
-        else:
-            routing_entries = rt_entries
-
-        parsed_entries = []
-
-        for entry in routing_entries:
-            parsed_entry = {
-                'prefix': entry.get('destination'),
-                'protocol': entry.get('protocol'),
-                'next_hop': entry.get('gateway'),
-                'metric': entry.get('metric'),
-                'interface': entry.get('interface'),
-            }
-            parsed_entries.append(parsed_entry)
-
-        return parsed_entries
+        return build_routes(RT_ENTRY_SCHEMA.iter_extract(response.xml), RouteEntry, output)
 
-    def get_routing_table_default_routes(self):
+    def get_routing_table_default_routes(self, version=4, source='ietf', resolve=False):
         '''
         Get default route entries from the global routing table
+        Only the default routes are transferred, the instance, rib and prefix are matched by the device.
+        Args:
+            version (int): IP version, 4 (default) or 6
+            source (str): 'ietf' (ietf-routing rib, default) or 'native' (static default routes of the
+                          Cisco-IOS-XE-native configuration)
+            resolve (bool): resolve the outgoing interface of routes having only a next hop, with
+                            targeted queries of the rib (default False). Every recursion step is a
+                            further <get>, see query_next_hop_interface().
         Returns:
             list: List of default route entries
         Similar cli command:
             show ip route 0.0.0.0 0.0.0.0
         '''
-        filter_xml = '''
-            <filter>
-                <routing-state xmlns="urn:ietf:params:xml:ns:yang:ietf-routing">
-                </routing-state>
-            </filter>
+        if source == 'ietf':
+            response = self.netconf_get(filter=default_routes_filter(version).to_xml())
+            routes = parse_default_routes(response, version)
+        elif source == 'native':
+            response = self.netconf_get(filter=native_default_routes_filter(version).to_xml())
+            routes = parse_native_default_routes(response, version)
+        else:
+            raise JeyPyatsValueError(
+                f"Unknown default route source '{source}', expected one of {', '.join(DEFAULT_ROUTE_SOURCES)}")
+
+        if resolve:
+            for route in routes:
+                if route['interface'] is None and route['next_hop']:
+                    route['interface'] = query_next_hop_interface(self, route['next_hop'])
+        return routes
+
+    def get_ipv6_default_routes(self, source='ietf', resolve=False):
         '''
-        response = self.netconf_get(filter=filter_xml)
-        # Remove XML declaration if present
-        xml_content = response.xml
-        if xml_content.startswith('<?xml'):
-            xml_content = xml_content.split('?>', 1)[1].strip()
-        xml_data = etree.fromstring(xml_content.encode('utf-8'), parser)
-        data_dict = xmltodict.parse(etree.tostring(xml_data))
-
-        # Fix interface for default route if None
-        routing_state = data_dict.get('rpc-reply', {}).get('data', {}).get('routing-state', {})
-        routing_instances = routing_state.get('routing-instance', [])
-        if isinstance(routing_instances, list):
-            for ri in routing_instances:
-                if ri.get('name') == 'default':
-                    ribs = ri.get('ribs', {}).get('rib', [])
-                    if isinstance(ribs, list):
-                        for rib in ribs:
-                            if rib.get('name') == 'ipv4-default':
-                                routes = rib.get('routes', {}).get('route', [])
-                                if isinstance(routes, list):
-                                    for route in routes:
-                                        if route.get('destination-prefix') == '0.0.0.0/0':
-                                            next_hop = route.get('next-hop', {})
-                                            if next_hop.get('outgoing-interface') is None:
-                                                next_hop_addr = next_hop.get('next-hop-address')
-                                                if next_hop_addr:
-                                                    # Assume /24 network
-                                                    network = '.'.join(next_hop_addr.split('.')[:3]) + '.0/24'
-                                                    # Find the route for this network
-                                                    for r in routes:
-                                                        if r.get('destination-prefix') == network:
-                                                            intf = r.get('next-hop', {}).get('outgoing-interface')
-                                                            if intf:
-                                                                next_hop['outgoing-interface'] = intf
-                                                            break
-
-        # Navigate to routing table entries
-        try:
-            rpc_reply = data_dict.get("rpc-reply", {})
-            data = rpc_reply.get("data", {})
-            routing_state = data.get("routing-state", {})
-            routing_instances = routing_state.get("routing-instance", [])
-
-            # Find the default routing instance
-            routing_instance = None
-            if isinstance(routing_instances, list):
-                for ri in routing_instances:
-                    if ri.get("name") == "default":
-                        routing_instance = ri
-                        break
-            elif isinstance(routing_instances, dict):
-                if routing_instances.get("name") == "default":
-                    routing_instance = routing_instances
-
-            if routing_instance is None:
-                return []
-
-            ribs = routing_instance.get("ribs", {})
-            rib_list = ribs.get("rib", [])
-
-            # Find the ipv4-default rib
-            rib = None
-            if isinstance(rib_list, list):
-                for r in rib_list:
-                    if r.get("name") == "ipv4-default":
-                        rib = r
-                        break
-            elif isinstance(rib_list, dict):
-                if rib_list.get("name") == "ipv4-default":
-                    rib = rib_list
-
-            if rib is None:
-                return []
-
-            routes = rib.get("routes", {})
-            route_entries = routes.get("route", [])
-
-            # Handle both single entry (dict) and multiple entries (list)
-            if isinstance(route_entries, dict):
-                routing_entries = [route_entries]
-            else:
-                routing_entries = route_entries
-
-            parsed_entries = []
-
-            for entry in routing_entries:
-                if entry.get('destination-prefix') == '0.0.0.0/0':
-                    next_hop = entry.get('next-hop', {})
-                    parsed_entry = {
-                        'prefix': entry.get('destination-prefix'),
-                        'protocol': entry.get('source-protocol'),
-                        'next_hop': next_hop.get('next-hop-address') if next_hop else None,
-                        'metric': entry.get('metric'),
-                        'interface': next_hop.get('outgoing-interface') if next_hop else None,
-                    }
-                    parsed_entries.append(parsed_entry)
-
-            return parsed_entries
-        except (KeyError, TypeError):
-            # If the expected structure is not found, return empty list
-            return []
+        Get IPv6 default route entries from the global routing table
+        Args:
+            source (str): 'ietf' or 'native', see get_routing_table_default_routes
+            resolve (bool): resolve the outgoing interface of routes having only a next hop (default False)
+        Returns:
+            list: List of default route entries
+        Similar cli command:
+            show ipv6 route ::/0
+        '''
+        return IOSXERoutingParsersMixin.get_routing_table_default_routes(self, 6, source, resolve)
 
     @classmethod
     def bind_to_device(cls, device):
-        setattr(device, 'get_routing_table_default_routes', cls.get_routing_table_default_routes.__get__(device, type(device)))
+        for name in ('get_routing_table_default_routes', 'get_ipv6_default_routes',
+                     'get_vrf_names', 'get_routing_tables'):
+            setattr(device, name, getattr(cls, name).__get__(device, type(device)))
@@ -20,98 +20,218 @@ __license__ = "Netalps, Copyright 2026. All rights reserved."
 '''
 Pyats IOS XE Syslog parsers using Netconf
 This module contains parsers to retrieve syslog messages from Cisco IOS XE devices via Netconf.
-It includes functions to get syslog messages and filter them.
+It includes functions to get syslog messages and filter them, parsing only the lines appended
+to the logging buffer since the previous read of the device.
 The parsers utilize XML filters to query the device and parse the XML responses into structured data.
 Each function is designed to handle specific syslog operations and return relevant information in a user-friendly format.
-The module leverages the Genie and lxml libraries for XML parsing and data extraction.
+The module leverages the lxml library for XML parsing and data extraction.
 '''
+import functools
+import hashlib
 import logging
-import xmltodict
-from genie.utils import Dq
-from lxml import etree
-from ...utils import BASE_RPC
-from packaging import version
-import json
+import re
+from ...utils.debug_dump import dump_payload
+from ...utils.filters import SubtreeFilter
+from ...utils.reply_decoder import first_record
 
 
-
-logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
 logger = logging.getLogger(__name__)
 
-parser = etree.XMLParser()
-parser.set_element_class_lookup(
-    etree.ElementDefaultClassLookup(element=etree.ElementBase)
-)
+IOSXE_LOGGING_NS = 'http://cisco.com/ns/yang/Cisco-IOS-XE-logging'
+
+
+def syslog_messages_filter(filter_text=None):
+    '''
+    Builds the subtree filter of get_syslog_messages
+    Args:
+        filter_text (str): unused, the text filter is applied by parse_syslog_messages
+                           since the buffer is a single leaf
+    Returns:
+        SubtreeFilter: buffered logging messages
+    '''
+    return SubtreeFilter(IOSXE_LOGGING_NS, 'logging/buffered/messages')
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_filter_texts(texts):
+    return re.compile('|'.join(re.escape(text) for text in texts), re.IGNORECASE)
+
+
+def compile_syslog_filter(filter_text):
+    '''
+    Compiles one or several filter texts into a single case insensitive regex
+    Args:
+        filter_text (str | list): text, or texts, a message must contain (any of them)
+    Returns:
+        re.Pattern: compiled filter, None without filter text
+    '''
+    if not filter_text:
+        return None
+    texts = (filter_text,) if isinstance(filter_text, str) else tuple(filter_text)
+    return _compile_filter_texts(texts)
+
+
+def parse_syslog_line(line):
+    '''
+    Parses a buffered logging line
+    Args:
+        line (str): '*timestamp: %facility-severity-MNEMONIC: message'
+    Returns:
+        dict: {'timestamp', 'facility', 'text'}, None if the line is not a message
+    '''
+    if not line.startswith('*'):
+        return None
+    parts = line.split(':', 2)
+    if len(parts) < 3:
+        return None
+    return {
+        'timestamp': parts[0][1:].strip(),  # remove *
+        'facility': parts[1].strip(),
+        'text': parts[2].strip(),
+    }
+
+
+def _buffered_messages(response):
+    logging_data = first_record(response.xml, 'logging/buffered/messages')
+    if not logging_data:
+        return ''
+    # messages is a single string leaf, one message per line
+    messages_text = logging_data if isinstance(logging_data, str) else str(logging_data)
+    return messages_text.strip()
+
+
+def parse_syslog_messages(response, filter_text=None):
+    '''
+    Parses the syslog messages out of a NETCONF reply
+    Args:
+        response: NETCONF reply of a <get> including the syslog_messages_filter() subtree
+        filter_text (str | list): Text, or texts, to filter messages containing one of them
+    Returns:
+        list: List of syslog messages
+    '''
+    messages_text = _buffered_messages(response)
+    if not messages_text:
+        return []
+
+    parsed_messages = [message for message in map(parse_syslog_line, messages_text.split('\n')) if message]
+    matcher = compile_syslog_filter(filter_text)
+    if matcher is not None:
+        parsed_messages = [message for message in parsed_messages if matcher.search(message['text'])]
+    return parsed_messages
+
+
+def _find_unique_line(text, line):
+    # offset of line as a whole line of text, -1 if absent or if it occurs more than once
+    found, end = -1, len(text)
+    while True:
+        offset = text.rfind(line, 0, end)
+        if offset == -1:
+            return found
+        stop = offset + len(line)
+        if (offset == 0 or text[offset - 1] == '\n') and (stop == len(text) or text[stop] == '\n'):
+            if found != -1:
+                return -1
+            found = offset
+        end = stop - 1
+
+
+def _digest(data):
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class SyslogCursor:
+    '''
+    Position in the buffered logging of a device
+
+    The cursor keeps the size and a digest of the buffer, and its last line. On the next read,
+    a buffer starting with the previous one is only appended to: the lines after it are split and
+    parsed, the messages of the previous lines being reused. A wrapped buffer is located after the
+    last seen line when that line occurs once in it. A buffer cleared, wrapped past the last seen
+    line, or where this line is repeated, is parsed from the start.
+
+    Attributes:
+        sequence (int): number of lines seen since the cursor was created
+        messages (list): parsed messages of the lines in the buffer at the last read
+    '''
+
+    __slots__ = ('digest', 'size', 'last_line', 'sequence', '_lines')
+
+    def __init__(self):
+        self.digest = None
+        # size of the buffer in bytes at the last read
+        self.size = 0
+        self.last_line = None
+        self.sequence = 0
+        # parsed message, or None, of every line of the buffer at the last read
+        self._lines = []
+
+    @property
+    def messages(self):
+        return [message for message in self._lines if message]
+
+    def advance(self, messages_text):
+        '''
+        Moves the cursor to the end of the buffer
+        Args:
+            messages_text (str): stripped buffered logging
+        Returns:
+            list: messages of the lines appended since the previous read
+        '''
+        data = messages_text.encode('utf-8')
+        digest = _digest(data)
+        if digest == self.digest:
+            return []
+
+        appended_text, retained = messages_text, 0
+        if self.last_line is not None:
+            if data[self.size:self.size + 1] == b'\n' and _digest(memoryview(data)[:self.size]) == self.digest:
+                # the previous buffer is unchanged, lines were only appended
+                appended_text = data[self.size + 1:].decode('utf-8')
+                retained = len(self._lines)
+            else:
+                offset = _find_unique_line(messages_text, self.last_line)
+                if offset != -1:
+                    appended_text = messages_text[offset + len(self.last_line) + 1:]
+                    retained = messages_text.count('\n', 0, offset) + 1
+
+        appended = appended_text.split('\n') if appended_text else []
+        new_lines = [parse_syslog_line(line) for line in appended]
+        self._lines = (self._lines[-retained:] if retained else []) + new_lines
+        self.sequence += len(new_lines)
+        self.digest = digest
+        self.size = len(data)
+        if appended:
+            self.last_line = appended[-1]
+        elif not messages_text:
+            self.last_line = None
+        return [message for message in new_lines if message]
+
 
 class IOSXESyslogParsersMixin:
     '''
     Collection of RPCs for parsing syslog information on IOS-XE devices
     '''
-    def get_syslog_messages(self, filter_text=None):
+    def get_syslog_messages(self, filter_text=None, new_only=False):
         '''
         Get syslog messages
+        Only the lines appended since the previous call are parsed, the device keeps a SyslogCursor.
         Args:
-            filter_text (str): Text to filter messages containing this string
+            filter_text (str | list): Text, or texts, to filter messages containing one of them
+            new_only (bool): only return the messages appended since the previous call
         Returns:
             list: List of syslog messages
         '''
-        filter_xml = '''
-            <filter>
-                <logging xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-logging">
-                    <buffered>
-                        <messages>
-                        </messages>
-                    </buffered>
-                </logging>
-            </filter>
-        '''
-        response = self.netconf_get(filter=filter_xml)
-        # Remove XML declaration if present
-        xml_content = response.xml
-        if xml_content.startswith('<?xml'):
-            xml_content = xml_content.split('?>', 1)[1].strip()
-        xml_data = etree.fromstring(xml_content.encode('utf-8'), parser)
-        data_dict = xmltodict.parse(etree.tostring(xml_data))
-
-        print(f"DEBUG SYSLOG: data_dict = {json.dumps(data_dict, indent=2)}")  # Debug print
-
-        # Check if data is None
-        data = data_dict.get('rpc-reply', {}).get('data')
-        if data is None:
-            return []
-
-        # Navigate to syslog messages
-        logging_data = data.get('logging', {}).get('buffered', {}).get('messages')
-        if not logging_data:
-            return []
-
-        # messages is a string, split into lines
-        messages_text = logging_data if isinstance(logging_data, str) else str(logging_data)
-        lines = messages_text.strip().split('\n')
-
-        parsed_messages = []
-
-        for line in lines:
-            if line.strip():
-                # Parse line: *timestamp: %facility-severity-MNEMONIC: message
-                if line.startswith('*'):
-                    parts = line.split(':', 2)
-                    if len(parts) >= 3:
-                        timestamp = parts[0][1:].strip()  # remove *
-                        facility = parts[1].strip()
-                        text = parts[2].strip()
-                        parsed_msg = {
-                            'timestamp': timestamp,
-                            'facility': facility,
-                            'text': text,
-                        }
-                        if filter_text:
-                            if filter_text.lower() in text.lower():
-                                parsed_messages.append(parsed_msg)
-                        else:
-                            parsed_messages.append(parsed_msg)
-
-        return parsed_messages
+        response = self.netconf_get(filter=syslog_messages_filter().to_xml())
+        cursor = vars(self).get('syslog_cursor')
+        if cursor is None:
+            cursor = self.syslog_cursor = SyslogCursor()
+        new_messages = cursor.advance(_buffered_messages(response))
+        messages = new_messages if new_only else cursor.messages
+        matcher = compile_syslog_filter(filter_text)
+        if matcher is not None:
+            messages = [message for message in messages if matcher.search(message['text'])]
+        dump_payload(logger, "Syslog messages", messages, device=self)
+        return messages
 
     @classmethod
     def bind_to_device(cls, device):
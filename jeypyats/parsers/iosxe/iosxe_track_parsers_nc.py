@@ -22,18 +22,62 @@ Pyats IOS XE Track parsers using Netconf
 This module contains parsers to retrieve Track information from Cisco IOS XE devices via Netconf.
 '''
 import logging
-import xmltodict
-from lxml import etree
-from ...utils import BASE_RPC
+from ...utils.filters import SubtreeFilter
+from ...utils.schemas import ExtractionSchema
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
 logger = logging.getLogger(__name__)
 
-parser = etree.XMLParser()
-parser.set_element_class_lookup(
-    etree.ElementDefaultClassLookup(element=etree.ElementBase)
+IOSXE_TRACK_OPER_NS = 'http://cisco.com/ns/yang/Cisco-IOS-XE-track-oper'
+
+# Extraction schema, compiled once at import
+TRACK_SCHEMA = ExtractionSchema(
+    'tracks/track',
+    {'track_id': 'track-number', 'state': 'track-state'},
+    namespace=IOSXE_TRACK_OPER_NS,
 )
 
+
+def track_states_filter():
+    '''
+    Builds the subtree filter of get_track_states
+
+    Returns:
+        SubtreeFilter: track number and state of every track
+    '''
+    return SubtreeFilter(IOSXE_TRACK_OPER_NS, 'tracks/track', leaves=['track-number', 'track-state'])
+
+
+def parse_track_states(response):
+    '''
+    Parses the track states out of a NETCONF reply
+
+    Args:
+        response: NETCONF reply of a <get> including the track_states_filter() subtree
+
+    Returns:
+        dict: Dictionary of track IDs and their states.
+    '''
+    # Check if response is valid
+    if not response or not hasattr(response, 'xml') or response.xml is None:
+        logger.warning("NETCONF response is invalid or empty for track states")
+        return {}
+
+    # Check for RPC errors
+    if '<rpc-error>' in response.xml:
+        logger.error(f"NETCONF RPC error in track response: {response.xml}")
+        return {}
+
+    try:
+        track_states = {}
+        for track in TRACK_SCHEMA.iter_extract(response.xml):
+            if track['track_id']:
+                track_states[track['track_id']] = {'state': track['state']}
+        return track_states
+    except Exception as e:
+        logger.error(f"Error parsing track response: {e}")
+        return {}
+
+
 class IOSXETrackParsersMixin:
     '''
     Collection of RPCs for parsing Track information on IOS-XE devices
@@ -45,51 +89,8 @@ class IOSXETrackParsersMixin:
         Returns:
             dict: Dictionary of track IDs and their states.
         '''
-        track_filter = '''
-        <filter>
-            <tracks xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-track-oper">
-                <track/>
-            </tracks>
-        </filter>
-        '''
-        response = self.netconf_get(filter=track_filter)
-
-        # Check if response is valid
-        if not response or not hasattr(response, 'xml') or response.xml is None:
-            logger.warning("NETCONF response is invalid or empty for track states")
-            return {}
-
-        # Check for RPC errors
-        if '<rpc-error>' in response.xml:
-            logger.error(f"NETCONF RPC error in track response: {response.xml}")
-            return {}
-
-        try:
-            # Remove XML declaration if present
-            xml_content = response.xml
-            if xml_content.startswith('<?xml'):
-                xml_content = xml_content.split('?>', 1)[1].strip()
-            xml_data = etree.fromstring(xml_content.encode('utf-8'), parser)
-            data_dict = xmltodict.parse(etree.tostring(xml_data))
-
-            if data_dict is None:
-                logger.warning("Failed to parse XML response for track states")
-                return {}
-
-            track_states = {}
-            tracks = data_dict.get('rpc-reply', {}).get('data', {}).get('tracks', {})
-            track_list = tracks.get('track', [])
-            if isinstance(track_list, dict):
-                track_list = [track_list]
-            for track in track_list:
-                track_id = track.get('track-number')
-                state = track.get('track-state')
-                if track_id:
-                    track_states[str(track_id)] = {'state': state}
-            return track_states
-        except Exception as e:
-            logger.error(f"Error parsing track response: {e}")
-            return {}
+        response = self.netconf_get(filter=track_states_filter().to_xml())
+        return parse_track_states(response)
 
     @classmethod
     def bind_to_device(cls, device):
@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: __init__.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 17:12:04
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 17:12:04
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+IOS-XE mixin library: polling waits (waits.WaitsMixin)
+'''
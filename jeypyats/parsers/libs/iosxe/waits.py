@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: waits.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 17:14:36
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 17:14:36
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+Pyats IOS XE polling waits using Netconf
+This module provides WaitsMixin, loaded by guess_and_load_mixin and apply_netconf_parsers.
+Each wait polls a NETCONF parser until the expected state is reached, sleeping with an
+exponential backoff between polls, and returns the measured convergence time, so that
+testcases wait exactly as long as the device needs instead of a fixed time.sleep().
+A wait that does not converge before its timeout raises JeyPyatsStateError.
+Polls bypass the reply cache of the device, if enabled.
+'''
+
+import logging
+import time
+from ....utils.utils import JeyPyatsStateError
+from ....utils.reply_cache import fresh_reads
+from ...iosxe.iosxe_routing_parsers_nc import query_next_hop_interface
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    'WaitResult',
+    'poll_until',
+    'WaitsMixin',
+]
+
+
+class WaitResult:
+    '''
+    Outcome of a converged wait
+
+    Attributes:
+        value: last value returned by the polled function
+        elapsed (float): convergence time in seconds, from the start of the wait to the matching poll
+        attempts (int): number of polls
+    '''
+
+    __slots__ = ('value', 'elapsed', 'attempts')
+
+    def __init__(self, value, elapsed, attempts):
+        self.value = value
+        self.elapsed = elapsed
+        self.attempts = attempts
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(elapsed={self.elapsed:.2f}, attempts={self.attempts})"
+
+
+def poll_until(poll, condition, timeout=60, interval=1, backoff=1.5, max_interval=10, description='condition'):
+    '''
+    Polls a function until its value satisfies a condition
+
+    Args:
+        poll (callable): function returning the current state, e.g. device.get_track_states
+        condition (callable): predicate called with the polled value
+        timeout (float): seconds before giving up (default 60)
+        interval (float): first sleep between polls in seconds (default 1)
+        backoff (float): factor applied to the sleep after each poll (default 1.5)
+        max_interval (float): upper bound of the sleep between polls (default 10)
+        description (str): what is waited for, used in logs and errors
+
+    Returns:
+        WaitResult: last polled value and convergence time
+
+    Raises:
+        JeyPyatsStateError: the condition is still not satisfied after timeout seconds
+    '''
+    start = time.monotonic()
+    deadline = start + timeout
+    attempts = 0
+    value = None
+    while True:
+        attempts += 1
+        try:
+            # the state is changing: a reply cache must not answer the polls
+            with fresh_reads():
+                value = poll()
+            if condition(value):
+                elapsed = time.monotonic() - start
+                logger.info(f"{description} reached after {elapsed:.2f}s ({attempts} polls)")
+                return WaitResult(value, elapsed, attempts)
+        except JeyPyatsStateError:
+            raise
+        except Exception as e:
+            # the device may be busy converging: keep polling until the deadline
+            logger.debug(f"Polling for {description} failed: {e}")
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise JeyPyatsStateError(
+                f"Timed out after {timeout}s ({attempts} polls) waiting for {description}, last value: {value}"
+            )
+        time.sleep(min(interval, remaining))
+        interval = min(interval * backoff, max_interval)
+
+
+class WaitsMixin:
+    '''
+    Collection of polling waits on IOS-XE devices, built on the NETCONF parsers
+    '''
+    def wait_for_default_route(self, next_hop=None, interface=None, timeout=90, interval=1, backoff=1.5,
+                               max_interval=10):
+        '''
+        Waits until a default route via next_hop and/or interface is installed
+
+        The default routes are polled without resolution. When an interface is expected, the
+        interface of a candidate route having only a next hop is resolved with targeted queries
+        of the rib, once per next hop for the whole wait.
+
+        Args:
+            next_hop (str, optional): expected next hop, e.g. '82.66.83.254'
+            interface (str, optional): expected outgoing interface, e.g. 'Cellular0/2/0'
+            timeout, interval, backoff, max_interval: see poll_until()
+
+        Returns:
+            WaitResult: default routes and convergence time
+        '''
+        if next_hop is None and interface is None:
+            raise ValueError("next_hop or interface must be given")
+
+        def matches(routes):
+            return any(
+                (next_hop is None or route.get('next_hop') == next_hop)
+                and (interface is None or route.get('interface') == interface)
+                for route in routes or []
+            )
+
+        interfaces = {}
+
+        def default_routes():
+            routes = self.get_routing_table_default_routes(resolve=False)
+            if interface is None:
+                return routes
+            for route in routes or []:
+                hop = route.get('next_hop')
+                if route.get('interface') is not None or not hop or next_hop not in (None, hop):
+                    continue
+                if hop not in interfaces:
+                    resolved = query_next_hop_interface(self, hop)
+                    if resolved is None:
+                        # the route of the next hop may not be installed yet, retried on the next poll
+                        continue
+                    interfaces[hop] = resolved
+                route['interface'] = interfaces[hop]
+            return routes
+
+        target = ' '.join(part for part in (f"via {next_hop}" if next_hop else '',
+                                            f"on {interface}" if interface else '') if part)
+        return poll_until(default_routes, matches, timeout, interval, backoff, max_interval,
+                          description=f"default route {target}")
+
+    def wait_for_track_state(self, track_id, state='up', timeout=60, interval=1, backoff=1.5, max_interval=10):
+        '''
+        Waits until a track object reaches a state
+
+        Args:
+            track_id (str | int): track number
+            state (str): expected state (default 'up')
+            timeout, interval, backoff, max_interval: see poll_until()
+
+        Returns:
+            WaitResult: track states and convergence time
+        '''
+        track_id = str(track_id)
+        return poll_until(
+            self.get_track_states, lambda tracks: (tracks or {}).get(track_id, {}).get('state') == state,
+            timeout, interval, backoff, max_interval, description=f"track {track_id} {state}",
+        )
+
+    def wait_for_ip_sla_state(self, sla_id, oper_state='active', timeout=60, interval=1, backoff=1.5,
+                              max_interval=10):
+        '''
+        Waits until an IP SLA reaches an operational state
+
+        Args:
+            sla_id (str | int): SLA index
+            oper_state (str): expected operational state (default 'active')
+            timeout, interval, backoff, max_interval: see poll_until()
+
+        Returns:
+            WaitResult: SLA states and convergence time
+        '''
+        sla_id = str(sla_id)
+        return poll_until(
+            self.get_ip_sla_states, lambda slas: (slas or {}).get(sla_id, {}).get('oper_state') == oper_state,
+            timeout, interval, backoff, max_interval, description=f"IP SLA {sla_id} {oper_state}",
+        )
+
+    def wait_for_sim_slot(self, interface, slot, data_profile=None, timeout=120, interval=2, backoff=1.5,
+                          max_interval=15):
+        '''
+        Waits until a cellular interface runs on a SIM slot
+
+        Args:
+            interface (str): cellular interface, e.g. 'Cellular0/2/0'
+            slot (int): expected SIM slot
+            data_profile (int, optional): expected data profile
+            timeout, interval, backoff, max_interval: see poll_until()
+
+        Returns:
+            WaitResult: SIM config and convergence time
+        '''
+        def matches(sim_config):
+            return (sim_config or {}).get('slot') == slot and (
+                data_profile is None or sim_config.get('data_profile') == data_profile
+            )
+
+        return poll_until(
+            lambda: self.get_cellular_sim_config(interface), matches, timeout, interval, backoff, max_interval,
+            description=f"{interface} on SIM slot {slot}",
+        )
+
+    def wait_for_interface_status(self, interface, oper_status='up', timeout=60, interval=1, backoff=1.5,
+                                  max_interval=10):
+        '''
+        Waits until an interface reaches an operational status
+
+        Args:
+            interface (str): interface name
+            oper_status (str): expected operational status (default 'up')
+            timeout, interval, backoff, max_interval: see poll_until()
+
+        Returns:
+            WaitResult: interface status and convergence time
+        '''
+        return poll_until(
+            lambda: self.get_interface_status(interface),
+            lambda status: (status or {}).get('oper_status') == oper_status,
+            timeout, interval, backoff, max_interval, description=f"{interface} {oper_status}",
+        )
+
+    @classmethod
+    def bind_to_device(cls, device):
+        for name in ('wait_for_default_route', 'wait_for_track_state', 'wait_for_ip_sla_state',
+                     'wait_for_sim_slot', 'wait_for_interface_status'):
+            setattr(device, name, getattr(cls, name).__get__(device, type(device)))
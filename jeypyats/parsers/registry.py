@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: registry.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 19:32:10
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 19:32:10
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+Registry of the NETCONF parser mixins
+Mixins are registered by OS and name with the module defining them, and the module is only
+imported when the mixin is loaded, so that binding a device imports the parsers it uses and
+nothing else.
+'''
+
+import importlib
+
+__all__ = [
+    'NETCONF_PARSERS',
+    'register_parser',
+    'load_parser',
+    'load_parsers',
+]
+
+# os -> name -> (module relative to jeypyats.parsers, mixin class name), in binding order
+NETCONF_PARSERS = {
+    'iosxe': {
+        'cellular': ('iosxe.iosxe_cellular_parsers_nc', 'IOSXECellularParsersMixin'),
+        'syslog': ('iosxe.iosxe_syslog_parsers_nc', 'IOSXESyslogParsersMixin'),
+        'ip_sla': ('iosxe.iosxe_ip_sla_parsers_nc', 'IOSXEIPSLAParsersMixin'),
+        'track': ('iosxe.iosxe_track_parsers_nc', 'IOSXETrackParsersMixin'),
+        'routing': ('iosxe.iosxe_routing_parsers_nc', 'IOSXERoutingParsersMixin'),
+        'interface': ('iosxe.iosxe_interface_parsers_nc', 'IOSXEInterfacesParsersMixin'),
+        'eem': ('iosxe.iosxe_eem_parsers_nc', 'IOSXEEEMParsersMixin'),
+        'collect': ('iosxe.iosxe_collect_parsers_nc', 'IOSXECollectParsersMixin'),
+        'notification': ('iosxe.iosxe_notification_parsers_nc', 'IOSXENotificationParsersMixin'),
+        'waits': ('libs.iosxe.waits', 'WaitsMixin'),
+        'async': ('iosxe.iosxe_async_parsers_nc', 'IOSXEAsyncParsersMixin'),
+    },
+}
+
+_loaded = {}
+
+
+def register_parser(os, name, module, class_name):
+    '''
+    Registers a parser mixin
+
+    Args:
+        os (str): device OS, e.g. 'iosxe'
+        name (str): parser name, e.g. 'routing'
+        module (str): absolute module path, or path relative to jeypyats.parsers
+        class_name (str): mixin class name
+    '''
+    NETCONF_PARSERS.setdefault(os, {})[name] = (module, class_name)
+    _loaded.pop((os, name), None)
+
+
+def load_parser(os, name):
+    '''
+    Imports a registered parser mixin
+
+    Args:
+        os (str): device OS, e.g. 'iosxe'
+        name (str): parser name, e.g. 'routing'
+
+    Returns:
+        type: mixin class
+
+    Raises:
+        KeyError: no such parser registered for this OS
+    '''
+    key = (os, name)
+    mixin = _loaded.get(key)
+    if mixin is None:
+        module, class_name = NETCONF_PARSERS[os][name]
+        if not module.startswith('jeypyats.'):
+            module = f'{__package__}.{module}'
+        mixin = _loaded[key] = getattr(importlib.import_module(module), class_name)
+    return mixin
+
+
+def load_parsers(os, names=None):
+    '''
+    Imports registered parser mixins
+
+    Args:
+        os (str): device OS, e.g. 'iosxe'
+        names (iterable, optional): parser names, every parser of the OS by default
+
+    Returns:
+        list: mixin classes, in registration order when names is not given
+    '''
+    names = list(NETCONF_PARSERS[os]) if names is None else names
+    return [load_parser(os, name) for name in names]
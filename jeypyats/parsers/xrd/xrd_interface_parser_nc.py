@@ -23,73 +23,58 @@ __license__ = "Netalps, Copyright 2026. All rights reserved."
 Parser for retrieving interface status via Netconf using OpenConfig YANG models.
 '''
 
-import xmltodict
-from genie.utils import Dq
 from lxml import etree
-from ...utils import sanitize_xml, BASE_RPC
+from ...utils.debug_dump import dump_payload
+from ...utils.filters import SubtreeFilter
+from ...utils.schemas import ExtractionSchema
+from .xrd_interface_parser_nc_oc import table_status
 import logging
 
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
 logger = logging.getLogger(__name__)
 
-parser = etree.XMLParser()
-parser.set_element_class_lookup(
-    etree.ElementDefaultClassLookup(element=etree.ElementBase)
+
+OPENCONFIG_INTERFACES_NS = 'http://openconfig.net/yang/interfaces'
+
+# Extraction schema, compiled once at import
+OPENCONFIG_STATE_SCHEMA = ExtractionSchema(
+    'interfaces/interface',
+    {'name': 'state/name', 'oper-status': 'state/oper-status'},
+    namespace=OPENCONFIG_INTERFACES_NS,
 )
 
 
-def get_interface_status(self):
+def get_interface_status(self, interface_name=None, table=None):
     """
     Récupère le statut des interfaces via NETCONF.
 
     Utilise un filtre subtree correct avec la méthode dispatch.
+    Si interface_name est fourni, seule cette interface est transférée.
+    Si une InterfaceTable est fournie (table), le statut en est lu sans requête.
     """
-    xml_rpc = """
-      <interfaces xmlns="http://openconfig.net/yang/interfaces">
-        <interface>
-          <state>
-            <name/>
-            <oper-status/>
-          </state>
-        </interface>
-      </interfaces>
-    """
-
-    parser = etree.XMLParser(remove_blank_text=True)
-
-    # Construction du filtre subtree avec le XML demandé
-    filter_xml = f"""
-      <filter xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" type="subtree">
-        {xml_rpc}
-      </filter>
-    """
-
-    filter_element = etree.fromstring(filter_xml, parser)
+    if table is not None:
+        return table_status(table, interface_name)
+    # Construction du filtre subtree (clé <name> injectée si une interface est demandée)
+    filter_element = SubtreeFilter(
+        OPENCONFIG_INTERFACES_NS, 'interfaces/interface',
+        keys={'name': interface_name}, leaves=['state/name', 'state/oper-status'],
+    ).to_element()
 
     # Création de l'élément <get> et ajout du filtre
     get_element = etree.Element("{urn:ietf:params:xml:ns:netconf:base:1.0}get")
     get_element.append(filter_element)
 
-    logger.info(f"Envoi de la requête NETCONF:\n{etree.tostring(get_element, pretty_print=True).decode()}")
+    dump_payload(logger, "Envoi de la requête NETCONF", get_element, device=self)
 
     # Envoi de la requête via dispatch (recommandé pour éléments XML personnalisés)
     reply = self.dispatch(get_element)
 
-    logger.info(f"Réponse reçue: {reply.xml}")
+    dump_payload(logger, "Réponse reçue", reply, device=self)
 
-    # Parsing de la réponse
-    reply_dict = xmltodict.parse(reply.xml)
-
-    if not reply.ok or not reply_dict.get("rpc-reply", {}).get("data"):
+    if not reply.ok:
         return []
 
-    interfaces = Dq(reply_dict).get_values("interface")
-    results = []
-    for intf in interfaces:
-        state = intf.get("state", {})
-        results.append({
-            "name": state.get("name"),
-            "oper-status": state.get("oper-status")
-        })
+    # Parsing de la réponse
+    results = OPENCONFIG_STATE_SCHEMA.extract(reply.xml)
+    dump_payload(logger, "The interfaces data", results, device=self)
     return results
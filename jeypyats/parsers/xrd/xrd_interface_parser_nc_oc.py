@@ -24,66 +24,96 @@ Parser for retrieving interface status via Netconf using OpenConfig YANG models.
 '''
 
 import logging
-import xmltodict
-import pprint
-from genie.utils import Dq
 from lxml import etree
-from ...utils import BASE_RPC
+from ...utils.debug_dump import dump_payload
+from ...utils.filters import SubtreeFilter
+from ...utils.interface_counters import COUNTER_FIELDS
+from ...utils.schemas import ExtractionSchema
 
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
 logger = logging.getLogger(__name__)
 
-parser = etree.XMLParser()
-parser.set_element_class_lookup(
-    etree.ElementDefaultClassLookup(element=etree.ElementBase)
+
+OPENCONFIG_INTERFACES_NS = 'http://openconfig.net/yang/interfaces'
+
+# Extraction schema, compiled once at import
+OPENCONFIG_STATE_SCHEMA = ExtractionSchema(
+    'interfaces/interface',
+    {'name': 'state/name', 'oper-status': 'state/oper-status'},
+    namespace=OPENCONFIG_INTERFACES_NS,
+)
+
+# OpenConfig counters, in the format of the IOS-XE get_interface_counters() for a CounterSampler
+COUNTER_LEAVES = {field: f"state/counters/{field.replace('_', '-')}" for field in COUNTER_FIELDS}
+
+OPENCONFIG_COUNTERS_SCHEMA = ExtractionSchema(
+    'interfaces/interface',
+    {'name': 'name', **{field: (leaf, int) for field, leaf in COUNTER_LEAVES.items()},
+     'discontinuity_time': 'state/counters/last-clear'},
+    namespace=OPENCONFIG_INTERFACES_NS,
 )
 
-def get_interface_status_oc(self):
+
+def table_status(table, interface_name=None):
+    '''
+    Status view of an InterfaceTable, in the format of get_interface_status_oc()
+
+    Returns:
+        list: [{'name': ..., 'oper-status': 'UP'}] of every interface, or of interface_name only,
+              read from the OpenConfig records of the table
+    '''
+    return [{'name': record['name'], 'oper-status': record['oper_status']}
+            for record in table.records('openconfig', interface_name)]
+
+
+def get_interface_status_oc(self, interface_name=None, table=None):
     """
     Retrieve the status of a specified network interface via Netconf
+
+    Args:
+        interface_name (str, optional): only retrieve this interface. If None, all interfaces are retrieved.
+        table (InterfaceTable, optional): answer from this table instead of querying the device
     """
-    xml_rpc = """
-      <interfaces xmlns="http://openconfig.net/yang/interfaces">
-        <interface>
-          <state>
-            <name/>
-            <oper-status/>
-          </state>
-        </interface>
-      </interfaces>
-    """
-    filter_xml = f"""
-      <filter xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" type="subtree">
-        {xml_rpc}
-      </filter>
-    """
-    filter_element = etree.fromstring(filter_xml, parser)
+    if table is not None:
+        return table_status(table, interface_name)
+    filter_element = SubtreeFilter(
+        OPENCONFIG_INTERFACES_NS, 'interfaces/interface',
+        keys={'name': interface_name}, leaves=['state/name', 'state/oper-status'],
+    ).to_element()
     get_element = etree.Element("{urn:ietf:params:xml:ns:netconf:base:1.0}get")
     get_element.append(filter_element)
-    logger.info(f"Envoi de la requête NETCONF:\n{etree.tostring(get_element, pretty_print=True).decode()}")
+    dump_payload(logger, "Envoi de la requête NETCONF", get_element, device=self)
     reply = self.dispatch(get_element)
-    logger.info(f"Réponse reçue: {reply.xml}")
-    reply_dict = xmltodict.parse(reply.xml)
-    if not reply.ok or not reply_dict.get("rpc-reply", {}).get("data"):
+    dump_payload(logger, "Réponse reçue", reply, device=self)
+    if not reply.ok:
         return []
-    logger.info(f"Full parsed RPC reply:\n{pprint.pformat(reply_dict, indent=2)}")
     # Navigate to the interface data
-    data = reply_dict.get("rpc-reply", {}).get("data", {})
-    interfaces_data = data.get("interfaces", {}).get("interface", [])
-
-    # Handle both single interface (dict) and multiple interfaces (list)
-    if isinstance(interfaces_data, dict):
-        interfaces = [interfaces_data]
-    else:
-        interfaces = interfaces_data
-
-    logger.info(f"The interfaces data:\n{pprint.pformat(interfaces, indent=2)}")
-    results = []
-    for intf in interfaces:
-        state = intf.get("state", {})
-        results.append({
-            "name": state.get("name"),
-            "oper-status": state.get("oper-status")
-        })
+    results = OPENCONFIG_STATE_SCHEMA.extract(reply.xml)
+    dump_payload(logger, "The interfaces data", results, device=self)
     return results
+
+
+def get_interface_counters_oc(self, interface_name=None):
+    """
+    Retrieve the octet, error and discard counters of the interfaces via Netconf
+
+    Args:
+        interface_name (str, optional): only retrieve this interface. If None, all interfaces are retrieved.
+
+    Returns:
+        list: [{'name', 'in_octets', 'out_octets', 'in_errors', 'out_errors', 'in_discards', 'out_discards',
+               'discontinuity_time'}], to feed a CounterSampler
+    """
+    filter_element = SubtreeFilter(
+        OPENCONFIG_INTERFACES_NS, 'interfaces/interface',
+        keys={'name': interface_name},
+        leaves=['name', *COUNTER_LEAVES.values(), 'state/counters/last-clear'],
+    ).to_element()
+    get_element = etree.Element("{urn:ietf:params:xml:ns:netconf:base:1.0}get")
+    get_element.append(filter_element)
+    reply = self.dispatch(get_element)
+    if not reply.ok:
+        return []
+    counters = OPENCONFIG_COUNTERS_SCHEMA.extract(reply.xml)
+    logger.info(f"Interface counters retrieved, {len(counters)} interfaces")
+    return counters
@@ -21,72 +21,124 @@ __license__ = "Netalps, Copyright 2026. All rights reserved."
 
 '''
 Parser for retrieving interface status via Netconf using Cisco IOS XR YANG models.
+collect_interface_table_xr() reads the OpenConfig and IOS XR states of every interface with a single
+<get> into an InterfaceTable, which the status functions of the XRd parsers accept instead of an RPC.
 '''
 
 import logging
-import xmltodict
-import pprint
-from genie.utils import Dq
 from lxml import etree
-from ...utils import BASE_RPC
+from ...utils.debug_dump import dump_payload
+from ...utils.filters import SubtreeFilter
+from ...utils.interface_table import InterfaceTable
+from ...utils.schemas import ExtractionSchema
+from .xrd_interface_parser_nc_oc import OPENCONFIG_INTERFACES_NS
 
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
 logger = logging.getLogger(__name__)
 
-parser = etree.XMLParser()
-parser.set_element_class_lookup(
-    etree.ElementDefaultClassLookup(element=etree.ElementBase)
+
+XR_PFI_IM_CMD_OPER_NS = 'http://cisco.com/ns/yang/Cisco-IOS-XR-pfi-im-cmd-oper'
+
+# Extraction schema, compiled once at import
+XR_INTERFACE_SCHEMA = ExtractionSchema(
+    'interfaces/interface-xr/interface',
+    {'interface-name': 'interface-name', 'state': 'state'},
+    namespace=XR_PFI_IM_CMD_OPER_NS,
+)
+
+# Interface table schemas, the IOS XR state gives the oper status (and the admin status when admin down)
+XR_INTERFACE_TABLE_SCHEMA = ExtractionSchema(
+    'interfaces/interface-xr/interface',
+    {'name': 'interface-name', 'state': 'state', 'description': 'description'},
+    namespace=XR_PFI_IM_CMD_OPER_NS,
+)
+
+OPENCONFIG_INTERFACE_TABLE_SCHEMA = ExtractionSchema(
+    'interfaces/interface',
+    {'name': 'name', 'oper_status': 'state/oper-status', 'admin_status': 'state/admin-status',
+     'description': 'state/description'},
+    namespace=OPENCONFIG_INTERFACES_NS,
 )
 
-def get_interface_status_xr(self):
+
+def interface_table_filter_element():
+    '''
+    Builds the filter of collect_interface_table_xr, for dispatch()
+
+    Returns:
+        lxml.etree._Element: '<filter type="subtree">' with the OpenConfig and IOS XR interface subtrees
+    '''
+    filter_element = SubtreeFilter(
+        OPENCONFIG_INTERFACES_NS, 'interfaces/interface',
+        leaves=['name', 'state/oper-status', 'state/admin-status', 'state/description'],
+    ).to_element()
+    xr_filter = SubtreeFilter(
+        XR_PFI_IM_CMD_OPER_NS, 'interfaces/interface-xr/interface',
+        leaves=['interface-name', 'description', 'state'],
+    ).to_element()
+    filter_element.extend(list(xr_filter))
+    return filter_element
+
+
+def parse_interface_table_xr(xml):
+    '''
+    Parses the OpenConfig and IOS XR interface states of a reply
+
+    Returns:
+        InterfaceTable: one row per interface, OpenConfig first
+    '''
+    table = InterfaceTable()
+    for record in OPENCONFIG_INTERFACE_TABLE_SCHEMA.iter_extract(xml):
+        table.add(record, 'openconfig')
+    for record in XR_INTERFACE_TABLE_SCHEMA.iter_extract(xml):
+        state = record['oper_status'] = record['state']
+        if state:
+            record['admin_status'] = 'down' if state == 'im-state-admin-down' else 'up'
+        table.add(record, 'xr')
+    return table
+
+
+def collect_interface_table_xr(self):
     """
-    Retrieve the status of a specified network interface via Netconf
+    Retrieve the state of every interface in the OpenConfig and IOS XR models with a single get
+
+    Returns:
+        InterfaceTable: interface states, also stored as self.interface_table. None if the get failed.
     """
-    xml_rpc = """
-    <interfaces xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-pfi-im-cmd-oper">
-        <interface-xr>
-            <interface>
-                <interface-name/>
-                <description/>
-                <line-state/>
-                <state/>
-            </interface>
-        </interface-xr>
-    </interfaces>
+    get_element = etree.Element("{urn:ietf:params:xml:ns:netconf:base:1.0}get")
+    get_element.append(interface_table_filter_element())
+    reply = self.dispatch(get_element)
+    if not reply.ok:
+        return None
+    table = parse_interface_table_xr(reply.xml)
+    self.interface_table = table
+    logger.info(f"Interface table retrieved, {len(table)} interfaces")
+    return table
+
+
+def get_interface_status_xr(self, interface_name=None, table=None):
     """
-    filter_xml = f"""
-      <filter xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" type="subtree">
-        {xml_rpc}
-      </filter>
+    Retrieve the status of a specified network interface via Netconf
+
+    Args:
+        interface_name (str, optional): only retrieve this interface. If None, all interfaces are retrieved.
+        table (InterfaceTable, optional): answer from this table instead of querying the device
     """
-    filter_element = etree.fromstring(filter_xml, parser)
+    if table is not None:
+        return [{'interface-name': record['name'], 'state': record['state']}
+                for record in table.records('xr', interface_name)]
+    filter_element = SubtreeFilter(
+        XR_PFI_IM_CMD_OPER_NS, 'interfaces/interface-xr/interface',
+        keys={'interface-name': interface_name}, leaves=['interface-name', 'description', 'line-state', 'state'],
+    ).to_element()
     get_element = etree.Element("{urn:ietf:params:xml:ns:netconf:base:1.0}get")
     get_element.append(filter_element)
-    logger.info(f"Envoi de la requête NETCONF:\n{etree.tostring(get_element, pretty_print=True).decode()}")
+    dump_payload(logger, "Envoi de la requête NETCONF", get_element, device=self)
     reply = self.dispatch(get_element)
-    logger.info(f"Réponse reçue: {reply.xml}")
-    reply_dict = xmltodict.parse(reply.xml)
-    if not reply.ok or not reply_dict.get("rpc-reply", {}).get("data"):
+    dump_payload(logger, "Réponse reçue", reply, device=self)
+    if not reply.ok:
         return []
-    logger.info(f"Full parsed RPC reply:\n{pprint.pformat(reply_dict, indent=2)}")
     # Navigate to the interface data
-    data = reply_dict.get("rpc-reply", {}).get("data", {})
-    interfaces_data = data.get("interfaces", {}).get("interface-xr", {}).get("interface", [])
-
-    # Handle both single interface (dict) and multiple interfaces (list)
-    if isinstance(interfaces_data, dict):
-        interfaces = [interfaces_data]
-    else:
-        interfaces = interfaces_data
-
-    logger.info(f"The interfaces data:\n{pprint.pformat(interfaces, indent=2)}")
-    results = []
-    for intf in interfaces:
-        ifstate = intf.get("state")
-        ifname = intf.get("interface-name")
-        results.append({
-            "interface-name": ifname,
-            "state": ifstate
-        })
+    results = XR_INTERFACE_SCHEMA.extract(reply.xml)
+    dump_payload(logger, "The interfaces data", results, device=self)
     return results
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: __init__.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 11:48:02
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 11:48:02
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+"""
+Benchmarks for the NETCONF parsers.
+This package contains synthetic reply generators and benchmark scripts that can be run
+without a device, e.g. python -m jeypyats.test_suite.benchmarks.bench_subtree_filters
+"""
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: bench_async_fleet.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 15:40:03
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 15:40:03
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+"""
+Fleet collection benchmark: sequential loop vs asyncio fleet runner.
+Reproduces the loop of scripts/xrd/StepIn/interface_test.py (connect, then get_interface_status_oc,
+one device after the other) against simulated devices with a fixed session setup time and round
+trip time, and runs the same work with gather_fleet().
+
+Usage:
+    python -m jeypyats.test_suite.benchmarks.bench_async_fleet [device_count] [concurrency]
+"""
+
+import sys
+import time
+from jeypyats.parsers.xrd.xrd_interface_parser_nc_oc import get_interface_status_oc
+from jeypyats.utils.async_netconf import offload, run_fleet
+from jeypyats.test_suite.benchmarks.fixtures import FakeManager, openconfig_interfaces_data
+
+# simulated SSH + NETCONF hello time and RPC round trip time, in seconds
+CONNECT_TIME = 0.05
+RTT = 0.02
+
+DATA = openconfig_interfaces_data(8)
+
+
+def connect(name):
+    """Simulated connect_netconf"""
+    time.sleep(CONNECT_TIME)
+    return FakeManager(DATA, rtt=RTT)
+
+
+def sequential(names):
+    """The interface_test.py loop"""
+    connections = {name: connect(name) for name in names}
+    return {name: get_interface_status_oc(connections[name]) for name in names}
+
+
+async def poll(name):
+    connection = await offload(connect, name)
+    return await offload(get_interface_status_oc, connection)
+
+
+def main(count=100, concurrency=50):
+    names = [f'xrd-{index:04d}' for index in range(count)]
+
+    start = time.perf_counter()
+    sequential_results = sequential(names)
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fleet_results = run_fleet({name: name for name in names}, poll, concurrency=concurrency, timeout=30)
+    fleet_time = time.perf_counter() - start
+
+    assert all(result.ok for result in fleet_results.values())
+    assert {name: result.result for name, result in fleet_results.items()} == sequential_results
+
+    print(f"{count} devices, connect {CONNECT_TIME * 1000:.0f} ms, rtt {RTT * 1000:.0f} ms")
+    print(f"  sequential loop          : {sequential_time:8.2f} s")
+    print(f"  gather_fleet({concurrency:>4})       : {fleet_time:8.2f} s")
+    print(f"  speedup                  : {sequential_time / fleet_time:8.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:3])))
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: bench_extraction.py
+# This file is a part of Netalps.fr
+#
+# Created: 18.10.2026 06:12:44
+# Author: Jeremie Rouzet
+#
+# Last Modified: 18.10.2026 06:12:44
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+"""
+Extraction benchmark: ExtractionSchema.iter_extract() vs iter_records() vs xmltodict.
+Decodes a synthetic get-routing-table reply (100k routes by default) with the compiled schema of
+get_routing_table_global(), with the generic records of the streaming decoder, and with the former
+fromstring/tostring/xmltodict conversion, and reports the best of a few rounds. The schema must stay
+at least as fast as iter_records(), which it builds on.
+
+Usage:
+    python -m jeypyats.test_suite.benchmarks.bench_extraction [route_count]
+"""
+
+import sys
+import time
+import xmltodict
+from lxml import etree
+from jeypyats.parsers.iosxe.iosxe_routing_parsers_nc import RT_ENTRY_SCHEMA
+from jeypyats.utils.reply_decoder import iter_records
+from jeypyats.test_suite.benchmarks.fixtures import iter_routing_table_data, rpc_reply
+
+ROUNDS = 3
+
+
+def xmltodict_routes(xml):
+    root = etree.fromstring(xml.encode('utf-8'))
+    data = xmltodict.parse(etree.tostring(root))
+    return data['rpc-reply']['data']['routing-table']['rt-entry']
+
+
+METHODS = {
+    'iter_extract': lambda xml: sum(1 for _ in RT_ENTRY_SCHEMA.iter_extract(xml)),
+    'iter_records': lambda xml: sum(1 for _ in iter_records(xml, 'routing-table/rt-entry')),
+    'xmltodict': lambda xml: len(xmltodict_routes(xml)),
+}
+
+
+def measure(method, xml):
+    """
+    Returns:
+        tuple: (route count, best seconds)
+    """
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        count = method(xml)
+        timings.append(time.perf_counter() - start)
+    return count, min(timings)
+
+
+def main(count=100000):
+    xml = rpc_reply(''.join(iter_routing_table_data(count)))
+    print(f"{count} rt-entry, {len(xml) / 2 ** 20:.0f} MiB reply, best of {ROUNDS}")
+    results = {}
+    for name, method in METHODS.items():
+        routes, elapsed = measure(method, xml)
+        assert routes == count
+        results[name] = elapsed
+        print(f"  {name:<12}: {elapsed:6.2f} s  {count / elapsed:9.0f} routes/s")
+    print(f"  iter_extract / iter_records: {results['iter_extract'] / results['iter_records']:.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:2])))
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: bench_import.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 19:51:38
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 19:51:38
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+"""
+Import time benchmark: cold 'import jeypyats' and cold binding of the IOS-XE parsers.
+Each measure runs in a fresh interpreter, so that nothing is already in sys.modules.
+
+Usage:
+    python -m jeypyats.test_suite.benchmarks.bench_import [repeat]
+"""
+
+import json
+import subprocess
+import sys
+
+# statement timed in a fresh interpreter -> label
+STATEMENTS = {
+    'import jeypyats': 'import jeypyats',
+    'import jeypyats.utils': 'import jeypyats.utils',
+    'bind IOS-XE parsers': (
+        'from jeypyats.utils.utils import bind_iosxe_parsers_to_device\n'
+        'bind_iosxe_parsers_to_device(type("Device", (), {})())'
+    ),
+}
+
+# modules a plain 'import jeypyats' must not import
+HEAVY_MODULES = ('pyats', 'genie', 'ncclient', 'asyncio')
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec(compile(sys.argv[1], '<bench>', 'exec'))
+elapsed = time.perf_counter() - start
+print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))
+"""
+
+
+def measure(statement):
+    """
+    Runs a statement in a fresh interpreter
+
+    Returns:
+        dict: {'elapsed': seconds, 'modules': imported module names}
+    """
+    output = subprocess.run([sys.executable, '-c', _PROBE, statement], check=True, capture_output=True, text=True)
+    return json.loads(output.stdout.splitlines()[-1])
+
+
+def heavy_modules(modules):
+    """Heavy top-level packages among imported module names"""
+    return sorted({name.split('.')[0] for name in modules} & set(HEAVY_MODULES))
+
+
+def main(repeat=3):
+    for label, statement in STATEMENTS.items():
+        runs = [measure(statement) for _ in range(repeat)]
+        best = min(run['elapsed'] for run in runs)
+        print(f"  {label:<24}: {best * 1000:8.1f} ms  heavy modules: {', '.join(heavy_modules(runs[0]['modules'])) or '-'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:2])))
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: bench_parsers.py
+# This file is a part of Netalps.fr
+#
+# Created: 18.10.2026 05:02:17
+# Author: Jeremie Rouzet
+#
+# Last Modified: 18.10.2026 05:02:17
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+"""
+Parser benchmark suite on replayed NETCONF replies.
+Every IOSXE*ParsersMixin method, the L2VPN ParsersMixin and the XRd parsers are run against a
+ReplayTransport serving a replay store, by default the synthetic data at 1% of fixtures.FIXTURE_SCALE
+(100 interfaces, 10k routes and 1k syslog lines), which completes in about 20 seconds. The full
+scale, 10k interfaces, 1M routes and 100k syslog lines, is opt-in with --scale 1 and runs far longer.
+The replies are built once, during a warm-up call, so that the timed rounds measure the parsers only.
+
+Every case reports its best round, the throughput in records and in reply MiB per second, and
+the peak memory of a call measured with tracemalloc in a separate round. Results can be saved
+and compared with a saved baseline, the run fails when a case got slower or needs more memory
+than the baseline beyond the tolerance. The timings are compared relative to a calibration
+workload, parsing and walking a fixed XML document, timed next to every round of a case, so that
+a baseline recorded on another machine, or under another load, still applies. Slowdowns below
+TIME_NOISE are ignored.
+bench_parsers_baseline.json is the baseline of the default scale, used by --baseline without
+file; save a new one with --save when the parsers get faster.
+
+Usage:
+    python -m jeypyats.test_suite.benchmarks.bench_parsers [--scale 0.01] [--store DIR] [--rounds 3]
+        [--only bgp] [--save baseline.json] [--baseline [baseline.json]] [--tolerance 0.25]
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import namedtuple
+from lxml import etree
+from jeypyats.parsers.xrd import xrd_interface_parser_nc as xrd_nc
+from jeypyats.parsers.xrd import xrd_interface_parser_nc_oc as xrd_oc
+from jeypyats.parsers.xrd import xrd_interface_parser_nc_xr as xrd_xr
+from jeypyats.test_suite.benchmarks.replay import INDEX_FILE, ReplayDevice, ReplayTransport, write_scaled_store
+
+INTERFACE = 'GigabitEthernet0/0/1'
+CELLULAR = 'Cellular0/2/0'
+VRFS = ['default', 'VRF0', 'VRF1', 'VRF2', 'VRF3']
+
+# absolute peak memory increase ignored by the comparison, small peaks vary between runs
+PEAK_NOISE = 2 ** 20
+# absolute slowdown in seconds ignored by the comparison, sub-millisecond calls vary between runs
+TIME_NOISE = 0.002
+
+DEFAULT_SCALE = 0.01
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_parsers_baseline.json')
+
+Case = namedtuple('Case', ['name', 'run'])
+
+
+def _syslog(device, **kwargs):
+    # the cursor would only parse the lines appended since the previous round
+    vars(device).pop('syslog_cursor', None)
+    return device.get_syslog_messages(**kwargs)
+
+
+CASES = (
+    Case('IOSXERoutingParsersMixin.get_routing_table_global', lambda d: d.get_routing_table_global()),
+    Case('IOSXERoutingParsersMixin.get_routing_table_global[table]',
+         lambda d: d.get_routing_table_global(output='table')),
+    Case('IOSXERoutingParsersMixin.get_routing_table', lambda d: d.get_routing_table()),
+    Case('IOSXERoutingParsersMixin.iter_routing_table', lambda d: sum(1 for _ in d.iter_routing_table())),
+    Case('IOSXERoutingParsersMixin.get_bgp_routes', lambda d: d.get_bgp_routes()),
+    Case('IOSXERoutingParsersMixin.get_bgp_routes[record]', lambda d: d.get_bgp_routes(output='record')),
+    Case('IOSXERoutingParsersMixin.iter_bgp_routes', lambda d: sum(1 for _ in d.iter_bgp_routes())),
+    Case('IOSXERoutingParsersMixin.get_ospf_routes', lambda d: d.get_ospf_routes()),
+    Case('IOSXERoutingParsersMixin.get_routing_tables', lambda d: d.get_routing_tables(vrfs=VRFS)),
+    Case('IOSXERoutingParsersMixin.get_routing_table_default_routes',
+         lambda d: d.get_routing_table_default_routes()),
+    Case('IOSXERoutingParsersMixin.get_routing_table_default_routes[native]',
+         lambda d: d.get_routing_table_default_routes(source='native')),
+    Case('IOSXERoutingParsersMixin.get_vrf_names', lambda d: d.get_vrf_names()),
+    Case('IOSXEInterfacesParsersMixin.collect_interface_table', lambda d: d.collect_interface_table()),
+    Case('IOSXEInterfacesParsersMixin.get_interface_status', lambda d: d.get_interface_status(INTERFACE)),
+    Case('IOSXEInterfacesParsersMixin.get_interfaces_status_openconfig',
+         lambda d: d.get_interfaces_status_openconfig()),
+    Case('IOSXEInterfacesParsersMixin.get_interfaces_cellular_status', lambda d: d.get_interfaces_cellular_status()),
+    Case('IOSXEInterfacesParsersMixin.get_interface_counters', lambda d: d.get_interface_counters()),
+    Case('IOSXEInterfacesParsersMixin.get_interface_counters[openconfig]',
+         lambda d: d.get_interface_counters(source='openconfig')),
+    Case('IOSXEInterfacesParsersMixin.get_interface_rates', lambda d: d.get_interface_rates()),
+    Case('IOSXESyslogParsersMixin.get_syslog_messages', _syslog),
+    Case('IOSXESyslogParsersMixin.get_syslog_messages[filter_text]',
+         lambda d: _syslog(d, filter_text=['ADJCHANGE', 'TRACK'])),
+    Case('IOSXESyslogParsersMixin.get_syslog_messages[new_only]', lambda d: d.get_syslog_messages(new_only=True)),
+    Case('IOSXEEEMParsersMixin.get_eem_event_history', lambda d: d.get_eem_event_history()),
+    Case('IOSXEIPSLAParsersMixin.get_ip_sla_states', lambda d: d.get_ip_sla_states()),
+    Case('IOSXETrackParsersMixin.get_track_states', lambda d: d.get_track_states()),
+    Case('IOSXECellularParsersMixin.get_cellular_sim_config', lambda d: d.get_cellular_sim_config(CELLULAR)),
+    Case('IOSXECollectParsersMixin.collect',
+         lambda d: d.collect(['default_routes', 'ip_sla', 'tracks', 'eem', f'sim:{CELLULAR}',
+                              f'interface:{INTERFACE}'])),
+    Case('IOSXENotificationParsersMixin.wait_for_message',
+         lambda d: d.wait_for_message('ADJCHANGE', timeout=1, since=0)),
+    Case('IOSXEAsyncParsersMixin.get_bgp_routes_async', lambda d: asyncio.run(d.get_bgp_routes_async())),
+    Case('WaitsMixin.wait_for_track_state', lambda d: d.wait_for_track_state(2, 'up', timeout=1)),
+    Case('ParsersMixin.get_l2vpn_bridge_domain_brief', lambda d: d.get_l2vpn_bridge_domain_brief()),
+    Case('xrd_interface_parser_nc.get_interface_status', xrd_nc.get_interface_status),
+    Case('xrd_interface_parser_nc_oc.get_interface_status_oc', xrd_oc.get_interface_status_oc),
+    Case('xrd_interface_parser_nc_oc.get_interface_counters_oc', xrd_oc.get_interface_counters_oc),
+    Case('xrd_interface_parser_nc_xr.get_interface_status_xr', xrd_xr.get_interface_status_xr),
+    Case('xrd_interface_parser_nc_xr.collect_interface_table_xr', xrd_xr.collect_interface_table_xr),
+)
+
+
+def count_records(result):
+    """Returns the number of records of a parser result"""
+    if isinstance(result, int):
+        return result
+    if isinstance(result, dict) and result and all(isinstance(value, list) for value in result.values()):
+        return sum(len(value) for value in result.values())
+    try:
+        return len(result)
+    except TypeError:
+        return 1 if result is not None else 0
+
+
+def measure(device, case, rounds=3):
+    """
+    Runs a case once to build its replies, then rounds timed calls and one traced call
+    The records are counted on the last timed call, e.g. get_interface_rates() has no rate on the first one.
+
+    Returns:
+        dict: records, reply bytes, best seconds and peak bytes of a call, best ratio of a call to the
+              calibrate() of its round, and the calibration of that round
+    """
+    transport = device.nc
+    received = transport.bytes_received
+    case.run(device)
+    reply_bytes = transport.bytes_received - received
+
+    timings, calibrations = [], []
+    for _ in range(rounds):
+        # the calibration is timed next to every round, it follows the speed changes of the machine
+        calibrations.append(calibrate())
+        gc.collect()
+        start = time.perf_counter()
+        result = case.run(device)
+        timings.append(time.perf_counter() - start)
+        records = count_records(result)
+        del result
+
+    gc.collect()
+    tracemalloc.start()
+    case.run(device)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # a slower machine slows down the calibration and the case of a round alike
+    relative, calibration = min((timing / calibration, calibration)
+                                for timing, calibration in zip(timings, calibrations))
+    return {'records': records, 'reply_bytes': reply_bytes, 'seconds': min(timings), 'peak_bytes': peak,
+            'relative': relative, 'calibration': calibration}
+
+
+CALIBRATION_XML = ('<data>' + ''.join(f'<entry><name>e{index}</name><value>{index}</value></entry>'
+                                        for index in range(20000)) + '</data>').encode('utf-8')
+
+
+def calibrate():
+    """
+    Measures the speed of the machine, on a workload independent from the parsers
+    The garbage collector is disabled, its pauses depend on the objects kept alive by the run.
+
+    Returns:
+        float: seconds of parsing CALIBRATION_XML and building a dict per entry
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        root = etree.fromstring(CALIBRATION_XML)
+        entries = [{child.tag: child.text for child in entry} for entry in root]
+        return time.perf_counter() - start
+    finally:
+        del root, entries
+        gc.enable()
+
+
+def compare(results, baseline, tolerance=0.25):
+    """
+    Compares results with a baseline
+    A case is compared by its time relative to the calibration, converted to seconds with the
+    calibration of the run.
+
+    Returns:
+        list: regression messages, empty when every case is within the tolerance
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        if 'relative' in result and 'relative' in reference:
+            seconds = result['relative'] * result['calibration']
+            expected = reference['relative'] * result['calibration']
+        else:
+            seconds, expected = result['seconds'], reference['seconds']
+        if seconds > expected * (1 + tolerance) + TIME_NOISE:
+            regressions.append(f"{name}: {seconds * 1000:.1f} ms per call, baseline {expected * 1000:.1f} ms")
+        if result['peak_bytes'] > reference['peak_bytes'] * (1 + tolerance) + PEAK_NOISE:
+            regressions.append(f"{name}: peak {result['peak_bytes'] / 2 ** 20:.1f} MiB, "
+                               f"baseline {reference['peak_bytes'] / 2 ** 20:.1f} MiB")
+    return regressions
+
+
+def run(store, rounds=3, only=None):
+    device = ReplayDevice('replay', ReplayTransport(store))
+    results = {}
+    print(f"{'case':<66} {'records':>9} {'ms/call':>9} {'records/s':>11} {'MiB/s':>7} {'peak MiB':>9}")
+    for case in CASES:
+        if only and only not in case.name:
+            continue
+        result = results[case.name] = measure(device, case, rounds)
+        seconds = max(result['seconds'], 1e-9)
+        print(f"{case.name:<66} {result['records']:>9} {result['seconds'] * 1000:>9.2f} "
+              f"{result['records'] / seconds:>11.0f} {result['reply_bytes'] / 2 ** 20 / seconds:>7.1f} "
+              f"{result['peak_bytes'] / 2 ** 20:>9.1f}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', type=float, default=DEFAULT_SCALE,
+                        help=f"factor of the synthetic fixture scale (default {DEFAULT_SCALE}, 1 for the full scale)")
+    parser.add_argument('--store', help="replay store, written with the synthetic data when it has no index")
+    parser.add_argument('--rounds', type=int, default=3, help="timed rounds of every case")
+    parser.add_argument('--only', help="only the cases whose name contains this text")
+    parser.add_argument('--save', help="write the results to this JSON file")
+    parser.add_argument('--baseline', nargs='?', const=BASELINE,
+                        help="compare the results with this JSON file, by default the baseline of the default scale")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown or memory increase")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as stream:
+            baseline = json.load(stream)
+        if baseline['scale'] != args.scale:
+            parser.error(f"{args.baseline} was recorded at scale {baseline['scale']}, not {args.scale}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = args.store or directory
+        if not os.path.exists(os.path.join(store, INDEX_FILE)):
+            start = time.perf_counter()
+            size = write_scaled_store(store, args.scale)
+            print(f"Replay store {store}: {size / 2 ** 20:.1f} MiB written in {time.perf_counter() - start:.1f} s")
+        results = run(store, args.rounds, args.only)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as stream:
+            json.dump({'scale': args.scale, 'results': results}, stream, indent=2, sort_keys=True)
+    if baseline is not None:
+        regressions = compare(results, baseline['results'], args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"No regression against {args.baseline} ({args.tolerance:.0%} tolerance)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
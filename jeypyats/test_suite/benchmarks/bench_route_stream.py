@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: bench_route_stream.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 23:41:19
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 23:41:19
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+"""
+Streamed route memory benchmark: get_bgp_routes() vs iter_bgp_routes().
+Counts the routes of a synthetic get-bgp-routes reply (1M routes by default) having a local
+preference of 200, once from the returned list and once from the iterator, and reports the peak
+of the Python memory allocated while doing so with tracemalloc. The reply itself is built before
+the measure and is not counted.
+
+Usage:
+    python -m jeypyats.test_suite.benchmarks.bench_route_stream [route_count]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from jeypyats.test_suite.benchmarks.bench_route_table import Device
+from jeypyats.test_suite.benchmarks.fixtures import FakeReply, bgp_routes_data
+
+
+def count_preferred(routes):
+    return sum(1 for route in routes if route['local_pref'] == '200')
+
+
+def measure(device, method):
+    """
+    Returns:
+        tuple: (preferred route count, peak bytes, seconds)
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    preferred = count_preferred(getattr(device, method)())
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return preferred, peak, elapsed
+
+
+def main(count=1000000):
+    device = Device(FakeReply(bgp_routes_data(count)))
+    print(f"{count} BGP routes, {len(device.reply.xml) / 2 ** 20:.0f} MiB reply")
+    results = {}
+    for method in ('get_bgp_routes', 'iter_bgp_routes'):
+        preferred, peak, elapsed = measure(device, method)
+        results[method] = preferred
+        print(f"  {method:<16}: peak {peak / 2 ** 20:8.1f} MiB  {elapsed:6.2f} s  ({preferred} routes with local-pref 200)")
+    assert results['get_bgp_routes'] == results['iter_bgp_routes']
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:2])))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: bench_route_table.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 21:58:03
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 21:58:03
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+"""
+Route container memory benchmark: dicts vs __slots__ records vs columnar RouteTable.
+Parses a synthetic get-bgp-routes reply with each output of get_bgp_routes() and measures the
+memory held by the returned routes with tracemalloc.
+
+Usage:
+    python -m jeypyats.test_suite.benchmarks.bench_route_table [route_count]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from jeypyats.parsers.iosxe.iosxe_routing_parsers_nc import IOSXERoutingParsersMixin
+from jeypyats.test_suite.benchmarks.fixtures import FakeReply, bgp_routes_data
+
+
+class Device(IOSXERoutingParsersMixin):
+    """Device answering every get with the same reply"""
+
+    def __init__(self, reply):
+        self.reply = reply
+
+    def netconf_get(self, *args, **kwargs):
+        return self.reply
+
+
+def measure(device, output):
+    """
+    Returns:
+        tuple: (routes, held bytes, parse seconds)
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    routes = device.get_bgp_routes(output=output)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return routes, held, elapsed
+
+
+def main(count=100000):
+    device = Device(FakeReply(bgp_routes_data(count)))
+    print(f"{count} BGP routes")
+    results = {}
+    for output in ('dict', 'record', 'table'):
+        routes, held, elapsed = measure(device, output)
+        results[output] = routes
+        print(f"  {output:<7}: {held / 2 ** 20:8.1f} MiB  {held / count:6.0f} B/route  parse {elapsed:6.2f} s")
+        del routes
+    assert results['table'] == results['record']
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:2])))
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: bench_subtree_filters.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 11:58:11
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 11:58:11
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+"""
+Reply size benchmark for get_interface_status.
+Compares the reply of the former whole-table filter with the reply of the keyed subtree
+filter on a synthetic device with 4000 interfaces, and times the parsing of both replies.
+
+Usage:
+    python -m jeypyats.test_suite.benchmarks.bench_subtree_filters [interface_count]
+"""
+
+import sys
+import time
+from jeypyats.utils.filters import SubtreeFilter
+from jeypyats.parsers.iosxe.iosxe_interface_parsers_nc import IETF_INTERFACES_NS, IETF_STATUS_SCHEMA
+from jeypyats.test_suite.benchmarks.fixtures import interfaces_state_data, interface_name, rpc_reply
+from jeypyats.test_suite.benchmarks.subtree import apply_subtree_filter
+
+# filter sent by get_interface_status before subtree filters were built with key leaves
+UNFILTERED = f'<filter><interfaces-state xmlns="{IETF_INTERFACES_NS}"><interface/></interfaces-state></filter>'
+
+
+def measure(data, filter_xml, interface):
+    """Returns the reply size in bytes and the time needed to find the interface in it"""
+    reply = rpc_reply(apply_subtree_filter(data, filter_xml))
+    start = time.perf_counter()
+    found = [record for record in IETF_STATUS_SCHEMA.iter_extract(reply) if record['name'] == interface]
+    elapsed = time.perf_counter() - start
+    if len(found) != 1:
+        raise RuntimeError(f"Interface {interface} not found in the filtered reply")
+    return len(reply.encode('utf-8')), elapsed
+
+
+def main(count=4000):
+    data = interfaces_state_data(count)
+    interface = interface_name(count - 1)
+    keyed = SubtreeFilter(
+        IETF_INTERFACES_NS, 'interfaces-state/interface',
+        keys={'name': interface}, leaves=['name', 'oper-status', 'admin-status'],
+    ).to_xml()
+
+    full_size, full_time = measure(data, UNFILTERED, interface)
+    keyed_size, keyed_time = measure(data, keyed, interface)
+
+    print(f"get_interface_status({interface}) on {count} interfaces")
+    print(f"  whole table filter : {full_size:>12,} bytes  parse {full_time * 1000:8.2f} ms")
+    print(f"  keyed subtree      : {keyed_size:>12,} bytes  parse {keyed_time * 1000:8.2f} ms")
+    print(f"  reduction          : {full_size / keyed_size:>12,.0f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 4000))
@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: fixtures.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 11:49:15
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 11:49:15
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+"""
+Synthetic NETCONF replies used by the benchmarks.
+The generated replies mimic the size and shape of the data returned by real devices.
+"""
+
+import time
+
+RPC_REPLY_HEADER = '<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101"><data>'
+RPC_REPLY_FOOTER = '</data></rpc-reply>'
+
+IOSXE_RPC_NS = 'http://cisco.com/ns/yang/Cisco-IOS-XE-rpc'
+
+
+def interface_name(index):
+    """Returns a realistic interface name for an index"""
+    return f"GigabitEthernet{index // 48}/{(index // 8) % 6}/{index % 8}"
+
+
+def interfaces_state_data(count=4000):
+    """Builds the ietf-interfaces 'interfaces-state' container of a device with count interfaces
+
+    Args:
+        count (int): number of interfaces
+
+    Returns:
+        str: XML of the interfaces-state container
+    """
+    interfaces = []
+    for index in range(count):
+        oper_status = 'up' if index % 5 else 'down'
+        interfaces.append(
+            f"<interface><name>{interface_name(index)}</name>"
+            f"<type xmlns:ianaift=\"urn:ietf:params:xml:ns:yang:iana-if-type\">ianaift:ethernetCsmacd</type>"
+            f"<admin-status>up</admin-status><oper-status>{oper_status}</oper-status>"
+            f"<last-change>2026-10-17T08:00:00.000+00:00</last-change>"
+            f"<if-index>{index + 1}</if-index><phys-address>00:1e:bd:{index // 256 % 256:02x}:{index % 256:02x}:01</phys-address>"
+            f"<speed>1000000000</speed>"
+            f"<statistics><discontinuity-time>2026-10-17T08:00:00.000+00:00</discontinuity-time>"
+            f"<in-octets>{index * 1000003}</in-octets><in-unicast-pkts>{index * 7919}</in-unicast-pkts>"
+            f"<in-broadcast-pkts>0</in-broadcast-pkts><in-multicast-pkts>{index}</in-multicast-pkts>"
+            f"<in-discards>0</in-discards><in-errors>0</in-errors><in-unknown-protos>0</in-unknown-protos>"
+            f"<out-octets>{index * 999983}</out-octets><out-unicast-pkts>{index * 7907}</out-unicast-pkts>"
+            f"<out-broadcast-pkts>0</out-broadcast-pkts><out-multicast-pkts>{index}</out-multicast-pkts>"
+            f"<out-discards>0</out-discards><out-errors>0</out-errors></statistics></interface>"
+        )
+    return (
+        '<interfaces-state xmlns="urn:ietf:params:xml:ns:yang:ietf-interfaces">'
+        + ''.join(interfaces)
+        + '</interfaces-state>'
+    )
+
+
+def rpc_reply(data):
+    """Wraps data in an rpc-reply/data envelope"""
+    return RPC_REPLY_HEADER + data + RPC_REPLY_FOOTER
+
+
+def openconfig_interfaces_data(count=8):
+    """Builds the OpenConfig 'interfaces' container of a device with count interfaces, all up
+
+    Args:
+        count (int): number of interfaces
+
+    Returns:
+        str: XML of the interfaces container
+    """
+    interfaces = ''.join(
+        f"<interface><name>GigabitEthernet0/0/0/{index}</name>"
+        f"<state><name>GigabitEthernet0/0/0/{index}</name><oper-status>UP</oper-status></state></interface>"
+        for index in range(count)
+    )
+    return f'<interfaces xmlns="http://openconfig.net/yang/interfaces">{interfaces}</interfaces>'
+
+
+def bgp_prefix(index):
+    """Returns a distinct /24 prefix for an index"""
+    return f"{1 + index // 65536}.{index // 256 % 256}.{index % 256}.0/24"
+
+
+def bgp_routes_data(count=100000, next_hops=16):
+    """Builds the get-bgp-routes output of a device with count routes learnt from a few peers
+
+    Args:
+        count (int): number of routes
+        next_hops (int): number of distinct next hops
+
+    Returns:
+        str: XML of the bgp-routes container
+    """
+    return ''.join(iter_bgp_routes_data(count, next_hops))
+
+
+def iter_bgp_routes_data(count=100000, next_hops=16):
+    """Yields the get-bgp-routes output of bgp_routes_data() in chunks, one per route"""
+    yield f'<bgp-routes xmlns="{IOSXE_RPC_NS}">'
+    for index in range(count):
+        yield (
+            f"<bgp-route><prefix>{bgp_prefix(index)}</prefix><next-hop>192.0.2.{index % next_hops + 1}</next-hop>"
+            f"<as-path>{64500 + index % next_hops} {3356 + index % 7} {15169 + index % 101}</as-path>"
+            f"<local-pref>{100 + index % 3 * 50}</local-pref></bgp-route>"
+        )
+    yield '</bgp-routes>'
+
+
+ROUTE_PROTOCOLS = ('bgp', 'ospf', 'static', 'connected')
+
+# Default scale of the replay store, see scaled_fixtures()
+FIXTURE_SCALE = {'interfaces': 10000, 'routes': 1000000, 'syslog_lines': 100000}
+
+SYSLOG_MESSAGES = (
+    '%LINK-3-UPDOWN: Interface {interface}, changed state to up',
+    '%LINEPROTO-5-UPDOWN: Line protocol on Interface {interface}, changed state to down',
+    '%BGP-5-ADJCHANGE: neighbor 192.0.2.{peer} Up',
+    '%TRACK-6-STATE: {track} ip sla {track} reachability Down -> Up',
+    '%SYS-5-CONFIG_I: Configured from console by admin on vty0',
+)
+
+
+def iter_routing_table_data(count=100000):
+    """Yields the get-routing-table output of a device with count routes, in chunks
+
+    Args:
+        count (int): number of routes
+
+    Yields:
+        str: XML of the routing-table container, one chunk per rt-entry
+    """
+    yield f'<routing-table xmlns="{IOSXE_RPC_NS}">'
+    for index in range(count):
+        yield (
+            f"<rt-entry><destination>{bgp_prefix(index)}</destination>"
+            f"<protocol>{ROUTE_PROTOCOLS[index % 4]}</protocol><gateway>192.0.2.{index % 16 + 1}</gateway>"
+            f"<metric>{index % 1000}</metric><interface>{interface_name(index % 48)}</interface></rt-entry>"
+        )
+    yield '</routing-table>'
+
+
+def iter_ospf_routes_data(count=10000):
+    """Yields the get-ospf-routes output of a device with count routes, in chunks"""
+    yield f'<ospf-routes xmlns="{IOSXE_RPC_NS}">'
+    for index in range(count):
+        yield (
+            f"<ospf-route><prefix>{bgp_prefix(index)}</prefix><area-id>{index % 4}</area-id>"
+            f"<next-hop>192.0.2.{index % 16 + 1}</next-hop><metric>{10 + index % 100}</metric></ospf-route>"
+        )
+    yield '</ospf-routes>'
+
+
+def iter_routing_state_data(count=100000, vrfs=4):
+    """Yields the ietf-routing 'routing-state' container, in chunks
+
+    The default instance holds a default route via 192.0.2.1, the connected route of its next hop
+    and count other routes. Every VRF instance holds 100 routes.
+
+    Args:
+        count (int): number of routes of the default instance
+        vrfs (int): number of VRF instances, named VRF0 to VRF<n-1>
+
+    Yields:
+        str: XML of the routing-state container, one chunk per route
+    """
+    def route(prefix, protocol, next_hop=None, interface=None, metric=0):
+        hop = f"<next-hop-address>{next_hop}</next-hop-address>" if next_hop else ''
+        hop += f"<outgoing-interface>{interface}</outgoing-interface>" if interface else ''
+        return (f"<route><destination-prefix>{prefix}</destination-prefix><source-protocol>{protocol}"
+                f"</source-protocol><metric>{metric}</metric><next-hop>{hop}</next-hop></route>")
+
+    yield '<routing-state xmlns="urn:ietf:params:xml:ns:yang:ietf-routing">'
+    for instance, routes in [('default', count)] + [(f'VRF{vrf}', 100) for vrf in range(vrfs)]:
+        yield f"<routing-instance><name>{instance}</name><ribs><rib><name>ipv4-default</name><routes>"
+        if instance == 'default':
+            yield route('0.0.0.0/0', 'static', next_hop='192.0.2.1', metric=1)
+            yield route('192.0.2.0/24', 'direct', interface=interface_name(0))
+        for index in range(routes):
+            yield route(bgp_prefix(index), ROUTE_PROTOCOLS[index % 4], next_hop=f"192.0.2.{index % 16 + 1}",
+                        metric=index % 1000)
+        yield '</routes></rib></ribs></routing-instance>'
+    yield '</routing-state>'
+
+
+def native_data(vrfs=4):
+    """Builds the IOS-XE native configuration of the VRF definitions and of a static default route"""
+    definitions = ''.join(f"<definition><name>VRF{vrf}</name></definition>" for vrf in range(vrfs))
+    return (
+        f'<native xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-native"><vrf>{definitions}</vrf>'
+        f"<ip><route><ip-route-interface-forwarding-list><prefix>0.0.0.0</prefix><mask>0.0.0.0</mask>"
+        f"<fwd-list><fwd>192.0.2.1</fwd><metric>1</metric></fwd-list>"
+        f"</ip-route-interface-forwarding-list></route></ip></native>"
+    )
+
+
+def iter_syslog_data(count=10000):
+    """Yields the buffered logging of a device with count messages, in chunks
+
+    Args:
+        count (int): number of lines of the buffer
+
+    Yields:
+        str: XML of the logging container, one chunk per line
+    """
+    yield '<logging xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-logging"><buffered><messages>'
+    for index in range(count):
+        text = SYSLOG_MESSAGES[index % len(SYSLOG_MESSAGES)].format(
+            interface=interface_name(index % 48), peer=index % 16 + 1, track=index % 100)
+        separator = '\n' if index + 1 < count else ''
+        yield f"*Oct 17 {index // 3600 % 24:02d}:{index // 60 % 60:02d}:{index % 60:02d}.000: {text}{separator}"
+    yield '</messages></buffered></logging>'
+
+
+def eem_event_history_data(count=1000):
+    """Builds the EEM 'event-history' container with count events"""
+    events = ''.join(
+        f"<event><name>applet_{index % 20}</name><type>syslog</type><time>2026-10-17T08:{index // 60 % 60:02d}:"
+        f"{index % 60:02d}</time><description>event {index}</description></event>"
+        for index in range(count)
+    )
+    return f'<event-history xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-eem">{events}</event-history>'
+
+
+def ip_sla_stats_data(count=1000):
+    """Builds the 'ip-sla-stats' container with count IP SLA operations"""
+    stats = ''.join(
+        f"<ip-sla-stat><sla-index>{index + 1}</sla-index><oper-state>"
+        f"{'oper-state-active' if index % 10 else 'oper-state-inactive'}</oper-state></ip-sla-stat>"
+        for index in range(count)
+    )
+    return f'<ip-sla-stats xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-ip-sla-oper">{stats}</ip-sla-stats>'
+
+
+def tracks_data(count=1000):
+    """Builds the 'tracks' container with count tracks"""
+    tracks = ''.join(
+        f"<track><track-number>{index + 1}</track-number><track-state>{'up' if index % 10 else 'down'}</track-state>"
+        f"</track>"
+        for index in range(count)
+    )
+    return f'<tracks xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-track-oper">{tracks}</tracks>'
+
+
+def cellular_interface_name(index):
+    """Returns the name of a Cellular interface for an index"""
+    return f"Cellular0/{2 + index // 2}/{index % 2}"
+
+
+def cellular_data(count=2):
+    """Builds the cellular operational container with the SIM of count Cellular interfaces"""
+    interfaces = ''.join(
+        f"<interface><name>{cellular_interface_name(index)}</name><sim><slot>{index % 2}</slot>"
+        f"<data-profile>{index + 1}</data-profile></sim></interface>"
+        for index in range(count)
+    )
+    return (f'<cellular xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-cellular-oper"><cellular>{interfaces}'
+            f'</cellular></cellular>')
+
+
+def openconfig_interfaces_state_data(count=4000):
+    """Builds the OpenConfig 'interfaces' container with the state and counters of count interfaces
+
+    Args:
+        count (int): number of interfaces
+
+    Returns:
+        str: XML of the interfaces container
+    """
+    interfaces = []
+    for index in range(count):
+        name = interface_name(index)
+        oper_status = 'UP' if index % 5 else 'DOWN'
+        interfaces.append(
+            f"<interface><name>{name}</name><state><name>{name}</name><admin-status>UP</admin-status>"
+            f"<oper-status>{oper_status}</oper-status><description>link {index}</description>"
+            f"<counters><in-octets>{index * 1000003}</in-octets><out-octets>{index * 999983}</out-octets>"
+            f"<in-errors>0</in-errors><out-errors>0</out-errors><in-discards>0</in-discards>"
+            f"<out-discards>0</out-discards><last-clear>2026-10-17T08:00:00Z</last-clear></counters>"
+            f"</state></interface>"
+        )
+    return f'<interfaces xmlns="http://openconfig.net/yang/interfaces">{"".join(interfaces)}</interfaces>'
+
+
+def iosxe_interfaces_oper_data(count=4000, cellular=2):
+    """Builds the Cisco-IOS-XE-interfaces-oper container of count interfaces and a few Cellular ones
+
+    Args:
+        count (int): number of GigabitEthernet interfaces
+        cellular (int): number of Cellular interfaces
+
+    Returns:
+        str: XML of the container
+    """
+    names = [cellular_interface_name(index) for index in range(cellular)]
+    names += [interface_name(index) for index in range(count)]
+    interfaces = ''.join(
+        f"<interface><name>{name}</name><admin-status>if-state-up</admin-status><oper-status>"
+        f"{'if-oper-state-ready' if index % 5 else 'if-oper-state-no-pass'}</oper-status>"
+        f"<description>link {index}</description></interface>"
+        for index, name in enumerate(names)
+    )
+    return f'<interfaces xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-interfaces-oper">{interfaces}</interfaces>'
+
+
+def xr_interfaces_data(count=4000):
+    """Builds the Cisco-IOS-XR-pfi-im-cmd-oper 'interfaces' container of count interfaces"""
+    states = ('im-state-up', 'im-state-up', 'im-state-up', 'im-state-down', 'im-state-admin-down')
+    interfaces = ''.join(
+        f"<interface><interface-name>GigabitEthernet0/0/0/{index}</interface-name>"
+        f"<state>{states[index % 5]}</state><line-state>{states[index % 5]}</line-state>"
+        f"<description>link {index}</description></interface>"
+        for index in range(count)
+    )
+    return (f'<interfaces xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-pfi-im-cmd-oper"><interface-xr>{interfaces}'
+            f'</interface-xr></interfaces>')
+
+
+def bridge_domains_data(count=1000):
+    """Builds the IOS XR 'l2vpnv2' container with count bridge domains on node 0/RP0/CPU0"""
+    domains = ''.join(
+        f"<bridge-domain><bridge-domain-name>BD{index}</bridge-domain-name><bridge-domain-info>"
+        f"<bridge-state>{'bridge-domain-state-up' if index % 10 else 'bridge-domain-state-down'}</bridge-state>"
+        f"</bridge-domain-info></bridge-domain>"
+        for index in range(count)
+    )
+    return (f'<l2vpnv2 xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-l2vpn-oper"><nodes><node>'
+            f'<node-id>0/RP0/CPU0</node-id><bridge-domains>{domains}</bridge-domains></node></nodes></l2vpnv2>')
+
+
+def scaled_fixtures(scale=1.0):
+    """Yields the data of every model queried by the parsers, scaled from FIXTURE_SCALE
+
+    Args:
+        scale (float): factor applied to FIXTURE_SCALE, e.g. 0.01 for 100 interfaces and 10k routes
+
+    Yields:
+        tuple: (key, data) where key is the '{namespace}name' of the top-level node, or of the RPC answered,
+               and data the XML of the node, as a string or an iterable of chunks
+    """
+    interfaces, routes, lines = (max(1, int(FIXTURE_SCALE[name] * scale))
+                                 for name in ('interfaces', 'routes', 'syslog_lines'))
+    other = max(10, interfaces // 10)
+    yield '{urn:ietf:params:xml:ns:yang:ietf-interfaces}interfaces-state', interfaces_state_data(interfaces)
+    yield '{http://openconfig.net/yang/interfaces}interfaces', openconfig_interfaces_state_data(interfaces)
+    yield ('{http://cisco.com/ns/yang/Cisco-IOS-XE-interfaces-oper}interfaces',
+           iosxe_interfaces_oper_data(interfaces))
+    yield '{http://cisco.com/ns/yang/Cisco-IOS-XR-pfi-im-cmd-oper}interfaces', xr_interfaces_data(interfaces)
+    yield f'{{{IOSXE_RPC_NS}}}get-routing-table', iter_routing_table_data(routes)
+    yield f'{{{IOSXE_RPC_NS}}}get-bgp-routes', iter_bgp_routes_data(routes)
+    yield f'{{{IOSXE_RPC_NS}}}get-ospf-routes', iter_ospf_routes_data(max(1, routes // 10))
+    yield '{urn:ietf:params:xml:ns:yang:ietf-routing}routing-state', iter_routing_state_data(max(1, routes // 10))
+    yield '{http://cisco.com/ns/yang/Cisco-IOS-XE-native}native', native_data()
+    yield '{http://cisco.com/ns/yang/Cisco-IOS-XE-logging}logging', iter_syslog_data(lines)
+    yield '{http://cisco.com/ns/yang/Cisco-IOS-XE-eem}event-history', eem_event_history_data(other)
+    yield '{http://cisco.com/ns/yang/Cisco-IOS-XE-ip-sla-oper}ip-sla-stats', ip_sla_stats_data(other)
+    yield '{http://cisco.com/ns/yang/Cisco-IOS-XE-track-oper}tracks', tracks_data(other)
+    yield '{http://cisco.com/ns/yang/Cisco-IOS-XE-cellular-oper}cellular', cellular_data()
+    yield '{http://cisco.com/ns/yang/Cisco-IOS-XR-l2vpn-oper}l2vpnv2', bridge_domains_data(other)
+
+
+class FakeReply:
+    """Minimal ncclient reply"""
+
+    def __init__(self, data):
+        self.ok = True
+        self.xml = rpc_reply(data)
+        self.data_xml = f'<data xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">{data}</data>'
+
+
+class FakeManager:
+    """ncclient manager answering every RPC with the same data after a simulated round trip time
+
+    Args:
+        data (str): XML of the data nodes returned by every RPC
+        rtt (float): simulated round trip time in seconds
+    """
+
+    def __init__(self, data, rtt=0.02):
+        self.reply = FakeReply(data)
+        self.rtt = rtt
+        self.connected = True
+
+    def _answer(self, *args, **kwargs):
+        time.sleep(self.rtt)
+        return self.reply
+
+    get = _answer
+    dispatch = _answer
+
+    def close_session(self):
+        self.connected = False
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: replay.py
+# This file is a part of Netalps.fr
+#
+# Created: 18.10.2026 04:41:52
+# Author: Jeremie Rouzet
+#
+# Last Modified: 18.10.2026 04:41:52
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+"""
+Replay of recorded NETCONF replies.
+A replay store is a directory holding the data nodes of a device, one file per top-level node,
+and an 'index.json' mapping the '{namespace}name' key of every node to its file. Replies of
+RPCs such as get-bgp-routes are stored under the key of the RPC.
+
+ReplayTransport answers get(), dispatch() and request() from the store like an ncclient manager:
+the reply of a <get> gathers the nodes of every top-level node of its filter, the reply of an
+RPC is the node stored under its key. Unknown nodes are answered with an empty <data/>.
+
+    write_scaled_store('store', scale=0.1)                    # synthetic data, see fixtures.scaled_fixtures()
+    record_device_replies(device, 'store')                     # or replies of a real device, as it is queried
+    device = ReplayDevice('csr1', ReplayTransport('store'))
+    device.get_bgp_routes()
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from lxml import etree
+from jeypyats.parsers.iosxe import ParsersMixin
+from jeypyats.parsers.iosxe.iosxe_async_parsers_nc import IOSXENetconfSession
+from jeypyats.parsers.iosxe.iosxe_notification_parsers_nc import IOSXENotificationParsersMixin
+from jeypyats.test_suite.benchmarks.fixtures import FakeReply, scaled_fixtures
+from jeypyats.test_suite.benchmarks.subtree import apply_subtree_filter
+
+NETCONF_BASE_NS = 'urn:ietf:params:xml:ns:netconf:base:1.0'
+INDEX_FILE = 'index.json'
+
+_UNSAFE = re.compile(r'[^\w.-]+')
+
+
+def _load_index(directory):
+    path = os.path.join(directory, INDEX_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as stream:
+        return json.load(stream)
+
+
+def record_reply(directory, key, data):
+    """Stores the data of a top-level node, or the reply of an RPC, in a replay store
+
+    Args:
+        directory (str): replay store, created if missing
+        key (str): '{namespace}name' of the node, or of the RPC
+        data (str | iterable): XML of the node, or chunks of it
+
+    Returns:
+        str: path of the written file
+    """
+    os.makedirs(directory, exist_ok=True)
+    name = etree.QName(key).localname
+    file_name = f"{_UNSAFE.sub('_', name)}.{hashlib.sha1(key.encode('utf-8')).hexdigest()[:8]}.xml"
+    with open(os.path.join(directory, file_name), 'w', encoding='utf-8') as stream:
+        if isinstance(data, str):
+            stream.write(data)
+        else:
+            stream.writelines(data)
+    index = _load_index(directory)
+    index[key] = file_name
+    with open(os.path.join(directory, INDEX_FILE), 'w', encoding='utf-8') as stream:
+        json.dump(index, stream, indent=2, sort_keys=True)
+    return os.path.join(directory, file_name)
+
+
+def write_scaled_store(directory, scale=1.0):
+    """Writes the synthetic data of fixtures.scaled_fixtures() to a replay store
+
+    Returns:
+        int: size of the store in bytes
+    """
+    size = 0
+    for key, data in scaled_fixtures(scale):
+        size += os.path.getsize(record_reply(directory, key, data))
+    return size
+
+
+def request_keys(request):
+    """Returns the keys of the data requested by a <get>, a filter or an RPC
+
+    Args:
+        request (str | bytes | lxml.etree._Element): '<filter>', '<get>', '<rpc>' or RPC such as '<get-bgp-routes>'
+
+    Returns:
+        tuple: (keys, filter element or None)
+    """
+    if isinstance(request, str):
+        request = request.strip().encode('utf-8')
+    root = request if etree.iselement(request) else etree.fromstring(request)
+    if root.tag == f'{{{NETCONF_BASE_NS}}}rpc':
+        root = next(iter(root))
+    if root.tag == f'{{{NETCONF_BASE_NS}}}get':
+        root = root.find(f'{{{NETCONF_BASE_NS}}}filter')
+        if root is None:
+            return (), None
+    if etree.QName(root).localname != 'filter':
+        return (root.tag,), None
+    return tuple(dict.fromkeys(child.tag for child in root if isinstance(child.tag, str))), root
+
+
+class ReplayTransport:
+    """ncclient manager answering from a replay store
+
+    Args:
+        directory (str): replay store
+        filtered (bool): apply the subtree filters like the server does, otherwise the whole
+                         top-level nodes are returned and the parsers select the entries
+        rtt (float): simulated round trip time in seconds
+
+    Attributes:
+        requests (int): number of requests answered
+        bytes_received (int): size of the replies served
+    """
+
+    def __init__(self, directory, filtered=True, rtt=0.0):
+        self.directory = directory
+        self.filtered = filtered
+        self.rtt = rtt
+        self.index = _load_index(directory)
+        self.connected = True
+        self.requests = 0
+        self.bytes_received = 0
+        self._data = {}
+        self._replies = {}
+        self._lock = threading.Lock()
+
+    def data(self, key):
+        """Returns the stored XML of a node, read once from the store, '' if unknown"""
+        if key not in self._data:
+            file_name = self.index.get(key)
+            if file_name is None:
+                self._data[key] = ''
+            else:
+                with open(os.path.join(self.directory, file_name), encoding='utf-8') as stream:
+                    self._data[key] = stream.read()
+        return self._data[key]
+
+    def _build_reply(self, request):
+        keys, filter_element = request_keys(request)
+        data = ''.join(self.data(key) for key in keys)
+        if self.filtered and filter_element is not None and data:
+            data = apply_subtree_filter(data, etree.tostring(filter_element))
+        return FakeReply(data)
+
+    def reply(self, request):
+        """Returns the reply of a request, built once per distinct request"""
+        cache_key = etree.tostring(request) if etree.iselement(request) else request
+        with self._lock:
+            reply = self._replies.get(cache_key)
+            if reply is None:
+                reply = self._replies[cache_key] = self._build_reply(request)
+            self.requests += 1
+            self.bytes_received += len(reply.xml)
+        if self.rtt:
+            time.sleep(self.rtt)
+        return reply
+
+    def get(self, filter=None):
+        return self.reply(filter) if filter is not None else FakeReply('')
+
+    def dispatch(self, rpc_command, source=None, filter=None):
+        return self.reply(rpc_command)
+
+    def request(self, msg, return_obj=False):
+        return self.reply(msg)
+
+    def clear(self):
+        """Drops the replies and the data read from the store"""
+        self._data.clear()
+        self._replies.clear()
+
+    def close_session(self):
+        self.connected = False
+
+
+class ReplayDevice(IOSXENetconfSession, IOSXENotificationParsersMixin, ParsersMixin):
+    """IOS-XE parsers, and the XRd parser functions, answered by a ReplayTransport
+
+    Args:
+        name (str): device name
+        nc (ReplayTransport): transport
+    """
+
+    def __init__(self, name, nc):
+        super().__init__(name, nc, pool=None)
+
+    def dispatch(self, rpc):
+        return self.nc.dispatch(rpc)
+
+    def request(self, msg, return_obj=False):
+        return self.nc.request(msg, return_obj)
+
+    def close(self):
+        self.nc = None
+
+
+def record_device_replies(device, directory):
+    """Stores the replies received by a device in a replay store while it is queried
+
+    Every top-level data node of the replies of netconf_get() is written under its key, the
+    reply of an RPC under the key of the RPC, so that the store answers the same queries afterwards.
+
+    Returns:
+        callable: restores the original netconf_get()
+    """
+    netconf_get = device.netconf_get
+
+    def recording_get(*args, **kwargs):
+        reply = netconf_get(*args, **kwargs)
+        request = args[0] if args else kwargs.get('filter')
+        xml = getattr(reply, 'xml', None)
+        if request is None or not xml:
+            return reply
+        root = etree.fromstring(xml.encode('utf-8') if isinstance(xml, str) else xml)
+        data = root.find(f'{{{NETCONF_BASE_NS}}}data')
+        nodes = [node for node in (data if data is not None else ()) if isinstance(node.tag, str)]
+        keys, filter_element = request_keys(request)
+        if filter_element is None:
+            for key in keys:
+                record_reply(directory, key, ''.join(etree.tostring(node, encoding='unicode') for node in nodes))
+        else:
+            for node in nodes:
+                record_reply(directory, node.tag, etree.tostring(node, encoding='unicode'))
+        return reply
+
+    device.netconf_get = recording_get
+
+    def restore():
+        device.netconf_get = netconf_get
+
+    return restore
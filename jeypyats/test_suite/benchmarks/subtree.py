@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: subtree.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 11:52:40
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 11:52:40
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+"""
+Server-side subtree filtering emulation (RFC 6241 section 6).
+apply_subtree_filter() applies a '<filter>' to a datastore the way a NETCONF server does,
+so that filtered replies can be measured and checked without a device.
+Only the subset of RFC 6241 used by the parsers is implemented: containment, selection
+and content match nodes. Attribute match expressions are ignored.
+"""
+
+import copy
+from lxml import etree
+
+
+def _children(element):
+    return [child for child in element if isinstance(child.tag, str)]
+
+
+def _filter_node(filter_node, data_node):
+    """Returns a filtered copy of data_node, or None if it is not selected"""
+    filter_children = _children(filter_node)
+    if not filter_children:
+        # selection node: the whole subtree is selected
+        return copy.deepcopy(data_node)
+
+    content_match = [child for child in filter_children if len(child) == 0 and (child.text or '').strip()]
+    others = [child for child in filter_children if child not in content_match]
+    for match in content_match:
+        values = [(child.text or '').strip() for child in data_node.findall(match.tag)]
+        if match.text.strip() not in values:
+            return None
+    if not others:
+        # only content match nodes: the whole matching entry is selected
+        return copy.deepcopy(data_node)
+
+    result = etree.Element(data_node.tag, nsmap=data_node.nsmap)
+    selected = False
+    for match in content_match:
+        for child in data_node.findall(match.tag):
+            result.append(copy.deepcopy(child))
+    for node in others:
+        for child in data_node.findall(node.tag):
+            filtered = _filter_node(node, child)
+            if filtered is not None:
+                result.append(filtered)
+                selected = True
+    return result if selected else None
+
+
+def apply_subtree_filter(data, filter_xml):
+    """Applies a subtree filter to a datastore
+
+    Args:
+        data (str | bytes): XML of the top-level data nodes, e.g. '<interfaces-state>...</interfaces-state>'
+        filter_xml (str | bytes): '<filter>...</filter>' XML, as built by SubtreeFilter.to_xml()
+
+    Returns:
+        str: XML of the filtered data nodes
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if isinstance(filter_xml, str):
+        filter_xml = filter_xml.encode('utf-8')
+    data_root = etree.fromstring(b'<data>' + data + b'</data>')
+    filter_root = etree.fromstring(filter_xml)
+
+    output = []
+    for filter_top in _children(filter_root):
+        for data_top in data_root.findall(filter_top.tag):
+            filtered = _filter_node(filter_top, data_top)
+            if filtered is not None:
+                output.append(etree.tostring(filtered, encoding='unicode'))
+    return ''.join(output)
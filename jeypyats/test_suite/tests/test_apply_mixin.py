@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_apply_mixin.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 20:24:50
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 20:24:50
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import unittest
+from types import SimpleNamespace
+from packaging import version
+from jeypyats.utils.utils import apply_mixin, apply_netconf_parsers, guess_and_load_mixin, method_table
+from jeypyats.parsers.libs.iosxe.waits import WaitsMixin
+from jeypyats.parsers.iosxe.iosxe_track_parsers_nc import IOSXETrackParsersMixin
+
+
+class BaseMixin:
+    __os_version__ = version.parse("16.9")
+
+    def get_state(self):
+        return 'base'
+
+    def get_base(self):
+        return 'base'
+
+    def _helper(self):
+        return 'hidden'
+
+
+class NewerMixin(BaseMixin):
+    __os_version__ = version.parse("17.6")
+
+    def get_state(self):
+        return 'newer'
+
+
+class Device:
+    def __init__(self, os_version):
+        self.os_version = version.parse(os_version)
+
+
+class TestApplyMixin(unittest.TestCase):
+    """Unit tests for the mixin method tables"""
+
+    def test_apply_mixin_resolves_versions(self):
+        """Test the newest method the device version supports is bound"""
+        old, new = Device("17.3"), Device("17.9")
+        apply_mixin(old, NewerMixin)
+        apply_mixin(new, NewerMixin)
+
+        self.assertEqual(old.get_state(), 'base')
+        self.assertEqual(new.get_state(), 'newer')
+        self.assertEqual(new.get_base(), 'base')
+        self.assertFalse(hasattr(new, '_helper'))
+
+    def test_method_table_is_cached(self):
+        """Test the table is computed once per mixin and version"""
+        method_table.cache_clear()
+        for _ in range(50):
+            apply_mixin(Device("17.9"), NewerMixin)
+
+        info = method_table.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 49)
+
+    def test_apply_mixin_keeps_instance_attributes(self):
+        """Test methods already set on the instance are not overridden"""
+        device = Device("17.9")
+        device.get_state = lambda: 'instance'
+        apply_mixin(device, NewerMixin)
+
+        self.assertEqual(device.get_state(), 'instance')
+
+    def test_guess_and_load_mixin(self):
+        """Test the mixin library of the device platform is loaded"""
+        device = Device("17.9")
+        device.connection_info = SimpleNamespace(os='iosxe', device_type='waits')
+        guess_and_load_mixin(device, 'parsers', mixin_name='WaitsMixin')
+
+        self.assertEqual(device.wait_for_track_state.__func__, WaitsMixin.wait_for_track_state)
+
+    def test_apply_netconf_parsers_shares_classes(self):
+        """Test devices of the same class share one composed class"""
+        devices = [Device("17.9") for _ in range(3)]
+        for device in devices:
+            apply_netconf_parsers(device)
+
+        self.assertEqual(len({type(device) for device in devices}), 1)
+        self.assertIsInstance(devices[0], Device)
+        self.assertTrue(hasattr(devices[0], 'get_track_states'))
+
+    def test_apply_netconf_parsers_selected_mixins(self):
+        """Test callers choose the composed mixins, applying again does not nest classes"""
+        device = Device("17.9")
+        apply_netconf_parsers(device, mixins=['track', WaitsMixin])
+
+        self.assertEqual(type(device).__bases__, (Device, IOSXETrackParsersMixin, WaitsMixin))
+        self.assertFalse(hasattr(device, 'get_syslog_messages'))
+
+        apply_netconf_parsers(device, mixins=['track'])
+        self.assertEqual(type(device).__bases__, (Device, IOSXETrackParsersMixin))
+
+
+if __name__ == '__main__':
+    unittest.main()
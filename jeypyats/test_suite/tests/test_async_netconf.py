@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_async_netconf.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 15:58:44
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 15:58:44
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+from jeypyats.utils.async_netconf import offload, run_fleet
+from jeypyats.parsers.iosxe.iosxe_async_parsers_nc import IOSXEAsyncParsersMixin, IOSXENetconfSession
+from jeypyats.test_suite.benchmarks.fixtures import FakeManager
+
+TRACKS_DATA = """<tracks xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-track-oper">
+    <track><track-number>1</track-number><track-state>up</track-state></track>
+</tracks>"""
+
+
+class TestAsyncNetconf(unittest.TestCase):
+    """Unit tests for the asyncio NETCONF layer"""
+
+    def test_run_fleet_bounds_concurrency(self):
+        """Test no more than 'concurrency' devices are handled at the same time"""
+        lock = threading.Lock()
+        running = {'now': 0, 'max': 0}
+
+        def blocking_call(name):
+            with lock:
+                running['now'] += 1
+                running['max'] = max(running['max'], running['now'])
+            time.sleep(0.01)
+            with lock:
+                running['now'] -= 1
+            return name.upper()
+
+        async def operation(name):
+            return await offload(blocking_call, name)
+
+        devices = {f'r{index}': f'r{index}' for index in range(20)}
+        results = run_fleet(devices, operation, concurrency=4, timeout=5)
+
+        self.assertEqual(list(results), list(devices))
+        self.assertTrue(all(result.ok for result in results.values()))
+        self.assertEqual(results['r3'].result, 'R3')
+        self.assertLessEqual(running['max'], 4)
+
+    def test_run_fleet_reports_errors_and_timeouts(self):
+        """Test failing and slow devices are reported without stopping the others"""
+        async def operation(name):
+            if name == 'broken':
+                raise ConnectionError("unreachable")
+            if name == 'slow':
+                await asyncio.sleep(1)
+            return 'ok'
+
+        results = run_fleet(['fine', 'broken', 'slow'], operation, concurrency=3, timeout=0.05)
+
+        self.assertTrue(results['fine'].ok)
+        self.assertIsInstance(results['broken'].error, ConnectionError)
+        self.assertIsInstance(results['slow'].error, asyncio.TimeoutError)
+        self.assertIsNone(results['slow'].result)
+
+    def test_async_parser_variants(self):
+        """Test every parser method has a coroutine variant running the parser"""
+        self.assertTrue(hasattr(IOSXEAsyncParsersMixin, 'get_track_states_async'))
+        self.assertTrue(hasattr(IOSXEAsyncParsersMixin, 'collect_async'))
+        self.assertFalse(hasattr(IOSXEAsyncParsersMixin, 'bind_to_device_async'))
+
+        pool = MagicMock()
+        session = IOSXENetconfSession('r1', FakeManager(TRACKS_DATA, rtt=0), pool=pool)
+
+        result = asyncio.run(session.get_track_states_async())
+        self.assertEqual(result, {'1': {'state': 'up'}})
+
+        asyncio.run(session.close_async())
+        pool.release.assert_called_once()
+        self.assertIsNone(session.nc)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_debug_dump.py
+# This file is a part of Netalps.fr
+#
+# Created: 18.10.2026 03:16:40
+# Author: Jeremie Rouzet
+#
+# Last Modified: 18.10.2026 03:16:40
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import logging
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from lxml import etree
+from jeypyats.utils.debug_dump import dump_payload, render_payload, enable_payload_dumps, disable_payload_dumps
+from jeypyats.parsers.iosxe.iosxe_eem_parsers_nc import IOSXEEEMParsersMixin
+
+
+class TestDebugDump(unittest.TestCase):
+    """Unit tests for the lazy payload dumps"""
+
+    def setUp(self):
+        """Set up a logger with DEBUG disabled"""
+        self.logger = logging.getLogger('jeypyats.test_debug_dump')
+        self.logger.setLevel(logging.INFO)
+
+    def test_render_payload(self):
+        """Test the rendering of text, elements, replies and records"""
+        element = etree.fromstring('<get><filter/></get>')
+        self.assertEqual(render_payload(element), '<get>\n  <filter/>\n</get>\n')
+        self.assertEqual(render_payload(SimpleNamespace(xml='<rpc-reply/>')), '<rpc-reply/>')
+        self.assertEqual(render_payload(b'<data/>'), '<data/>')
+        self.assertEqual(render_payload([{'name': 'Gi1'}]), '[\n  {\n    "name": "Gi1"\n  }\n]')
+
+    def test_truncated(self):
+        """Test long payloads are truncated, JSON rendering stops at the limit"""
+        self.assertEqual(render_payload('x' * 20, limit=5), 'xxxxx... [truncated, 15 more characters]')
+        records = [{'name': f'Gi{index}'} for index in range(100000)]
+
+        def chunks(encoder, payload):
+            yield from ('[', '{"name": "Gi0"}', ', ')
+            raise AssertionError("rendered beyond the limit")
+
+        with patch('jeypyats.utils.debug_dump.json.JSONEncoder.iterencode', chunks):
+            self.assertEqual(render_payload(records, limit=10), '[{"name": ... [truncated]')
+        self.assertEqual(render_payload(records, limit=None).count('"name"'), 100000)
+
+    def test_not_rendered_when_disabled(self):
+        """Test nothing is rendered when the level is disabled and no dump file is set"""
+        with patch('jeypyats.utils.debug_dump.render_payload') as render:
+            dump_payload(self.logger, 'NETCONF reply', '<rpc-reply/>', device=SimpleNamespace())
+            render.assert_not_called()
+        with self.assertLogs(self.logger, logging.INFO) as logs:
+            dump_payload(self.logger, 'NETCONF reply', '<rpc-reply/>', level=logging.INFO, limit=4)
+        self.assertEqual(logs.records[0].getMessage(), 'NETCONF reply:\n<rpc... [truncated, 8 more characters]')
+
+    def test_device_dump_file(self):
+        """Test the payloads of a device are appended to its file whatever the log level"""
+        device = SimpleNamespace(name='csr 1')
+        with tempfile.TemporaryDirectory() as directory:
+            dump_file = enable_payload_dumps(device, os.path.join(directory, 'dumps'))
+            self.assertEqual(os.path.basename(dump_file.path), 'csr_1.payloads.log')
+            dump_payload(self.logger, 'NETCONF reply', '<rpc-reply>' + 'x' * 10000 + '</rpc-reply>', device=device)
+            disable_payload_dumps(device)
+            dump_payload(self.logger, 'NETCONF reply', '<ignored/>', device=device)
+            with open(dump_file.path, encoding='utf-8') as stream:
+                content = stream.read()
+        self.assertIn('NETCONF reply\n<rpc-reply>' + 'x' * 10000 + '</rpc-reply>\n', content)
+        self.assertNotIn('<ignored/>', content)
+
+    def test_eem_events_not_printed(self):
+        """Test the EEM events are no longer printed"""
+        device = MagicMock()
+        device.netconf_get.return_value = MagicMock(xml='<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">'
+                                                        '<data/></rpc-reply>')
+        with patch('builtins.print') as mock_print:
+            self.assertEqual(IOSXEEEMParsersMixin.get_eem_event_history(device), [])
+            mock_print.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_filters.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 12:04:53
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 12:04:53
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import unittest
+from jeypyats.utils.filters import SubtreeFilter, NETCONF_BASE_NS
+from jeypyats.test_suite.benchmarks.fixtures import interfaces_state_data, rpc_reply
+from jeypyats.test_suite.benchmarks.subtree import apply_subtree_filter
+from jeypyats.parsers.iosxe.iosxe_interface_parsers_nc import IETF_STATUS_SCHEMA
+
+IETF_INTERFACES_NS = 'urn:ietf:params:xml:ns:yang:ietf-interfaces'
+
+
+class TestSubtreeFilter(unittest.TestCase):
+    """Unit tests for the subtree filter builder"""
+
+    def test_key_and_leaves(self):
+        """Test key leaves become content match nodes and leaves become selection nodes"""
+        subtree_filter = SubtreeFilter(
+            IETF_INTERFACES_NS, 'interfaces-state/interface',
+            keys={'name': 'GigabitEthernet1'}, leaves=['name', 'oper-status', 'state/admin-status'],
+        )
+
+        self.assertEqual(
+            subtree_filter.to_xml(),
+            f'<filter><interfaces-state xmlns="{IETF_INTERFACES_NS}"><interface>'
+            '<name>GigabitEthernet1</name><oper-status/><state><admin-status/></state>'
+            '</interface></interfaces-state></filter>'
+        )
+
+    def test_ancestor_keys_and_none_values(self):
+        """Test 'element/leaf' keys are attached to their ancestor and None keys are ignored"""
+        subtree_filter = SubtreeFilter(
+            'urn:ietf:params:xml:ns:yang:ietf-routing', 'routing-state/routing-instance/ribs/rib/routes/route',
+            keys={'routing-instance/name': 'default', 'rib/name': 'ipv4-default', 'destination-prefix': None},
+        )
+
+        self.assertEqual(
+            subtree_filter.subtree(),
+            '<routing-state xmlns="urn:ietf:params:xml:ns:yang:ietf-routing"><routing-instance>'
+            '<name>default</name><ribs><rib><name>ipv4-default</name><routes><route/></routes></rib></ribs>'
+            '</routing-instance></routing-state>'
+        )
+
+    def test_unknown_ancestor_key(self):
+        """Test a key outside of the path is rejected"""
+        with self.assertRaises(ValueError):
+            SubtreeFilter(IETF_INTERFACES_NS, 'interfaces-state/interface', keys={'rib/name': 'x'}).subtree()
+
+    def test_to_element(self):
+        """Test the lxml element is a subtree filter in the NETCONF base namespace"""
+        element = SubtreeFilter(IETF_INTERFACES_NS, 'interfaces-state/interface').to_element()
+
+        self.assertEqual(element.tag, f'{{{NETCONF_BASE_NS}}}filter')
+        self.assertEqual(element.get('type'), 'subtree')
+        self.assertEqual(element[0].tag, f'{{{IETF_INTERFACES_NS}}}interfaces-state')
+
+    def test_keyed_filter_reduces_reply(self):
+        """Test a keyed filter only returns the requested interface and leaves"""
+        data = interfaces_state_data(200)
+        keyed = SubtreeFilter(
+            IETF_INTERFACES_NS, 'interfaces-state/interface',
+            keys={'name': 'GigabitEthernet0/0/5'}, leaves=['name', 'oper-status', 'admin-status'],
+        )
+        unfiltered = SubtreeFilter(IETF_INTERFACES_NS, 'interfaces-state/interface')
+
+        keyed_reply = rpc_reply(apply_subtree_filter(data, keyed.to_xml()))
+        full_reply = rpc_reply(apply_subtree_filter(data, unfiltered.to_xml()))
+
+        self.assertEqual(IETF_STATUS_SCHEMA.extract(keyed_reply), [
+            {'name': 'GigabitEthernet0/0/5', 'oper_status': 'down', 'admin_status': 'up'}
+        ])
+        self.assertEqual(len(IETF_STATUS_SCHEMA.extract(full_reply)), 200)
+        self.assertLess(len(keyed_reply) * 100, len(full_reply))
+
+
+if __name__ == '__main__':
+    unittest.main()
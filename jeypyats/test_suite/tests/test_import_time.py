@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_import_time.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 20:02:14
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 20:02:14
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import unittest
+from jeypyats.test_suite.benchmarks.bench_import import STATEMENTS, heavy_modules, measure
+
+
+class TestImportTime(unittest.TestCase):
+    """Import time regression tests, each import runs in a fresh interpreter"""
+
+    def test_import_jeypyats_is_lazy(self):
+        """Test importing the package does not import the subpackages or the heavy dependencies"""
+        run = measure(STATEMENTS['import jeypyats'])
+
+        self.assertNotIn('jeypyats.parsers', run['modules'])
+        self.assertNotIn('jeypyats.test_suite', run['modules'])
+        self.assertEqual(heavy_modules(run['modules']), [])
+
+    def test_import_utils_is_lazy(self):
+        """Test the utilities do not import ncclient, pyATS or asyncio until they are used"""
+        run = measure(STATEMENTS['import jeypyats.utils'])
+
+        self.assertEqual(heavy_modules(run['modules']), [])
+        self.assertNotIn('jeypyats.utils.netconf_connector', run['modules'])
+        self.assertLess(run['elapsed'], 2.0)
+
+    def test_binding_imports_only_parsers(self):
+        """Test binding the IOS-XE parsers to a device does not import the connection stack"""
+        run = measure(STATEMENTS['bind IOS-XE parsers'])
+
+        self.assertIn('jeypyats.parsers.iosxe.iosxe_routing_parsers_nc', run['modules'])
+        self.assertNotIn('jeypyats.parsers.iosxe.iosxe_async_parsers_nc', run['modules'])
+        self.assertEqual(heavy_modules(run['modules']), [])
+
+    def test_lazy_attributes(self):
+        """Test the lazy attributes resolve to the objects of their modules"""
+        import jeypyats
+        from jeypyats import utils
+        from jeypyats.utils.filters import SubtreeFilter
+
+        self.assertIs(utils.SubtreeFilter, SubtreeFilter)
+        self.assertIn('run_fleet', dir(utils))
+        self.assertIs(jeypyats.utils, utils)
+        with self.assertRaises(AttributeError):
+            utils.missing_attribute
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_interface_counters.py
+# This file is a part of Netalps.fr
+#
+# Created: 18.10.2026 02:31:07
+# Author: Jeremie Rouzet
+#
+# Last Modified: 18.10.2026 02:31:07
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import unittest
+from unittest.mock import MagicMock, patch
+from jeypyats.utils.interface_counters import CounterSampler, counter_delta
+from jeypyats.utils.utils import JeyPyatsValueError
+from jeypyats.parsers.iosxe.iosxe_interface_parsers_nc import IOSXEInterfacesParsersMixin, interface_counters_filter
+from jeypyats.parsers.xrd.xrd_interface_parser_nc_oc import get_interface_counters_oc
+
+
+def ietf_counters_reply(counters):
+    entries = ''.join(
+        f"<interface><name>{name}</name><statistics><discontinuity-time>{cleared}</discontinuity-time>"
+        f"<in-octets>{in_octets}</in-octets><out-octets>{out_octets}</out-octets><in-errors>1</in-errors>"
+        f"</statistics></interface>"
+        for name, in_octets, out_octets, cleared in counters)
+    return MagicMock(xml=f"""<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0"><data>
+        <interfaces-state xmlns="urn:ietf:params:xml:ns:yang:ietf-interfaces">{entries}</interfaces-state>
+        </data></rpc-reply>""")
+
+
+class Device(IOSXEInterfacesParsersMixin):
+    def __init__(self):
+        self.netconf_get = MagicMock()
+
+
+class TestCounterSampler(unittest.TestCase):
+    """Unit tests for the interface counter sampler"""
+
+    def test_counter_delta(self):
+        """Test the increase of 32 and 64 bits counters wrapping around"""
+        self.assertEqual(counter_delta(10, 25), 15)
+        self.assertEqual(counter_delta(2 ** 32 - 10, 5), 15)
+        self.assertEqual(counter_delta(2 ** 40, 5), 2 ** 64 - 2 ** 40 + 5)
+
+    def test_rates(self):
+        """Test the rates of every interface since the previous sample"""
+        sampler = CounterSampler(fields=('in_octets', 'out_octets'))
+        self.assertEqual(sampler.update([{'name': 'Gi1', 'in_octets': 1000, 'out_octets': 2 ** 32 - 100}], 100.0), {})
+        rates = sampler.update([{'name': 'Gi1', 'in_octets': 4000, 'out_octets': 200},
+                                {'name': 'Gi2', 'in_octets': 5}], 110.0)
+        self.assertEqual(rates, {'Gi1': {'in_octets': 300.0, 'out_octets': 30.0}})
+        self.assertEqual(sampler.utilisation('Gi1', 24000), {'in': 0.1, 'out': 0.01})
+        self.assertIsNone(sampler.utilisation('Gi2', 24000))
+        rates = sampler.update([{'name': 'Gi2', 'in_octets': 105}], 120.0)
+        self.assertEqual(rates, {'Gi2': {'in_octets': 10.0}})
+        self.assertEqual(sorted(sampler.rates()), ['Gi1', 'Gi2'])
+
+    def test_grows_beyond_capacity(self):
+        """Test the preallocated arrays grow when more interfaces appear"""
+        sampler = CounterSampler(capacity=2)
+        sampler.update([{'name': f'Gi{index}', 'in_octets': index} for index in range(10)], 0.5)
+        rates = sampler.update([{'name': f'Gi{index}', 'in_octets': index + 10} for index in range(10)], 1.5)
+        self.assertEqual(len(sampler), 10)
+        self.assertEqual({name: rate['in_octets'] for name, rate in rates.items()},
+                         {f'Gi{index}': 10.0 for index in range(10)})
+
+    def test_timestamp_zero_and_unordered_samples(self):
+        """Test a first sample at timestamp 0 gives rates, and the interfaces may change order between samples"""
+        sampler = CounterSampler(fields=('in_octets',))
+        self.assertEqual(sampler.update([{'name': 'Gi1', 'in_octets': 0}, {'name': 'Gi2', 'in_octets': 0},
+                                         {'name': 'Gi3', 'in_octets': 0}], 0), {})
+        rates = sampler.update([{'name': 'Gi3', 'in_octets': 30}, {'name': 'Gi1', 'in_octets': 10}], 10)
+        self.assertEqual(rates, {'Gi3': {'in_octets': 3.0}, 'Gi1': {'in_octets': 1.0}})
+        rates = sampler.update([{'name': 'Gi1', 'in_octets': 20}, {'name': 'Gi2', 'in_octets': 40},
+                                {'name': 'Gi3', 'in_octets': 60}], 20)
+        self.assertEqual(rates, {'Gi1': {'in_octets': 1.0}, 'Gi2': {'in_octets': 2.0}, 'Gi3': {'in_octets': 3.0}})
+
+    def test_discontinuity_restarts(self):
+        """Test an interface whose counters were cleared starts over without rate"""
+        sampler = CounterSampler(fields=('in_octets',))
+        sampler.update([{'name': 'Gi1', 'in_octets': 5000, 'discontinuity_time': 't0'}], 1.0)
+        self.assertEqual(sampler.update([{'name': 'Gi1', 'in_octets': 10, 'discontinuity_time': 't1'}], 2.0), {})
+        self.assertEqual(sampler.update([{'name': 'Gi1', 'in_octets': 20, 'discontinuity_time': 't1'}], 3.0),
+                         {'Gi1': {'in_octets': 10.0}})
+        sampler.reset()
+        self.assertEqual(sampler.update([{'name': 'Gi1', 'in_octets': 30, 'discontinuity_time': 't1'}], 4.0), {})
+
+    def test_first_clear_restarts(self):
+        """Test a discontinuity time reported for the first time restarts the interface instead of a wrap"""
+        sampler = CounterSampler(fields=('in_octets',))
+        sampler.update([{'name': 'Gi1', 'in_octets': 1000}], 0.0)
+        self.assertEqual(sampler.update([{'name': 'Gi1', 'in_octets': 500, 'discontinuity_time': 't1'}], 10.0), {})
+        self.assertEqual(sampler.update([{'name': 'Gi1', 'in_octets': 600, 'discontinuity_time': 't1'}], 20.0),
+                         {'Gi1': {'in_octets': 10.0}})
+
+    def test_missing_counter_has_no_rate(self):
+        """Test a counter missing from either sample has no rate, instead of a wrap around"""
+        sampler = CounterSampler(fields=('in_octets', 'out_octets'))
+        sampler.update([{'name': 'Gi1', 'in_octets': 1000, 'out_octets': 100}], 0.0)
+        self.assertEqual(sampler.update([{'name': 'Gi1', 'in_octets': None, 'out_octets': 200}], 10.0),
+                         {'Gi1': {'out_octets': 10.0}})
+        self.assertEqual(sampler.update([{'name': 'Gi1', 'in_octets': 1100, 'out_octets': 300}], 20.0),
+                         {'Gi1': {'out_octets': 10.0}})
+        self.assertEqual(sampler.update([{'name': 'Gi1', 'in_octets': 1200}], 30.0), {'Gi1': {'in_octets': 10.0}})
+
+
+class TestInterfaceCounterParsers(unittest.TestCase):
+    """Unit tests for the interface counter parsers"""
+
+    def test_get_interface_counters(self):
+        """Test the IETF counters are parsed as int"""
+        device = Device()
+        device.netconf_get.return_value = ietf_counters_reply([('Gi1', 100, 200, 't0')])
+        counters = device.get_interface_counters('Gi1')
+        device.netconf_get.assert_called_once_with(filter=interface_counters_filter('Gi1').to_xml())
+        self.assertEqual(counters, [{'name': 'Gi1', 'in_octets': 100, 'out_octets': 200, 'in_errors': 1,
+                                     'out_errors': None, 'in_discards': None, 'out_discards': None,
+                                     'discontinuity_time': 't0'}])
+
+    @patch('jeypyats.utils.interface_counters.time.time', side_effect=[100.0, 110.0])
+    def test_get_interface_rates(self, mock_time):
+        """Test successive samples give rates with the sampler of the device"""
+        device = Device()
+        device.netconf_get.return_value = ietf_counters_reply([('Gi1', 100, 200, 't0')])
+        self.assertEqual(device.get_interface_rates(), {})
+        device.netconf_get.return_value = ietf_counters_reply([('Gi1', 1100, 200, 't0')])
+        rates = device.get_interface_rates()
+        self.assertEqual((rates['Gi1']['in_octets'], rates['Gi1']['out_octets']), (100.0, 0.0))
+        self.assertEqual(len(device.interface_counter_sampler), 1)
+
+    def test_unknown_source(self):
+        """Test an unknown counter model is rejected"""
+        with self.assertRaises(JeyPyatsValueError):
+            interface_counters_filter(source='native')
+
+    def test_get_interface_counters_oc(self):
+        """Test the XRd OpenConfig counters"""
+        device = MagicMock()
+        device.dispatch.return_value = MagicMock(ok=True, xml="""<rpc-reply
+            xmlns="urn:ietf:params:xml:ns:netconf:base:1.0"><data>
+            <interfaces xmlns="http://openconfig.net/yang/interfaces"><interface><name>GigabitEthernet0/0/0/0</name>
+            <state><counters><in-octets>42</in-octets><out-octets>7</out-octets><last-clear>t0</last-clear>
+            </counters></state></interface></interfaces></data></rpc-reply>""")
+        counters = get_interface_counters_oc(device)
+        self.assertEqual((counters[0]['name'], counters[0]['in_octets'], counters[0]['out_octets']),
+                         ('GigabitEthernet0/0/0/0', 42, 7))
+        device.dispatch.return_value = MagicMock(ok=False)
+        self.assertEqual(get_interface_counters_oc(device), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
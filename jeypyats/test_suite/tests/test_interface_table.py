@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_interface_table.py
+# This file is a part of Netalps.fr
+#
+# Created: 18.10.2026 01:41:19
+# Author: Jeremie Rouzet
+#
+# Last Modified: 18.10.2026 01:41:19
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import unittest
+from unittest.mock import MagicMock
+from jeypyats.utils.interface_table import InterfaceTable, normalize_status, interface_type
+from jeypyats.parsers.iosxe.iosxe_interface_parsers_nc import IOSXEInterfacesParsersMixin, interface_table_filter
+from jeypyats.parsers.xrd.xrd_interface_parser_nc import get_interface_status
+from jeypyats.parsers.xrd.xrd_interface_parser_nc_oc import get_interface_status_oc
+from jeypyats.parsers.xrd.xrd_interface_parser_nc_xr import collect_interface_table_xr, get_interface_status_xr
+from jeypyats.test_suite.benchmarks.fixtures import FakeReply, rpc_reply
+from jeypyats.test_suite.benchmarks.subtree import apply_subtree_filter
+
+IOSXE_DATA = """
+    <interfaces-state xmlns="urn:ietf:params:xml:ns:yang:ietf-interfaces">
+        <interface><name>GigabitEthernet0/0</name><oper-status>up</oper-status><admin-status>up</admin-status></interface>
+        <interface><name>Cellular0/2/0</name><oper-status>down</oper-status><admin-status>up</admin-status></interface>
+    </interfaces-state>
+    <interfaces xmlns="http://openconfig.net/yang/interfaces">
+        <interface><name>GigabitEthernet0/0</name><state><oper-status>UP</oper-status>
+            <description>uplink</description></state></interface>
+        <interface><name>GigabitEthernet0/1</name><state><oper-status>LOWER_LAYER_DOWN</oper-status>
+            <admin-status>UP</admin-status></state></interface>
+    </interfaces>
+    <interfaces xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-interfaces-oper">
+        <interface><name>Cellular0/2/0</name><oper-status>if-oper-state-no-pass</oper-status></interface>
+        <interface><name>Cellular0/3/0</name><oper-status>if-oper-state-ready</oper-status>
+            <admin-status>if-state-up</admin-status></interface>
+    </interfaces>
+"""
+
+IOSXE_REPLY = rpc_reply(IOSXE_DATA)
+
+XR_REPLY = """<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="1"><data>
+    <interfaces xmlns="http://openconfig.net/yang/interfaces">
+        <interface><name>GigabitEthernet0/0/0/0</name><state><name>GigabitEthernet0/0/0/0</name>
+            <oper-status>UP</oper-status><admin-status>UP</admin-status></state></interface>
+    </interfaces>
+    <interfaces xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-pfi-im-cmd-oper"><interface-xr>
+        <interface><interface-name>GigabitEthernet0/0/0/0</interface-name><state>im-state-up</state></interface>
+        <interface><interface-name>GigabitEthernet0/0/0/1</interface-name><state>im-state-admin-down</state></interface>
+    </interface-xr></interfaces>
+</data></rpc-reply>"""
+
+
+class TestInterfaceTable(unittest.TestCase):
+    """Unit tests for the interface state table"""
+
+    def test_normalize_status(self):
+        """Test the statuses of every model are converted to the IETF values"""
+        self.assertEqual(normalize_status('UP'), 'up')
+        self.assertEqual(normalize_status('if-oper-state-ready'), 'up')
+        self.assertEqual(normalize_status('if-oper-state-no-pass'), 'down')
+        self.assertEqual(normalize_status('im-state-admin-down'), 'down')
+        self.assertEqual(normalize_status('if-state-up'), 'up')
+        self.assertIsNone(normalize_status(None))
+
+    def test_interface_type(self):
+        """Test the type of an interface is the alphabetic part of its name"""
+        self.assertEqual(interface_type('Cellular0/2/0'), 'Cellular')
+        self.assertEqual(interface_type('Port-channel1'), 'Port-channel')
+        self.assertIsNone(interface_type(''))
+
+    def test_merge_and_indexes(self):
+        """Test the first model fills the fields and the next ones only the missing fields"""
+        table = InterfaceTable()
+        table.add({'name': 'Cellular0/2/0', 'admin_status': 'up'}, 'ietf')
+        table.add({'name': 'Cellular0/2/0', 'oper_status': 'if-oper-state-ready', 'admin_status': 'if-state-down',
+                   'description': 'lte'}, 'iosxe')
+        table.add({'name': 'GigabitEthernet0/0', 'oper_status': 'down'}, 'ietf')
+        row = table['Cellular0/2/0']
+        self.assertEqual((row.oper_status, row.admin_status, row.description, row.source), ('up', 'up', 'lte', 'ietf'))
+        self.assertEqual([row.name for row in table.with_oper_status('UP')], ['Cellular0/2/0'])
+        self.assertEqual([row.name for row in table.with_oper_status(None)], [])
+        self.assertEqual([row.name for row in table.with_type('GigabitEthernet')], ['GigabitEthernet0/0'])
+        self.assertEqual(table.types(), ['Cellular', 'GigabitEthernet'])
+        self.assertEqual(table.rows('Loopback0'), [])
+        self.assertEqual(len(table), 2)
+
+    def test_iosxe_collect_and_views(self):
+        """Test the IOS-XE collector reads the three models with one get and the status functions answer from it"""
+        device = MagicMock()
+        device.netconf_get.return_value = MagicMock(xml=IOSXE_REPLY)
+        table = IOSXEInterfacesParsersMixin.collect_interface_table(device)
+        device.netconf_get.assert_called_once_with(filter=interface_table_filter())
+        self.assertIs(device.interface_table, table)
+        self.assertEqual(table['GigabitEthernet0/0'].description, 'uplink')
+        self.assertEqual(table['Cellular0/3/0'].oper_status, 'up')
+
+        device.netconf_get.reset_mock()
+        self.assertEqual(IOSXEInterfacesParsersMixin.get_interface_status(device, 'Cellular0/2/0', table=table),
+                         {'oper_status': 'down', 'admin_status': 'up'})
+        self.assertEqual(IOSXEInterfacesParsersMixin.get_interface_status(device, 'Loopback0', table=table),
+                         {'oper_status': 'unknown', 'admin_status': 'unknown'})
+        self.assertEqual(
+            IOSXEInterfacesParsersMixin.get_interfaces_cellular_status(device, table=table),
+            {'Cellular0/2/0': {'oper_status': 'if-oper-state-no-pass', 'admin_status': 'unknown'},
+             'Cellular0/3/0': {'oper_status': 'if-oper-state-ready', 'admin_status': 'if-state-up'}})
+        self.assertEqual(
+            IOSXEInterfacesParsersMixin.get_interfaces_status_openconfig(device, 'GigabitEthernet0/1', table=table),
+            {'GigabitEthernet0/1': {'oper_status': 'LOWER_LAYER_DOWN', 'admin_status': 'UP'}})
+        device.netconf_get.assert_not_called()
+
+    def test_iosxe_table_and_device_agree(self):
+        """Test the IOS-XE status functions return the same values from a table and from the device"""
+        device = MagicMock()
+        # the device applies the subtree filter of every query
+        device.netconf_get.side_effect = lambda filter: FakeReply(apply_subtree_filter(IOSXE_DATA, filter))
+        table = IOSXEInterfacesParsersMixin.collect_interface_table(device)
+        for function, args in ((IOSXEInterfacesParsersMixin.get_interfaces_status_openconfig, ()),
+                               (IOSXEInterfacesParsersMixin.get_interfaces_status_openconfig, ('GigabitEthernet0/1',)),
+                               (IOSXEInterfacesParsersMixin.get_interfaces_cellular_status, ()),
+                               (IOSXEInterfacesParsersMixin.get_interfaces_cellular_status, ('Cellular0/3/0',)),
+                               (IOSXEInterfacesParsersMixin.get_interface_status, ('Cellular0/2/0',)),
+                               (IOSXEInterfacesParsersMixin.get_interface_status, ('Cellular0/3/0',))):
+            with self.subTest(function=function.__name__, args=args):
+                self.assertEqual(function(device, *args, table=table), function(device, *args))
+
+    def test_xrd_table_and_device_agree(self):
+        """Test the XRd status functions return the same values from a table and from the device"""
+        device = MagicMock()
+        device.dispatch.return_value = MagicMock(ok=True, xml=XR_REPLY)
+        table = collect_interface_table_xr(device)
+        for function in (get_interface_status, get_interface_status_oc, get_interface_status_xr):
+            with self.subTest(function=function.__name__):
+                self.assertEqual(function(device, table=table), function(device))
+
+    def test_xrd_collect_and_views(self):
+        """Test the XRd collector reads OpenConfig and IOS XR with one dispatch and the status functions use it"""
+        device = MagicMock()
+        device.dispatch.return_value = MagicMock(ok=True, xml=XR_REPLY)
+        table = collect_interface_table_xr(device)
+        device.dispatch.assert_called_once()
+        self.assertEqual(table['GigabitEthernet0/0/0/1'].admin_status, 'down')
+
+        device.dispatch.reset_mock()
+        self.assertEqual(get_interface_status_xr(device, table=table), [
+            {'interface-name': 'GigabitEthernet0/0/0/0', 'state': 'im-state-up'},
+            {'interface-name': 'GigabitEthernet0/0/0/1', 'state': 'im-state-admin-down'}])
+        self.assertEqual(get_interface_status_oc(device, 'GigabitEthernet0/0/0/0', table=table),
+                         [{'name': 'GigabitEthernet0/0/0/0', 'oper-status': 'UP'}])
+        self.assertEqual(get_interface_status(device, 'GigabitEthernet0/0/0/1', table=table), [])
+        device.dispatch.assert_not_called()
+
+    def test_xrd_collect_failed(self):
+        """Test the XRd collector returns None when the get fails"""
+        device = MagicMock()
+        device.dispatch.return_value = MagicMock(ok=False)
+        self.assertIsNone(collect_interface_table_xr(device))
+
+
+if __name__ == '__main__':
+    unittest.main()
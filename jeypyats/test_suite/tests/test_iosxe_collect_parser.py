@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_iosxe_collect_parser.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 13:32:08
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 13:32:08
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import unittest
+from unittest.mock import MagicMock, patch
+from lxml import etree
+from ncclient.operations.rpc import RPCError
+from jeypyats.parsers.iosxe.iosxe_collect_parsers_nc import IOSXECollectParsersMixin
+from jeypyats.utils.utils import JeyPyatsValueError
+
+
+BATCH_DATA = """
+    <routing-state xmlns="urn:ietf:params:xml:ns:yang:ietf-routing">
+        <routing-instance>
+            <name>default</name>
+            <ribs>
+                <rib>
+                    <name>ipv4-default</name>
+                    <routes>
+                        <route>
+                            <destination-prefix>0.0.0.0/0</destination-prefix>
+                            <next-hop><next-hop-address>82.66.83.254</next-hop-address></next-hop>
+                        </route>
+                        <route>
+                            <destination-prefix>82.66.83.0/24</destination-prefix>
+                            <next-hop><outgoing-interface>GigabitEthernet0/0/0</outgoing-interface></next-hop>
+                        </route>
+                    </routes>
+                </rib>
+            </ribs>
+        </routing-instance>
+    </routing-state>
+    <ip-sla-stats xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-ip-sla-oper">
+        <ip-sla-stat><sla-index>1</sla-index><oper-state>active</oper-state></ip-sla-stat>
+    </ip-sla-stats>
+    <tracks xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-track-oper">
+        <track><track-number>1</track-number><track-state>up</track-state></track>
+    </tracks>
+    <cellular xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-cellular-oper">
+        <cellular>
+            <interface>
+                <name>Cellular0/2/0</name>
+                <sim><slot>0</slot><data-profile>1</data-profile></sim>
+            </interface>
+            <interface>
+                <name>Cellular0/3/0</name>
+                <sim><slot>1</slot><data-profile>2</data-profile></sim>
+            </interface>
+        </cellular>
+    </cellular>
+    <interfaces-state xmlns="urn:ietf:params:xml:ns:yang:ietf-interfaces">
+        <interface><name>Cellular0/2/0</name><admin-status>up</admin-status><oper-status>up</oper-status></interface>
+    </interfaces-state>
+"""
+
+
+def make_reply(data):
+    """Builds a mocked ncclient reply"""
+    reply = MagicMock()
+    reply.xml = f'<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="1"><data>{data}</data></rpc-reply>'
+    reply.data_xml = f'<data xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">{data}</data>'
+    return reply
+
+
+def rpc_error():
+    """Builds the RPCError raised by ncclient for an <rpc-error> reply"""
+    return RPCError(etree.fromstring(
+        '<rpc-error xmlns="urn:ietf:params:xml:ns:netconf:base:1.0"><error-type>application</error-type>'
+        '<error-tag>unknown-namespace</error-tag><error-severity>error</error-severity>'
+        '<error-message>unknown namespace</error-message></rpc-error>'))
+
+
+class TestIOSXECollectParser(unittest.TestCase):
+    """Unit tests for the IOS-XE batched state collection"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.mock_device = MagicMock()
+
+    @patch('jeypyats.parsers.iosxe.iosxe_collect_parsers_nc.logger')
+    def test_collect_single_get(self, mock_logger):
+        """Test every query is answered from a single NETCONF get"""
+        self.mock_device.netconf_get.return_value = make_reply(BATCH_DATA)
+
+        result = IOSXECollectParsersMixin.collect(
+            self.mock_device,
+            ['default_routes', 'ip_sla', 'tracks', 'sim:Cellular0/3/0', 'interface:Cellular0/2/0'],
+        )
+
+        self.mock_device.netconf_get.assert_called_once()
+        self.assertEqual(result['default_routes'][0]['next_hop'], '82.66.83.254')
+        self.assertEqual(len(result['default_routes']), 1)
+        self.assertIsNone(result['default_routes'][0]['interface'])
+        self.assertEqual(result['ip_sla'], {'1': {'oper_state': 'active'}})
+        self.assertEqual(result['tracks'], {'1': {'state': 'up'}})
+        self.assertEqual(result['sim:Cellular0/3/0'], {'slot': 1, 'data_profile': 2})
+        self.assertEqual(result['interface:Cellular0/2/0'], {'oper_status': 'up', 'admin_status': 'up'})
+
+    @patch('jeypyats.parsers.iosxe.iosxe_collect_parsers_nc.logger')
+    def test_collect_merges_filters(self, mock_logger):
+        """Test the subtree filters are merged as siblings of a single filter"""
+        self.mock_device.netconf_get.return_value = make_reply(BATCH_DATA)
+
+        IOSXECollectParsersMixin.collect(self.mock_device, ['default_routes', 'tracks', 'tracks', 'sim:Cellular0/2/0'])
+
+        filter_element = etree.fromstring(self.mock_device.netconf_get.call_args[1]['filter'])
+        self.assertEqual(
+            [etree.QName(child).localname for child in filter_element],
+            ['routing-state', 'tracks', 'cellular'],
+        )
+
+    @patch('jeypyats.parsers.iosxe.iosxe_collect_parsers_nc.logger')
+    def test_collect_falls_back_on_rpc_error(self, mock_logger):
+        """Test every query gets its own NETCONF get when the batched get fails"""
+        self.mock_device.netconf_get.side_effect = [rpc_error(), make_reply(BATCH_DATA), make_reply(BATCH_DATA)]
+
+        result = IOSXECollectParsersMixin.collect(self.mock_device, ['ip_sla', 'tracks'])
+
+        self.assertEqual(self.mock_device.netconf_get.call_count, 3)
+        self.assertEqual(result, {'ip_sla': {'1': {'oper_state': 'active'}}, 'tracks': {'1': {'state': 'up'}}})
+        self.assertEqual(mock_logger.warning.call_count, 2)
+
+    @patch('jeypyats.parsers.iosxe.iosxe_collect_parsers_nc.logger')
+    def test_collect_fallback_keeps_other_queries(self, mock_logger):
+        """Test a reply which is not ok triggers the fallback and a rejected query gives None"""
+        error_reply = make_reply(BATCH_DATA)
+        error_reply.ok = False
+        self.mock_device.netconf_get.side_effect = [error_reply, rpc_error(), make_reply(BATCH_DATA)]
+
+        result = IOSXECollectParsersMixin.collect(self.mock_device, ['ip_sla', 'tracks'])
+
+        self.assertEqual(result, {'ip_sla': None, 'tracks': {'1': {'state': 'up'}}})
+
+    def test_collect_unknown_query(self):
+        """Test unknown queries and missing arguments are rejected before any RPC is sent"""
+        with self.assertRaises(JeyPyatsValueError):
+            IOSXECollectParsersMixin.collect(self.mock_device, ['bgp'])
+        with self.assertRaises(JeyPyatsValueError):
+            IOSXECollectParsersMixin.collect(self.mock_device, ['sim'])
+        self.mock_device.netconf_get.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
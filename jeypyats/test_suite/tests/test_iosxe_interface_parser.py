@@ -59,13 +59,13 @@ class TestIOSXEInterfaceParser(unittest.TestCase):
         mock_response = MagicMock()
         mock_response.xml = """<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="1">
             <data>
-                <interfaces-state xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-interfaces-oper">
+                <interfaces xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-interfaces-oper">
                     <interface>
                         <name>Cellular0/2/0</name>
                         <oper-status>up</oper-status>
                         <admin-status>up</admin-status>
                     </interface>
-                </interfaces-state>
+                </interfaces>
             </data>
         </rpc-reply>"""
 
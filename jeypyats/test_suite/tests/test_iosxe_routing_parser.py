@@ -14,9 +14,44 @@
 # Copyright (c) 2026 Netalps.fr
 ########################################################################################################################
 
+import os
 import unittest
+from contextlib import contextmanager
 from unittest.mock import MagicMock, patch
-from jeypyats.parsers.iosxe.iosxe_routing_parsers_nc import IOSXERoutingParsersMixin
+from jeypyats.parsers.iosxe.iosxe_collect_parsers_nc import IOSXECollectParsersMixin
+from jeypyats.parsers.iosxe.iosxe_routing_parsers_nc import IOSXERoutingParsersMixin, covering_routes_filter
+from jeypyats.utils.netconf_connector import NetconfConnectorConnection, NetconfSessionPool
+from jeypyats.utils.utils import JeyPyatsStateError, JeyPyatsValueError
+
+
+def ietf_rib_reply(rib, routes):
+    entries = ''.join(
+        f"<route><destination-prefix>{prefix}</destination-prefix><source-protocol>{protocol}</source-protocol>"
+        f"<next-hop>{f'<next-hop-address>{next_hop}</next-hop-address>' if next_hop else ''}"
+        f"{f'<outgoing-interface>{interface}</outgoing-interface>' if interface else ''}</next-hop></route>"
+        for prefix, protocol, next_hop, interface in routes)
+    return MagicMock(xml=f"""<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0"><data>
+        <routing-state xmlns="urn:ietf:params:xml:ns:yang:ietf-routing"><routing-instance><name>default</name>
+        <ribs><rib><name>{rib}</name><routes>{entries}</routes></rib></ribs>
+        </routing-instance></routing-state></data></rpc-reply>""")
+
+
+def routing_reply(filter):
+    vrf = filter.split('<vrf-name>')[1].split('<')[0]
+    return MagicMock(xml=f"""<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+        <routing-table xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-rpc"><rt-entry>
+            <destination>10.0.0.0/8</destination><interface>{vrf}</interface>
+        </rt-entry></routing-table></rpc-reply>""")
+
+
+@contextmanager
+def pooled_session(pooled):
+    yield MagicMock()
+    pooled.append('released')
+
+
+class Device(IOSXERoutingParsersMixin):
+    """Device wired by NetconfConnectorConnection.connect()"""
 
 
 class TestIOSXERoutingParser(unittest.TestCase):
@@ -54,6 +89,27 @@ class TestIOSXERoutingParser(unittest.TestCase):
         # Verify the call was made
         self.mock_device.netconf_get.assert_called_once()
         self.assertIsInstance(result, list)
+        self.assertEqual(result[0], {
+            'prefix': '0.0.0.0/0',
+            'protocol': 'static',
+            'next_hop': '192.168.1.1',
+            'metric': None,
+            'interface': 'GigabitEthernet0/0',
+        })
+
+    def test_iter_routing_table(self):
+        """Test the routing table iterator yields the entries of the VRF"""
+        self.mock_device.netconf_get.return_value = MagicMock(xml="""<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+            <routing-table xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-rpc">
+                <rt-entry><destination>10.0.0.0/8</destination><gateway>10.1.1.2</gateway><metric>20</metric></rt-entry>
+                <rt-entry><destination>10.2.0.0/16</destination><gateway>10.1.1.3</gateway><metric>30</metric></rt-entry>
+            </routing-table>
+        </rpc-reply>""")
+
+        routes = IOSXERoutingParsersMixin.iter_routing_table(self.mock_device, 'CUSTOMER', output='record')
+
+        self.assertIn('<vrf-name>CUSTOMER</vrf-name>', self.mock_device.netconf_get.call_args[0][0])
+        self.assertEqual([(route.prefix, route.metric) for route in routes], [('10.0.0.0/8', 20), ('10.2.0.0/16', 30)])
 
     @patch('jeypyats.parsers.iosxe.iosxe_routing_parsers_nc.logger')
     def test_get_routing_table_custom_vrf(self, mock_logger):
@@ -210,6 +266,165 @@ class TestIOSXERoutingParser(unittest.TestCase):
         self.assertEqual(result[0]['prefix'], '0.0.0.0/0')
         self.assertEqual(result[0]['next_hop'], '82.66.83.254')
 
+    def test_default_routes_filter_matches_the_prefix(self):
+        """Test the default route query is filtered on the instance, the rib and the prefix"""
+        self.mock_device.netconf_get.return_value = ietf_rib_reply(
+            'ipv4-default', [('0.0.0.0/0', 'static', '82.66.83.254', 'GigabitEthernet0/0/0')])
+
+        IOSXERoutingParsersMixin.get_routing_table_default_routes(self.mock_device)
+
+        call_args = self.mock_device.netconf_get.call_args[1]['filter']
+        self.assertIn('<name>default</name>', call_args)
+        self.assertIn('<name>ipv4-default</name>', call_args)
+        self.assertIn('<destination-prefix>0.0.0.0/0</destination-prefix>', call_args)
+
+    def test_default_route_interface_is_queried(self):
+        """Test the interface of a default route with only a next hop is resolved with targeted queries"""
+        self.mock_device.netconf_get.side_effect = [
+            ietf_rib_reply('ipv4-default', [('0.0.0.0/0', 'static', '82.66.83.254', None)]),
+            ietf_rib_reply('ipv4-default', [('82.66.83.0/24', 'static', '10.0.0.1', None),
+                                            ('82.66.0.0/16', 'direct', None, 'GigabitEthernet0/0/2')]),
+            ietf_rib_reply('ipv4-default', [('10.0.0.0/30', 'direct', None, 'GigabitEthernet0/0/0')]),
+        ]
+
+        result = IOSXERoutingParsersMixin.get_routing_table_default_routes(self.mock_device, resolve=True)
+
+        self.assertEqual(result[0]['interface'], 'GigabitEthernet0/0/0')
+        self.assertEqual(self.mock_device.netconf_get.call_count, 3)
+        second_filter = self.mock_device.netconf_get.call_args_list[1][1]['filter']
+        self.assertIn('<destination-prefix>82.66.83.254/32</destination-prefix>', second_filter)
+        self.assertIn('<destination-prefix>82.66.83.0/24</destination-prefix>', second_filter)
+        self.assertNotIn('0.0.0.0/0', second_filter)
+
+    def test_default_route_interface_is_not_resolved_by_default(self):
+        """Test a default route with only a next hop is returned without further queries, like collect() does"""
+        reply = ietf_rib_reply('ipv4-default', [('0.0.0.0/0', 'static', '82.66.83.254', None)])
+        self.mock_device.netconf_get.return_value = reply
+
+        result = IOSXERoutingParsersMixin.get_routing_table_default_routes(self.mock_device)
+
+        self.mock_device.netconf_get.assert_called_once()
+        self.assertIsNone(result[0]['interface'])
+        self.assertEqual(result, IOSXECollectParsersMixin.collect(self.mock_device, ['default_routes'])['default_routes'])
+
+    def test_ipv6_default_routes(self):
+        """Test the IPv6 variant queries the ipv6-default rib"""
+        self.mock_device.netconf_get.return_value = ietf_rib_reply(
+            'ipv6-default', [('::/0', 'static', '2001:db8::1', 'GigabitEthernet0/0/0')])
+
+        result = IOSXERoutingParsersMixin.get_ipv6_default_routes(self.mock_device)
+
+        call_args = self.mock_device.netconf_get.call_args[1]['filter']
+        self.assertIn('<destination-prefix>::/0</destination-prefix>', call_args)
+        self.assertEqual(result[0]['next_hop'], '2001:db8::1')
+        self.assertEqual(covering_routes_filter('2001:db8::1').count('<destination-prefix>'), 128)
+
+    def test_native_default_routes(self):
+        """Test the static default routes of the native model"""
+        self.mock_device.netconf_get.return_value = MagicMock(xml="""<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+            <data><native xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-native"><ip><route>
+                <ip-route-interface-forwarding-list>
+                    <prefix>0.0.0.0</prefix><mask>0.0.0.0</mask>
+                    <fwd-list><fwd>Cellular0/2/0</fwd><metric>10</metric></fwd-list>
+                    <fwd-list><fwd>GigabitEthernet0/0/0</fwd><interface-next-hop><ip-address>82.66.83.254</ip-address></interface-next-hop></fwd-list>
+                </ip-route-interface-forwarding-list>
+            </route></ip></native></data>
+        </rpc-reply>""")
+
+        result = IOSXERoutingParsersMixin.get_routing_table_default_routes(self.mock_device, source='native')
+
+        call_args = self.mock_device.netconf_get.call_args[1]['filter']
+        self.assertIn('<ip-route-interface-forwarding-list><prefix>0.0.0.0</prefix><mask>0.0.0.0</mask>', call_args)
+        self.assertEqual(result, [
+            {'prefix': '0.0.0.0/0', 'protocol': 'static', 'next_hop': None, 'metric': '10', 'interface': 'Cellular0/2/0'},
+            {'prefix': '0.0.0.0/0', 'protocol': 'static', 'next_hop': '82.66.83.254', 'metric': None,
+             'interface': 'GigabitEthernet0/0/0'},
+        ])
+        with self.assertRaises(JeyPyatsValueError):
+            IOSXERoutingParsersMixin.get_routing_table_default_routes(self.mock_device, source='snmp')
+
+    def test_get_routing_tables_bulk(self):
+        """Test the routes of every VRF are fetched with a single get and grouped by VRF"""
+        self.mock_device.netconf_get.return_value = MagicMock(xml="""<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0"><data>
+            <routing-state xmlns="urn:ietf:params:xml:ns:yang:ietf-routing">
+                <routing-instance><name>default</name><ribs>
+                    <rib><name>ipv4-default</name><routes>
+                        <route><destination-prefix>0.0.0.0/0</destination-prefix><next-hop><next-hop-address>82.66.83.254</next-hop-address></next-hop></route>
+                    </routes></rib>
+                    <rib><name>ipv6-default</name><routes>
+                        <route><destination-prefix>::/0</destination-prefix></route>
+                    </routes></rib>
+                </ribs></routing-instance>
+                <routing-instance><name>CUSTOMER</name><ribs><rib><name>ipv4-default</name><routes>
+                    <route><destination-prefix>10.0.0.0/8</destination-prefix><metric>20</metric></route>
+                    <route><destination-prefix>10.1.0.0/16</destination-prefix><metric>30</metric></route>
+                </routes></rib></ribs></routing-instance>
+            </routing-state></data></rpc-reply>""")
+
+        result = IOSXERoutingParsersMixin.get_routing_tables(self.mock_device, output='record')
+
+        self.mock_device.netconf_get.assert_called_once()
+        self.assertEqual(list(result), ['default', 'CUSTOMER'])
+        self.assertEqual(result['default'][0].next_hop, '82.66.83.254')
+        self.assertEqual([route.metric for route in result['CUSTOMER']], [20, 30])
+
+        IOSXERoutingParsersMixin.get_routing_tables(self.mock_device, vrfs=['CUSTOMER', 'EMPTY'])
+        call_args = self.mock_device.netconf_get.call_args[1]['filter']
+        self.assertIn('<name>CUSTOMER</name>', call_args)
+        self.assertIn('<name>EMPTY</name>', call_args)
+
+    def test_get_routing_tables_concurrent(self):
+        """Test every discovered VRF is fetched through netconf_get on a pooled session of its own"""
+        vrf_names = MagicMock(xml="""<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0"><data>
+            <native xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-native"><vrf>
+                <definition><name>BLUE</name></definition><definition><name>RED</name></definition>
+            </vrf></native></data></rpc-reply>""")
+        self.mock_device.netconf_get.side_effect = \
+            lambda filter: vrf_names if '<native' in filter else routing_reply(filter)
+        pooled = []
+        self.mock_device.netconf_pooled_session = lambda timeout=None: pooled_session(pooled)
+        self.mock_device.netconf_free_sessions = lambda: 1
+
+        result = IOSXERoutingParsersMixin.get_routing_tables(self.mock_device, mode='concurrent', concurrency=4)
+
+        self.assertEqual({vrf: routes[0]['interface'] for vrf, routes in result.items()},
+                         {'default': 'default', 'BLUE': 'BLUE', 'RED': 'RED'})
+        self.assertEqual(pooled, ['released'] * 3)
+
+        self.mock_device.netconf_get.side_effect = RuntimeError("session closed")
+        with self.assertRaises(JeyPyatsStateError):
+            IOSXERoutingParsersMixin.get_routing_tables(self.mock_device, vrfs=['BLUE'], mode='concurrent')
+        with self.assertRaises(JeyPyatsValueError):
+            IOSXERoutingParsersMixin.get_routing_tables(self.mock_device, mode='serial')
+
+    @patch.dict(os.environ, {'PYATS_USER': 'admin', 'PYATS_PASSWORD': 'secret'})
+    @patch.object(NetconfConnectorConnection, 'connection_info', {'ip': '10.0.0.1', 'port': 830})
+    @patch('jeypyats.utils.netconf_connector.manager.connect')
+    def test_get_routing_tables_concurrent_pool_exhausted(self, mock_connect):
+        """Test the concurrent mode fails fast when the connection and a subscription hold every session"""
+        def new_session(*args, **kwargs):
+            session = MagicMock(connected=True)
+            session.get.side_effect = routing_reply
+            return session
+
+        mock_connect.side_effect = new_session
+        pool = NetconfSessionPool(max_sessions_per_device=2, connect_timeout=0.5)
+        connection = NetconfConnectorConnection()
+        connection.pool = pool
+        connection.device = device = Device()
+        connection.connect()
+        subscription = device.netconf_open_session()
+
+        with self.assertRaises(JeyPyatsStateError):
+            device.get_routing_tables(vrfs=['BLUE', 'RED'], mode='concurrent', timeout=5)
+        self.assertEqual(pool.free_sessions('10.0.0.1', 830, 'admin'), 0)
+
+        device.netconf_release_session(subscription)
+        result = device.get_routing_tables(vrfs=['BLUE', 'RED'], mode='concurrent', timeout=5)
+        self.assertEqual({vrf: routes[0]['interface'] for vrf, routes in result.items()},
+                         {'BLUE': 'BLUE', 'RED': 'RED'})
+        self.assertEqual(pool.free_sessions('10.0.0.1', 830, 'admin'), 1)
+        self.assertEqual(mock_connect.call_count, 2)
 
 if __name__ == '__main__':
     unittest.main()
@@ -16,7 +16,20 @@
 
 import unittest
 from unittest.mock import MagicMock, patch
-from jeypyats.parsers.iosxe.iosxe_syslog_parsers_nc import IOSXESyslogParsersMixin
+from jeypyats.parsers.iosxe import iosxe_syslog_parsers_nc
+from jeypyats.parsers.iosxe.iosxe_syslog_parsers_nc import IOSXESyslogParsersMixin, SyslogCursor, parse_syslog_line
+
+
+def syslog_reply(lines):
+    response = MagicMock()
+    response.xml = f"""<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="1">
+        <data>
+            <logging xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-logging">
+                <buffered><messages>{chr(10).join(lines)}</messages></buffered>
+            </logging>
+        </data>
+    </rpc-reply>"""
+    return response
 
 
 class TestIOSXESyslogParser(unittest.TestCase):
@@ -74,6 +87,68 @@ class TestIOSXESyslogParser(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertIn('LINK', result[0]['text'])
 
+    def test_get_syslog_messages_only_parses_new_lines(self):
+        """Test repeated calls reuse the messages already parsed and parse the appended lines only"""
+        self.mock_device = MagicMock(spec=['netconf_get'])
+        lines = [f"*Oct 17 18:20:{index:02d}.000: %SYS-5-CONFIG_I: message {index}" for index in range(4)]
+        self.mock_device.netconf_get.return_value = syslog_reply(lines)
+        self.assertEqual(len(IOSXESyslogParsersMixin.get_syslog_messages(self.mock_device)), 4)
+
+        # the buffer wraps: the two oldest lines are dropped and two lines are appended
+        lines = lines[2:] + ["*Oct 17 18:21:00.000: %HA_EM-6-LOG: SIM_SWITCH: Bascule automatique vers SIM1",
+                             "*Oct 17 18:21:05.000: %HA_EM-6-LOG: FTTH_RESTORE: FTTH restored"]
+        self.mock_device.netconf_get.return_value = syslog_reply(lines)
+        with patch.object(iosxe_syslog_parsers_nc, 'parse_syslog_line',
+                          wraps=iosxe_syslog_parsers_nc.parse_syslog_line) as parse_line:
+            new = IOSXESyslogParsersMixin.get_syslog_messages(self.mock_device, new_only=True)
+        self.assertEqual(parse_line.call_count, 2)
+        self.assertEqual(len(new), 2)
+
+        result = IOSXESyslogParsersMixin.get_syslog_messages(self.mock_device, filter_text=['sim1', 'FTTH'])
+        self.assertEqual(len(result), 2)
+        self.assertEqual(len(IOSXESyslogParsersMixin.get_syslog_messages(self.mock_device)), 4)
+        self.assertEqual(IOSXESyslogParsersMixin.get_syslog_messages(self.mock_device, new_only=True), [])
+
+    @patch('jeypyats.parsers.iosxe.iosxe_syslog_parsers_nc.dump_payload')
+    def test_messages_are_dumped_once(self, mock_dump):
+        """Test the parsed messages are dumped once, with the device, and not by the reply parser of collect()"""
+        self.mock_device.netconf_get.return_value = syslog_reply(
+            ["*Oct 17 18:20:00.000: %SYS-5-CONFIG_I: Configured from console by console"])
+        messages = IOSXESyslogParsersMixin.get_syslog_messages(self.mock_device)
+        mock_dump.assert_called_once_with(iosxe_syslog_parsers_nc.logger, "Syslog messages", messages,
+                                          device=self.mock_device)
+        mock_dump.reset_mock()
+        iosxe_syslog_parsers_nc.parse_syslog_messages(self.mock_device.netconf_get.return_value)
+        mock_dump.assert_not_called()
+
+    def test_syslog_cursor_restarts_on_cleared_buffer(self):
+        """Test a cleared buffer, without the last seen line, is parsed from the start"""
+        cursor = SyslogCursor()
+        cursor.advance("*Oct 17 18:20:00.000: %SYS-5-CONFIG_I: before clear")
+        new = cursor.advance("*Oct 17 18:22:00.000: %SYS-5-CONFIG_I: after clear")
+
+        self.assertEqual(len(new), 1)
+        self.assertIn('after clear', new[0]['text'])
+        self.assertEqual(len(cursor.messages), 1)
+        self.assertEqual(cursor.sequence, 2)
+
+    def test_syslog_cursor_repeated_last_line(self):
+        """Test appended lines repeating the last seen line are all returned, a wrapped buffer repeating it is parsed"""
+        up = "*Oct 17 18:20:00.000: %TRACK-6-STATE: 1 ip sla 1 reachability Down -> Up"
+        down = "*Oct 17 18:20:30.000: %TRACK-6-STATE: 1 ip sla 1 reachability Up -> Down"
+        cursor = SyslogCursor()
+        cursor.advance('\n'.join([down, up]))
+
+        new = cursor.advance('\n'.join([down, up, down, up]))
+        self.assertEqual(new, [parse_syslog_line(down), parse_syslog_line(up)])
+        self.assertEqual(len(cursor.messages), 4)
+
+        # the buffer wraps and the last seen line occurs twice: parsed from the start
+        new = cursor.advance('\n'.join([up, down, up, down, up]))
+        self.assertEqual(len(new), 5)
+        self.assertEqual(len(cursor.messages), 5)
+        self.assertEqual(cursor.sequence, 9)
+
 
 if __name__ == '__main__':
     unittest.main()
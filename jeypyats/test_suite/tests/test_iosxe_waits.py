@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_iosxe_waits.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 17:48:21
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 17:48:21
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import unittest
+from unittest.mock import MagicMock, patch
+from jeypyats.parsers.libs.iosxe.waits import WaitsMixin, poll_until
+from jeypyats.utils.utils import JeyPyatsStateError
+
+
+class FakeTime:
+    """Clock advanced by sleep() only"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestIOSXEWaits(unittest.TestCase):
+    """Unit tests for the IOS-XE polling waits"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.mock_device = MagicMock()
+        self.fake_time = FakeTime()
+        patcher = patch('jeypyats.parsers.libs.iosxe.waits.time', self.fake_time)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch('jeypyats.parsers.libs.iosxe.waits.logger')
+    def test_wait_for_default_route_converges(self, mock_logger):
+        """Test the wait returns as soon as the route is installed, with backoff between polls"""
+        self.mock_device.get_routing_table_default_routes.side_effect = [
+            [{'next_hop': '82.66.83.254', 'interface': 'GigabitEthernet0/0/0'}],
+            [],
+            [{'next_hop': None, 'interface': 'Cellular0/2/0'}],
+        ]
+
+        result = WaitsMixin.wait_for_default_route(self.mock_device, interface='Cellular0/2/0', interval=1, backoff=2)
+
+        self.assertEqual(result.attempts, 3)
+        self.assertEqual(self.fake_time.sleeps, [1, 2])
+        self.assertEqual(result.elapsed, 3)
+        self.assertEqual(result.value[0]['interface'], 'Cellular0/2/0')
+
+    @patch('jeypyats.parsers.libs.iosxe.waits.query_next_hop_interface')
+    @patch('jeypyats.parsers.libs.iosxe.waits.logger')
+    def test_wait_for_default_route_resolves_once(self, mock_logger, mock_resolve):
+        """Test the interface of a next hop is resolved once per wait, and retried until the next hop is routed"""
+        primary = {'next_hop': '82.66.83.254', 'interface': None}
+        backup = {'next_hop': '10.0.0.1', 'interface': None}
+        self.mock_device.get_routing_table_default_routes.side_effect = [
+            [dict(primary)], [dict(primary)], [dict(primary), dict(backup)], [dict(primary), dict(backup)]]
+        mock_resolve.side_effect = ['GigabitEthernet0/0/0', None, 'Cellular0/2/0']
+
+        result = WaitsMixin.wait_for_default_route(self.mock_device, interface='Cellular0/2/0', interval=1, backoff=1)
+
+        self.assertEqual(result.attempts, 4)
+        self.assertEqual(result.value[1]['interface'], 'Cellular0/2/0')
+        self.assertEqual([call.args[1] for call in mock_resolve.call_args_list],
+                         ['82.66.83.254', '10.0.0.1', '10.0.0.1'])
+        self.mock_device.get_routing_table_default_routes.assert_called_with(resolve=False)
+
+    @patch('jeypyats.parsers.libs.iosxe.waits.logger')
+    def test_wait_for_track_state_times_out(self, mock_logger):
+        """Test a wait that never converges raises a state error at the deadline"""
+        self.mock_device.get_track_states.return_value = {'1': {'state': 'down'}}
+
+        with self.assertRaises(JeyPyatsStateError) as context:
+            WaitsMixin.wait_for_track_state(self.mock_device, 1, 'up', timeout=10, interval=1, backoff=2, max_interval=4)
+
+        self.assertIn('track 1 up', str(context.exception))
+        # sleeps are capped by max_interval and never go past the deadline
+        self.assertEqual(self.fake_time.sleeps, [1, 2, 4, 3])
+
+    @patch('jeypyats.parsers.libs.iosxe.waits.logger')
+    def test_wait_for_sim_slot_ignores_poll_errors(self, mock_logger):
+        """Test errors raised while the device converges are retried"""
+        self.mock_device.get_cellular_sim_config.side_effect = [
+            Exception("session busy"),
+            {'slot': 1, 'data_profile': 1},
+            {'slot': 1, 'data_profile': 2},
+        ]
+
+        result = WaitsMixin.wait_for_sim_slot(self.mock_device, 'Cellular0/2/0', slot=1, data_profile=2)
+
+        self.assertEqual(result.value, {'slot': 1, 'data_profile': 2})
+        self.assertEqual(result.attempts, 3)
+        self.mock_device.get_cellular_sim_config.assert_called_with('Cellular0/2/0')
+
+    def test_poll_until_first_poll(self):
+        """Test no sleep happens when the state is already reached"""
+        result = poll_until(lambda: 'up', lambda value: value == 'up')
+
+        self.assertEqual(result.attempts, 1)
+        self.assertEqual(self.fake_time.sleeps, [])
+
+    def test_wait_for_default_route_requires_a_target(self):
+        """Test a default route wait needs a next hop or an interface"""
+        with self.assertRaises(ValueError):
+            WaitsMixin.wait_for_default_route(self.mock_device)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_netconf_connector.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 14:20:37
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 14:20:37
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+from ncclient.transport import TransportError
+from jeypyats.utils.netconf_connector import NetconfSessionPool, NetconfConnectorConnection
+from jeypyats.utils.utils import JeyPyatsNotConnectedError
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def new_session(*args, **kwargs):
+    """Builds a healthy mocked ncclient manager"""
+    session = MagicMock()
+    session.connected = True
+    return session
+
+
+@patch('jeypyats.utils.netconf_connector.manager.connect', side_effect=new_session)
+class TestNetconfSessionPool(unittest.TestCase):
+    """Unit tests for the NETCONF session pool"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.clock = FakeClock()
+        self.pool = NetconfSessionPool(max_sessions_per_device=2, idle_timeout=60, clock=self.clock)
+
+    def test_released_session_is_reused(self, mock_connect):
+        """Test a released session is handed out again without reconnecting"""
+        first = self.pool.acquire('10.0.0.1', 830, 'admin', 'secret')
+        self.pool.release(first)
+        second = self.pool.acquire('10.0.0.1', 830, 'admin', 'secret')
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_connect.call_count, 1)
+
+    def test_sessions_are_keyed_by_device_and_user(self, mock_connect):
+        """Test different devices or users get different sessions"""
+        with self.pool.session('10.0.0.1', 830, 'admin', 'secret') as first:
+            pass
+        with self.pool.session('10.0.0.2', 830, 'admin', 'secret') as second:
+            pass
+        with self.pool.session('10.0.0.1', 830, 'operator', 'secret') as third:
+            pass
+
+        self.assertEqual(len({id(first), id(second), id(third)}), 3)
+        self.assertEqual(len(self.pool.stats()), 3)
+
+    def test_max_sessions_per_device(self, mock_connect):
+        """Test acquire times out when every session of the device is in use"""
+        self.pool.acquire('10.0.0.1', 830, 'admin', 'secret')
+        self.pool.acquire('10.0.0.1', 830, 'admin', 'secret')
+
+        with self.assertRaises(JeyPyatsNotConnectedError):
+            self.pool.acquire('10.0.0.1', 830, 'admin', 'secret', timeout=0)
+        self.assertEqual(self.pool.stats()[('10.0.0.1', 830, 'admin')], {'open': 2, 'in_use': 2})
+
+    def test_broken_session_is_replaced(self, mock_connect):
+        """Test a session failing the health check is closed and replaced"""
+        first = self.pool.acquire('10.0.0.1', 830, 'admin', 'secret')
+        self.pool.release(first)
+        first.connected = False
+
+        second = self.pool.acquire('10.0.0.1', 830, 'admin', 'secret')
+
+        self.assertIsNot(first, second)
+        first.close_session.assert_called_once()
+        self.assertEqual(self.pool.stats()[('10.0.0.1', 830, 'admin')], {'open': 1, 'in_use': 1})
+
+    def test_idle_sessions_are_evicted(self, mock_connect):
+        """Test sessions idle for longer than idle_timeout are closed"""
+        session = self.pool.acquire('10.0.0.1', 830, 'admin', 'secret')
+        self.pool.release(session)
+
+        self.clock.now = 30
+        self.assertEqual(self.pool.evict_idle(), 0)
+        self.clock.now = 61
+        self.assertEqual(self.pool.evict_idle(), 1)
+
+        session.close_session.assert_called_once()
+        self.assertEqual(self.pool.stats(), {})
+
+    def test_failed_connection_frees_the_slot(self, mock_connect):
+        """Test a failed connection raises and does not count against the device limit"""
+        mock_connect.side_effect = [Exception("unreachable"), new_session(), new_session()]
+
+        with self.assertRaises(JeyPyatsNotConnectedError):
+            self.pool.acquire('10.0.0.1', 830, 'admin', 'secret')
+        self.pool.acquire('10.0.0.1', 830, 'admin', 'secret')
+        self.pool.acquire('10.0.0.1', 830, 'admin', 'secret')
+
+    def test_connection_reconnects_on_transport_error(self, mock_connect):
+        """Test NetconfConnectorConnection transparently reconnects a broken session"""
+        connection = NetconfConnectorConnection()
+        connection.pool = self.pool
+        connection.nc = self.pool.acquire('10.0.0.1', 830, 'admin', 'secret')
+        broken = connection.nc
+        broken.get.side_effect = TransportError("Socket closed")
+
+        reply = connection.netconf_get(filter='<filter/>')
+
+        self.assertIsNot(connection.nc, broken)
+        self.assertIs(reply, connection.nc.get.return_value)
+        self.assertEqual(mock_connect.call_count, 2)
+
+    @patch.dict(os.environ, {'PYATS_USER': 'admin', 'PYATS_PASSWORD': 'secret'})
+    @patch.object(NetconfConnectorConnection, 'connection_info', {'ip': '10.0.0.1', 'port': 830})
+    def test_open_session_times_out_when_the_pool_is_full(self, mock_connect):
+        """Test the session of the connection counts against the limit and open_session fails fast"""
+        connection = NetconfConnectorConnection()
+        connection.pool = self.pool
+        connection.connect()
+        subscription = connection.open_session()
+        with self.assertRaises(JeyPyatsNotConnectedError):
+            connection.open_session(timeout=0)
+        self.pool.release(subscription)
+        self.assertIsNotNone(connection.open_session(timeout=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_notifications.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 18:55:30
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 18:55:30
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import queue
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+from jeypyats.utils.notifications import EventBuffer, NotificationSubscription, decode_notification
+from jeypyats.parsers.iosxe.iosxe_notification_parsers_nc import IOSXENotificationParsersMixin
+
+SYSLOG_NOTIFICATION = """<notification xmlns="urn:ietf:params:xml:ns:netconf:notification:1.0">
+    <eventTime>2026-10-17T18:20:45.123Z</eventTime>
+    <syslog-message xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-logging">
+        <severity>5</severity>
+        <message>%HA_EM-6-LOG: SIM_SWITCH: Bascule automatique vers SIM1</message>
+    </syslog-message>
+</notification>"""
+
+EEM_NOTIFICATION = """<notification xmlns="urn:ietf:params:xml:ns:netconf:notification:1.0">
+    <eventTime>2026-10-17T18:21:02.000Z</eventTime>
+    <eem-event xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-eem"><msg>FTTH restored</msg></eem-event>
+</notification>"""
+
+
+class FakeNotification:
+    def __init__(self, xml):
+        self.notification_xml = xml
+
+
+class FakeNotificationManager:
+    """ncclient manager whose notifications are pushed by the test"""
+
+    def __init__(self):
+        self.notifications = queue.Queue()
+        self.subscriptions = []
+        self.closed = threading.Event()
+
+    def create_subscription(self, filter=None, stream_name=None):
+        self.subscriptions.append((filter, stream_name))
+
+    def push(self, xml):
+        self.notifications.put(FakeNotification(xml))
+
+    def take_notification(self, block=True, timeout=None):
+        try:
+            return self.notifications.get(block=block, timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close_session(self):
+        self.closed.set()
+
+
+class TestNotifications(unittest.TestCase):
+    """Unit tests for the NETCONF notification subscriptions"""
+
+    def test_decode_notification(self):
+        """Test the event kind, time and text are extracted from the notification"""
+        event = decode_notification(SYSLOG_NOTIFICATION)
+        self.assertEqual(event['kind'], 'syslog')
+        self.assertEqual(event['event_time'], '2026-10-17T18:20:45.123Z')
+        self.assertIn('Bascule automatique vers SIM1', event['text'])
+        self.assertEqual(event['record']['severity'], '5')
+
+        self.assertEqual(decode_notification(EEM_NOTIFICATION)['kind'], 'eem')
+
+    def test_event_buffer_is_bounded(self):
+        """Test the oldest events are dropped and sequence numbers keep growing"""
+        buffer = EventBuffer(size=3)
+        for index in range(5):
+            buffer.append({'kind': 'syslog', 'text': f'message {index}'})
+
+        self.assertEqual([event['seq'] for event in buffer.events()], [3, 4, 5])
+        self.assertEqual(buffer.dropped, 2)
+        self.assertEqual(buffer.last_seq, 5)
+        self.assertEqual(buffer.events('message [34]', since=3)[0]['seq'], 4)
+        self.assertIsNone(buffer.wait_for('message 9', timeout=0.01))
+
+    def test_subscription_delivers_events(self):
+        """Test notifications received after the subscription wake up a waiting testcase"""
+        nc = FakeNotificationManager()
+        on_close = MagicMock()
+        subscription = NotificationSubscription(nc, buffer_size=10, on_close=on_close, poll_interval=0.01)
+        subscription.start(stream='NETCONF')
+        self.assertEqual(nc.subscriptions, [(None, 'NETCONF')])
+
+        threading.Timer(0.05, nc.push, args=(EEM_NOTIFICATION,)).start()
+        nc.push(SYSLOG_NOTIFICATION)
+
+        event = subscription.wait_for_message('FTTH restored', timeout=2)
+        self.assertEqual(event['kind'], 'eem')
+        self.assertEqual(event['seq'], 2)
+        self.assertEqual(len(subscription.messages(kind='syslog')), 1)
+
+        subscription.stop()
+        self.assertFalse(subscription.active)
+        self.assertTrue(nc.closed.is_set())
+        on_close.assert_called_once_with(nc)
+
+    def test_unknown_protocol(self):
+        """Test an unknown subscription protocol is rejected"""
+        with self.assertRaises(ValueError):
+            NotificationSubscription(FakeNotificationManager()).start(protocol='gnmi')
+
+    def test_wait_for_message_falls_back_to_syslog(self):
+        """Test the syslog buffer is searched when no subscription is running"""
+        mock_device = MagicMock()
+        mock_device.event_subscription = None
+        mock_device.get_syslog_messages.return_value = [
+            {'timestamp': 'Oct 17 18:20:45', 'facility': '%HA_EM-6-LOG', 'text': 'SIM_SWITCH: Bascule automatique vers SIM1'},
+        ]
+
+        with patch('jeypyats.parsers.libs.iosxe.waits.logger'):
+            message = IOSXENotificationParsersMixin.wait_for_message(mock_device, 'vers SIM1', timeout=1)
+
+        self.assertEqual(message['facility'], '%HA_EM-6-LOG')
+
+    def test_wait_for_message_defaults_to_new_events(self):
+        """Test the events buffered before the call only match with an explicit since"""
+        nc = FakeNotificationManager()
+        subscription = NotificationSubscription(nc, poll_interval=0.01)
+        subscription.start()
+        subscription.buffer.append(decode_notification(SYSLOG_NOTIFICATION))
+        mock_device = MagicMock()
+        mock_device.event_subscription = subscription
+
+        self.assertIsNone(IOSXENotificationParsersMixin.wait_for_message(mock_device, 'vers SIM1', timeout=0.05))
+        event = IOSXENotificationParsersMixin.wait_for_message(mock_device, 'vers SIM1', timeout=0.05, since=0)
+        self.assertEqual(event['seq'], 1)
+
+        threading.Timer(0.05, nc.push, args=(SYSLOG_NOTIFICATION,)).start()
+        event = IOSXENotificationParsersMixin.wait_for_message(mock_device, 'vers SIM1', timeout=2)
+        self.assertEqual(event['seq'], 2)
+        subscription.stop()
+
+    def test_wait_for_message_polls_new_syslog_messages(self):
+        """Test the polling fallback moves the syslog cursor first and only reads the new messages"""
+        old = {'timestamp': 'Oct 17 18:20:45', 'facility': '%HA_EM-6-LOG', 'text': 'SIM_SWITCH: vers SIM1 (old)'}
+        new = {'timestamp': 'Oct 17 18:25:02', 'facility': '%HA_EM-6-LOG', 'text': 'SIM_SWITCH: vers SIM1'}
+        replies = [[old], [], [new]]
+        mock_device = MagicMock()
+        mock_device.event_subscription = None
+        mock_device.get_syslog_messages.side_effect = lambda new_only=False: replies.pop(0)
+
+        with patch('jeypyats.parsers.libs.iosxe.waits.time.sleep'), patch('jeypyats.parsers.libs.iosxe.waits.logger'):
+            message = IOSXENotificationParsersMixin.wait_for_message(mock_device, 'vers SIM1', timeout=10)
+
+        self.assertEqual(message, new)
+        for call in mock_device.get_syslog_messages.call_args_list:
+            self.assertEqual(call.kwargs, {'new_only': True})
+
+    def test_wait_for_message_after_the_subscription_died(self):
+        """Test a waiter falls back to polling when the reader thread stops instead of blocking until its timeout"""
+        nc = FakeNotificationManager()
+        failing = threading.Event()
+        take_notification = nc.take_notification
+
+        def take_or_fail(block=True, timeout=None):
+            if failing.is_set():
+                raise EOFError("session closed")
+            return take_notification(block=block, timeout=timeout)
+
+        nc.take_notification = take_or_fail
+        subscription = NotificationSubscription(nc, poll_interval=0.01)
+        subscription.start()
+        mock_device = MagicMock()
+        mock_device.event_subscription = subscription
+        mock_device.get_syslog_messages.return_value = [
+            {'timestamp': 'Oct 17 18:21:02', 'facility': '%HA_EM-6-LOG', 'text': 'FTTH restored'},
+        ]
+
+        threading.Timer(0.05, failing.set).start()
+        with patch('jeypyats.parsers.iosxe.iosxe_notification_parsers_nc.logger'), \
+                patch('jeypyats.parsers.libs.iosxe.waits.logger'):
+            message = IOSXENotificationParsersMixin.wait_for_message(mock_device, 'FTTH restored', timeout=30)
+            self.assertFalse(subscription.active)
+            self.assertEqual(message['text'], 'FTTH restored')
+            # a stopped subscription is not waited on at all
+            message = IOSXENotificationParsersMixin.wait_for_message(mock_device, 'FTTH restored', timeout=30)
+        self.assertEqual(message['text'], 'FTTH restored')
+
+    def test_subscribe_events_uses_a_dedicated_session(self):
+        """Test the subscription runs on its own pooled session, released when it stops"""
+        nc = FakeNotificationManager()
+        mock_device = MagicMock()
+        mock_device.event_subscription = None
+        mock_device.netconf_open_session.return_value = nc
+
+        subscription = IOSXENotificationParsersMixin.subscribe_events(mock_device)
+        self.assertIs(mock_device.event_subscription, subscription)
+
+        IOSXENotificationParsersMixin.unsubscribe_events(mock_device)
+        self.assertIsNone(mock_device.event_subscription)
+        mock_device.netconf_release_session.assert_called_once_with(nc)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_parallel_connect.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 16:55:29
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 16:55:29
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from jeypyats.utils.parallel_connect import (
+    connect_devices, connect_devices_in_parallel, format_connection_summary,
+)
+
+
+def make_devices(names):
+    """Builds mocked pyATS devices"""
+    devices = {}
+    for name in names:
+        device = MagicMock()
+        device.name = name
+        devices[name] = device
+    return devices
+
+
+class TestParallelConnect(unittest.TestCase):
+    """Unit tests for the parallel device connection"""
+
+    def test_devices_are_connected_in_parallel(self):
+        """Test devices are connected concurrently with device.connect() by default"""
+        devices = make_devices([f'r{index}' for index in range(10)])
+        for device in devices.values():
+            device.connect.side_effect = lambda: time.sleep(0.05)
+
+        start = time.perf_counter()
+        results = connect_devices(devices, max_workers=10, timeout=5)
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.4)
+        self.assertTrue(all(result.ok for result in results.values()))
+        self.assertIs(results['r0'].result, devices['r0'])
+        devices['r9'].connect.assert_called_once()
+
+    @patch('jeypyats.utils.parallel_connect.log')
+    def test_section_parameters_and_failure(self, mock_log):
+        """Test connections and summary are published and the section fails on unreachable devices"""
+        devices = make_devices(['r1', 'r2', 'r3'])
+        section = MagicMock()
+        section.parent.parameters = {}
+
+        def connector(device):
+            if device.name == 'r2':
+                raise ConnectionError("unreachable")
+            return f'session-{device.name}'
+
+        summary = connect_devices_in_parallel(section, devices, connector=connector, max_workers=2, timeout=5)
+
+        self.assertEqual(section.parent.parameters['connections'], {'r1': 'session-r1', 'r3': 'session-r3'})
+        self.assertEqual(summary['connected'], ['r1', 'r3'])
+        self.assertEqual(summary['failed'], {'r2': 'ConnectionError: unreachable'})
+        self.assertIs(section.parent.parameters['connection_summary'], summary)
+        section.failed.assert_called_once()
+        self.assertIn('r2', section.failed.call_args[0][0])
+
+    def test_timeout_and_summary_table(self):
+        """Test a device exceeding the timeout is reported as failed in the summary table"""
+        devices = make_devices(['fast', 'stuck'])
+        devices['stuck'].connect.side_effect = lambda: time.sleep(0.5)
+        section = MagicMock()
+        section.parent.parameters = {}
+
+        summary = connect_devices_in_parallel(section, devices, max_workers=2, timeout=0.1)
+        table = format_connection_summary(summary)
+
+        self.assertEqual(summary['connected'], ['fast'])
+        self.assertIn('TimeoutError', summary['failed']['stuck'])
+        self.assertIn('1/2 connected', table)
+        self.assertTrue(table.splitlines()[1].startswith('stuck'))
+
+
+if __name__ == '__main__':
+    unittest.main()
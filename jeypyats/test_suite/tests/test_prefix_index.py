@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_prefix_index.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 23:07:41
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 23:07:41
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import ipaddress
+import random
+import unittest
+from unittest.mock import MagicMock
+from jeypyats.utils.prefix_index import PrefixIndex
+from jeypyats.parsers.iosxe.iosxe_routing_parsers_nc import parse_default_routes, query_next_hop_interface
+from jeypyats.test_suite.benchmarks.fixtures import FakeReply
+from jeypyats.test_suite.benchmarks.subtree import apply_subtree_filter
+
+PREFIXES = ['0.0.0.0/0', '10.0.0.0/8', '10.1.0.0/16', '10.1.1.0/24', '10.1.1.128/25', '192.168.0.0/16',
+            '2001:db8::/32', '2001:db8:1::/48']
+
+
+def rib_data(routes):
+    entries = ''.join(
+        f"<route><destination-prefix>{prefix}</destination-prefix><source-protocol>{protocol}</source-protocol>"
+        f"<next-hop>{f'<next-hop-address>{next_hop}</next-hop-address>' if next_hop else ''}"
+        f"{f'<outgoing-interface>{interface}</outgoing-interface>' if interface else ''}</next-hop></route>"
+        for prefix, protocol, next_hop, interface in routes)
+    return f"""<routing-state xmlns="urn:ietf:params:xml:ns:yang:ietf-routing"><routing-instance><name>default</name>
+        <ribs><rib><name>ipv4-default</name><routes>{entries}</routes></rib></ribs>
+        </routing-instance></routing-state>"""
+
+
+def rib_reply(routes):
+    return FakeReply(rib_data(routes))
+
+
+class TestPrefixIndex(unittest.TestCase):
+    """Unit tests for the longest prefix match index"""
+
+    def setUp(self):
+        self.index = PrefixIndex((prefix, prefix) for prefix in PREFIXES)
+
+    def test_lookup(self):
+        """Test the most specific prefix containing the address is returned"""
+        self.assertEqual(len(self.index), len(PREFIXES))
+        self.assertEqual(self.index.lookup('10.1.1.200'), '10.1.1.128/25')
+        self.assertEqual(self.index.lookup('10.1.1.2'), '10.1.1.0/24')
+        self.assertEqual(self.index.lookup('10.2.0.1'), '10.0.0.0/8')
+        self.assertEqual(self.index.lookup('8.8.8.8'), '0.0.0.0/0')
+        self.assertEqual(self.index.lookup('2001:db8:1::1'), '2001:db8:1::/48')
+        self.assertIsNone(self.index.lookup('2001:db9::1'))
+        self.assertEqual(self.index.lookup_prefix('10.1.9.9'), '10.1.0.0/16')
+
+    def test_exact_and_covering(self):
+        """Test exact matches and the prefixes containing a prefix"""
+        self.assertEqual(self.index.exact('10.1.0.0/16'), '10.1.0.0/16')
+        self.assertIsNone(self.index.exact('10.1.0.0/17'))
+        self.assertIsNone(self.index.exact('10.0.0.0/7'))
+        self.assertIn('10.1.1.5/24', self.index)
+        self.assertEqual([prefix for prefix, _ in self.index.covering('10.1.1.0/26')],
+                         ['0.0.0.0/0', '10.0.0.0/8', '10.1.0.0/16', '10.1.1.0/24'])
+        self.assertEqual(self.index.covering('2001:db8::/32'), [('2001:db8::/32', '2001:db8::/32')])
+
+    def test_insert_replaces(self):
+        """Test inserting a prefix again replaces its value"""
+        self.index.insert('10.0.0.0/8', 'new')
+        self.assertEqual(self.index.exact('10.0.0.0/8'), 'new')
+        self.assertEqual(len(self.index), len(PREFIXES))
+        self.assertEqual(self.index.setdefault('172.16.0.0/12', []), [])
+        self.assertEqual(len(self.index), len(PREFIXES) + 1)
+        with self.assertRaises(ValueError):
+            self.index.insert('not-a-prefix', None)
+
+    def test_matches_a_linear_scan(self):
+        """Test random lookups match a scan of every prefix"""
+        rng = random.Random(7)
+        networks = {ipaddress.ip_network((rng.getrandbits(32), rng.randint(0, 32)), strict=False) for _ in range(500)}
+        index = PrefixIndex((str(network), network) for network in networks)
+        for _ in range(500):
+            address = ipaddress.ip_address(rng.getrandbits(32))
+            matches = [network for network in networks if address in network]
+            expected = max(matches, key=lambda network: network.prefixlen) if matches else None
+            self.assertEqual(index.lookup(str(address)), expected)
+
+
+class TestNextHopResolution(unittest.TestCase):
+    """Unit tests for the recursive next hop resolution of the default routes"""
+
+    def test_default_route_interface_is_not_resolved_in_reply(self):
+        """Test only the default routes are parsed, the routes of the reply do not resolve their interface"""
+        routes = parse_default_routes(rib_reply([
+            ('0.0.0.0/0', 'static', '82.66.83.254', None),
+            ('82.66.83.0/23', 'direct', None, 'GigabitEthernet0/0/0'),
+        ]))
+        self.assertEqual(len(routes), 1)
+        self.assertIsNone(routes[0]['interface'])
+
+    def test_recursive_resolution(self):
+        """Test next hops are resolved through routes without interface, loops and the default route are ignored"""
+        data = rib_data([
+            ('0.0.0.0/0', 'static', '10.9.9.9', None),
+            ('10.9.0.0/16', 'static', '172.16.0.1', None),
+            ('172.16.0.0/30', 'direct', None, 'Tunnel1'),
+            ('192.0.2.0/24', 'static', '198.51.100.1', None),
+            ('198.51.100.0/24', 'static', '192.0.2.1', None),
+        ])
+        device = MagicMock()
+        device.netconf_get.side_effect = lambda filter: FakeReply(apply_subtree_filter(data, filter))
+
+        self.assertEqual(query_next_hop_interface(device, '10.9.9.9'), 'Tunnel1')
+        self.assertIsNone(query_next_hop_interface(device, '192.0.2.1'))
+        self.assertIsNone(query_next_hop_interface(device, '8.8.8.8'))
+        self.assertIsNone(query_next_hop_interface(device, '10.9.9.9', max_depth=1))
+        self.assertIsNone(query_next_hop_interface(device, 'invalid'))
+
+if __name__ == '__main__':
+    unittest.main()
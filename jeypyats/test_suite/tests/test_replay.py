@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_replay.py
+# This file is a part of Netalps.fr
+#
+# Created: 18.10.2026 05:24:09
+# Author: Jeremie Rouzet
+#
+# Last Modified: 18.10.2026 05:24:09
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from jeypyats.parsers.iosxe.iosxe_routing_parsers_nc import bgp_routes_rpc
+from jeypyats.parsers.iosxe.iosxe_interface_parsers_nc import interface_status_filter
+from jeypyats.test_suite.benchmarks.bench_parsers import CASES, calibrate, compare, count_records, measure
+from jeypyats.test_suite.benchmarks.fixtures import FakeReply, bgp_routes_data, interfaces_state_data, rpc_reply
+from jeypyats.test_suite.benchmarks.replay import (INDEX_FILE, ReplayDevice, ReplayTransport, record_device_replies,
+                                                   record_reply, request_keys, write_scaled_store)
+
+IETF_INTERFACES = '{urn:ietf:params:xml:ns:yang:ietf-interfaces}interfaces-state'
+
+
+class TestReplayTransport(unittest.TestCase):
+    """Unit tests for the replay of recorded NETCONF replies"""
+
+    def setUp(self):
+        """Create an empty replay store"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.store = self.directory.name
+
+    def test_request_keys(self):
+        """Test the keys of filters, gets and RPCs"""
+        self.assertEqual(request_keys(interface_status_filter('Gi1').to_xml())[0], (IETF_INTERFACES,))
+        self.assertEqual(request_keys(bgp_routes_rpc()),
+                         (('{http://cisco.com/ns/yang/Cisco-IOS-XE-rpc}get-bgp-routes',), None))
+        self.assertEqual(request_keys('<get xmlns="urn:ietf:params:xml:ns:netconf:base:1.0"/>'), ((), None))
+
+    def test_filtered_and_whole_replies(self):
+        """Test the filter is applied like the server does, or the whole node is returned"""
+        record_reply(self.store, IETF_INTERFACES, [interfaces_state_data(3)])
+        with open(os.path.join(self.store, INDEX_FILE), encoding='utf-8') as stream:
+            self.assertIn(IETF_INTERFACES, json.load(stream))
+        filter_xml = interface_status_filter('GigabitEthernet0/0/1').to_xml()
+        filtered = ReplayTransport(self.store).get(filter=filter_xml)
+        self.assertEqual(filtered.xml.count('<interface>'), 1)
+        self.assertNotIn('<statistics>', filtered.xml)
+        transport = ReplayTransport(self.store, filtered=False)
+        self.assertEqual(transport.get(filter=filter_xml).xml, rpc_reply(interfaces_state_data(3)))
+        self.assertIs(transport.get(filter=filter_xml), transport.get(filter=filter_xml))
+        self.assertEqual(transport.requests, 3)
+
+    def test_unknown_node_answers_empty_data(self):
+        """Test a node missing from the store gives an empty reply"""
+        device = ReplayDevice('csr1', ReplayTransport(self.store))
+        self.assertEqual(device.get_bgp_routes(), [])
+        self.assertEqual(device.get_track_states(), {})
+
+    def test_record_device_replies(self):
+        """Test the replies received by a device are replayed afterwards"""
+        device = MagicMock()
+        device.netconf_get.return_value = FakeReply(bgp_routes_data(5))
+        restore = record_device_replies(device, self.store)
+        device.netconf_get(bgp_routes_rpc())
+        restore()
+        self.assertIsInstance(device.netconf_get, MagicMock)
+        replay = ReplayDevice('csr1', ReplayTransport(self.store))
+        self.assertEqual(len(replay.get_bgp_routes()), 5)
+
+    def test_scaled_store(self):
+        """Test every benchmark case runs on a small scaled store"""
+        write_scaled_store(self.store, scale=0.0005)
+        device = ReplayDevice('csr1', ReplayTransport(self.store))
+        for case in CASES:
+            result = measure(device, case, rounds=1)
+            self.assertGreaterEqual(result['seconds'], 0, case.name)
+        self.assertEqual(count_records(device.get_bgp_routes()), 500)
+
+    def test_compare(self):
+        """Test slower or larger cases are reported against the baseline"""
+        baseline = {'a': {'seconds': 1.0, 'peak_bytes': 10 * 2 ** 20}, 'b': {'seconds': 1.0, 'peak_bytes': 0}}
+        results = {'a': {'seconds': 1.2, 'peak_bytes': 20 * 2 ** 20}, 'b': {'seconds': 1.5, 'peak_bytes': 100},
+                   'c': {'seconds': 9.0, 'peak_bytes': 0}}
+        regressions = compare(results, baseline, tolerance=0.25)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith('a: peak 20.0 MiB'))
+        self.assertTrue(regressions[1].startswith('b: 1500.0 ms per call'))
+
+    def test_compare_scales_and_ignores_noise(self):
+        """Test the baseline timings are scaled by the calibrations, and sub-millisecond slowdowns ignored"""
+        baseline = {'slow': {'seconds': 1.0, 'peak_bytes': 0, 'relative': 25.0, 'calibration': 0.04},
+                    'fast': {'seconds': 0.0003, 'peak_bytes': 0, 'relative': 0.0075, 'calibration': 0.04}}
+        # the machine is 1.5 times slower
+        results = {'slow': {'seconds': 1.5, 'peak_bytes': 0, 'relative': 25.0, 'calibration': 0.06},
+                   'fast': {'seconds': 0.0009, 'peak_bytes': 0, 'relative': 0.015, 'calibration': 0.06}}
+        self.assertEqual(compare(results, baseline, tolerance=0.25), [])
+        results['slow']['relative'] = 40.0
+        regressions = compare(results, baseline, tolerance=0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith('slow: 2400.0 ms per call, baseline 1500.0 ms'))
+        self.assertGreater(calibrate(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_reply_cache.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 21:05:37
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 21:05:37
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import unittest
+from unittest.mock import MagicMock
+from jeypyats.utils.reply_cache import enable_reply_cache, disable_reply_cache
+from jeypyats.parsers.libs.iosxe.waits import poll_until
+from jeypyats.parsers.iosxe.iosxe_track_parsers_nc import IOSXETrackParsersMixin, track_states_filter
+
+TRACKS_REPLY = """<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="1"><data>
+<tracks xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-track-oper">
+    <track><track-number>1</track-number><track-state>up</track-state></track>
+</tracks></data></rpc-reply>"""
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Device(IOSXETrackParsersMixin):
+    """Device connected with a fake session"""
+
+    def __init__(self):
+        self.nc = MagicMock()
+        self.netconf_get = MagicMock(return_value=MagicMock(ok=True, xml=TRACKS_REPLY))
+        self.configure = MagicMock()
+
+
+class TestReplyCache(unittest.TestCase):
+    """Unit tests for the NETCONF reply cache"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.device = Device()
+        self.get = self.device.netconf_get
+        self.cache = enable_reply_cache(self.device, ttl=5, max_size=2, clock=self.clock)
+
+    def test_reads_share_one_rpc_within_ttl(self):
+        """Test repeated reads of the same subtree within the TTL send a single get"""
+        for _ in range(3):
+            self.assertEqual(self.device.get_track_states(), {'1': {'state': 'up'}})
+        self.assertEqual(self.get.call_count, 1)
+        self.assertEqual(self.cache.hits, 2)
+
+        self.clock.now = 6
+        self.device.get_track_states()
+        self.assertEqual(self.get.call_count, 2)
+
+    def test_lru_eviction(self):
+        """Test the least recently used reply is evicted when the cache is full"""
+        for filter in ('<filter>a</filter>', '<filter>b</filter>', '<filter>a</filter>', '<filter>c</filter>'):
+            self.device.netconf_get(filter=filter)
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNotNone(self.cache.get('<filter>a</filter>'))
+        self.assertIsNone(self.cache.get('<filter>b</filter>'))
+
+    def test_configuration_invalidates(self):
+        """Test configure() and edit-config drop the cached replies"""
+        self.device.get_track_states()
+        self.device.configure(['track 1 ip sla 1'])
+        self.device.get_track_states()
+        self.device.nc.edit_config(target='running', config='<config/>')
+        self.device.get_track_states()
+
+        self.assertEqual(self.get.call_count, 3)
+
+        self.cache.invalidate(track_states_filter().to_xml())
+        self.assertEqual(len(self.cache), 0)
+
+    def test_reconnected_session_invalidates(self):
+        """Test edit-config on the session replacing a broken one during a get still drops the cached replies"""
+        reply = self.get.return_value
+
+        def reconnect(filter=None):
+            # NetconfConnectorConnection.netconf_get() installs the new session as device.nc
+            self.device.nc = MagicMock()
+            return reply
+
+        self.get.side_effect = reconnect
+        self.device.get_track_states()
+        self.get.side_effect = None
+        self.device.nc.edit_config(target='running', config='<config/>')
+        self.device.get_track_states()
+
+        self.assertEqual(self.get.call_count, 2)
+        self.assertTrue(hasattr(self.device.nc.edit_config, '__wrapped_write__'))
+
+    def test_waits_bypass_the_cache(self):
+        """Test polls always reach the device"""
+        self.device.get_track_states()
+        poll_until(self.device.get_track_states, lambda tracks: True)
+
+        self.assertEqual(self.get.call_count, 2)
+
+    def test_failed_replies_are_not_cached(self):
+        """Test rpc-error replies are not reused"""
+        self.get.return_value = MagicMock(ok=False)
+        self.device.netconf_get(filter='<filter>a</filter>')
+        self.device.netconf_get(filter='<filter>a</filter>')
+
+        self.assertEqual(self.get.call_count, 2)
+
+    def test_disable_reply_cache(self):
+        """Test the uncached methods are restored"""
+        disable_reply_cache(self.device)
+
+        self.assertIs(self.device.netconf_get, self.get)
+        self.assertIsNone(self.device.reply_cache)
+        self.assertFalse(hasattr(self.device.nc.edit_config, '__wrapped_write__'))
+        self.assertFalse(hasattr(self.device.configure, '__wrapped_write__'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_reply_decoder.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 09:40:12
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 09:40:12
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import unittest
+from unittest.mock import MagicMock
+from lxml import etree
+from jeypyats.utils.reply_decoder import iter_elements, iter_records, first_record
+
+
+ROUTING_STATE_REPLY = """<?xml version="1.0" encoding="UTF-8"?>
+<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="1">
+    <data>
+        <routing-state xmlns="urn:ietf:params:xml:ns:yang:ietf-routing">
+            <routing-instance>
+                <name>default</name>
+                <ribs>
+                    <rib>
+                        <name>ipv4-default</name>
+                        <routes>
+                            <route>
+                                <destination-prefix>0.0.0.0/0</destination-prefix>
+                                <next-hop>
+                                    <next-hop-address>82.66.83.254</next-hop-address>
+                                </next-hop>
+                            </route>
+                            <route>
+                                <destination-prefix>82.66.83.0/24</destination-prefix>
+                                <next-hop>
+                                    <outgoing-interface>GigabitEthernet0/0/0</outgoing-interface>
+                                </next-hop>
+                            </route>
+                        </routes>
+                    </rib>
+                    <rib>
+                        <name>ipv6-default</name>
+                        <routes>
+                            <route>
+                                <destination-prefix>::/0</destination-prefix>
+                            </route>
+                        </routes>
+                    </rib>
+                </ribs>
+            </routing-instance>
+        </routing-state>
+    </data>
+</rpc-reply>"""
+
+
+class TestReplyDecoder(unittest.TestCase):
+    """Unit tests for the streaming reply decoder"""
+
+    def test_iter_records_converts_like_xmltodict(self):
+        """Test records are plain dicts with nested containers"""
+        routes = list(iter_records(ROUTING_STATE_REPLY, 'ribs/rib/routes/route'))
+
+        self.assertEqual(len(routes), 3)
+        self.assertEqual(routes[0], {
+            'destination-prefix': '0.0.0.0/0',
+            'next-hop': {'next-hop-address': '82.66.83.254'},
+        })
+        self.assertEqual(routes[2], {'destination-prefix': '::/0'})
+
+    def test_iter_records_with_keys(self):
+        """Test ancestor keys are attached to every record"""
+        routes = list(iter_records(
+            ROUTING_STATE_REPLY, 'ribs/rib/routes/route',
+            keys={'instance': 'routing-instance/name', 'rib': 'rib/name'},
+        ))
+
+        self.assertEqual([route['rib'] for route in routes], ['ipv4-default', 'ipv4-default', 'ipv6-default'])
+        self.assertTrue(all(route['instance'] == 'default' for route in routes))
+
+    def test_iter_records_repeated_children_become_lists(self):
+        """Test repeated leaves are grouped in a list"""
+        reply = "<data><entry><hop>a</hop><hop>b</hop><empty/></entry></data>"
+
+        record = first_record(reply, 'data/entry')
+
+        self.assertEqual(record, {'hop': ['a', 'b'], 'empty': None})
+
+    def test_iter_records_accepts_reply_objects_and_bytes(self):
+        """Test the decoder reads reply objects and bytes"""
+        reply = MagicMock()
+        reply.xml = ROUTING_STATE_REPLY
+
+        self.assertEqual(len(list(iter_records(reply, 'routes/route'))), 3)
+        self.assertEqual(len(list(iter_records(ROUTING_STATE_REPLY.encode(), 'routes/route'))), 3)
+
+    def test_iter_elements_clears_consumed_elements(self):
+        """Test consumed records are released from the tree"""
+        reply = "<data><list>" + "".join(f"<item><id>{i}</id></item>" for i in range(50)) + "</list></data>"
+
+        seen = []
+        for element, _ in iter_elements(reply, 'list/item'):
+            # previous siblings are dropped as soon as they have been consumed
+            self.assertIsNone(element.getprevious())
+            seen.append(element.findtext('id'))
+
+        self.assertEqual(seen, [str(i) for i in range(50)])
+
+    def test_first_record_default(self):
+        """Test first_record falls back to the default value"""
+        self.assertEqual(first_record(ROUTING_STATE_REPLY, 'logging/buffered/messages', default=[]), [])
+
+    def test_iter_records_invalid_xml(self):
+        """Test malformed replies raise a syntax error"""
+        with self.assertRaises(etree.XMLSyntaxError):
+            list(iter_records("invalid xml content", 'data/entry'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_rib_snapshot.py
+# This file is a part of Netalps.fr
+#
+# Created: 18.10.2026 00:49:05
+# Author: Jeremie Rouzet
+#
+# Last Modified: 18.10.2026 00:49:05
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import os
+import tempfile
+import unittest
+from jeypyats.utils.rib_snapshot import RibSnapshot
+from jeypyats.utils.route_table import build_routes
+from jeypyats.utils.utils import JeyPyatsValueError
+from jeypyats.parsers.iosxe.iosxe_routing_parsers_nc import RouteEntry
+
+BEFORE = {
+    'default': [
+        {'prefix': '0.0.0.0/0', 'protocol': 'static', 'next_hop': '82.66.83.254', 'metric': '1', 'interface': None},
+        {'prefix': '10.0.0.0/8', 'protocol': 'ospf', 'next_hop': '10.1.1.2', 'metric': '20', 'interface': 'Gi0/0/1'},
+        {'prefix': '10.0.0.0/8', 'protocol': 'ospf', 'next_hop': '10.1.1.3', 'metric': '20', 'interface': 'Gi0/0/2'},
+    ],
+    'CUSTOMER': [
+        {'prefix': '10.0.0.0/8', 'protocol': 'bgp', 'next_hop': '192.0.2.1', 'metric': None, 'interface': None},
+    ],
+}
+
+AFTER = {
+    'default': [
+        {'prefix': '0.0.0.0/0', 'protocol': 'static', 'next_hop': None, 'metric': '1', 'interface': 'Cellular0/2/0'},
+        # same ECMP routes, other order
+        {'prefix': '10.0.0.0/8', 'protocol': 'ospf', 'next_hop': '10.1.1.3', 'metric': '20', 'interface': 'Gi0/0/2'},
+        {'prefix': '10.0.0.0/8', 'protocol': 'ospf', 'next_hop': '10.1.1.2', 'metric': '20', 'interface': 'Gi0/0/1'},
+    ],
+    'CUSTOMER': [
+        {'prefix': '172.16.0.0/12', 'protocol': 'bgp', 'next_hop': '192.0.2.1', 'metric': None, 'interface': None},
+    ],
+}
+
+
+class TestRibSnapshot(unittest.TestCase):
+    """Unit tests for the RIB snapshots and diffs"""
+
+    def test_diff(self):
+        """Test added, removed and changed prefixes are found, ECMP order does not matter"""
+        before, after = RibSnapshot.capture(BEFORE), RibSnapshot.capture(AFTER)
+
+        diff = before.diff(after)
+
+        self.assertEqual(len(before), 3)
+        self.assertEqual(before.vrfs(), ['CUSTOMER', 'default'])
+        self.assertEqual(diff.added, [('CUSTOMER', '172.16.0.0/12')])
+        self.assertEqual(diff.removed, [('CUSTOMER', '10.0.0.0/8')])
+        self.assertEqual(diff.changed, [('default', '0.0.0.0/0')])
+        self.assertEqual(diff.summary(), {'added': 1, 'removed': 1, 'changed': 1})
+        self.assertFalse(before.diff(RibSnapshot.capture(BEFORE)))
+
+        details = diff.details(before, after)
+        self.assertEqual(details[('default', '0.0.0.0/0')]['after'][0]['interface'], 'Cellular0/2/0')
+        self.assertEqual(details[('CUSTOMER', '172.16.0.0/12')]['before'], [])
+        report = diff.report(before, after, limit=2)
+        self.assertEqual(report[0], 'RIB diff: 1 added, 1 removed, 1 changed')
+        self.assertEqual(report[-1], '  ... 1 more')
+
+    def test_file_round_trip(self):
+        """Test a snapshot file loads back with the same digests, routes streamed from records"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'before.jsonl.gz')
+            captured = RibSnapshot.capture(iter(build_routes(BEFORE['default'], RouteEntry, 'record')), path=path)
+            loaded = RibSnapshot.load(path)
+
+            self.assertEqual(loaded.digests, captured.digests)
+            self.assertEqual(loaded.vrfs(), ['default'])
+            self.assertEqual(len(list(loaded.routes())), 3)
+            self.assertEqual(dict(loaded.routes([('default', '0.0.0.0/0')]))[('default', '0.0.0.0/0')]['metric'], 1)
+
+            not_a_snapshot = os.path.join(directory, 'other.txt')
+            with open(not_a_snapshot, 'w') as stream:
+                stream.write('{}')
+            with self.assertRaises((JeyPyatsValueError, OSError)):
+                RibSnapshot.load(not_a_snapshot)
+
+
+if __name__ == '__main__':
+    unittest.main()
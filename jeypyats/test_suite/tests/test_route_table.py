@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_route_table.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 22:14:27
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 22:14:27
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import unittest
+from unittest.mock import MagicMock
+from jeypyats.utils.route_table import RouteTable, build_routes, iter_routes, route_record_class
+from jeypyats.utils.utils import JeyPyatsValueError
+from jeypyats.parsers.iosxe.iosxe_routing_parsers_nc import IOSXERoutingParsersMixin, RouteEntry, BGPRoute
+from jeypyats.test_suite.benchmarks.fixtures import FakeReply, bgp_routes_data
+
+ROUTES = [
+    {'prefix': '0.0.0.0/0', 'protocol': 'static', 'next_hop': '82.66.83.254', 'metric': '1', 'interface': None},
+    {'prefix': '10.0.0.0/8', 'protocol': 'ospf', 'next_hop': '10.1.1.2', 'metric': '20', 'interface': 'GigabitEthernet0/0/1'},
+    {'prefix': '2001:db8::/32', 'protocol': 'bgp', 'next_hop': '2001:db8::1', 'metric': None, 'interface': None},
+    {'prefix': 'not-a-prefix', 'protocol': 'ospf', 'next_hop': '10.1.1.2', 'metric': 'infinity', 'interface': None},
+]
+
+
+class TestRouteTable(unittest.TestCase):
+    """Unit tests for the compact route containers"""
+
+    def test_records(self):
+        """Test records convert the integer fields and read like dicts"""
+        routes = build_routes(ROUTES, RouteEntry, 'record')
+
+        self.assertEqual(routes[1].metric, 20)
+        self.assertEqual(routes[1]['interface'], 'GigabitEthernet0/0/1')
+        self.assertEqual(routes[3].get('metric'), 'infinity')
+        self.assertIsNone(routes[0].get('missing'))
+        self.assertFalse(hasattr(routes[0], '__dict__'))
+        self.assertIs(routes[1].next_hop, routes[3].next_hop)
+        with self.assertRaises(KeyError):
+            routes[0]['missing']
+
+    def test_table_round_trip(self):
+        """Test the table returns the routes it was built from"""
+        table = build_routes(ROUTES, RouteEntry, 'table')
+
+        self.assertEqual(len(table), 4)
+        self.assertEqual(table, build_routes(ROUTES, RouteEntry, 'record'))
+        self.assertEqual(table[-2].prefix, '2001:db8::/32')
+        self.assertEqual(table[3]['prefix'], 'not-a-prefix')
+        self.assertEqual(table.column('protocol'), ['static', 'ospf', 'bgp', 'ospf'])
+        self.assertEqual([route.metric for route in table[:2]], [1, 20])
+        self.assertEqual(table.to_dicts()[0]['next_hop'], '82.66.83.254')
+        with self.assertRaises(IndexError):
+            table[4]
+
+    def test_table_is_smaller_than_dicts(self):
+        """Test the columns of a large table use a fraction of the memory of the dicts"""
+        routes = IOSXERoutingParsersMixin.get_bgp_routes(
+            MagicMock(netconf_get=MagicMock(return_value=FakeReply(bgp_routes_data(2000)))), output='table')
+
+        self.assertEqual(len(routes), 2000)
+        self.assertEqual(routes[0], {'prefix': '1.0.0.0/24', 'next_hop': '192.0.2.1',
+                                     'as_path': '64500 3356 15169', 'local_pref': 100})
+        self.assertLess(routes.nbytes(), 2000 * 100)
+
+    def test_record_classes_are_shared(self):
+        """Test the same schema gives the same record class"""
+        self.assertIs(route_record_class('BGPRoute', ('prefix', 'next_hop', 'as_path', 'local_pref'), ('local_pref',)),
+                      BGPRoute)
+        self.assertIsInstance(RouteTable(BGPRoute).fields, tuple)
+
+    def test_unknown_output(self):
+        """Test an unknown output is rejected"""
+        with self.assertRaises(JeyPyatsValueError):
+            build_routes(ROUTES, RouteEntry, 'dataframe')
+        with self.assertRaises(JeyPyatsValueError):
+            iter_routes(ROUTES, RouteEntry, 'table')
+
+    def test_streamed_routes(self):
+        """Test the iterators yield the routes of the lists, decoding them on demand"""
+        device = MagicMock(netconf_get=MagicMock(return_value=FakeReply(bgp_routes_data(300))))
+
+        routes = IOSXERoutingParsersMixin.iter_bgp_routes(device, output='record')
+        self.assertEqual(next(routes), BGPRoute('1.0.0.0/24', '192.0.2.1', '64500 3356 15169', 100))
+        self.assertEqual(1 + sum(1 for _ in routes), 300)
+        self.assertEqual(list(IOSXERoutingParsersMixin.iter_bgp_routes(device)),
+                         IOSXERoutingParsersMixin.get_bgp_routes(device))
+        self.assertIn('<vrf-name>default</vrf-name>', device.netconf_get.call_args[0][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_rpc_timing.py
+# This file is a part of Netalps.fr
+#
+# Created: 18.10.2026 04:07:26
+# Author: Jeremie Rouzet
+#
+# Last Modified: 18.10.2026 04:07:26
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from lxml import etree
+from jeypyats.utils.rpc_timing import (HistogramSink, JsonLinesSink, PrometheusTextSink, RpcTiming, add_timing_sink,
+                                       remove_timing_sink, enable_rpc_timing, disable_rpc_timing,
+                                       format_timing_summary)
+from jeypyats.parsers.iosxe.iosxe_eem_parsers_nc import IOSXEEEMParsersMixin
+from jeypyats.parsers.iosxe.iosxe_routing_parsers_nc import IOSXERoutingParsersMixin
+
+EEM_REPLY = """<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0"><data>
+    <event-history xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-eem"><event><name>e1</name></event>
+    <event><name>e2</name></event></event-history></data></rpc-reply>"""
+
+
+class Sink:
+    def __init__(self):
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class Device(IOSXEEEMParsersMixin, IOSXERoutingParsersMixin):
+    def __init__(self, reply):
+        self.name = 'csr1'
+        self.netconf_get = MagicMock(return_value=MagicMock(xml=reply))
+        self.dispatch = MagicMock(return_value=MagicMock(xml='<rpc-reply/>', ok=True))
+
+
+class TestRpcTiming(unittest.TestCase):
+    """Unit tests for the per-RPC timing records"""
+
+    def setUp(self):
+        """Register a recording sink"""
+        self.sink = add_timing_sink(Sink())
+
+    def tearDown(self):
+        """Unregister the sink"""
+        remove_timing_sink(self.sink)
+
+    def test_parser_and_rpc_records(self):
+        """Test a parser call emits the record of its RPC and its own record"""
+        device = Device(EEM_REPLY)
+        enable_rpc_timing(device)
+        self.assertEqual(len(device.get_eem_event_history()), 2)
+        rpc, parser = self.sink.records
+        self.assertEqual((rpc.device, rpc.rpc, rpc.kind, rpc.bytes_received), ('csr1', 'netconf_get', 'rpc',
+                                                                              len(EEM_REPLY)))
+        self.assertEqual(len(rpc.filter_hash), 16)
+        self.assertIsNone(rpc.parse_ms)
+        self.assertEqual((parser.rpc, parser.kind, parser.records, parser.filter_hash),
+                         ('get_eem_event_history', 'parser', 2, rpc.filter_hash))
+        self.assertEqual((parser.rtt_ms, parser.bytes_sent), (rpc.rtt_ms, rpc.bytes_sent))
+        self.assertGreaterEqual(parser.parse_ms, 0)
+
+    def test_sizes_are_encoded_bytes(self):
+        """Test a reply with non-ASCII text is counted in UTF-8 bytes, like the requests"""
+        reply = EEM_REPLY.replace('e2', 'Bascule réseau')
+        device = Device(reply)
+        enable_rpc_timing(device)
+        device.get_eem_event_history()
+        self.assertEqual(self.sink.records[0].bytes_received, len(reply.encode('utf-8')))
+        self.assertEqual(self.sink.records[0].bytes_received, len(reply) + 1)
+
+    def test_dispatch_and_errors(self):
+        """Test dispatch requests are measured and failing calls recorded"""
+        device = Device(EEM_REPLY)
+        device.netconf_get.side_effect = RuntimeError('session closed')
+        enable_rpc_timing(device)
+        device.dispatch(etree.Element('get'))
+        with self.assertRaises(RuntimeError):
+            device.get_eem_event_history()
+        dispatch, rpc, parser = self.sink.records
+        self.assertEqual((dispatch.rpc, dispatch.bytes_sent, dispatch.bytes_received), ('dispatch', 6, 12))
+        self.assertEqual(rpc.error, 'RuntimeError: session closed')
+        self.assertEqual(parser.error, 'RuntimeError: session closed')
+
+    def test_iterator_timed_while_consumed(self):
+        """Test a parser returning an iterator is recorded once consumed"""
+        device = Device('<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0"><data/></rpc-reply>')
+        enable_rpc_timing(device)
+        routes = device.iter_bgp_routes()
+        self.assertEqual([record.rpc for record in self.sink.records], ['netconf_get'])
+        self.assertEqual(list(routes), [])
+        parser = self.sink.records[-1]
+        self.assertEqual((parser.rpc, parser.records, parser.rtt_ms),
+                         ('iter_bgp_routes', 0, self.sink.records[0].rtt_ms))
+
+    def test_disable(self):
+        """Test the original methods are restored"""
+        device = Device(EEM_REPLY)
+        netconf_get = device.netconf_get
+        enable_rpc_timing(device)
+        disable_rpc_timing(device)
+        self.assertIs(device.netconf_get, netconf_get)
+        self.assertNotIn('get_eem_event_history', vars(device))
+        device.get_eem_event_history()
+        self.assertEqual(self.sink.records, [])
+
+    def test_histogram_summary(self):
+        """Test the in-memory histogram summary and its table"""
+        histogram = HistogramSink()
+        for rtt in (3.0, 4.0, 40.0):
+            histogram.emit(RpcTiming('csr1', 'netconf_get', rtt_ms=rtt, bytes_received=100))
+        histogram.emit(RpcTiming('csr1', 'get_bgp_routes', 'parser', rtt_ms=40.0, parse_ms=12.0, records=5))
+        rpc = next(row for row in histogram.summary() if row['rpc'] == 'netconf_get')
+        self.assertEqual((rpc['count'], rpc['rtt_p95_ms'], rpc['rtt_max_ms'], rpc['bytes_received']),
+                         (3, 40.0, 40.0, 300))
+        table = format_timing_summary(histogram.summary())
+        self.assertIn('get_bgp_routes', table)
+        self.assertTrue(table.endswith('3 RPCs, 0.05s round trip in total'))
+
+    def test_file_sinks(self):
+        """Test the JSON lines and Prometheus text sinks"""
+        with tempfile.TemporaryDirectory() as directory:
+            jsonl = JsonLinesSink(os.path.join(directory, 'timings.jsonl'))
+            prom = PrometheusTextSink(os.path.join(directory, 'timings.prom'), interval=3600)
+            for sink in (jsonl, prom):
+                sink.emit(RpcTiming('csr1', 'netconf_get', rtt_ms=7.0, bytes_received=10))
+                sink.close()
+            with open(jsonl.path, encoding='utf-8') as stream:
+                self.assertEqual(json.loads(stream.readline())['rtt_ms'], 7.0)
+            with open(prom.path, encoding='utf-8') as stream:
+                text = stream.read()
+        self.assertIn('jeypyats_rpc_rtt_seconds_bucket{device="csr1",rpc="netconf_get",kind="rpc",le="0.01"} 1',
+                      text)
+        self.assertIn('jeypyats_rpc_bytes_received_total{device="csr1",rpc="netconf_get",kind="rpc"} 10', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
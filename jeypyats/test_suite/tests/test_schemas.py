@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: test_schemas.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 10:48:03
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 10:48:03
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+import unittest
+from jeypyats.utils.schemas import ExtractionSchema
+
+
+RT_REPLY = """<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="1">
+    <routing-table xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-rpc">
+        <rt-entry>
+            <destination>0.0.0.0/0</destination>
+            <gateway>192.168.1.1</gateway>
+            <metric>1</metric>
+        </rt-entry>
+        <rt-entry>
+            <destination>192.168.1.0/24</destination>
+            <interface>GigabitEthernet0/0</interface>
+        </rt-entry>
+    </routing-table>
+</rpc-reply>"""
+
+RT_SCHEMA = ExtractionSchema(
+    'routing-table/rt-entry',
+    {'prefix': 'destination', 'next_hop': 'gateway', 'metric': ('metric', int), 'interface': 'interface'},
+    namespace='http://cisco.com/ns/yang/Cisco-IOS-XE-rpc',
+)
+
+
+class TestExtractionSchema(unittest.TestCase):
+    """Unit tests for compiled extraction schemas"""
+
+    def test_extract_with_namespace(self):
+        """Test fields are extracted with converters and missing leaves become None"""
+        result = RT_SCHEMA.extract(RT_REPLY)
+
+        self.assertEqual(result, [
+            {'prefix': '0.0.0.0/0', 'next_hop': '192.168.1.1', 'metric': 1, 'interface': None},
+            {'prefix': '192.168.1.0/24', 'next_hop': None, 'metric': None, 'interface': 'GigabitEthernet0/0'},
+        ])
+
+    def test_extract_ignores_other_namespaces(self):
+        """Test namespace-aware fields do not match leaves of another model"""
+        reply = RT_REPLY.replace('Cisco-IOS-XE-rpc', 'Cisco-IOS-XE-other')
+
+        result = RT_SCHEMA.extract(reply)
+
+        self.assertEqual(result[0]['prefix'], None)
+
+    def test_extract_without_namespace(self):
+        """Test schemas without namespace match leaves by local name"""
+        schema = ExtractionSchema('routing-table/rt-entry', {'prefix': 'destination'})
+
+        self.assertEqual(schema.extract(RT_REPLY), [{'prefix': '0.0.0.0/0'}, {'prefix': '192.168.1.0/24'}])
+
+    def test_where_and_keys(self):
+        """Test records are filtered on fields and ancestor keys"""
+        reply = """<data>
+            <instance><name>default</name><route><prefix>0.0.0.0/0</prefix></route></instance>
+            <instance><name>MGMT</name><route><prefix>10.0.0.0/8</prefix></route></instance>
+        </data>"""
+        schema = ExtractionSchema(
+            'instance/route', {'prefix': 'prefix'},
+            keys={'instance': 'instance/name'}, where={'instance': 'MGMT'}, include_keys=True,
+        )
+
+        self.assertEqual(schema.extract(reply), [{'prefix': '10.0.0.0/8', 'instance': 'MGMT'}])
+
+    def test_defaults_and_extract_first(self):
+        """Test default values and first record extraction"""
+        schema = ExtractionSchema('rt-entry', {'protocol': 'protocol'}, defaults={'protocol': 'unknown'})
+
+        self.assertEqual(schema.extract_first(RT_REPLY), {'protocol': 'unknown'})
+        self.assertEqual(schema.extract_first("<data/>", {}), {})
+
+    def test_fields(self):
+        """Test declared field names are exposed in order"""
+        self.assertEqual(RT_SCHEMA.fields, ('prefix', 'next_hop', 'metric', 'interface'))
+
+
+if __name__ == '__main__':
+    unittest.main()
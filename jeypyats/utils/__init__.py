@@ -19,6 +19,62 @@ __contact__ = 'jeremie.rouzet@netalps.fr'
 __copyright__ = 'Netalps, 2026'
 __license__ = "Netalps, Copyright 2026. All rights reserved."
 
+'''
+JeyPyats utilities
+The exceptions and XML helpers of .utils and the RPC templates are imported eagerly. The other names
+are module attributes resolved on first access (PEP 562), so that 'import jeypyats' does not pay for
+ncclient, pyATS or asyncio until a connection, the session pool or the fleet runner is actually used.
+'''
+
+import importlib
+
 from .utils import *
 from .rpc_msgs import BASE_RPC, BASE_RPC_RPC, RPC_OK_MSG, RPC_EMPTY_MSG
-from .netconf_connector import connect_netconf
+
+# attribute -> submodule defining it
+_LAZY_ATTRIBUTES = {
+    'teardown': 'utils',
+    'connect_netconf': 'netconf_connector',
+    'NetconfSessionPool': 'netconf_connector',
+    'default_pool': 'netconf_connector',
+    'iter_elements': 'reply_decoder',
+    'iter_records': 'reply_decoder',
+    'first_record': 'reply_decoder',
+    'ExtractionSchema': 'schemas',
+    'SubtreeFilter': 'filters',
+    'merge_filters': 'filters',
+    'offload': 'async_netconf',
+    'asyncify': 'async_netconf',
+    'gather_fleet': 'async_netconf',
+    'run_fleet': 'async_netconf',
+    'FleetResult': 'async_netconf',
+    'connect_devices': 'parallel_connect',
+    'connect_devices_in_parallel': 'parallel_connect',
+    'NotificationSubscription': 'notifications',
+    'ReplyCache': 'reply_cache',
+    'enable_reply_cache': 'reply_cache',
+    'disable_reply_cache': 'reply_cache',
+    'RouteTable': 'route_table',
+    'PrefixIndex': 'prefix_index',
+    'RibSnapshot': 'rib_snapshot',
+    'InterfaceTable': 'interface_table',
+    'CounterSampler': 'interface_counters',
+    'dump_payload': 'debug_dump',
+    'enable_payload_dumps': 'debug_dump',
+    'enable_rpc_timing': 'rpc_timing',
+    'HistogramSink': 'rpc_timing',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    # cache the attribute, later accesses do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
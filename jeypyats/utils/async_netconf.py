@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: async_netconf.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 14:52:19
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 14:52:19
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+Asyncio layer on top of the ncclient sessions
+ncclient is a blocking library, so blocking calls (session setup, RPCs and the parsers running them)
+are offloaded to a thread pool and awaited from the event loop. gather_fleet() runs one coroutine
+per device with bounded concurrency and a per-device timeout, so that a single process can poll
+1000+ devices while only 'concurrency' threads are busy at any time.
+asyncify() turns the methods of a parser mixin into coroutine methods suffixed with '_async'.
+
+Example:
+    async def poll(device):
+        return await device.get_track_states_async()
+
+    results = run_fleet(devices, poll, concurrency=100, timeout=60)
+    for name, result in results.items():
+        print(name, result.ok, result.elapsed, result.result or result.error)
+'''
+
+import asyncio
+import contextvars
+import functools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .netconf_connector import default_pool
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    'offload',
+    'asyncify',
+    'acquire_session_async',
+    'FleetResult',
+    'gather_fleet',
+    'run_fleet',
+]
+
+# executor used by offload(), set by gather_fleet() for the duration of a fleet run
+_executor = contextvars.ContextVar('jeypyats_netconf_executor', default=None)
+
+
+async def offload(func, *args, **kwargs):
+    '''
+    Runs a blocking callable in a worker thread and awaits its result
+
+    The executor of the running gather_fleet() is used, the loop default executor otherwise.
+
+    Args:
+        func (callable): blocking callable
+        *args, **kwargs: arguments of the callable
+
+    Returns:
+        result of the callable
+    '''
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(_executor.get(), call)
+
+
+async def acquire_session_async(host, port, username, password, device_params=None, pool=None, timeout=None):
+    '''
+    Coroutine version of NetconfSessionPool.acquire(), the SSH and NETCONF hello run in a worker thread
+
+    Args:
+        host (str): device address
+        port (int): NETCONF port
+        username (str): username
+        password (str): password
+        device_params (dict, optional): ncclient device handler parameters
+        pool (NetconfSessionPool, optional): session pool (default: the process-wide pool)
+        timeout (float, optional): seconds to wait for a free session of the device
+
+    Returns:
+        ncclient.manager.Manager: pooled session, to be handed back with pool.release()
+    '''
+    pool = default_pool if pool is None else pool
+    return await offload(pool.acquire, host, port, username, password, device_params, timeout)
+
+
+def _async_variant(name, method):
+    async def variant(self, *args, **kwargs):
+        return await offload(method, self, *args, **kwargs)
+    variant.__name__ = f'{name}_async'
+    variant.__qualname__ = f'{name}_async'
+    variant.__doc__ = f"Coroutine version of {name}(), the NETCONF exchange runs in a worker thread\n{method.__doc__ or ''}"
+    return variant
+
+
+def asyncify(*mixin_classes, name='AsyncParsersMixin'):
+    '''
+    Builds a mixin holding a coroutine '<method>_async' for every public method of the given mixins
+
+    Args:
+        *mixin_classes (class): parser mixins
+        name (str): name of the built class
+
+    Returns:
+        class: mixin with the coroutine methods
+    '''
+    methods = {}
+    for mixin_class in mixin_classes:
+        for method_name, method in vars(mixin_class).items():
+            if method_name.startswith('_') or not callable(method) or isinstance(method, (classmethod, staticmethod)):
+                continue
+            methods[f'{method_name}_async'] = _async_variant(method_name, method)
+    return type(name, (), methods)
+
+
+class FleetResult:
+    '''
+    Outcome of an operation on one device
+
+    Attributes:
+        name (str): device name
+        result: value returned by the operation, None on error
+        error (Exception): raised exception, asyncio.TimeoutError on timeout, None on success
+        elapsed (float): seconds spent on the device, the wait for a free slot excluded
+    '''
+
+    __slots__ = ('name', 'result', 'error', 'elapsed')
+
+    def __init__(self, name, result=None, error=None, elapsed=0.0):
+        self.name = name
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        status = 'ok' if self.ok else f'error={self.error!r}'
+        return f"{self.__class__.__name__}({self.name!r}, {status}, elapsed={self.elapsed:.3f})"
+
+
+def _device_items(devices):
+    if isinstance(devices, dict):
+        return list(devices.items())
+    return [(getattr(device, 'name', str(device)), device) for device in devices]
+
+
+async def gather_fleet(devices, operation, concurrency=64, timeout=60):
+    '''
+    Runs an operation on every device concurrently
+
+    Args:
+        devices (dict | iterable): name -> device mapping, or devices with a 'name' attribute
+        operation (callable): coroutine function called with the device, e.g. lambda d: d.collect_async([...])
+        concurrency (int): maximum number of devices handled at the same time (default 64)
+        timeout (float): per-device timeout in seconds, None to disable (default 60)
+
+    Returns:
+        dict: device name -> FleetResult, in the order of devices
+
+    A timed out device is reported with an asyncio.TimeoutError. The thread running its blocking call
+    is not interrupted: it ends when the ncclient timeout of the session expires.
+    '''
+    items = _device_items(devices)
+    semaphore = asyncio.Semaphore(concurrency)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='jeypyats-netconf')
+    token = _executor.set(executor)
+
+    async def run(name, device):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(operation(device), timeout)
+                return FleetResult(name, result=result, elapsed=time.perf_counter() - start)
+            except Exception as e:
+                log.warning(f"{name}: {type(e).__name__} {e}")
+                return FleetResult(name, error=e, elapsed=time.perf_counter() - start)
+
+    try:
+        results = await asyncio.gather(*(run(name, device) for name, device in items))
+    finally:
+        _executor.reset(token)
+        executor.shutdown(wait=False)
+    return {result.name: result for result in results}
+
+
+def run_fleet(devices, operation, concurrency=64, timeout=60):
+    '''
+    Synchronous entry point of gather_fleet(), for scripts and aetest sections
+
+    Args:
+        see gather_fleet()
+
+    Returns:
+        dict: device name -> FleetResult
+    '''
+    return asyncio.run(gather_fleet(devices, operation, concurrency=concurrency, timeout=timeout))
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: debug_dump.py
+# This file is a part of Netalps.fr
+#
+# Created: 18.10.2026 02:58:13
+# Author: Jeremie Rouzet
+#
+# Last Modified: 18.10.2026 02:58:13
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+Lazy payload dumps
+dump_payload() logs a NETCONF request, a reply or parsed records for debugging. The payload is only
+rendered when the log level is enabled (DEBUG by default) or when payload dumps are enabled for the
+device, and the logged text is truncated:
+
+    dump_payload(logger, "NETCONF reply", reply, device=self)
+
+enable_payload_dumps() additionally appends the payloads of a device to its own file, e.g.
+'dumps/csr1.payloads.log', whatever the log level:
+
+    enable_payload_dumps(device, 'dumps', limit=None)      # full payloads in dumps/<device>.payloads.log
+
+Payloads are rendered as is for text, pretty printed for lxml elements, as the XML of ncclient
+replies, and as indented JSON otherwise. JSON rendering stops at the truncation limit, a large
+record list is not formatted beyond it.
+'''
+
+import datetime
+import json
+import logging
+import os
+import re
+import threading
+from lxml import etree
+
+__all__ = [
+    'DEFAULT_DUMP_LIMIT',
+    'dump_payload',
+    'render_payload',
+    'PayloadDumpFile',
+    'enable_payload_dumps',
+    'disable_payload_dumps',
+]
+
+# characters of a payload written to the logs
+DEFAULT_DUMP_LIMIT = 4096
+
+_UNSAFE = re.compile(r'[^\w.-]+')
+
+
+def _truncate(text, limit):
+    if limit is None or len(text) <= limit:
+        return text
+    return f"{text[:limit]}... [truncated, {len(text) - limit} more characters]"
+
+
+def render_payload(payload, limit=DEFAULT_DUMP_LIMIT):
+    '''
+    Renders a payload as text
+
+    Args:
+        payload: str, bytes, lxml element, reply object with an 'xml' attribute, or JSON serializable data
+        limit (int, optional): maximum number of characters, None for the full payload
+
+    Returns:
+        str: rendered payload, truncated to limit
+    '''
+    if not isinstance(payload, (str, bytes, dict, list, tuple)) and not etree.iselement(payload) \
+            and hasattr(payload, 'xml'):
+        payload = payload.xml
+    if etree.iselement(payload):
+        return _truncate(etree.tostring(payload, pretty_print=True, encoding='unicode'), limit)
+    if isinstance(payload, bytes):
+        return _truncate(payload.decode('utf-8', 'replace'), limit)
+    if isinstance(payload, str):
+        return _truncate(payload, limit)
+    # the encoder yields small chunks, stop once the limit is reached
+    chunks, length = [], 0
+    for chunk in json.JSONEncoder(indent=2, default=str, ensure_ascii=False).iterencode(payload):
+        chunks.append(chunk)
+        length += len(chunk)
+        if limit is not None and length > limit:
+            return f"{''.join(chunks)[:limit]}... [truncated]"
+    return ''.join(chunks)
+
+
+class PayloadDumpFile:
+    '''
+    File receiving the payload dumps of one device
+
+    Args:
+        path (str): file, payloads are appended to it
+        limit (int, optional): maximum number of characters of a payload, None for the full payloads
+    '''
+
+    def __init__(self, path, limit=None):
+        self.path = path
+        self.limit = limit
+        self._lock = threading.Lock()
+
+    def write(self, label, text):
+        timestamp = datetime.datetime.now().isoformat(timespec='milliseconds')
+        with self._lock, open(self.path, 'a', encoding='utf-8') as stream:
+            stream.write(f"----- {timestamp} {label}\n{text}\n")
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.path!r})"
+
+
+def _dump_file(device):
+    # dump file of a device, only when set by enable_payload_dumps()
+    if device is None or not hasattr(device, '__dict__'):
+        return None
+    return vars(device).get('payload_dump')
+
+
+def dump_payload(logger, label, payload, device=None, level=logging.DEBUG, limit=DEFAULT_DUMP_LIMIT):
+    '''
+    Logs a payload, rendering it only when it is written somewhere
+
+    Args:
+        logger (logging.Logger): logger of the calling module
+        label (str): description of the payload, e.g. 'NETCONF reply'
+        payload: request, reply or parsed data, see render_payload()
+        device (optional): device of the payload, to write it to the dump file of the device
+        level (int): log level of the dump (default DEBUG)
+        limit (int, optional): maximum number of characters logged, None for the full payload
+    '''
+    dump_file = _dump_file(device)
+    logged = logger.isEnabledFor(level)
+    if dump_file is None:
+        if logged:
+            logger.log(level, "%s:\n%s", label, render_payload(payload, limit))
+        return
+    text = render_payload(payload, dump_file.limit)
+    dump_file.write(label, text)
+    if logged:
+        logger.log(level, "%s:\n%s", label, _truncate(text, limit))
+
+
+def enable_payload_dumps(device, directory, limit=None):
+    '''
+    Writes the payload dumps of a device to '<directory>/<device name>.payloads.log'
+
+    Args:
+        device: device whose payloads are dumped
+        directory (str): directory of the dump files, created if missing
+        limit (int, optional): maximum number of characters of a payload, None for the full payloads
+
+    Returns:
+        PayloadDumpFile: dump file, also stored as device.payload_dump
+    '''
+    name = getattr(device, 'name', None)
+    name = _UNSAFE.sub('_', name) if isinstance(name, str) and name else 'device'
+    os.makedirs(directory, exist_ok=True)
+    device.payload_dump = PayloadDumpFile(os.path.join(directory, f"{name}.payloads.log"), limit)
+    return device.payload_dump
+
+
+def disable_payload_dumps(device):
+    '''
+    Stops writing the payload dumps of a device to its file
+    '''
+    device.payload_dump = None
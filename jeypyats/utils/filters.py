@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: filters.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 11:20:36
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 11:20:36
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+NETCONF subtree filter builder
+This module builds RFC 6241 subtree filters from a YANG namespace and a path.
+Key leaves are injected as content match nodes (<name>GigabitEthernet1</name>) so that a
+single-item lookup only transfers that item, and leaf selectors are injected as selection
+nodes (<oper-status/>) so that only the requested leaves are returned.
+Filters are rendered as the '<filter>' string expected by device.netconf_get(filter=...)
+or as an lxml element for device.dispatch().
+Several filters can be merged with merge_filters() to fetch unrelated subtrees in a single <get>.
+'''
+
+from lxml import etree
+
+__all__ = [
+    'SubtreeFilter',
+    'merge_filters',
+    'NETCONF_BASE_NS',
+]
+
+NETCONF_BASE_NS = 'urn:ietf:params:xml:ns:netconf:base:1.0'
+
+
+def _split_path(path):
+    return [step for step in path.strip('/').split('/') if step]
+
+
+class SubtreeFilter:
+    '''
+    Subtree filter for one YANG container
+
+    Args:
+        namespace (str): YANG namespace of the top container
+        path (str): '/'-separated path from the top container to the list entry (or leaf) to query,
+                    e.g. 'interfaces-state/interface'
+        keys (dict, optional): content match leaves. A plain leaf name is attached to the last element
+                               of the path; 'element/leaf' is attached to the deepest element of the path
+                               named 'element', e.g. {'routing-instance/name': 'default'}.
+                               Entries whose value is None are ignored.
+        leaves (list, optional): selection leaves under the last element of the path, nested leaves are
+                                 written 'container/leaf'. Without leaves the whole entry is returned.
+
+    Example:
+        SubtreeFilter(
+            'urn:ietf:params:xml:ns:yang:ietf-interfaces', 'interfaces-state/interface',
+            keys={'name': 'GigabitEthernet1'}, leaves=['oper-status', 'admin-status'],
+        ).to_xml()
+    '''
+
+    __slots__ = ('namespace', 'path', 'keys', 'leaves')
+
+    def __init__(self, namespace, path, keys=None, leaves=None):
+        self.namespace = namespace
+        self.path = _split_path(path)
+        if not self.path:
+            raise ValueError("Filter path cannot be empty")
+        self.keys = {name: value for name, value in (keys or {}).items() if value is not None}
+        self.leaves = list(leaves or [])
+
+    def _build(self):
+        namespace = self.namespace
+        root = etree.Element(f'{{{namespace}}}{self.path[0]}', nsmap={None: namespace})
+        chain = [root]
+        for step in self.path[1:]:
+            chain.append(etree.SubElement(chain[-1], f'{{{namespace}}}{step}'))
+
+        key_leaves = set()
+        for key, value in self.keys.items():
+            steps = _split_path(key)
+            if len(steps) == 1:
+                parent = chain[-1]
+                key_leaves.add(steps[0])
+            else:
+                owners = [element for element in chain if etree.QName(element).localname == steps[-2]]
+                if not owners:
+                    raise ValueError(f"Key '{key}' does not belong to filter path '{'/'.join(self.path)}'")
+                parent = owners[-1]
+            leaf = etree.Element(f'{{{namespace}}}{steps[-1]}')
+            leaf.text = str(value)
+            # content match nodes go first, right after the containment node
+            insert_at = 0
+            for child in parent:
+                if child.text is None:
+                    break
+                insert_at += 1
+            parent.insert(insert_at, leaf)
+
+        for selector in self.leaves:
+            steps = _split_path(selector)
+            if len(steps) == 1 and steps[0] in key_leaves:
+                continue
+            parent = chain[-1]
+            for step in steps:
+                tag = f'{{{namespace}}}{step}'
+                child = parent.find(tag)
+                if child is None or child.text is not None:
+                    child = etree.SubElement(parent, tag)
+                parent = child
+        return root
+
+    def subtree(self):
+        """Returns the filter content, i.e. the top container without the '<filter>' wrapper
+
+        Returns:
+            str: XML of the top container
+        """
+        return etree.tostring(self._build(), encoding='unicode')
+
+    def to_xml(self):
+        """Returns the filter as expected by device.netconf_get(filter=...)
+
+        Returns:
+            str: '<filter>...</filter>' XML
+        """
+        return f'<filter>{self.subtree()}</filter>'
+
+    def to_element(self):
+        """Returns the filter as an lxml element, in the NETCONF base namespace, for device.dispatch()
+
+        Returns:
+            lxml.etree._Element: '<filter type="subtree">' element
+        """
+        filter_element = etree.Element(f'{{{NETCONF_BASE_NS}}}filter', nsmap={None: NETCONF_BASE_NS})
+        filter_element.set('type', 'subtree')
+        filter_element.append(self._build())
+        return filter_element
+
+    def __str__(self):
+        return self.to_xml()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(namespace={self.namespace!r}, path={'/'.join(self.path)!r}, "
+            f"keys={self.keys!r}, leaves={self.leaves!r})"
+        )
+
+
+def merge_filters(filters):
+    """Merges subtree filters into a single '<filter>', the top containers becoming siblings
+
+    Filters producing the same subtree are sent once. The server returns the union of the
+    subtrees selected by each of them (RFC 6241 section 6.2.5).
+
+    Args:
+        filters (iterable): SubtreeFilter objects
+
+    Returns:
+        str: '<filter>...</filter>' XML
+    """
+    subtrees = []
+    for subtree_filter in filters:
+        subtree = subtree_filter.subtree()
+        if subtree not in subtrees:
+            subtrees.append(subtree)
+    if not subtrees:
+        raise ValueError("Cannot merge an empty list of filters")
+    return f'<filter>{"".join(subtrees)}</filter>'
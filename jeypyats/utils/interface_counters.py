@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: interface_counters.py
+# This file is a part of Netalps.fr
+#
+# Created: 18.10.2026 02:04:51
+# Author: Jeremie Rouzet
+#
+# Last Modified: 18.10.2026 02:04:51
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+Interface counter rates
+CounterSampler turns successive counter samples of the interfaces of a device (e.g. the result of
+get_interface_counters()) into rates per second. The previous sample of every interface is kept in
+preallocated packed arrays, one slot per interface, with a mask of the counters holding a previous
+value. The counter increases of all the interfaces are computed in one pass over the previous and current
+values, read as a single slice when the interfaces come in the order of their slots (as they do
+from one sample of a device to the next), then grouped into the rates of every interface:
+
+    sampler = CounterSampler()
+    sampler.update(device.get_interface_counters())         # first sample, no rate yet
+    ... 30 seconds later ...
+    rates = sampler.update(device.get_interface_counters())
+    rates['GigabitEthernet1']['in_octets']                  # octets per second
+    sampler.utilisation('GigabitEthernet1', 1e9)            # {'in': 0.12, 'out': 0.03}, ratio of the speed
+
+Counters going backwards are 32 or 64 bits counters which wrapped around, unless the discontinuity
+time of the interface changed (counters cleared, interface re-created, or a first clear reported),
+in which case the interface starts over without rate. A counter the device does not report (None)
+has no rate until two successive samples report it.
+'''
+
+import time
+from array import array
+
+__all__ = [
+    'COUNTER_FIELDS',
+    'CounterSampler',
+    'counter_delta',
+]
+
+COUNTER_FIELDS = ('in_octets', 'out_octets', 'in_errors', 'out_errors', 'in_discards', 'out_discards')
+
+_WRAP_32 = 2 ** 32
+_WRAP_64 = 2 ** 64
+
+
+def counter_delta(previous, current):
+    '''
+    Increase of a counter between two samples, wrap around included
+
+    A counter lower than its previous value wrapped around: at 2^32 when both values fit in 32 bits,
+    at 2^64 otherwise.
+
+    Returns:
+        int: increase of the counter
+    '''
+    if current >= previous:
+        return current - previous
+    return current + (_WRAP_32 if previous < _WRAP_32 else _WRAP_64) - previous
+
+
+class CounterSampler:
+    '''
+    Rates of the interface counters of one device, from successive samples
+
+    Args:
+        fields (tuple): counters of the samples (default COUNTER_FIELDS)
+        capacity (int): number of interfaces preallocated, the arrays double when more interfaces appear
+    '''
+
+    def __init__(self, fields=COUNTER_FIELDS, capacity=64):
+        self.fields = tuple(fields)
+        self._slots = {}
+        self._capacity = 0
+        self._previous = array('Q')
+        self._timestamps = array('d')
+        # 1 for every counter of a slot holding a previous value, the rates are computed against it
+        self._valid = bytearray()
+        self._discontinuities = []
+        self._rates = {}
+        self._grow(max(capacity, 1))
+
+    def _grow(self, capacity):
+        # preallocates the arrays for capacity interfaces
+        added = capacity - self._capacity
+        self._previous.extend(array('Q', [0]) * (added * len(self.fields)))
+        self._timestamps.extend(array('d', [0.0]) * added)
+        self._valid.extend(bytes(added * len(self.fields)))
+        self._discontinuities.extend([None] * added)
+        self._capacity = capacity
+
+    def _slot(self, name):
+        slot = self._slots.get(name)
+        if slot is None:
+            slot = self._slots[name] = len(self._slots)
+            if slot >= self._capacity:
+                self._grow(self._capacity * 2)
+        return slot
+
+    def update(self, samples, timestamp=None):
+        '''
+        Adds a sample of the counters and computes the rates since the previous one
+
+        Args:
+            samples (iterable): counter records, dicts with 'name', the counter fields and optionally
+                                'discontinuity_time'. A counter missing, or None, has no rate on this
+                                sample nor on the next one.
+            timestamp (float, optional): time of the sample, time.time() by default
+
+        Returns:
+            dict: interface name -> {counter: rate per second}, for the interfaces of the sample
+                  which were in the previous one, with the counters reported by both samples
+        '''
+        timestamp = time.time() if timestamp is None else timestamp
+        width = len(self.fields)
+        previous, timestamps, valid = self._previous, self._timestamps, self._valid
+        discontinuities = self._discontinuities
+        # gather the sample in the slot layout of the arrays
+        names, slots, current, present = [], [], array('Q'), bytearray()
+        for sample in samples:
+            name = sample.get('name')
+            if not name:
+                continue
+            slot = self._slot(name)
+            names.append(name)
+            slots.append(slot)
+            values = [sample.get(field) for field in self.fields]
+            current.extend(0 if value is None else int(value) & (_WRAP_64 - 1) for value in values)
+            present.extend(value is not None for value in values)
+            discontinuity = sample.get('discontinuity_time')
+            if discontinuity != discontinuities[slot]:
+                # counters cleared since the previous sample, or a first clear: no rate for this interface
+                valid[slot * width:(slot + 1) * width] = bytes(width)
+                discontinuities[slot] = discontinuity
+        if not slots:
+            return {}
+
+        first = slots[0]
+        contiguous = slots == list(range(first, first + len(slots)))
+        if contiguous:
+            old_values = previous[first * width:(first + len(slots)) * width]
+            old_valid = valid[first * width:(first + len(slots)) * width]
+        else:
+            old_values, old_valid = array('Q'), bytearray()
+            for slot in slots:
+                old_values.extend(previous[slot * width:(slot + 1) * width])
+                old_valid.extend(valid[slot * width:(slot + 1) * width])
+        # counter increases of every interface in one pass, wrap around included (see counter_delta())
+        deltas = [new - old if new >= old else new + (_WRAP_32 if old < _WRAP_32 else _WRAP_64) - old
+                  for old, new in zip(old_values, current)]
+
+        rates = {}
+        fields = self.fields
+        for position, (name, slot) in enumerate(zip(names, slots)):
+            elapsed = timestamp - timestamps[slot]
+            base = position * width
+            if elapsed > 0 and any(old_valid[base:base + width]):
+                # a counter missing from either sample has no rate
+                interface_rates = {
+                    field: delta / elapsed
+                    for field, delta, was_valid, is_present in zip(
+                        fields, deltas[base:base + width], old_valid[base:base + width], present[base:base + width])
+                    if was_valid and is_present
+                }
+                if interface_rates:
+                    rates[name] = interface_rates
+            timestamps[slot] = timestamp
+        if contiguous:
+            previous[first * width:(first + len(slots)) * width] = current
+            valid[first * width:(first + len(slots)) * width] = present
+        else:
+            for position, slot in enumerate(slots):
+                previous[slot * width:(slot + 1) * width] = current[position * width:(position + 1) * width]
+                valid[slot * width:(slot + 1) * width] = present[position * width:(position + 1) * width]
+        self._rates.update(rates)
+        return rates
+
+    def rates(self, name=None):
+        '''
+        Returns the last rates computed, of every interface or of one interface (None if unknown)
+        '''
+        return dict(self._rates) if name is None else self._rates.get(name)
+
+    def utilisation(self, name, speed):
+        '''
+        Last input and output utilisation of an interface
+
+        Args:
+            name (str): interface name
+            speed (float): interface speed in bits per second
+
+        Returns:
+            dict: {'in': ratio, 'out': ratio} of the speed, None without rate or speed
+        '''
+        rates = self._rates.get(name)
+        if not rates or not speed:
+            return None
+        return {'in': rates.get('in_octets', 0) * 8 / speed, 'out': rates.get('out_octets', 0) * 8 / speed}
+
+    def reset(self, name=None):
+        '''Forgets the previous sample of every interface, or of one interface'''
+        for slot in (self._slots.values() if name is None else [self._slots[name]] if name in self._slots else []):
+            self._valid[slot * len(self.fields):(slot + 1) * len(self.fields)] = bytes(len(self.fields))
+            self._discontinuities[slot] = None
+        if name is None:
+            self._rates.clear()
+        else:
+            self._rates.pop(name, None)
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self._slots)} interfaces)"
@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: interface_table.py
+# This file is a part of Netalps.fr
+#
+# Created: 18.10.2026 01:12:36
+# Author: Jeremie Rouzet
+#
+# Last Modified: 18.10.2026 01:12:36
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+Interface state table
+InterfaceTable merges the interface states read from several YANG models (OpenConfig, IETF,
+IOS-XE and IOS-XR native) into one row per interface, with statuses normalized to the IETF
+values ('up', 'down', 'testing', ...), and indexes the rows by name, type and oper status:
+
+    table = device.collect_interface_table()
+    table['Cellular0/2/0'].oper_status          # 'up'
+    table.with_type('GigabitEthernet')          # rows of the GigabitEthernet interfaces
+    table.with_oper_status('down')              # rows of the interfaces down
+
+The type of an interface is the alphabetic part of its name, e.g. 'Cellular' for 'Cellular0/2/0'.
+When several models report an interface, the first model added fills the fields, the next ones
+only fill the fields still missing.
+
+The records of every model are kept as read, records(source) returns them so that the status
+parsers answer from a table with the values the device reports in that model:
+
+    table.records('openconfig', 'GigabitEthernet0/0')   # [{'name': ..., 'oper_status': 'UP', ...}]
+'''
+
+import re
+import sys
+
+__all__ = [
+    'InterfaceState',
+    'InterfaceTable',
+    'normalize_status',
+    'interface_type',
+]
+
+# prefixes of the native status enumerations, e.g. 'if-oper-state-ready' or 'im-state-up'
+_STATUS_PREFIXES = ('if-oper-state-', 'if-state-', 'im-state-')
+
+# native statuses without IETF equivalent name
+_STATUS_ALIASES = {'ready': 'up', 'no-pass': 'down', 'admin-down': 'down'}
+
+_TYPE = re.compile(r'[A-Za-z-]+')
+
+
+def normalize_status(value):
+    '''
+    Converts a status of any interface model to the IETF values
+
+    Args:
+        value (str): e.g. 'UP', 'if-oper-state-ready', 'im-state-admin-down'
+
+    Returns:
+        str: e.g. 'up' or 'down', None for a missing value
+    '''
+    if not value:
+        return None
+    value = value.strip().lower()
+    for prefix in _STATUS_PREFIXES:
+        if value.startswith(prefix):
+            value = value[len(prefix):]
+            break
+    return sys.intern(_STATUS_ALIASES.get(value, value))
+
+
+def interface_type(name):
+    '''
+    Returns the type of an interface, the alphabetic part of its name ('Cellular' for 'Cellular0/2/0')
+    '''
+    match = _TYPE.match(name or '')
+    return sys.intern(match.group(0)) if match else None
+
+
+class InterfaceState:
+    '''
+    Row of an InterfaceTable
+    '''
+
+    __slots__ = ('name', 'type', 'oper_status', 'admin_status', 'description', 'source')
+
+    _fields = __slots__
+
+    def __init__(self, name, oper_status=None, admin_status=None, description=None, source=None):
+        self.name = name
+        self.type = interface_type(name)
+        self.oper_status = normalize_status(oper_status)
+        self.admin_status = normalize_status(admin_status)
+        self.description = description
+        self.source = source
+
+    def __getitem__(self, name):
+        if name not in self._fields:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def get(self, name, default=None):
+        return getattr(self, name) if name in self._fields else default
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __eq__(self, other):
+        if isinstance(other, InterfaceState):
+            other = other.as_dict()
+        return self.as_dict() == other if isinstance(other, dict) else NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.name!r}, oper_status={self.oper_status!r}, " \
+               f"admin_status={self.admin_status!r})"
+
+
+class InterfaceTable:
+    '''
+    Interface states of a device indexed by name, type and oper status
+
+    Args:
+        rows (iterable, optional): (source, record) pairs to add, see add()
+    '''
+
+    def __init__(self, rows=None):
+        self._rows = {}
+        self._records = {}
+        self._by_type = {}
+        self._by_oper_status = {}
+        if rows is not None:
+            for source, record in rows:
+                self.add(record, source)
+
+    def add(self, record, source=None):
+        '''
+        Adds the state of an interface read from a model
+
+        Args:
+            record (dict): 'name' and any of 'oper_status', 'admin_status', 'description'
+            source (str, optional): model of the record, e.g. 'ietf' or 'openconfig'
+
+        Returns:
+            InterfaceState: row of the interface
+        '''
+        name = record.get('name')
+        if not name:
+            return None
+        self._records.setdefault(source, {})[name] = record
+        row = self._rows.get(name)
+        if row is None:
+            row = self._rows[name] = InterfaceState(
+                name, record.get('oper_status'), record.get('admin_status'), record.get('description'), source)
+            self._by_type.setdefault(row.type, {})[name] = row
+            self._by_oper_status.setdefault(row.oper_status, {})[name] = row
+            return row
+        if row.oper_status is None and record.get('oper_status'):
+            del self._by_oper_status[None][name]
+            row.oper_status = normalize_status(record['oper_status'])
+            self._by_oper_status.setdefault(row.oper_status, {})[name] = row
+        if row.admin_status is None:
+            row.admin_status = normalize_status(record.get('admin_status'))
+        if row.description is None:
+            row.description = record.get('description')
+        return row
+
+    def get(self, name, default=None):
+        return self._rows.get(name, default)
+
+    def __getitem__(self, name):
+        return self._rows[name]
+
+    def __contains__(self, name):
+        return name in self._rows
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __iter__(self):
+        return iter(self._rows.values())
+
+    def names(self):
+        return list(self._rows)
+
+    def rows(self, name=None):
+        '''Returns every row, or the row of one interface (empty list if it is unknown)'''
+        if name is None:
+            return list(self._rows.values())
+        row = self._rows.get(name)
+        return [row] if row is not None else []
+
+    def records(self, source, name=None):
+        '''Returns the records of a model as added, or the record of one interface (empty list if it is unknown)'''
+        records = self._records.get(source, {})
+        if name is None:
+            return list(records.values())
+        record = records.get(name)
+        return [record] if record is not None else []
+
+    def with_type(self, type):
+        '''Returns the rows of the interfaces of a type, e.g. 'Cellular' '''
+        return list(self._by_type.get(type, {}).values())
+
+    def with_oper_status(self, status):
+        '''Returns the rows of the interfaces with an oper status, e.g. 'down' '''
+        return list(self._by_oper_status.get(normalize_status(status), {}).values())
+
+    def types(self):
+        return sorted(type for type in self._by_type if type)
+
+    def to_dicts(self):
+        return [row.as_dict() for row in self]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self._rows)} interfaces)"
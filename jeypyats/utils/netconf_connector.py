@@ -8,7 +8,7 @@
 # Created: 2025/06/25 13:41:04
 # Author: Jeremie Rouzet
 #
-# Last Modified: 29.01.2026 23:42:07
+# Last Modified: 17.10.2026 14:05:51
 # Modified By: Jeremie Rouzet
 #
 # Copyright (c) 2025 Netalps.fr
@@ -24,15 +24,36 @@ Utility module for establishing NETCONF connections using ncclient
 This module provides a function to connect to a NETCONF-enabled device.
 It uses the ncclient library to manage the connection.
 It handles connection errors and logs them appropriately.
+Sessions are drawn from a process-wide pool keyed by (host, port, username), so that the SSH and
+NETCONF hello cost is paid once per device instead of once per testcase. The pool checks the health
+of a session before handing it out, closes sessions left idle for too long, caps the number of
+sessions per device and transparently reconnects broken sessions.
 '''
 
 import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
 from ncclient import manager
+from ncclient.transport import TransportError
 from pyats.connections import BaseConnection
+from .debug_dump import dump_payload
+from .utils import JeyPyatsNotConnectedError
 
+log = logging.getLogger(__name__)
 
-def connect_netconf(host, port, username, password, device_params=None):
+__all__ = [
+    'connect_netconf',
+    'NetconfSessionPool',
+    'default_pool',
+    'NetconfConnectorConnection',
+]
+
+
+def connect_netconf(host, port, username, password, device_params=None, timeout=30):
     try:
+        kwargs = {'device_params': device_params} if device_params else {}
         return manager.connect(
             host=str(host),
             port=port,
@@ -41,14 +62,266 @@ def connect_netconf(host, port, username, password, device_params=None):
             hostkey_verify=False,
             allow_agent=False,
             look_for_keys=False,
-            timeout=30
+            timeout=timeout,
+            **kwargs
         )
     except Exception as e:
         logging.error(f"Failed to connect to {host}: {e}")
         return None
 
+
+class _PooledSession:
+    '''A NETCONF session owned by the pool'''
+
+    __slots__ = ('key', 'manager', 'password', 'device_params', 'in_use', 'last_used')
+
+    def __init__(self, key, nc_manager, password, device_params, now):
+        self.key = key
+        self.manager = nc_manager
+        self.password = password
+        self.device_params = device_params
+        self.in_use = True
+        self.last_used = now
+
+
+class NetconfSessionPool:
+    '''
+    Process-wide pool of ncclient sessions keyed by (host, port, username)
+
+    Args:
+        max_sessions_per_device (int): maximum number of open sessions per device (default 2)
+        idle_timeout (float): seconds after which an unused session is closed (default 300)
+        keepalive (int): SSH keepalive interval in seconds, 0 to disable (default 30)
+        connect_timeout (int): ncclient connection timeout in seconds (default 30)
+        clock (callable): monotonic clock, mainly for tests
+
+    Every session handed out counts against max_sessions_per_device until it is released, including
+    the session held by a connection for its whole life and the session of a notification subscription.
+
+    Example:
+        with default_pool.session('10.0.0.1', 830, 'admin', 'secret') as nc:
+            reply = nc.get(filter=filter_xml)
+    '''
+
+    def __init__(self, max_sessions_per_device=2, idle_timeout=300, keepalive=30, connect_timeout=30,
+                 clock=time.monotonic):
+        self.max_sessions_per_device = max_sessions_per_device
+        self.idle_timeout = idle_timeout
+        self.keepalive = keepalive
+        self.connect_timeout = connect_timeout
+        self._clock = clock
+        self._sessions = {}
+        self._by_manager = {}
+        self._condition = threading.Condition()
+
+    @staticmethod
+    def _is_healthy(nc_manager):
+        try:
+            return bool(nc_manager.connected)
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close(nc_manager):
+        try:
+            nc_manager.close_session()
+        except Exception as e:
+            log.debug(f"Error while closing NETCONF session: {e}")
+
+    def _set_keepalive(self, nc_manager):
+        transport = getattr(getattr(nc_manager, '_session', None), '_transport', None)
+        if self.keepalive and transport is not None and hasattr(transport, 'set_keepalive'):
+            transport.set_keepalive(self.keepalive)
+
+    def _discard(self, pooled):
+        self._sessions[pooled.key].remove(pooled)
+        self._by_manager.pop(id(pooled.manager), None)
+
+    def _evict_idle(self):
+        '''Closes the sessions left idle for more than idle_timeout, must be called with the lock held'''
+        limit = self._clock() - self.idle_timeout
+        evicted = []
+        for sessions in self._sessions.values():
+            for pooled in list(sessions):
+                if not pooled.in_use and pooled.last_used < limit:
+                    self._discard(pooled)
+                    evicted.append(pooled.manager)
+        return evicted
+
+    def evict_idle(self):
+        '''
+        Closes the sessions left idle for more than idle_timeout
+
+        Returns:
+            int: number of closed sessions
+        '''
+        with self._condition:
+            evicted = self._evict_idle()
+            self._condition.notify_all()
+        for nc_manager in evicted:
+            self._close(nc_manager)
+        return len(evicted)
+
+    def acquire(self, host, port, username, password, device_params=None, timeout=None):
+        '''
+        Hands out a healthy session to the device, opening one if needed
+
+        Args:
+            host (str): device address
+            port (int): NETCONF port
+            username (str): username
+            password (str): password
+            device_params (dict, optional): ncclient device handler parameters
+            timeout (float, optional): seconds to wait for a session when the device already has
+                                       max_sessions_per_device sessions in use. None waits forever.
+
+        Returns:
+            ncclient.manager.Manager: session, to be handed back with release()
+
+        Raises:
+            JeyPyatsNotConnectedError: the session could not be opened or none was released in time
+        '''
+        key = (str(host), int(port), username)
+        deadline = None if timeout is None else self._clock() + timeout
+        to_close = []
+        with self._condition:
+            while True:
+                to_close.extend(self._evict_idle())
+                sessions = self._sessions.setdefault(key, [])
+                pooled = next((pooled for pooled in sessions if not pooled.in_use), None)
+                if pooled is not None:
+                    if self._is_healthy(pooled.manager):
+                        pooled.in_use = True
+                        pooled.last_used = self._clock()
+                        break
+                    log.info(f"Dropping broken NETCONF session to {host}:{port}")
+                    self._discard(pooled)
+                    to_close.append(pooled.manager)
+                    continue
+                if len(sessions) < self.max_sessions_per_device:
+                    # reserve the slot, the session is opened outside of the lock
+                    pooled = _PooledSession(key, None, password, device_params, self._clock())
+                    sessions.append(pooled)
+                    break
+                remaining = None if deadline is None else deadline - self._clock()
+                if remaining is not None and remaining <= 0:
+                    raise JeyPyatsNotConnectedError(
+                        f"No NETCONF session to {host}:{port} released within {timeout}s "
+                        f"({self.max_sessions_per_device} sessions in use)"
+                    )
+                self._condition.wait(remaining)
+
+        for nc_manager in to_close:
+            self._close(nc_manager)
+        if pooled.manager is not None:
+            return pooled.manager
+
+        nc_manager = connect_netconf(host, port, username, password, device_params, timeout=self.connect_timeout)
+        with self._condition:
+            if nc_manager is None:
+                self._sessions[key].remove(pooled)
+                self._condition.notify_all()
+                raise JeyPyatsNotConnectedError(f"Failed to open a NETCONF session to {host}:{port}")
+            pooled.manager = nc_manager
+            self._by_manager[id(nc_manager)] = pooled
+        self._set_keepalive(nc_manager)
+        log.debug(f"Opened NETCONF session to {host}:{port}")
+        return nc_manager
+
+    def release(self, nc_manager):
+        '''
+        Hands a session back to the pool, broken sessions are closed
+
+        Args:
+            nc_manager (ncclient.manager.Manager): session returned by acquire()
+        '''
+        healthy = self._is_healthy(nc_manager)
+        with self._condition:
+            pooled = self._by_manager.get(id(nc_manager))
+            if pooled is None:
+                return
+            if healthy:
+                pooled.in_use = False
+                pooled.last_used = self._clock()
+            else:
+                self._discard(pooled)
+            self._condition.notify_all()
+        if not healthy:
+            self._close(nc_manager)
+
+    def reconnect(self, nc_manager):
+        '''
+        Replaces a broken session by a new session to the same device
+
+        Args:
+            nc_manager (ncclient.manager.Manager): session returned by acquire()
+
+        Returns:
+            ncclient.manager.Manager: new session, to be handed back with release()
+
+        Raises:
+            JeyPyatsNotConnectedError: no session could be opened within connect_timeout
+        '''
+        with self._condition:
+            pooled = self._by_manager.get(id(nc_manager))
+            if pooled is None:
+                raise JeyPyatsNotConnectedError("Session does not belong to this pool")
+            self._discard(pooled)
+            self._condition.notify_all()
+        self._close(nc_manager)
+        host, port, username = pooled.key
+        log.info(f"Reconnecting NETCONF session to {host}:{port}")
+        return self.acquire(host, port, username, pooled.password, pooled.device_params, self.connect_timeout)
+
+    @contextmanager
+    def session(self, host, port, username, password, device_params=None, timeout=None):
+        '''Context manager version of acquire() and release()'''
+        nc_manager = self.acquire(host, port, username, password, device_params, timeout)
+        try:
+            yield nc_manager
+        finally:
+            self.release(nc_manager)
+
+    def free_sessions(self, host, port, username):
+        '''
+        Returns:
+            int: number of sessions to the device which can still be acquired without waiting
+        '''
+        with self._condition:
+            sessions = self._sessions.get((str(host), int(port), username), [])
+            return self.max_sessions_per_device - sum(1 for pooled in sessions if pooled.in_use)
+
+    def stats(self):
+        '''
+        Returns:
+            dict: (host, port, username) -> {'open': int, 'in_use': int}
+        '''
+        with self._condition:
+            return {
+                key: {'open': len(sessions), 'in_use': sum(1 for pooled in sessions if pooled.in_use)}
+                for key, sessions in self._sessions.items() if sessions
+            }
+
+    def close_all(self):
+        '''Closes every pooled session, e.g. at the end of a job'''
+        with self._condition:
+            managers = [pooled.manager for sessions in self._sessions.values() for pooled in sessions
+                        if pooled.manager is not None]
+            self._sessions.clear()
+            self._by_manager.clear()
+            self._condition.notify_all()
+        for nc_manager in managers:
+            self._close(nc_manager)
+
+
+# Process-wide pool shared by every NetconfConnectorConnection
+default_pool = NetconfSessionPool()
+
+
 class NetconfConnectorConnection(BaseConnection):
-    """Custom NETCONF connection class using ncclient directly."""
+    """Custom NETCONF connection class using ncclient sessions drawn from the process-wide pool."""
+
+    pool = default_pool
 
     def __init__(self, device=None, alias=None, via=None, **kwargs):
         if device is not None:
@@ -57,6 +330,8 @@ class NetconfConnectorConnection(BaseConnection):
             self.alias = alias
         self._connection_info = kwargs
         self.nc = None
+        # additional session used by netconf_get() in the current thread, see pooled_session()
+        self._local = threading.local()
         self._connected = False
         if device is not None or alias is not None:
             super().__init__(device=device, alias=alias, via=via)
@@ -64,25 +339,125 @@ class NetconfConnectorConnection(BaseConnection):
     @property
     def connected(self):
         return self._connected
-    def connect(self):
-        import os
+
+    @staticmethod
+    def _credentials():
         user = os.getenv('PYATS_USER')
         password = os.getenv('PYATS_PASSWORD')
         if not user or not password:
             raise Exception("PYATS_USER and PYATS_PASSWORD environment variables must be set")
+        return user, password
+
+    def connect(self, timeout=None):
+        '''
+        Draws the session of the connection from the pool, the session is held until disconnect()
+
+        Args:
+            timeout (float, optional): seconds to wait when max_sessions_per_device sessions to the device
+                                       are already in use (default: the connect_timeout of the pool)
+        '''
+        user, password = self._credentials()
         ip = self.connection_info['ip']
         port = self.connection_info['port']
-        self.nc = connect_netconf(ip, port, user, password)
-        if not self.nc:
-            raise Exception("Failed to connect to NETCONF")
+        timeout = self.pool.connect_timeout if timeout is None else timeout
+        try:
+            self.nc = self.pool.acquire(ip, port, user, password, timeout=timeout)
+        except JeyPyatsNotConnectedError as e:
+            raise Exception("Failed to connect to NETCONF") from e
         self._connected = True
         # Set device.nc for easy access
         if hasattr(self, 'device') and self.device:
             self.device.nc = self.nc
-            self.device.netconf_get = lambda filter=None: self.nc.get(filter=filter) if filter else None
+            self.device.netconf_get = self.netconf_get
+            self.device.netconf_open_session = self.open_session
+            self.device.netconf_release_session = self.pool.release
+            self.device.netconf_pooled_session = self.pooled_session
+            self.device.netconf_free_sessions = self.free_sessions
+
+    def open_session(self, timeout=None):
+        '''
+        Acquires an additional pooled session to the device, e.g. for a notification subscription
+        which cannot share the session used for <get>
+
+        The session of the connection itself, and any session still held by a subscription, count
+        against max_sessions_per_device: with the default limit of 2, a connected device has a single
+        additional session to hand out.
+
+        Args:
+            timeout (float, optional): seconds to wait for a session to be released when the limit is
+                                       reached (default: the connect_timeout of the pool)
+
+        Returns:
+            ncclient.manager.Manager: session, to be handed back with pool.release()
+
+        Raises:
+            JeyPyatsNotConnectedError: no session was released in time
+        '''
+        user, password = self._credentials()
+        timeout = self.pool.connect_timeout if timeout is None else timeout
+        return self.pool.acquire(self.connection_info['ip'], self.connection_info['port'], user, password,
+                                 timeout=timeout)
+
+    def free_sessions(self):
+        '''
+        Returns:
+            int: number of additional sessions to the device the pool can hand out without waiting
+        '''
+        user, _ = self._credentials()
+        return self.pool.free_sessions(self.connection_info['ip'], self.connection_info['port'], user)
+
+    @contextmanager
+    def pooled_session(self, timeout=None):
+        '''
+        Sends the netconf_get() calls of the current thread over an additional pooled session,
+        e.g. to fetch several VRFs concurrently, the session is handed back to the pool on exit
+
+        Args:
+            timeout (float, optional): see open_session()
+
+        Raises:
+            JeyPyatsNotConnectedError: no session was released in time
+        '''
+        self._local.nc = self.open_session(timeout)
+        try:
+            yield self._local.nc
+        finally:
+            nc, self._local.nc = self._local.nc, None
+            self.pool.release(nc)
+
+    def netconf_get(self, filter=None):
+        '''
+        Sends a <get>, reconnecting once if the pooled session turns out to be broken
+
+        Args:
+            filter (str, optional): '<filter>' XML
+
+        Returns:
+            ncclient reply, or None without filter
+        '''
+        if not filter:
+            return None
+        device = getattr(self, 'device', None)
+        dump_payload(log, "NETCONF get filter", filter, device=device)
+        local_nc = getattr(self._local, 'nc', None)
+        try:
+            reply = (local_nc or self.nc).get(filter=filter)
+        except TransportError as e:
+            log.warning(f"NETCONF session broken ({e}), reconnecting")
+            if local_nc is not None:
+                local_nc = self._local.nc = self.pool.reconnect(local_nc)
+                reply = local_nc.get(filter=filter)
+            else:
+                self.nc = self.pool.reconnect(self.nc)
+                if hasattr(self, 'device') and self.device:
+                    self.device.nc = self.nc
+                reply = self.nc.get(filter=filter)
+        dump_payload(log, "NETCONF reply", reply, device=device)
+        return reply
 
     def disconnect(self):
+        # the session goes back to the pool instead of being closed
         if self.nc:
-            self.nc.close()
+            self.pool.release(self.nc)
             self.nc = None
         self._connected = False
@@ -0,0 +1,312 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: notifications.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 18:20:45
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 18:20:45
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+NETCONF notification subscriptions
+This module subscribes a dedicated ncclient session to a notification stream, either with the
+RFC 5277 <create-subscription> or with the RFC 8639 <establish-subscription>, and delivers the
+notifications incrementally into a bounded in-memory ring buffer filled by a reader thread.
+Testcases wait for a message with wait_for_message(pattern, timeout) instead of downloading and
+re-parsing the whole log buffer of the device.
+
+Every event is a dict:
+    {'seq': 12, 'kind': 'syslog', 'event_time': '2026-10-17T18:20:45Z', 'text': '...', 'record': {...}}
+'''
+
+import collections
+import logging
+import re
+import threading
+import time
+from lxml import etree
+from .reply_decoder import element_to_record, localname
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    'EventBuffer',
+    'NotificationSubscription',
+    'decode_notification',
+    'SUBSCRIBED_NOTIFICATIONS_NS',
+]
+
+NETCONF_NOTIFICATION_NS = 'urn:ietf:params:xml:ns:netconf:notification:1.0'
+SUBSCRIBED_NOTIFICATIONS_NS = 'urn:ietf:params:xml:ns:yang:ietf-subscribed-notifications'
+
+# leaves holding the human readable message of a notification, by order of preference
+_TEXT_LEAVES = ('message', 'msg', 'msg-text', 'text', 'event-msg', 'description')
+
+
+def _find_text(record):
+    if isinstance(record, dict):
+        for leaf in _TEXT_LEAVES:
+            if isinstance(record.get(leaf), str):
+                return record[leaf]
+        for value in record.values():
+            text = _find_text(value)
+            if text:
+                return text
+    elif isinstance(record, list):
+        for value in record:
+            text = _find_text(value)
+            if text:
+                return text
+    return None
+
+
+def _classify(content):
+    name = content.tag.lower()
+    if 'eem' in name:
+        return 'eem'
+    if 'syslog' in name or 'logging' in name:
+        return 'syslog'
+    return localname(content.tag)
+
+
+def decode_notification(xml, classify=None):
+    '''
+    Decodes a <notification> message
+
+    Args:
+        xml (str | bytes): notification XML
+        classify (callable, optional): content element -> event kind. By default EEM and syslog
+                                       notifications are recognized from their namespace or name.
+
+    Returns:
+        dict: event without 'seq', or None if the notification has no content
+    '''
+    if isinstance(xml, str):
+        xml = xml.encode('utf-8')
+    root = etree.fromstring(xml)
+    event_time = root.findtext(f'{{{NETCONF_NOTIFICATION_NS}}}eventTime')
+    content = next(
+        (child for child in root if isinstance(child.tag, str) and localname(child.tag) != 'eventTime'), None
+    )
+    if content is None:
+        return None
+    record = element_to_record(content)
+    text = _find_text(record) if isinstance(record, dict) else record
+    return {
+        'kind': (classify or _classify)(content),
+        'event_time': event_time,
+        'text': text if text is not None else etree.tostring(content, encoding='unicode'),
+        'record': record,
+    }
+
+
+class EventBuffer:
+    '''
+    Bounded ring buffer of events, oldest events are dropped when it is full
+
+    Args:
+        size (int): maximum number of kept events (default 1000)
+    '''
+
+    def __init__(self, size=1000):
+        self._events = collections.deque(maxlen=size)
+        self._condition = threading.Condition()
+        self._next_seq = 1
+        self.dropped = 0
+        self.closed = False
+
+    @property
+    def last_seq(self):
+        '''Sequence number of the latest event, 0 if none. Pass it as 'since' to only see newer events.'''
+        with self._condition:
+            return self._next_seq - 1
+
+    def append(self, event):
+        with self._condition:
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+            event['seq'] = self._next_seq
+            self._next_seq += 1
+            self._events.append(event)
+            self._condition.notify_all()
+        return event
+
+    def close(self):
+        '''Marks the buffer as receiving no more events, waiters return at once'''
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+    def _select(self, regex, since, kind):
+        return [
+            event for event in self._events
+            if event['seq'] > since
+            and (kind is None or event['kind'] == kind)
+            and (regex is None or regex.search(event['text'] or ''))
+        ]
+
+    def events(self, pattern=None, since=0, kind=None):
+        '''
+        Returns the buffered events matching a pattern
+
+        Args:
+            pattern (str | re.Pattern, optional): regular expression searched in the event text
+            since (int): only events with a greater sequence number (default 0, every event)
+            kind (str, optional): only events of this kind, e.g. 'syslog' or 'eem'
+
+        Returns:
+            list: events, oldest first
+        '''
+        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+        with self._condition:
+            return self._select(regex, since, kind)
+
+    def wait_for(self, pattern, timeout=60, since=0, kind=None):
+        '''
+        Waits for an event matching a pattern, already buffered or yet to come
+
+        Args:
+            pattern (str | re.Pattern): regular expression searched in the event text
+            timeout (float): seconds to wait (default 60)
+            since (int): only events with a greater sequence number (default 0, every event)
+            kind (str, optional): only events of this kind
+
+        Returns:
+            dict: first matching event, None on timeout or once the buffer is closed
+        '''
+        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                matches = self._select(regex, since, kind)
+                if matches:
+                    return matches[0]
+                # only the events appended while waiting need to be checked again
+                since = max(since, self._next_seq - 1)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self.closed:
+                    return None
+                self._condition.wait(remaining)
+
+
+class NotificationSubscription:
+    '''
+    Notification subscription on a dedicated ncclient session
+
+    A session carrying a subscription is not used for other RPCs (RFC 5277 section 2.1.1):
+    it is closed when the subscription stops.
+
+    Args:
+        nc (ncclient.manager.Manager): dedicated session
+        buffer_size (int): size of the ring buffer (default 1000)
+        classify (callable, optional): see decode_notification()
+        on_close (callable, optional): called with the session once it is closed, e.g. pool.release
+        poll_interval (float): reader thread wake up interval, bounds the stop() latency (default 0.5)
+    '''
+
+    def __init__(self, nc, buffer_size=1000, classify=None, on_close=None, poll_interval=0.5):
+        self.nc = nc
+        self.buffer = EventBuffer(buffer_size)
+        self.classify = classify
+        self.on_close = on_close
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def active(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, stream=None, filter=None, xpath=None, protocol='rfc5277'):
+        '''
+        Sends the subscription RPC and starts the reader thread
+
+        Args:
+            stream (str, optional): stream name, e.g. 'NETCONF'. RFC 5277 defaults to the NETCONF stream.
+            filter (str, optional): RFC 5277 '<filter>' on the notification content
+            xpath (str, optional): RFC 8639 stream-xpath-filter
+            protocol (str): 'rfc5277' (create-subscription) or 'rfc8639' (establish-subscription)
+
+        Returns:
+            NotificationSubscription: self
+        '''
+        if protocol == 'rfc5277':
+            self.nc.create_subscription(filter=filter, stream_name=stream)
+        elif protocol == 'rfc8639':
+            rpc = etree.Element(f'{{{SUBSCRIBED_NOTIFICATIONS_NS}}}establish-subscription',
+                                nsmap={None: SUBSCRIBED_NOTIFICATIONS_NS})
+            etree.SubElement(rpc, f'{{{SUBSCRIBED_NOTIFICATIONS_NS}}}stream').text = stream or 'NETCONF'
+            if xpath:
+                etree.SubElement(rpc, f'{{{SUBSCRIBED_NOTIFICATIONS_NS}}}stream-xpath-filter').text = xpath
+            reply = self.nc.dispatch(rpc)
+            if not reply.ok:
+                raise RuntimeError(f"establish-subscription rejected: {reply.xml}")
+        else:
+            raise ValueError(f"Unknown subscription protocol '{protocol}', expected 'rfc5277' or 'rfc8639'")
+
+        self._stop.clear()
+        self.buffer.closed = False
+        self._thread = threading.Thread(target=self._run, name='jeypyats-notifications', daemon=True)
+        self._thread.start()
+        log.info(f"Subscribed to notification stream {stream or 'NETCONF'} ({protocol})")
+        return self
+
+    def _run(self):
+        try:
+            while not self._stop.is_set():
+                try:
+                    notification = self.nc.take_notification(block=True, timeout=self.poll_interval)
+                except Exception as e:
+                    log.warning(f"Notification session closed: {e}")
+                    return
+                if notification is None:
+                    continue
+                try:
+                    event = decode_notification(notification.notification_xml, self.classify)
+                except etree.XMLSyntaxError as e:
+                    log.warning(f"Dropping malformed notification: {e}")
+                    continue
+                if event is not None:
+                    self.buffer.append(event)
+        finally:
+            # no event will come anymore, do not let the waiters block until their timeout
+            self.buffer.close()
+
+    def wait_for_message(self, pattern, timeout=60, since=0, kind=None):
+        '''Waits for a message matching a pattern, see EventBuffer.wait_for()'''
+        return self.buffer.wait_for(pattern, timeout=timeout, since=since, kind=kind)
+
+    def messages(self, pattern=None, since=0, kind=None):
+        '''Returns the buffered messages matching a pattern, see EventBuffer.events()'''
+        return self.buffer.events(pattern, since=since, kind=kind)
+
+    def stop(self):
+        '''Stops the reader thread and closes the session'''
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval * 4)
+            self._thread = None
+        try:
+            self.nc.close_session()
+        except Exception as e:
+            log.debug(f"Error while closing the notification session: {e}")
+        if self.on_close is not None:
+            self.on_close(self.nc)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: parallel_connect.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 16:31:12
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 16:31:12
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+Parallel device connection for aetest CommonSetup sections
+connect_devices_in_parallel() connects every device of a testbed with a bounded number of workers
+and a per-device timeout, logs a per-device status and latency summary, and publishes the
+connections to the testscript parameters.
+aetest only runs subsections defined in the testscript itself, so the helper is called from the
+connect subsection of the script:
+
+    class CommonSetup(aetest.CommonSetup):
+        @aetest.subsection
+        def connect_to_devices(self, testbed, connect_workers=32, connect_timeout=120):
+            connect_devices_in_parallel(self, testbed.devices, max_workers=connect_workers, timeout=connect_timeout)
+'''
+
+import logging
+from .async_netconf import offload, run_fleet
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    'connect_devices',
+    'summarize_connections',
+    'format_connection_summary',
+    'connect_devices_in_parallel',
+]
+
+
+def _connect_device(device):
+    device.connect()
+    return device
+
+
+def connect_devices(devices, connector=None, max_workers=32, timeout=120):
+    '''
+    Connects devices in parallel
+
+    Args:
+        devices (dict | iterable): name -> device mapping (e.g. testbed.devices), or devices with a 'name' attribute
+        connector (callable, optional): blocking callable returning the connection of a device.
+                                        Defaults to device.connect(), the connection being the device itself.
+        max_workers (int): maximum number of devices connected at the same time (default 32)
+        timeout (float): per-device timeout in seconds (default 120)
+
+    Returns:
+        dict: device name -> FleetResult (result is the connection, elapsed the connection latency)
+    '''
+    connector = _connect_device if connector is None else connector
+
+    async def connect(device):
+        return await offload(connector, device)
+
+    return run_fleet(devices, connect, concurrency=max_workers, timeout=timeout)
+
+
+def summarize_connections(results):
+    '''
+    Builds a structured summary of connect_devices() results
+
+    Args:
+        results (dict): device name -> FleetResult
+
+    Returns:
+        dict: {'connected': [names], 'failed': {name: error}, 'devices': {name: {'ok', 'latency', 'error'}},
+               'latency': {'min', 'avg', 'max'}} with latencies in seconds
+    '''
+    devices = {
+        name: {
+            'ok': result.ok,
+            'latency': round(result.elapsed, 3),
+            'error': None if result.ok else f"{type(result.error).__name__}: {result.error}",
+        }
+        for name, result in results.items()
+    }
+    latencies = [device['latency'] for device in devices.values()]
+    return {
+        'connected': [name for name, device in devices.items() if device['ok']],
+        'failed': {name: device['error'] for name, device in devices.items() if not device['ok']},
+        'devices': devices,
+        'latency': {
+            'min': min(latencies, default=0.0),
+            'avg': round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+            'max': max(latencies, default=0.0),
+        },
+    }
+
+
+def format_connection_summary(summary):
+    '''
+    Formats a summarize_connections() summary as a table, slowest devices first
+
+    Args:
+        summary (dict): summary returned by summarize_connections()
+
+    Returns:
+        str: table
+    '''
+    width = max([len(name) for name in summary['devices']] + [len('Device')])
+    lines = [f"{'Device':<{width}}  {'Status':<6}  {'Latency':>9}  Error"]
+    ordered = sorted(summary['devices'].items(), key=lambda item: item[1]['latency'], reverse=True)
+    for name, device in ordered:
+        status = 'ok' if device['ok'] else 'FAILED'
+        lines.append(f"{name:<{width}}  {status:<6}  {device['latency']:>8.2f}s  {device['error'] or ''}".rstrip())
+    latency = summary['latency']
+    lines.append(
+        f"{len(summary['connected'])}/{len(summary['devices'])} connected, latency "
+        f"min {latency['min']:.2f}s avg {latency['avg']:.2f}s max {latency['max']:.2f}s"
+    )
+    return '\n'.join(lines)
+
+
+def connect_devices_in_parallel(section, devices, connector=None, max_workers=32, timeout=120,
+                                parameter='connections'):
+    '''
+    Connects devices in parallel from an aetest section
+
+    The connections are published in the testscript parameters under 'parameter' (name -> connection)
+    and the structured summary under 'connection_summary'. The section fails if a device could not
+    be connected, once every device has been tried.
+
+    Args:
+        section: running aetest section (self of the subsection)
+        devices (dict | iterable): name -> device mapping (e.g. testbed.devices)
+        connector (callable, optional): see connect_devices()
+        max_workers (int): maximum number of devices connected at the same time (default 32)
+        timeout (float): per-device timeout in seconds (default 120)
+        parameter (str): name of the testscript parameter receiving the connections (default 'connections')
+
+    Returns:
+        dict: summary returned by summarize_connections()
+    '''
+    results = connect_devices(devices, connector=connector, max_workers=max_workers, timeout=timeout)
+    summary = summarize_connections(results)
+    log.info(f"Connection summary:\n{format_connection_summary(summary)}")
+
+    section.parent.parameters[parameter] = {
+        name: result.result for name, result in results.items() if result.ok
+    }
+    section.parent.parameters['connection_summary'] = summary
+    if summary['failed']:
+        section.failed(f"Failed to connect to {len(summary['failed'])} device(s): {', '.join(summary['failed'])}")
+    return summary
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: prefix_index.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 22:52:08
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 22:52:08
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+Prefix index
+PrefixIndex is a Patricia trie (path compressed binary radix trie) of IP prefixes, one per IP
+version, giving the longest prefix match of an address like the forwarding table does:
+
+    index = PrefixIndex((route['prefix'], route) for route in routes)
+    index.lookup('10.1.1.2')          # value of the most specific prefix containing the address
+    index.covering('10.1.0.0/16')     # [(prefix, value)] of the prefixes containing 10.1.0.0/16
+    index.exact('10.0.0.0/8')         # value of this very prefix
+
+Lookups walk at most one node per bit of the address, whatever the number of prefixes.
+Prefixes are normalized, host bits are ignored: '10.1.1.1/8' is '10.0.0.0/8'.
+'''
+
+import ipaddress
+
+__all__ = [
+    'PrefixIndex',
+]
+
+_WIDTHS = {4: 32, 6: 128}
+
+
+class _Node:
+    __slots__ = ('key', 'length', 'value', 'children')
+
+    def __init__(self, key, length, value):
+        self.key = key
+        self.length = length
+        self.value = value
+        self.children = [None, None]
+
+
+# value of the nodes which only join two branches
+_EMPTY = object()
+
+
+def _parse(prefix):
+    network = ipaddress.ip_network(prefix, strict=False)
+    return network.version, int(network.network_address), network.prefixlen
+
+
+def _bit(key, position, width):
+    return (key >> (width - 1 - position)) & 1
+
+
+def _common_length(key, other, limit, width):
+    difference = key ^ other
+    common = width - difference.bit_length() if difference else width
+    return min(common, limit)
+
+
+class PrefixIndex:
+    '''
+    Longest prefix match index of IP prefixes
+
+    Args:
+        items (iterable, optional): (prefix, value) pairs to insert, e.g. ('10.0.0.0/8', route)
+
+    Raises:
+        ValueError: a prefix or an address is not valid
+    '''
+
+    def __init__(self, items=None):
+        self._roots = {version: _Node(0, 0, _EMPTY) for version in _WIDTHS}
+        self._length = 0
+        if items is not None:
+            for prefix, value in items:
+                self.insert(prefix, value)
+
+    def _find(self, version, key, length):
+        # node of this exact prefix, None if absent
+        width = _WIDTHS[version]
+        node = self._roots[version]
+        while node is not None and node.length < length:
+            node = node.children[_bit(key, node.length, width)]
+            if node is not None and (node.length > length or (key ^ node.key) >> (width - node.length)):
+                return None
+        return node
+
+    def insert(self, prefix, value):
+        '''
+        Inserts a prefix, replacing its value if already present
+
+        Args:
+            prefix (str): IP prefix, e.g. '10.0.0.0/8' or '2001:db8::/32'
+            value: value returned by the lookups
+        '''
+        version, key, length = _parse(prefix)
+        width = _WIDTHS[version]
+        node = self._roots[version]
+        while True:
+            if node.length == length:
+                if node.value is _EMPTY:
+                    self._length += 1
+                node.value = value
+                return
+            bit = _bit(key, node.length, width)
+            child = node.children[bit]
+            if child is None:
+                node.children[bit] = _Node(key, length, value)
+                self._length += 1
+                return
+            common = _common_length(key, child.key, min(length, child.length), width)
+            if common == child.length:
+                node = child
+                continue
+            if common == length:
+                # the new prefix contains the child
+                inserted = _Node(key, length, value)
+                inserted.children[_bit(child.key, length, width)] = child
+            else:
+                # the prefixes diverge, a node without value joins them
+                inserted = _Node(key >> (width - common) << (width - common), common, _EMPTY)
+                inserted.children[_bit(child.key, common, width)] = child
+                inserted.children[_bit(key, common, width)] = _Node(key, length, value)
+            node.children[bit] = inserted
+            self._length += 1
+            return
+
+    def setdefault(self, prefix, default=None):
+        '''
+        Returns the value of a prefix, inserting it with a default value if absent
+        '''
+        version, key, length = _parse(prefix)
+        node = self._find(version, key, length)
+        if node is not None and node.value is not _EMPTY:
+            return node.value
+        self.insert(prefix, default)
+        return default
+
+    def exact(self, prefix, default=None):
+        '''
+        Returns the value of a prefix, default if it is not in the index
+        '''
+        node = self._find(*_parse(prefix))
+        return default if node is None or node.value is _EMPTY else node.value
+
+    def _walk(self, version, key, length):
+        # nodes holding a value containing key/length, least specific first
+        width = _WIDTHS[version]
+        node = self._roots[version]
+        while node is not None and node.length <= length:
+            if (key ^ node.key) >> (width - node.length):
+                return
+            if node.value is not _EMPTY:
+                yield node
+            if node.length == width:
+                return
+            node = node.children[_bit(key, node.length, width)]
+
+    def _longest(self, address):
+        address = ipaddress.ip_address(address)
+        match = None
+        for match in self._walk(address.version, int(address), _WIDTHS[address.version]):
+            pass
+        return address.version, match
+
+    def lookup(self, address, default=None):
+        '''
+        Longest prefix match of an address
+
+        Args:
+            address (str): IP address, e.g. '10.1.1.2'
+            default: returned when no prefix contains the address
+
+        Returns:
+            value of the most specific prefix containing the address
+        '''
+        match = self._longest(address)[1]
+        return default if match is None else match.value
+
+    def lookup_prefix(self, address):
+        '''
+        Returns the most specific prefix containing an address, None if there is none
+        '''
+        version, match = self._longest(address)
+        return None if match is None else self._prefix(version, match)
+
+    def covering(self, prefix):
+        '''
+        Prefixes containing a prefix, itself included
+
+        Returns:
+            list: (prefix, value) pairs, least specific first
+        '''
+        version, key, length = _parse(prefix)
+        return [(self._prefix(version, node), node.value) for node in self._walk(version, key, length)]
+
+    @staticmethod
+    def _prefix(version, node):
+        address = ipaddress.IPv4Address(node.key) if version == 4 else ipaddress.IPv6Address(node.key)
+        return f"{address}/{node.length}"
+
+    def __contains__(self, prefix):
+        return self.exact(prefix, _EMPTY) is not _EMPTY
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._length} prefixes)"
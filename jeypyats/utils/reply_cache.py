@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: reply_cache.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 20:48:12
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 20:48:12
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+Opt-in NETCONF read cache
+enable_reply_cache() wraps the netconf_get of a device with a cache keyed by a hash of the filter
+XML, with a time to live and a least recently used eviction, so that the verification steps of a
+testcase reading the same subtree within a short window share one RPC:
+
+    cache = enable_reply_cache(device, ttl=5, max_size=128)
+    device.get_cellular_sim_config('Cellular0/2/0')   # <get>
+    device.get_cellular_sim_config('Cellular0/2/0')   # cached reply
+    device.configure(['interface Cellular0/2/0', 'shutdown'])   # invalidates the cache
+
+The cache is invalidated after configure() and after <edit-config> on the device session, including
+the session replacing a broken one.
+Reads made inside fresh_reads(), e.g. every poll of the waits, always reach the device.
+'''
+
+import collections
+import contextlib
+import contextvars
+import functools
+import hashlib
+import logging
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    'ReplyCache',
+    'fresh_reads',
+    'enable_reply_cache',
+    'disable_reply_cache',
+]
+
+# set while the reads must bypass the caches, see fresh_reads()
+_fresh = contextvars.ContextVar('jeypyats_fresh_reads', default=False)
+
+# device methods changing the configuration, the cache is invalidated after them
+_WRITE_METHODS = ('configure', 'netconf_edit_config')
+
+
+@contextlib.contextmanager
+def fresh_reads():
+    '''
+    Context in which the cached reads reach the device, the replies still refresh the caches
+    '''
+    token = _fresh.set(True)
+    try:
+        yield
+    finally:
+        _fresh.reset(token)
+
+
+class ReplyCache:
+    '''
+    LRU cache of NETCONF replies with a time to live
+
+    Args:
+        ttl (float): seconds a reply is reused (default 5)
+        max_size (int): number of kept replies, the least recently used one is evicted (default 128)
+        clock (callable): monotonic clock, for tests (default time.monotonic)
+    '''
+
+    def __init__(self, ttl=5, max_size=128, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._clock = clock
+        self._replies = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(filter):
+        '''Cache key of a filter XML'''
+        return hashlib.sha1(filter.encode('utf-8')).hexdigest()
+
+    def get(self, filter):
+        '''
+        Returns the cached reply of a filter, None if absent or expired
+        '''
+        key = self.key(filter)
+        with self._lock:
+            entry = self._replies.get(key)
+            if entry is None or self._clock() - entry[1] > self.ttl:
+                self._replies.pop(key, None)
+                self.misses += 1
+                return None
+            self._replies.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, filter, reply):
+        key = self.key(filter)
+        with self._lock:
+            self._replies[key] = (reply, self._clock())
+            self._replies.move_to_end(key)
+            while len(self._replies) > self.max_size:
+                self._replies.popitem(last=False)
+
+    def invalidate(self, filter=None):
+        '''
+        Drops the cached reply of a filter, or every cached reply without filter
+        '''
+        with self._lock:
+            if filter is None:
+                self._replies.clear()
+            else:
+                self._replies.pop(self.key(filter), None)
+
+    def __len__(self):
+        return len(self._replies)
+
+    def wrap(self, netconf_get):
+        '''
+        Returns a caching version of a netconf_get(filter) function
+        '''
+        @functools.wraps(netconf_get)
+        def cached_get(filter=None):
+            if not filter:
+                return netconf_get(filter=filter)
+            if not _fresh.get():
+                reply = self.get(filter)
+                if reply is not None:
+                    return reply
+            reply = netconf_get(filter=filter)
+            if getattr(reply, 'ok', True):
+                self.put(filter, reply)
+            return reply
+
+        cached_get.__wrapped_get__ = netconf_get
+        return cached_get
+
+    def invalidating(self, write):
+        '''
+        Returns a version of a configuration method invalidating the cache once it returns or fails
+        '''
+        @functools.wraps(write)
+        def invalidating_write(*args, **kwargs):
+            try:
+                return write(*args, **kwargs)
+            finally:
+                self.invalidate()
+
+        invalidating_write.__wrapped_write__ = write
+        return invalidating_write
+
+
+def enable_reply_cache(device, ttl=5, max_size=128, clock=time.monotonic):
+    '''
+    Caches the netconf_get replies of a device
+
+    To be called once the device is connected, as the connection sets device.netconf_get.
+
+    Args:
+        device: device with a netconf_get(filter) method
+        ttl (float): seconds a reply is reused (default 5)
+        max_size (int): number of kept replies (default 128)
+        clock (callable): monotonic clock, for tests
+
+    Returns:
+        ReplyCache: cache, also stored as device.reply_cache
+    '''
+    cache = getattr(device, 'reply_cache', None)
+    if cache is not None:
+        return cache
+    cache = ReplyCache(ttl=ttl, max_size=max_size, clock=clock)
+    cached_get = cache.wrap(device.netconf_get)
+
+    @functools.wraps(cached_get)
+    def netconf_get(filter=None):
+        try:
+            return cached_get(filter=filter)
+        finally:
+            # a broken session is replaced during the get, the new device.nc must invalidate the cache as well
+            _invalidate_on_edit(cache, getattr(device, 'nc', None))
+
+    netconf_get.__wrapped_get__ = cached_get.__wrapped_get__
+    device.netconf_get = netconf_get
+    for name in _WRITE_METHODS:
+        if callable(getattr(device, name, None)):
+            setattr(device, name, cache.invalidating(getattr(device, name)))
+    _invalidate_on_edit(cache, getattr(device, 'nc', None))
+    device.reply_cache = cache
+    return cache
+
+
+def _invalidate_on_edit(cache, nc):
+    # wraps the edit_config of a session once
+    if nc is None or hasattr(vars(nc).get('edit_config'), '__wrapped_write__'):
+        return
+    try:
+        nc.edit_config = cache.invalidating(nc.edit_config)
+    except AttributeError:
+        log.debug("The session of the device has no edit_config, it is not invalidating the cache")
+
+
+def disable_reply_cache(device):
+    '''
+    Restores the uncached netconf_get and configuration methods of a device
+    '''
+    cache = getattr(device, 'reply_cache', None)
+    if cache is None:
+        return
+    device.netconf_get = device.netconf_get.__wrapped_get__
+    for name in _WRITE_METHODS:
+        method = vars(device).get(name)
+        if method is not None and hasattr(method, '__wrapped_write__'):
+            setattr(device, name, method.__wrapped_write__)
+    nc = getattr(device, 'nc', None)
+    edit_config = vars(nc).get('edit_config') if nc is not None else None
+    if hasattr(edit_config, '__wrapped_write__'):
+        nc.edit_config = edit_config.__wrapped_write__
+    device.reply_cache = None
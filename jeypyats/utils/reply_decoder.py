@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: reply_decoder.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 09:12:41
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 09:12:41
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+Streaming NETCONF reply decoder
+This module decodes NETCONF replies in a single pass using lxml.etree.iterparse.
+Parsers declare the path of the list element they are interested in
+(e.g. 'routing-state/routing-instance/ribs/rib/routes/route') and get one record per list entry.
+Elements are cleared as soon as they have been consumed, so the memory footprint stays bounded
+by the size of a single record instead of the size of the whole reply.
+Paths are matched on local names, so namespace prefixes in the reply do not matter.
+'''
+
+import io
+import re
+from lxml import etree
+
+__all__ = [
+    'iter_elements',
+    'iter_records',
+    'first_record',
+    'element_to_record',
+    'localname',
+]
+
+
+def localname(tag):
+    """Returns the local part of an lxml tag, i.e. strips the '{namespace}' prefix
+
+    Args:
+        tag (str): lxml element tag
+
+    Returns:
+        str: tag without namespace
+    """
+    return tag.rpartition('}')[2]
+
+
+def _split_path(path):
+    return tuple(part for part in path.strip('/').split('/') if part)
+
+
+_LEADING_SPACE = re.compile(r'\s*')
+
+
+class _EncodedText:
+    """File-like object encoding a str reply in chunks, so that the reply is never copied whole"""
+
+    def __init__(self, text):
+        self._text = text
+        self._position = _LEADING_SPACE.match(text).end()
+
+    def read(self, size=-1):
+        # at most 4 bytes per character in UTF-8, the chunk never exceeds size bytes
+        end = len(self._text) if size is None or size < 0 else self._position + max(size // 4, 1)
+        chunk = self._text[self._position:end]
+        self._position += len(chunk)
+        return chunk.encode('utf-8')
+
+
+def _source(xml):
+    """Turns a reply (str, bytes, reply object or file-like object) into something iterparse can read"""
+    if not isinstance(xml, (str, bytes)):
+        if hasattr(xml, 'xml'):
+            xml = xml.xml
+        elif hasattr(xml, 'read'):
+            return xml
+    if xml is None:
+        raise ValueError("Cannot decode an empty NETCONF reply")
+    if isinstance(xml, str):
+        return _EncodedText(xml)
+    return io.BytesIO(xml.lstrip() if xml[:1].isspace() else xml)
+
+
+def element_to_record(element):
+    """Converts an lxml element into plain python data, the same way xmltodict does
+
+    Leaves become their stripped text (None if empty), containers become dicts
+    and repeated children become lists. Attributes and namespaces are dropped.
+
+    Args:
+        element (lxml.etree._Element): element to convert
+
+    Returns:
+        dict | str | None: converted element
+    """
+    if len(element) == 0:
+        text = element.text
+        if text is None:
+            return None
+        text = text.strip()
+        return text or None
+    record = {}
+    for child in element:
+        if not isinstance(child.tag, str):
+            # comments and processing instructions
+            continue
+        name = localname(child.tag)
+        value = element_to_record(child)
+        if name in record:
+            existing = record[name]
+            if isinstance(existing, list):
+                existing.append(value)
+            else:
+                record[name] = [existing, value]
+        else:
+            record[name] = value
+    return record
+
+
+def iter_elements(xml, path, keys=None):
+    """Yields every element of a reply matching a list-element path
+
+    The path is matched against the end of the element ancestry, using local names.
+    The yielded element is fully built (all its children are available) and is cleared
+    as soon as the consumer asks for the next one: do not keep references to it.
+
+    Args:
+        xml (str | bytes | file-like | reply object): NETCONF reply
+        path (str): '/'-separated path of the list element, e.g. 'ribs/rib/routes/route'
+        keys (dict, optional): mapping of name -> leaf path of an ancestor key, e.g. {'rib': 'rib/name'}.
+                               The latest value seen for each key is yielded along with the element.
+
+    Yields:
+        tuple: (element, dict of key values)
+    """
+    target = _split_path(path)
+    depth = len(target)
+    last = target[-1]
+    key_paths = {name: _split_path(key_path) for name, key_path in (keys or {}).items()}
+    key_values = {name: None for name in key_paths}
+
+    stack = []
+    record_depth = None
+    context = etree.iterparse(
+        _source(xml), events=('start', 'end'), huge_tree=True, resolve_entities=False, remove_comments=True
+    )
+    for event, element in context:
+        if event == 'start':
+            stack.append(localname(element.tag))
+            if record_depth is not None:
+                continue
+            if stack[-1] == last and tuple(stack[-depth:]) == target:
+                record_depth = len(stack)
+                continue
+            for name, key_path in key_paths.items():
+                # a new list entry owning this key starts: forget the previous value
+                if len(key_path) > 1 and tuple(stack[-(len(key_path) - 1):]) == key_path[:-1]:
+                    key_values[name] = None
+            continue
+
+        if record_depth is not None and len(stack) > record_depth:
+            stack.pop()
+            continue
+
+        if record_depth is not None:
+            record_depth = None
+            yield element, dict(key_values)
+        else:
+            for name, key_path in key_paths.items():
+                if tuple(stack[-len(key_path):]) == key_path:
+                    key_values[name] = (element.text or '').strip() or None
+        stack.pop()
+
+        element.clear()
+        parent = element.getparent()
+        if parent is not None:
+            parent.remove(element)
+    del context
+
+
+def iter_records(xml, path, keys=None):
+    """Yields one record per list element of a reply
+
+    Each record is converted with element_to_record. When keys are given and the record is a dict,
+    the ancestor key values are added to the record under their names.
+
+    Args:
+        xml (str | bytes | file-like | reply object): NETCONF reply
+        path (str): '/'-separated path of the list element
+        keys (dict, optional): mapping of name -> leaf path of an ancestor key
+
+    Yields:
+        dict | str | None: decoded records
+
+    Example:
+        for route in iter_records(reply.xml, 'ribs/rib/routes/route', keys={'rib': 'rib/name'}):
+            print(route['rib'], route['destination-prefix'])
+    """
+    for element, key_values in iter_elements(xml, path, keys):
+        record = element_to_record(element)
+        if key_values and isinstance(record, dict):
+            record.update(key_values)
+        yield record
+
+
+def first_record(xml, path, default=None):
+    """Returns the first record matching path, or default if there is none
+
+    Args:
+        xml (str | bytes | file-like | reply object): NETCONF reply
+        path (str): '/'-separated path of the element
+        default: value returned when nothing matches
+
+    Returns:
+        dict | str | None: first decoded record
+    """
+    for record in iter_records(xml, path):
+        return record
+    return default
@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: rib_snapshot.py
+# This file is a part of Netalps.fr
+#
+# Created: 18.10.2026 00:27:44
+# Author: Jeremie Rouzet
+#
+# Last Modified: 18.10.2026 00:27:44
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+RIB snapshots and diffs
+A RibSnapshot keeps one 64 bits digest per (vrf, prefix) of a routing table, the routes themselves
+being written as gzip compressed JSON lines (to a file, or in memory without path). Two snapshots
+are compared digest by digest in a single pass, and only the routes of the differing prefixes are
+read back from the snapshots:
+
+    before = RibSnapshot.capture(device.get_routing_tables(), path='before.jsonl.gz')
+    ... failover ...
+    after = RibSnapshot.capture(device.iter_routing_table(), path='after.jsonl.gz')
+    diff = before.diff(after)
+    diff.summary()                        # {'added': 1, 'removed': 0, 'changed': 2}
+    for line in diff.report(before, after): logger.info(line)
+
+ECMP routes of a prefix are combined in its digest whatever their order.
+'''
+
+import gzip
+import hashlib
+import io
+import json
+import time
+from .utils import JeyPyatsValueError
+
+__all__ = [
+    'RibSnapshot',
+    'RibDiff',
+    'route_digest',
+]
+
+_FORMAT = 'jeypyats-rib-snapshot'
+_VERSION = 1
+_DIGEST_MASK = 2 ** 64 - 1
+
+
+def _as_dict(route):
+    return route.as_dict() if hasattr(route, 'as_dict') else dict(route)
+
+
+def route_digest(route):
+    '''
+    64 bits digest of a route, independent of the key order of the route
+
+    Args:
+        route (dict | RouteRecord): route
+
+    Returns:
+        int: digest
+    '''
+    encoded = json.dumps(route, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), 'big')
+
+
+def _vrf_routes(routes, vrf):
+    # (vrf, route) pairs of a VRF -> routes mapping or of the routes of a single VRF
+    if isinstance(routes, dict):
+        for name, vrf_routes in routes.items():
+            for route in vrf_routes:
+                yield name, route
+    else:
+        for route in routes:
+            yield vrf, route
+
+
+class RibSnapshot:
+    '''
+    Digests of the routes of one or several VRFs, keyed by (vrf, prefix)
+
+    Snapshots are built with capture() or load(), not directly.
+    '''
+
+    def __init__(self, digests, source, created=None, prefix_field='prefix'):
+        self.digests = digests
+        self.created = created
+        self.prefix_field = prefix_field
+        self._source = source
+
+    @classmethod
+    def capture(cls, routes, vrf='default', path=None, prefix_field='prefix'):
+        '''
+        Takes a snapshot of routes, written to a gzip JSON lines file or kept compressed in memory
+
+        Args:
+            routes (dict | iterable): VRF name -> routes (e.g. get_routing_tables()), or the routes of a
+                                      single VRF, possibly an iterator (e.g. iter_routing_table())
+            vrf (str): VRF of the routes when they are not given by VRF (default 'default')
+            path (str, optional): snapshot file, the snapshot is kept in memory without path
+            prefix_field (str): route field holding the prefix (default 'prefix')
+
+        Returns:
+            RibSnapshot: snapshot
+        '''
+        created = time.time()
+        source = path if path is not None else io.BytesIO()
+        digests = {}
+        with gzip.open(source, 'wt', encoding='utf-8') as stream:
+            stream.write(json.dumps({'format': _FORMAT, 'version': _VERSION, 'created': created,
+                                     'prefix_field': prefix_field}) + '\n')
+            for name, route in _vrf_routes(routes, vrf):
+                route = _as_dict(route)
+                key = (name, route.get(prefix_field))
+                # the digest of ECMP routes is the sum of their digests, whatever their order
+                digests[key] = (digests.get(key, 0) + route_digest(route)) & _DIGEST_MASK
+                stream.write(json.dumps([name, route], separators=(',', ':'), default=str) + '\n')
+        return cls(digests, source, created, prefix_field)
+
+    @staticmethod
+    def _read(source):
+        if isinstance(source, io.BytesIO):
+            source.seek(0)
+        with gzip.open(source, 'rt', encoding='utf-8') as stream:
+            header = json.loads(stream.readline() or 'null')
+            if not isinstance(header, dict) or header.get('format') != _FORMAT:
+                raise JeyPyatsValueError("Not a RIB snapshot")
+            yield header
+            for line in stream:
+                yield json.loads(line)
+
+    @classmethod
+    def load(cls, path):
+        '''
+        Loads the digests of a snapshot file, the routes stay on disk
+
+        Raises:
+            JeyPyatsValueError: the file is not a RIB snapshot
+        '''
+        lines = cls._read(path)
+        header = next(lines)
+        prefix_field = header.get('prefix_field', 'prefix')
+        digests = {}
+        for name, route in lines:
+            key = (name, route.get(prefix_field))
+            digests[key] = (digests.get(key, 0) + route_digest(route)) & _DIGEST_MASK
+        return cls(digests, path, header.get('created'), prefix_field)
+
+    def routes(self, keys=None):
+        '''
+        Reads the routes back from the snapshot
+
+        Args:
+            keys (iterable, optional): (vrf, prefix) keys to read, every route by default
+
+        Yields:
+            tuple: ((vrf, prefix), route dict)
+        '''
+        keys = None if keys is None else set(keys)
+        lines = self._read(self._source)
+        next(lines)
+        for name, route in lines:
+            key = (name, route.get(self.prefix_field))
+            if keys is None or key in keys:
+                yield key, route
+
+    def diff(self, other):
+        '''
+        Compares the snapshot with a later one
+
+        Args:
+            other (RibSnapshot): later snapshot
+
+        Returns:
+            RibDiff: prefixes added, removed and changed in other
+        '''
+        mine, theirs = self.digests, other.digests
+        added = [key for key in theirs if key not in mine]
+        removed = [key for key in mine if key not in theirs]
+        changed = [key for key, digest in mine.items() if key in theirs and theirs[key] != digest]
+        return RibDiff(added, removed, changed)
+
+    def vrfs(self):
+        '''Returns the VRF names of the snapshot'''
+        return sorted({name for name, _ in self.digests})
+
+    def __len__(self):
+        return len(self.digests)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self.digests)} prefixes)"
+
+
+class RibDiff:
+    '''
+    Differences between two RIB snapshots
+
+    Attributes:
+        added (list): (vrf, prefix) keys only in the later snapshot
+        removed (list): (vrf, prefix) keys only in the earlier snapshot
+        changed (list): (vrf, prefix) keys whose routes differ
+    '''
+
+    def __init__(self, added, removed, changed):
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def summary(self):
+        '''Returns the number of added, removed and changed prefixes'''
+        return {'added': len(self.added), 'removed': len(self.removed), 'changed': len(self.changed)}
+
+    def details(self, before, after, keys=None):
+        '''
+        Reads the routes of the differing prefixes back from the snapshots
+
+        Args:
+            before (RibSnapshot): earlier snapshot
+            after (RibSnapshot): later snapshot
+            keys (iterable, optional): (vrf, prefix) keys to read, every differing prefix by default
+
+        Returns:
+            dict: (vrf, prefix) -> {'before': [routes], 'after': [routes]}
+        '''
+        keys = (*self.added, *self.removed, *self.changed) if keys is None else keys
+        details = {key: {'before': [], 'after': []} for key in keys}
+        for side, snapshot in (('before', before), ('after', after)):
+            for key, route in snapshot.routes(details):
+                details[key][side].append(route)
+        return details
+
+    def report(self, before, after, limit=50):
+        '''
+        Human readable lines describing the differences, for the logs
+
+        Args:
+            before (RibSnapshot): earlier snapshot
+            after (RibSnapshot): later snapshot
+            limit (int): maximum number of prefixes described
+
+        Returns:
+            list: lines
+        '''
+        counts = self.summary()
+        lines = [f"RIB diff: {counts['added']} added, {counts['removed']} removed, {counts['changed']} changed"]
+        shown = [('+', key) for key in self.added] + [('-', key) for key in self.removed] \
+            + [('~', key) for key in self.changed]
+        details = self.details(before, after, [key for _, key in shown[:limit]])
+        for sign, (vrf, prefix) in shown[:limit]:
+            routes = details[(vrf, prefix)]
+            lines.append(f"  {sign} {vrf} {prefix}: {routes['before']} -> {routes['after']}")
+        if len(shown) > limit:
+            lines.append(f"  ... {len(shown) - limit} more")
+        return lines
+
+    def __repr__(self):
+        counts = self.summary()
+        return (f"{self.__class__.__name__}(added={counts['added']}, removed={counts['removed']}, "
+                f"changed={counts['changed']})")
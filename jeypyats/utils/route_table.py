@@ -0,0 +1,365 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: route_table.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 21:31:56
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 21:31:56
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+Compact route containers
+Routing parsers return one dict per route by default. For large tables (a full BGP table is about
+a million routes) they can return instead:
+    - 'record': RouteRecord objects, one __slots__ instance per route
+    - 'table': a columnar RouteTable, where prefixes are packed integers, integer fields are packed
+      in arrays and the other fields are dictionary encoded, so that repeated protocols, interfaces
+      and next hops are stored once
+
+Records and table rows support the read access of the dicts: route['next_hop'], route.get('metric'),
+and export to dicts with as_dict() / to_dicts(). The integer fields of a record class (e.g. metric)
+are converted to int in both compact forms. Prefixes of a RouteTable are normalized by ipaddress.
+
+The iter_* variants of the parsers yield the routes (dicts or records) while the reply is decoded,
+for consumers filtering, counting or writing the routes without keeping them.
+'''
+
+import functools
+import ipaddress
+import sys
+from array import array
+from .utils import JeyPyatsValueError
+
+__all__ = [
+    'RouteRecord',
+    'route_record_class',
+    'RouteTable',
+    'build_routes',
+    'iter_routes',
+    'ROUTE_OUTPUTS',
+]
+
+ROUTE_OUTPUTS = ('dict', 'record', 'table')
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+
+class RouteRecord:
+    '''
+    Base class of the __slots__ route records, see route_record_class()
+    '''
+
+    __slots__ = ()
+    _fields = ()
+    _integer_fields = ()
+    _interned_fields = ()
+
+    def __init__(self, *values, **named):
+        for name, value in zip(self._fields, values):
+            setattr(self, name, value)
+        for name in self._fields[len(values):]:
+            setattr(self, name, named.get(name))
+
+    @classmethod
+    def from_mapping(cls, mapping):
+        '''Builds a record from a dict, converting the integer fields and interning the repeated strings'''
+        record = cls(*(mapping.get(name) for name in cls._fields))
+        for name in cls._integer_fields:
+            setattr(record, name, _to_int(getattr(record, name)))
+        for name in cls._interned_fields:
+            value = getattr(record, name)
+            if isinstance(value, str):
+                setattr(record, name, sys.intern(value))
+        return record
+
+    def __getitem__(self, name):
+        if name not in self._fields:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def get(self, name, default=None):
+        return getattr(self, name) if name in self._fields else default
+
+    def keys(self):
+        return self._fields
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __eq__(self, other):
+        if isinstance(other, RouteRecord):
+            other = other.as_dict()
+        return self.as_dict() == other if isinstance(other, dict) else NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        values = ', '.join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{self.__class__.__name__}({values})"
+
+
+@functools.lru_cache(maxsize=None)
+def route_record_class(name, fields, integer_fields=(), prefix_field='prefix'):
+    '''
+    Creates the __slots__ record class of a route schema
+
+    Args:
+        name (str): class name, e.g. 'RouteEntry'
+        fields (tuple): field names, e.g. ExtractionSchema.fields
+        integer_fields (tuple): fields converted to int, e.g. ('metric',)
+        prefix_field (str): field holding the prefix, the only string field which is not interned
+
+    Returns:
+        type: RouteRecord subclass, the same class for the same arguments
+    '''
+    fields = tuple(fields)
+    integer_fields = tuple(field for field in integer_fields if field in fields)
+    return type(name, (RouteRecord,), {
+        '__slots__': fields,
+        '_fields': fields,
+        '_integer_fields': integer_fields,
+        '_interned_fields': tuple(field for field in fields if field not in integer_fields and field != prefix_field),
+    })
+
+
+class _StringColumn:
+    # dictionary encoded values: code 0 is None
+    __slots__ = ('codes', 'values', 'index')
+
+    def __init__(self):
+        self.codes = array('I')
+        self.values = [None]
+        self.index = {None: 0}
+
+    def append(self, value):
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(sys.intern(value) if isinstance(value, str) else value)
+        self.codes.append(code)
+
+    def __getitem__(self, position):
+        return self.values[self.codes[position]]
+
+    def nbytes(self):
+        return self.codes.itemsize * len(self.codes) + sum(sys.getsizeof(value) for value in self.values)
+
+
+class _IntegerColumn:
+    # None and values which are not integers are kept aside, by position
+    __slots__ = ('data', 'others')
+
+    _MISSING = -2 ** 63
+
+    def __init__(self):
+        self.data = array('q')
+        self.others = {}
+
+    def append(self, value):
+        if isinstance(value, str):
+            value = _to_int(value)
+        if isinstance(value, int) and value != self._MISSING and -2 ** 63 < value < 2 ** 63:
+            self.data.append(value)
+        else:
+            self.others[len(self.data)] = value
+            self.data.append(self._MISSING)
+
+    def __getitem__(self, position):
+        value = self.data[position]
+        if value == self._MISSING:
+            return self.others.get(position if position >= 0 else len(self.data) + position)
+        return value
+
+    def nbytes(self):
+        return self.data.itemsize * len(self.data) + sys.getsizeof(self.others)
+
+
+class _PrefixColumn:
+    # address as two 64 bits halves, prefix length and IP version; unparsable prefixes are kept aside
+    __slots__ = ('high', 'low', 'length', 'version', 'others')
+
+    _NO_LENGTH = 255
+
+    def __init__(self):
+        self.high = array('Q')
+        self.low = array('Q')
+        self.length = array('B')
+        self.version = array('B')
+        self.others = {}
+
+    def append(self, prefix):
+        try:
+            address, _, length = prefix.partition('/')
+            address = ipaddress.ip_address(address)
+            length = int(length) if length else self._NO_LENGTH
+            if not 0 <= length <= self._NO_LENGTH:
+                raise ValueError(length)
+        except (AttributeError, ValueError):
+            self.others[len(self.version)] = prefix
+            address, length = None, 0
+        value = int(address) if address is not None else 0
+        self.high.append(value >> 64)
+        self.low.append(value & 0xFFFFFFFFFFFFFFFF)
+        self.length.append(length)
+        self.version.append(address.version if address is not None else 0)
+
+    def __getitem__(self, position):
+        version = self.version[position]
+        if not version:
+            return self.others.get(position if position >= 0 else len(self.version) + position)
+        value = self.high[position] << 64 | self.low[position]
+        address = ipaddress.IPv4Address(value) if version == 4 else ipaddress.IPv6Address(value)
+        length = self.length[position]
+        return str(address) if length == self._NO_LENGTH else f"{address}/{length}"
+
+    def nbytes(self):
+        return sum(column.itemsize * len(column) for column in (self.high, self.low, self.length, self.version)) \
+            + sys.getsizeof(self.others)
+
+
+class RouteTable:
+    '''
+    Columnar table of routes
+
+    Args:
+        record_class (type): RouteRecord subclass giving the fields, rows are returned as instances of it
+        prefix_field (str): field packed as an IP prefix (default 'prefix')
+        routes (iterable, optional): routes (dicts or records) to append
+
+    Example:
+        table = device.get_bgp_routes(output='table')
+        len(table), table[0]['next_hop'], table.column('next_hop')
+        for route in table: ...
+    '''
+
+    def __init__(self, record_class, prefix_field='prefix', routes=None):
+        self.record_class = record_class
+        self.prefix_field = prefix_field
+        self._columns = {}
+        for name in record_class._fields:
+            if name == prefix_field:
+                self._columns[name] = _PrefixColumn()
+            elif name in record_class._integer_fields:
+                self._columns[name] = _IntegerColumn()
+            else:
+                self._columns[name] = _StringColumn()
+        self._length = 0
+        if routes is not None:
+            self.extend(routes)
+
+    @property
+    def fields(self):
+        return self.record_class._fields
+
+    def append(self, route):
+        '''Appends a route, a dict or a record'''
+        for name, column in self._columns.items():
+            column.append(route.get(name))
+        self._length += 1
+
+    def extend(self, routes):
+        for route in routes:
+            self.append(route)
+
+    def __len__(self):
+        return self._length
+
+    def _row(self, position):
+        return self.record_class(*(column[position] for column in self._columns.values()))
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self._row(index) for index in range(*position.indices(self._length))]
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError("route index out of range")
+        return self._row(position)
+
+    def __iter__(self):
+        columns = list(self._columns.values())
+        record_class = self.record_class
+        for position in range(self._length):
+            yield record_class(*(column[position] for column in columns))
+
+    def column(self, name):
+        '''Returns the values of a field, in route order'''
+        column = self._columns[name]
+        return [column[position] for position in range(self._length)]
+
+    def to_dicts(self):
+        '''Exports the routes as dicts'''
+        return [route.as_dict() for route in self]
+
+    def nbytes(self):
+        '''Approximate memory used by the columns, in bytes'''
+        return sum(column.nbytes() for column in self._columns.values())
+
+    def __eq__(self, other):
+        if isinstance(other, RouteTable):
+            return self.fields == other.fields and self.to_dicts() == other.to_dicts()
+        if isinstance(other, list):
+            return self.to_dicts() == [route.as_dict() if isinstance(route, RouteRecord) else route for route in other]
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.record_class.__name__}, {self._length} routes)"
+
+
+def build_routes(routes, record_class, output='dict'):
+    '''
+    Collects extracted routes in the requested form
+
+    Args:
+        routes (iterable): route dicts, e.g. ExtractionSchema.iter_extract(reply)
+        record_class (type): RouteRecord subclass of the routes
+        output (str): 'dict' (list of dicts), 'record' (list of records) or 'table' (RouteTable)
+
+    Returns:
+        list | RouteTable: routes
+    '''
+    if output == 'dict':
+        return list(routes)
+    if output == 'record':
+        return [record_class.from_mapping(route) for route in routes]
+    if output == 'table':
+        return RouteTable(record_class, routes=routes)
+    raise JeyPyatsValueError(f"Unknown route output '{output}', expected one of {', '.join(ROUTE_OUTPUTS)}")
+
+
+def iter_routes(routes, record_class, output='dict'):
+    '''
+    Yields extracted routes in the requested form, one at a time
+
+    Args:
+        routes (iterable): route dicts, e.g. ExtractionSchema.iter_extract(reply)
+        record_class (type): RouteRecord subclass of the routes
+        output (str): 'dict' or 'record', a table holds every route and is built with build_routes()
+
+    Returns:
+        iterator: routes
+    '''
+    if output == 'dict':
+        return iter(routes)
+    if output == 'record':
+        return map(record_class.from_mapping, routes)
+    raise JeyPyatsValueError(f"Unknown streamed route output '{output}', expected 'dict' or 'record'")
@@ -0,0 +1,590 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: rpc_timing.py
+# This file is a part of Netalps.fr
+#
+# Created: 18.10.2026 03:41:52
+# Author: Jeremie Rouzet
+#
+# Last Modified: 18.10.2026 03:41:52
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+Per-RPC timing records
+enable_rpc_timing() wraps the NETCONF methods of a device (netconf_get, dispatch, request) and its
+parser methods, so that every call emits a RpcTiming record to the registered sinks:
+
+    timings = add_timing_sink(HistogramSink())
+    add_timing_sink(JsonLinesSink('rpc_timings.jsonl'))
+    add_timing_sink(PrometheusTextSink('/var/lib/node_exporter/jeypyats.prom'))
+    enable_rpc_timing(device)
+    device.get_bgp_routes()
+    ...
+    logger.info(format_timing_summary(timings.summary()))     # e.g. in the CommonCleanup of the job
+
+The record of a NETCONF method ('rpc' kind) holds the round trip time of the RPC, the hash of its
+filter and the sizes of the request and of the reply XML. The record of a parser method ('parser'
+kind) holds the round trip time of the RPCs made during the call, the remaining time spent in
+Python (parse_ms: decoding, extraction, post-processing) and the number of records returned.
+Parsers returning an iterator are timed while the iterator is consumed.
+No record is built while no sink is registered.
+'''
+
+import collections.abc
+import contextvars
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from lxml import etree
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    'RpcTiming',
+    'HistogramSink',
+    'JsonLinesSink',
+    'PrometheusTextSink',
+    'add_timing_sink',
+    'remove_timing_sink',
+    'enable_rpc_timing',
+    'disable_rpc_timing',
+    'format_timing_summary',
+]
+
+# device methods sending an RPC
+_RPC_METHODS = ('netconf_get', 'dispatch', 'request')
+
+# upper bounds of the histogram buckets, in milliseconds
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000, 60000)
+
+_sinks = []
+_sinks_lock = threading.Lock()
+
+# parser call in progress, collecting the RPCs made during the call
+_current_call = contextvars.ContextVar('jeypyats_rpc_timing_call', default=None)
+
+
+class RpcTiming:
+    '''
+    Timing record of a NETCONF RPC or of a parser call
+
+    Attributes:
+        device (str): device name
+        rpc (str): NETCONF method ('netconf_get', 'dispatch', 'request') or parser method name
+        kind (str): 'rpc' or 'parser'
+        filter_hash (str): hash of the (last) filter or request sent, None without RPC
+        bytes_sent (int): size of the requests, in bytes
+        bytes_received (int): size of the replies XML, in UTF-8 bytes
+        rtt_ms (float): round trip time of the RPCs
+        parse_ms (float): time spent in Python around the RPCs, None for an 'rpc' record
+        records (int): number of records returned, None when the result has no length
+        error (str): exception raised by the call, None on success
+        timestamp (float): end of the call, time.time()
+    '''
+
+    __slots__ = ('device', 'rpc', 'kind', 'filter_hash', 'bytes_sent', 'bytes_received', 'rtt_ms', 'parse_ms',
+                 'records', 'error', 'timestamp')
+
+    _fields = __slots__
+
+    def __init__(self, device, rpc, kind='rpc', filter_hash=None, bytes_sent=0, bytes_received=0, rtt_ms=0.0,
+                 parse_ms=None, records=None, error=None, timestamp=None):
+        self.device = device
+        self.rpc = rpc
+        self.kind = kind
+        self.filter_hash = filter_hash
+        self.bytes_sent = bytes_sent
+        self.bytes_received = bytes_received
+        self.rtt_ms = rtt_ms
+        self.parse_ms = parse_ms
+        self.records = records
+        self.error = error
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.device!r}, {self.rpc!r}, rtt_ms={self.rtt_ms:.1f}, " \
+               f"parse_ms={self.parse_ms}, records={self.records})"
+
+
+class _Histogram:
+    # bucket counts of HISTOGRAM_BOUNDS_MS, the last bucket is +Inf
+    __slots__ = ('counts', 'total', 'maximum')
+
+    def __init__(self):
+        self.counts = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def add(self, value):
+        for position, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+            if value <= bound:
+                break
+        else:
+            position = len(HISTOGRAM_BOUNDS_MS)
+        self.counts[position] += 1
+        self.total += value
+        self.maximum = max(self.maximum, value)
+
+    def quantile(self, ratio):
+        # upper bound of the bucket holding the quantile, the maximum for the +Inf bucket
+        count = sum(self.counts)
+        if not count:
+            return 0.0
+        rank = ratio * count
+        seen = 0
+        for position, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= rank:
+                return min(HISTOGRAM_BOUNDS_MS[position], self.maximum) if position < len(HISTOGRAM_BOUNDS_MS) \
+                    else self.maximum
+        return self.maximum
+
+
+class _Series:
+    # aggregated records of one (device, rpc, kind)
+    __slots__ = ('count', 'errors', 'rtt', 'parse', 'bytes_sent', 'bytes_received', 'records')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.rtt = _Histogram()
+        self.parse = _Histogram()
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.records = 0
+
+    def add(self, record):
+        self.count += 1
+        self.errors += record.error is not None
+        self.rtt.add(record.rtt_ms)
+        if record.parse_ms is not None:
+            self.parse.add(record.parse_ms)
+        self.bytes_sent += record.bytes_sent
+        self.bytes_received += record.bytes_received
+        self.records += record.records or 0
+
+
+class HistogramSink:
+    '''
+    In-memory sink aggregating the records per (device, rpc) into round trip and parse time histograms
+    '''
+
+    def __init__(self):
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        key = (record.device, record.rpc, record.kind)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series()
+            series.add(record)
+
+    def summary(self):
+        '''
+        Aggregated timings, slowest total round trip time first
+
+        Returns:
+            list: [{'device', 'rpc', 'kind', 'count', 'errors', 'rtt_avg_ms', 'rtt_p95_ms', 'rtt_max_ms',
+                   'parse_avg_ms', 'parse_max_ms', 'bytes_sent', 'bytes_received', 'records'}]
+        '''
+        with self._lock:
+            items = list(self._series.items())
+        rows = []
+        for (device, rpc, kind), series in items:
+            parsed = sum(series.parse.counts)
+            rows.append({
+                'device': device,
+                'rpc': rpc,
+                'kind': kind,
+                'count': series.count,
+                'errors': series.errors,
+                'rtt_avg_ms': series.rtt.total / series.count,
+                'rtt_p95_ms': series.rtt.quantile(0.95),
+                'rtt_max_ms': series.rtt.maximum,
+                'parse_avg_ms': series.parse.total / parsed if parsed else None,
+                'parse_max_ms': series.parse.maximum if parsed else None,
+                'bytes_sent': series.bytes_sent,
+                'bytes_received': series.bytes_received,
+                'records': series.records,
+            })
+        rows.sort(key=lambda row: row['rtt_avg_ms'] * row['count'], reverse=True)
+        return rows
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def __len__(self):
+        return sum(series.count for series in self._series.values())
+
+
+class JsonLinesSink:
+    '''
+    Sink appending each record as a JSON line to a file
+
+    Args:
+        path (str): JSON lines file
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._stream = open(path, 'a', encoding='utf-8')
+
+    def emit(self, record):
+        line = json.dumps(record.as_dict(), separators=(',', ':'))
+        with self._lock:
+            self._stream.write(line + '\n')
+            self._stream.flush()
+
+    def close(self):
+        with self._lock:
+            self._stream.close()
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class PrometheusTextSink(HistogramSink):
+    '''
+    Sink writing the aggregated timings in the Prometheus text format, e.g. for the node exporter
+    textfile collector
+
+    The file is replaced atomically, at most every 'interval' seconds while records are emitted and
+    on flush().
+
+    Args:
+        path (str): '.prom' file
+        interval (float): minimum seconds between two writes (default 15)
+    '''
+
+    def __init__(self, path, interval=15):
+        super().__init__()
+        self.path = path
+        self.interval = interval
+        self._written = 0.0
+
+    def emit(self, record):
+        super().emit(record)
+        if time.monotonic() - self._written >= self.interval:
+            self.flush()
+
+    def render(self):
+        '''Returns the timings in the Prometheus text format'''
+        with self._lock:
+            items = list(self._series.items())
+        lines = []
+        for metric, attribute, description in (('rtt', 'rtt', 'NETCONF round trip time'),
+                                               ('parse', 'parse', 'Python time around the RPCs of a parser call')):
+            name = f'jeypyats_rpc_{metric}_seconds'
+            lines += [f'# HELP {name} {description}', f'# TYPE {name} histogram']
+            for (device, rpc, kind), series in items:
+                histogram = getattr(series, attribute)
+                labels = f'device="{_label(device)}",rpc="{_label(rpc)}",kind="{kind}"'
+                cumulative = 0
+                for bound, count in zip((*HISTOGRAM_BOUNDS_MS, None), histogram.counts):
+                    cumulative += count
+                    le = '+Inf' if bound is None else f'{bound / 1000:g}'
+                    lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+                lines.append(f'{name}_sum{{{labels}}} {histogram.total / 1000:.6f}')
+                lines.append(f'{name}_count{{{labels}}} {cumulative}')
+        for attribute, description in (('bytes_sent', 'Size of the requests'),
+                                       ('bytes_received', 'Size of the replies'),
+                                       ('records', 'Records returned by the parsers'),
+                                       ('errors', 'Failed calls')):
+            name = f'jeypyats_rpc_{attribute}_total'
+            lines += [f'# HELP {name} {description}', f'# TYPE {name} counter']
+            for (device, rpc, kind), series in items:
+                labels = f'device="{_label(device)}",rpc="{_label(rpc)}",kind="{kind}"'
+                lines.append(f'{name}{{{labels}}} {getattr(series, attribute)}')
+        return '\n'.join(lines) + '\n'
+
+    def flush(self):
+        '''Writes the file'''
+        temporary = f'{self.path}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as stream:
+            stream.write(self.render())
+        os.replace(temporary, self.path)
+        self._written = time.monotonic()
+
+    close = flush
+
+
+def add_timing_sink(sink):
+    '''
+    Registers a sink, an object with an emit(record) method
+
+    Returns:
+        the sink
+    '''
+    with _sinks_lock:
+        if sink not in _sinks:
+            _sinks.append(sink)
+    return sink
+
+
+def remove_timing_sink(sink):
+    '''Unregisters a sink, closing it when it has a close() method'''
+    with _sinks_lock:
+        if sink in _sinks:
+            _sinks.remove(sink)
+    close = getattr(sink, 'close', None)
+    if callable(close):
+        close()
+
+
+def _emit(record):
+    for sink in list(_sinks):
+        try:
+            sink.emit(record)
+        except Exception as e:
+            log.warning(f"Timing sink {sink!r} failed: {e}")
+
+
+def _device_name(device):
+    name = getattr(device, 'name', None)
+    return name if isinstance(name, str) else type(device).__name__
+
+
+def _request(method, args, kwargs):
+    # request text of an RPC method call: the filter of netconf_get, the element of dispatch, the msg of request
+    if method == 'netconf_get':
+        request = kwargs.get('filter', args[0] if args else None)
+    elif method == 'dispatch':
+        request = kwargs.get('rpc_command', args[0] if args else None)
+    else:
+        request = kwargs.get('msg', args[0] if args else None)
+    if etree.iselement(request):
+        return etree.tostring(request)
+    return request.encode('utf-8') if isinstance(request, str) else request
+
+
+def _reply_size(reply):
+    # encoded size, like the requests: the characters of a str reply may take several bytes
+    xml = getattr(reply, 'xml', reply)
+    if isinstance(xml, str):
+        return len(xml.encode('utf-8'))
+    return len(xml) if isinstance(xml, bytes) else 0
+
+
+class _Call:
+    # parser call in progress: RPCs made during the call and Python time
+    __slots__ = ('device', 'rpc', 'parent', 'rtt_ms', 'bytes_sent', 'bytes_received', 'filter_hash', 'elapsed')
+
+    def __init__(self, device, rpc, parent):
+        self.device = device
+        self.rpc = rpc
+        self.parent = parent
+        self.rtt_ms = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.filter_hash = None
+        self.elapsed = 0.0
+
+    def add_rpc(self, rtt_ms, bytes_sent, bytes_received, filter_hash):
+        call = self
+        while call is not None:
+            call.rtt_ms += rtt_ms
+            call.bytes_sent += bytes_sent
+            call.bytes_received += bytes_received
+            call.filter_hash = filter_hash
+            call = call.parent
+
+    def finish(self, records=None, error=None):
+        elapsed_ms = self.elapsed * 1000
+        _emit(RpcTiming(self.device, self.rpc, 'parser', self.filter_hash, self.bytes_sent, self.bytes_received,
+                        self.rtt_ms, max(elapsed_ms - self.rtt_ms, 0.0), records, error))
+
+
+def _timed_rpc(device_name, method, function):
+    @functools.wraps(function)
+    def timed(*args, **kwargs):
+        if not _sinks:
+            return function(*args, **kwargs)
+        request = _request(method, args, kwargs)
+        filter_hash = hashlib.sha1(request).hexdigest()[:16] if request else None
+        error = None
+        start = time.perf_counter()
+        try:
+            reply = function(*args, **kwargs)
+            return reply
+        except Exception as e:
+            error, reply = f"{type(e).__name__}: {e}", None
+            raise
+        finally:
+            rtt_ms = (time.perf_counter() - start) * 1000
+            bytes_sent, bytes_received = len(request or b''), _reply_size(reply)
+            call = _current_call.get()
+            if call is not None:
+                call.add_rpc(rtt_ms, bytes_sent, bytes_received, filter_hash)
+            _emit(RpcTiming(device_name, method, 'rpc', filter_hash, bytes_sent, bytes_received, rtt_ms,
+                            error=error))
+    timed.__timed__ = function
+    return timed
+
+
+def _records(result):
+    try:
+        return len(result)
+    except TypeError:
+        return None
+
+
+def _timed_iterator(iterator, call):
+    # the call is active, and timed, only while the iterator produces an item
+    count, error = 0, None
+    try:
+        while True:
+            token = _current_call.set(call)
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                call.elapsed += time.perf_counter() - start
+                _current_call.reset(token)
+            count += 1
+            yield item
+    finally:
+        call.finish(count, error)
+
+
+def _timed_parser(device_name, name, function):
+    @functools.wraps(function)
+    def timed(*args, **kwargs):
+        if not _sinks:
+            return function(*args, **kwargs)
+        call = _Call(device_name, name, _current_call.get())
+        token = _current_call.set(call)
+        start = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        except Exception as e:
+            call.elapsed = time.perf_counter() - start
+            call.finish(error=f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            _current_call.reset(token)
+        call.elapsed = time.perf_counter() - start
+        if isinstance(result, collections.abc.Iterator):
+            return _timed_iterator(result, call)
+        call.finish(_records(result))
+        return result
+    timed.__timed__ = function
+    return timed
+
+
+def _parser_methods(device):
+    # public methods of the device defined by the parser modules, through its class or bound to it
+    names = set()
+    for cls in type(device).__mro__:
+        if cls.__module__.startswith('jeypyats.parsers'):
+            names.update(name for name, value in vars(cls).items()
+                         if not name.startswith('_') and inspect.isfunction(value)
+                         and not inspect.iscoroutinefunction(value))
+    for name, value in vars(device).items():
+        function = getattr(value, '__func__', None)
+        if not name.startswith('_') and inspect.isfunction(function) \
+                and function.__module__.startswith('jeypyats.parsers') and not inspect.iscoroutinefunction(function):
+            names.add(name)
+    return sorted(names)
+
+
+def enable_rpc_timing(device):
+    '''
+    Times the NETCONF methods and the parser methods of a device
+
+    To be called once the device is connected and its parsers are applied, as they set the methods.
+
+    Args:
+        device: device with netconf_get, dispatch or request methods
+
+    Returns:
+        list: names of the timed methods
+    '''
+    originals = vars(device).get('rpc_timing_originals')
+    if originals is not None:
+        return sorted(originals)
+    originals = {}
+    device_name = _device_name(device)
+    for name in _RPC_METHODS:
+        method = getattr(device, name, None)
+        if callable(method):
+            originals[name] = vars(device).get(name)
+            setattr(device, name, _timed_rpc(device_name, name, method))
+    for name in _parser_methods(device):
+        if name in originals:
+            continue
+        originals[name] = vars(device).get(name)
+        setattr(device, name, _timed_parser(device_name, name, getattr(device, name)))
+    device.rpc_timing_originals = originals
+    return sorted(originals)
+
+
+def disable_rpc_timing(device):
+    '''
+    Restores the untimed methods of a device
+    '''
+    originals = vars(device).get('rpc_timing_originals')
+    if originals is None:
+        return
+    for name, original in originals.items():
+        if original is None:
+            vars(device).pop(name, None)
+        else:
+            setattr(device, name, original)
+    device.rpc_timing_originals = None
+
+
+def format_timing_summary(summary, limit=None):
+    '''
+    Formats a HistogramSink summary as a table, slowest first
+
+    Args:
+        summary (list): rows returned by HistogramSink.summary()
+        limit (int, optional): maximum number of rows
+
+    Returns:
+        str: table
+    '''
+    rows = summary[:limit] if limit else summary
+    device_width = max([len(row['device']) for row in rows] + [len('Device')])
+    rpc_width = max([len(row['rpc']) for row in rows] + [len('RPC')])
+    lines = [f"{'Device':<{device_width}}  {'RPC':<{rpc_width}}  {'Calls':>5}  {'Err':>3}  {'RTT avg':>9}  "
+             f"{'RTT p95':>9}  {'RTT max':>9}  {'Parse avg':>9}  {'Received':>10}  {'Records':>8}"]
+    for row in rows:
+        parse = f"{row['parse_avg_ms']:>7.1f}ms" if row['parse_avg_ms'] is not None else f"{'-':>9}"
+        lines.append(
+            f"{row['device']:<{device_width}}  {row['rpc']:<{rpc_width}}  {row['count']:>5}  {row['errors']:>3}  "
+            f"{row['rtt_avg_ms']:>7.1f}ms  {row['rtt_p95_ms']:>7.1f}ms  {row['rtt_max_ms']:>7.1f}ms  {parse}  "
+            f"{row['bytes_received']:>10}  {row['records']:>8}"
+        )
+    calls = sum(row['count'] for row in summary if row['kind'] == 'rpc')
+    total = sum(row['rtt_avg_ms'] * row['count'] for row in summary if row['kind'] == 'rpc')
+    lines.append(f"{calls} RPCs, {total / 1000:.2f}s round trip in total")
+    return '\n'.join(lines)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+########################################################################################################################
+#
+# File: schemas.py
+# This file is a part of Netalps.fr
+#
+# Created: 17.10.2026 10:05:27
+# Author: Jeremie Rouzet
+#
+# Last Modified: 17.10.2026 10:05:27
+# Modified By: Jeremie Rouzet
+#
+# Copyright (c) 2026 Netalps.fr
+########################################################################################################################
+
+__author__ = ["Jeremie Rouzet"]
+__contact__ = 'jeremie.rouzet@netalps.fr'
+__copyright__ = 'Netalps, 2026'
+__license__ = "Netalps, Copyright 2026. All rights reserved."
+
+'''
+Declarative extraction schemas for NETCONF replies
+A schema declares the list element to extract (a path decoded by the streaming reply decoder)
+and a field map from output names to leaf paths relative to that list element.
+Field paths are compiled once, when the schema is created. The leaves which are direct children of
+the list element are read in a single walk of its children, through a tag -> fields map (the
+'{namespace}leaf' tag when the schema declares the YANG namespace of the reply, the local name
+otherwise). Nested paths are compiled into lxml XPath objects: namespace-aware ETXPath objects
+when the schema declares a namespace, local-name() based XPath objects otherwise.
+Parsers declare their schemas at module level and run them with extract() or iter_extract().
+'''
+
+from lxml import etree
+from .reply_decoder import iter_elements
+
+__all__ = [
+    'ExtractionSchema',
+]
+
+
+def _compile_field(path, namespace):
+    """Compiles a leaf path relative to the list element into an XPath returning its text nodes"""
+    steps = [step for step in path.strip('/').split('/') if step]
+    if not steps:
+        raise ValueError("Field path cannot be empty")
+    if namespace:
+        expression = '/'.join(f'{{{namespace}}}{step}' for step in steps) + '/text()'
+        return etree.ETXPath(expression, smart_strings=False)
+    expression = '/'.join(f"*[local-name()='{step}']" for step in steps) + '/text()'
+    return etree.XPath(expression, smart_strings=False)
+
+
+class ExtractionSchema:
+    '''
+    Compiled description of the records to extract from a NETCONF reply
+
+    Args:
+        path (str): '/'-separated path of the list element, e.g. 'routing-table/rt-entry'
+        fields (dict): output name -> leaf path relative to the list element, or a (leaf path, converter) tuple
+        namespace (str, optional): YANG namespace of the leaves. None matches leaves in any namespace
+        keys (dict, optional): name -> leaf path of an ancestor key (see reply_decoder.iter_elements)
+        where (dict, optional): name -> expected value; records whose field or key differs are skipped
+        defaults (dict, optional): name -> value used when a leaf is missing
+        include_keys (bool): add the ancestor keys to the records (default False)
+
+    Example:
+        RT_ENTRY_SCHEMA = ExtractionSchema(
+            'routing-table/rt-entry',
+            {'prefix': 'destination', 'next_hop': 'gateway', 'metric': ('metric', int)},
+            namespace='http://cisco.com/ns/yang/Cisco-IOS-XE-rpc',
+        )
+        routes = RT_ENTRY_SCHEMA.extract(response.xml)
+    '''
+
+    __slots__ = ('path', 'namespace', 'keys', 'where', 'defaults', 'include_keys', '_fields', '_children')
+
+    def __init__(self, path, fields, namespace=None, keys=None, where=None, defaults=None, include_keys=False):
+        self.path = path
+        self.namespace = namespace
+        self.keys = dict(keys) if keys else None
+        self.where = tuple((where or {}).items())
+        self.defaults = dict(defaults or {})
+        self.include_keys = include_keys
+        compiled = []
+        # tag of a direct child leaf -> names of the fields reading it
+        children = {}
+        for name, spec in fields.items():
+            field_path, converter = spec if isinstance(spec, tuple) else (spec, None)
+            xpath = _compile_field(field_path, namespace)
+            step = field_path.strip('/')
+            if '/' in step:
+                compiled.append((name, xpath, converter))
+            else:
+                children.setdefault(f'{{{namespace}}}{step}' if namespace else step, []).append(name)
+                compiled.append((name, None, converter))
+        self._fields = tuple(compiled)
+        self._children = {tag: tuple(names) for tag, names in children.items()}
+
+    @property
+    def fields(self):
+        """Output field names, in declaration order"""
+        return tuple(name for name, _, _ in self._fields)
+
+    def extract_element(self, element, key_values=None):
+        """Extracts one record from an already parsed list element
+
+        Args:
+            element (lxml.etree._Element): list element
+            key_values (dict, optional): ancestor key values
+
+        Returns:
+            dict: extracted record, or None if it does not match the 'where' clause
+        """
+        defaults = self.defaults
+        # text of the first child of every direct leaf, like the text() of an XPath
+        texts = {}
+        children = self._children
+        if children:
+            local = self.namespace is None
+            for child in element:
+                # comments and processing instructions have no str tag, they never match
+                tag = child.tag
+                names = children.get(tag.rpartition('}')[2] if local and isinstance(tag, str) else tag)
+                if names is not None:
+                    text = child.text
+                    if text is not None:
+                        for name in names:
+                            if name not in texts:
+                                texts[name] = text
+        record = {}
+        for name, xpath, converter in self._fields:
+            if xpath is None:
+                value = texts.get(name)
+            else:
+                found = xpath(element)
+                value = found[0] if found else None
+            value = value.strip() if value else None
+            if not value:
+                value = defaults.get(name)
+            elif converter is not None:
+                value = converter(value)
+            record[name] = value
+        for name, expected in self.where:
+            value = record[name] if name in record else (key_values or {}).get(name)
+            if value != expected:
+                return None
+        if self.include_keys and key_values:
+            record.update(key_values)
+        return record
+
+    def iter_extract(self, xml):
+        """Yields the records of a reply, decoding it as a stream
+
+        Args:
+            xml (str | bytes | file-like | reply object): NETCONF reply
+
+        Yields:
+            dict: extracted records
+        """
+        extract_element = self.extract_element
+        for element, key_values in iter_elements(xml, self.path, self.keys):
+            record = extract_element(element, key_values)
+            if record is not None:
+                yield record
+
+    def extract(self, xml):
+        """Returns the list of records of a reply
+
+        Args:
+            xml (str | bytes | file-like | reply object): NETCONF reply
+
+        Returns:
+            list: extracted records
+        """
+        return list(self.iter_extract(xml))
+
+    def extract_first(self, xml, default=None):
+        """Returns the first record of a reply, or default if there is none"""
+        for record in self.iter_extract(xml):
+            return record
+        return default
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(path={self.path!r}, fields={self.fields!r})"
@@ -25,21 +25,21 @@ This module provides various utility functions and custom exceptions
 used across the JeyPyats framework.
 '''
 
+import functools
 import importlib
 import logging
 from packaging import version
 from lxml import etree
-from pyats import aetest
 
 # create a logger for this module
 log = logging.getLogger(__name__)
 
-# Custom decorator alias for backwards compatibility
-# pyats.aetest uses 'cleanup' instead of 'teardown'
-teardown = aetest.cleanup
+# versions assumed for devices and mixin classes without os_version / __os_version__
+_NEWEST_VERSION = version.parse("65000")
+_NO_VERSION = version.parse("0")
 
+# 'teardown' is resolved by __getattr__ below, so that importing jeypyats does not import pyats.aetest
 __all__ = [
-    'teardown',
     'JeyPyatsBaseException',
     'JeyPyatsValueError',
     'JeyPyatsTypeError',
@@ -48,6 +48,7 @@ __all__ = [
     'JeyPyatsNotConnectedError',
     'JeyPyatsStateError',
     'apply_mixin',
+    'method_table',
     'sanitize_xml',
     'xml_insert_after',
     'xml_insert_in',
@@ -57,6 +58,15 @@ __all__ = [
 ]
 
 
+def __getattr__(name):
+    # Custom decorator alias for backwards compatibility
+    # pyats.aetest uses 'cleanup' instead of 'teardown'
+    if name == 'teardown':
+        from pyats import aetest
+        return aetest.cleanup
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class JeyPyatsBaseException(Exception):
     """Base exception for all JeyPyats errors."""
 
@@ -112,46 +122,14 @@ def apply_mixin(obj, mixin_class):
 
         my_instance.my_method()  # This will correctly print "Hello from mixin!"
     """
-    def _remove_duplicate_methods(objects):
-        # maybe this can be done smarter?
-        highest_version = {}
-
-        for obj in objects:
-            name = obj[0]
-            ver = obj[2]
-
-            if name not in highest_version or ver > highest_version[name][2]:
-                highest_version[name] = obj
-
-        return set(highest_version.values())
-
-    empty_dict = {}
-    mixin_items = empty_dict.items()
     try:
         obj_version = obj.os_version
     except AttributeError:
         log.warning(f"{obj} has no os_version")
         log.warning("Loading the newest mixins")
-        obj_version = version.parse("65000")
-
-    for cls in mixin_class.__mro__:
-        try:
-            cls_version = cls.__os_version__
-        except AttributeError:
-            log.debug(f"{cls.__name__} has no os_version")
-            cls_version = version.parse("0")
-        if obj_version >= cls_version:
-            class_methods = vars(cls).items()
-            class_methods = [
-                (method_name, method, cls_version)
-                for method_name, method in class_methods
-                # don't load the protected methods
-                if not method_name.startswith("__") and not method_name.startswith("_")
-            ]
-            mixin_items = mixin_items | set(class_methods)
-    mixin_items = _remove_duplicate_methods(mixin_items)
-    for name, method, _ in mixin_items:
-        if callable(method) and name not in vars(obj):
+        obj_version = _NEWEST_VERSION
+    for name, method in method_table(mixin_class, obj_version):
+        if name not in vars(obj):
             try:
                 setattr(obj, name, method.__get__(obj))
             except AttributeError as err:
@@ -159,6 +137,52 @@ def apply_mixin(obj, mixin_class):
                 log.debug(err)
 
 
+@functools.lru_cache(maxsize=None)
+def method_table(mixin_class, obj_version):
+    """
+    Resolves the methods a mixin provides to a device running a given OS version.
+
+    Every class of the mixin MRO whose __os_version__ is not newer than obj_version contributes
+    its public callables. When several classes define the same method, the one with the highest
+    __os_version__ wins, the most derived class on a tie.
+    The table is computed once per (mixin, version) and cached, so that binding many devices
+    of the same platform does not walk the MRO again.
+
+    Args:
+        mixin_class (class): The class containing the mixin methods.
+        obj_version (Version): OS version of the device.
+
+    Returns:
+        tuple: (method name, function) pairs
+    """
+    resolved = {}
+    for cls in mixin_class.__mro__:
+        cls_version = getattr(cls, '__os_version__', _NO_VERSION)
+        if obj_version < cls_version:
+            continue
+        for method_name, method in vars(cls).items():
+            # don't load the protected methods
+            if method_name.startswith("_") or not callable(method):
+                continue
+            if method_name not in resolved or cls_version > resolved[method_name][1]:
+                resolved[method_name] = (method, cls_version)
+    return tuple((name, method) for name, (method, _) in resolved.items())
+
+
+@functools.lru_cache(maxsize=None)
+def _mixin_classes(mixin_type, os, device_type, mixin_name):
+    # It will raise an ModuleNotFoundError if module is not found, errors are not cached
+    module = importlib.import_module(f"jeypyats.{mixin_type}.libs.{os}.{device_type}")
+    classes = [getattr(module, mixin_name)]
+    # try to see we can load some waits
+    try:
+        module = importlib.import_module(f"jeypyats.{mixin_type}.libs.{os}.waits")
+        classes.append(getattr(module, "WaitsMixin"))
+    except ModuleNotFoundError:
+        log.debug(f"Could not load waits for {os}")
+    return tuple(classes)
+
+
 def guess_and_load_mixin(obj, mixin_type, mixin_name=None):
     """
     Dynamically loads and applies a mixin class to the given object based on its connection information.
@@ -189,22 +213,10 @@ def guess_and_load_mixin(obj, mixin_type, mixin_name=None):
         )
 
     mixin = {"parsers": "ParsersMixin", "configs": "ConfigsMixin"}
-
-    module_path = f"jeypyats.{mixin_type}.libs.{obj.connection_info.os}.{obj.connection_info.device_type}"
     mixin_name = mixin[mixin_type] if mixin_name is None else mixin_name
-    # It will raise an ModuleNotFoundError if module is not found
-    module = importlib.import_module(module_path)
-    mixin_class = getattr(module, mixin_name)
-    apply_mixin(obj, mixin_class)
-    # try to see we can load some waits
-    module_path = f"jeypyats.{mixin_type}.libs.{obj.connection_info.os}.waits"
-    mixin_name = "WaitsMixin"
-    try:
-        module = importlib.import_module(module_path)
-        mixin_class = getattr(module, mixin_name)
+    # the mixin modules are looked up once per platform
+    for mixin_class in _mixin_classes(mixin_type, obj.connection_info.os, obj.connection_info.device_type, mixin_name):
         apply_mixin(obj, mixin_class)
-    except ModuleNotFoundError:
-        log.debug(f"Could not load waits for {obj.connection_info.os}")
 
 
 def sanitize_xml(xml_string):
@@ -303,31 +315,44 @@ def bind_iosxe_parsers_to_device(device):
     Returns:
         None
     """
-    from ..parsers.iosxe.iosxe_routing_parsers_nc import IOSXERoutingParsersMixin
-    from ..parsers.iosxe.iosxe_interface_parsers_nc import IOSXEInterfacesParsersMixin
-    from ..parsers.iosxe.iosxe_eem_parsers_nc import IOSXEEEMParsersMixin
-    from ..parsers.iosxe.iosxe_syslog_parsers_nc import IOSXESyslogParsersMixin
-    from ..parsers.iosxe.iosxe_ip_sla_parsers_nc import IOSXEIPSLAParsersMixin
-    from ..parsers.iosxe.iosxe_track_parsers_nc import IOSXETrackParsersMixin
-    from ..parsers.iosxe.iosxe_cellular_parsers_nc import IOSXECellularParsersMixin
-    IOSXERoutingParsersMixin.bind_to_device(device)
-    IOSXEInterfacesParsersMixin.bind_to_device(device)
-    IOSXEEEMParsersMixin.bind_to_device(device)
-    IOSXESyslogParsersMixin.bind_to_device(device)
-    IOSXEIPSLAParsersMixin.bind_to_device(device)
-    IOSXETrackParsersMixin.bind_to_device(device)
-    IOSXECellularParsersMixin.bind_to_device(device)
-
-
-def apply_netconf_parsers(device):
+    from ..parsers.registry import NETCONF_PARSERS, load_parsers
+    # the coroutine variants have no bind_to_device, they are only added by apply_netconf_parsers
+    for mixin in load_parsers('iosxe', [name for name in NETCONF_PARSERS['iosxe'] if name != 'async']):
+        mixin.bind_to_device(device)
+
+
+@functools.lru_cache(maxsize=None)
+def netconf_device_class(base_class, mixins):
+    """
+    Composes a device class with NETCONF parser mixins.
+
+    The class is built once per (base class, mixins) and shared by every device of that class,
+    instead of one identical class per device.
+
+    Args:
+        base_class (class): The class of the device, e.g. pyats Device.
+        mixins (tuple): The mixin classes, in MRO order.
+
+    Returns:
+        class: IOSXENETCONFDevice class deriving from base_class and mixins
+    """
+    # the base class is kept, so that applying parsers again composes from it instead of nesting classes
+    return type('IOSXENETCONFDevice', (base_class, *mixins), {'_netconf_base_class': base_class})
+
+
+def apply_netconf_parsers(device, mixins=None):
     """
     Apply NETCONF parser mixins to the device.
+
+    Args:
+        device: The device instance to apply the parsers to.
+        mixins (iterable, optional): The mixins to compose, as parser registry names (e.g. 'routing')
+                                     or mixin classes. Every IOS-XE parser by default.
     """
-    from ..parsers.iosxe.iosxe_cellular_parsers_nc import IOSXECellularParsersMixin
-    from ..parsers.iosxe.iosxe_syslog_parsers_nc import IOSXESyslogParsersMixin
-    from ..parsers.iosxe.iosxe_ip_sla_parsers_nc import IOSXEIPSLAParsersMixin
-    from ..parsers.iosxe.iosxe_track_parsers_nc import IOSXETrackParsersMixin
-    from ..parsers.iosxe.iosxe_routing_parsers_nc import IOSXERoutingParsersMixin
-    from ..parsers.iosxe.iosxe_interface_parsers_nc import IOSXEInterfacesParsersMixin
-    device.__class__ = type('IOSXENETCONFDevice', (device.__class__, IOSXECellularParsersMixin, IOSXESyslogParsersMixin, IOSXEIPSLAParsersMixin, IOSXETrackParsersMixin, IOSXERoutingParsersMixin, IOSXEInterfacesParsersMixin), {})
+    from ..parsers.registry import load_parser, load_parsers
+    if mixins is None:
+        mixins = load_parsers('iosxe')
+    mixins = tuple(load_parser('iosxe', mixin) if isinstance(mixin, str) else mixin for mixin in mixins)
+    base_class = vars(device.__class__).get('_netconf_base_class', device.__class__)
+    device.__class__ = netconf_device_class(base_class, mixins)
     log.info("Applied NETCONF parser mixins to device.")
@@ -42,7 +42,9 @@ from jeypyats.utils.utils import block_if_fails
 from jeypyats.utils.utils import teardown
 from jeypyats.utils.utils import apply_netconf_parsers
 from jeypyats.utils.netconf_connector import NetconfConnectorConnection
-import time
+from jeypyats.utils.parallel_connect import connect_devices_in_parallel
+from jeypyats.utils.rib_snapshot import RibSnapshot
+from jeypyats.utils.rpc_timing import HistogramSink, add_timing_sink, enable_rpc_timing, format_timing_summary
 import json
 
 
@@ -50,6 +52,9 @@ import json
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# timings of every NETCONF RPC and parser call of the job, summarized in the cleanup
+RPC_TIMINGS = add_timing_sink(HistogramSink())
+
 class JeylanCommonSetup(aetest.CommonSetup, NetconfConnectorConnection):
     """
     Common setup for Jeylan failover tests.
@@ -65,15 +70,23 @@ class JeylanCommonSetup(aetest.CommonSetup, NetconfConnectorConnection):
     @block_if_fails
     @aetest.subsection
     def connect_to_devices(self):
-        """ Connect to all devices in the testbed """
+        """ Connect to all devices in the testbed, in parallel """
         self.testbed = self.parameters['testbed']
         self.parent.testbed = self.testbed
-        for device in self.testbed.devices.values():
+
+        def connect(device):
             logger.info(f"Connecting to device: {device.name}")
             device.connect()
             if device.name == 'jey-isr1k-ce-03':
                 # Get the NETCONF connection from the custom class
                 self.connect()
+            return device
+
+        connect_devices_in_parallel(
+            self, self.testbed.devices, connector=connect,
+            max_workers=self.parameters.get('connect_workers', 32),
+            timeout=self.parameters.get('connect_timeout', 120),
+        )
         logger.info("All devices connected successfully.")
 
     @block_if_fails
@@ -111,13 +124,21 @@ class FailoverTestcase(aetest.Testcase):
         self.sw.connect()
         # Ajouter les méthodes aux instances des devices
         apply_netconf_parsers(self.ce)
+        enable_rpc_timing(self.ce)
+        # EEM and syslog messages are pushed by the router instead of downloading its log buffer
+        try:
+            self.ce.subscribe_events()
+        except Exception as e:
+            logger.warning(f"Event subscription unavailable, falling back to syslog polling: {e}")
         logger.info("Failover testcase setup complete.")
 
     @aetest.test
     def check_initial_state(self, steps):
         """ Check initial state: primary route active, SLA/tracks up, SIM slot 0 """
+        # Routes, SLA, tracks, SIM and LTE interface states are fetched with a single NETCONF get
+        state = self.ce.collect(['default_routes', 'ip_sla', 'tracks', 'sim:Cellular0/2/0', 'interface:Cellular0/2/0'])
         with steps.start("Check primary route is active initially"):
-            primary_route = self.ce.get_routing_table_default_routes()
+            primary_route = state['default_routes']
             logger.info(f"Primary route initially: {json.dumps(primary_route, indent=2)}")
             assert primary_route, "No default route found initially."
             # Check for tracked default route via FTTH gateway
@@ -125,14 +146,14 @@ class FailoverTestcase(aetest.Testcase):
             logger.info("Primary route is active and correct initially.")
 
         with steps.start("Check IP SLA and track states initially"):
-            sla_states = self.ce.get_ip_sla_states()
+            sla_states = state['ip_sla']
             logger.info(f"IP SLA states: {json.dumps(sla_states, indent=2)}")
             if sla_states:
                 assert sla_states.get('1', {}).get('oper_state') == 'active', "SLA 1 not active."
             else:
                 logger.warning("No SLA states found, assuming SLA not configured or not retrievable via NETCONF.")
 
-            track_states = self.ce.get_track_states()
+            track_states = state['tracks']
             logger.info(f"Track states: {json.dumps(track_states, indent=2)}")
             if track_states:
                 assert track_states.get('1', {}).get('state') == 'up', "Track 1 not up."
@@ -141,7 +162,7 @@ class FailoverTestcase(aetest.Testcase):
             logger.info("SLA and tracks checked initially.")
 
         with steps.start("Check initial SIM slot (should be 0 for Free)"):
-            sim_config = self.ce.get_cellular_sim_config('Cellular0/2/0')
+            sim_config = state['sim:Cellular0/2/0']
             logger.info(f"Initial SIM config: {json.dumps(sim_config, indent=2)}")
             if sim_config:
                 assert sim_config.get('slot') == 0, "SIM not on slot 0 initially."
@@ -151,11 +172,16 @@ class FailoverTestcase(aetest.Testcase):
                 logger.warning("No SIM config found, assuming cellular not configured or not retrievable via NETCONF.")
 
         with steps.start("Check LTE interface status"):
-            lte_status = self.ce.get_interface_status('Cellular0/2/0')
+            lte_status = state['interface:Cellular0/2/0']
             logger.info(f"LTE interface Cellular0/2/0 status: {json.dumps(lte_status, indent=2)}")
             assert lte_status.get('oper_status') == 'up', f"LTE interface is not up: {lte_status}"
             logger.info("LTE interface is up initially.")
 
+        with steps.start("Snapshot the routing tables before failover"):
+            # only the digests stay in memory, the routes are kept compressed for the final diff
+            self.rib_before = RibSnapshot.capture(self.ce.get_routing_tables())
+            logger.info(f"Routing tables snapshot: {len(self.rib_before)} prefixes in {len(self.rib_before.vrfs())} VRFs")
+
     @aetest.test
     def simulate_failover(self, steps):
         """ Simulate failover by shutting down the switch port connected to the ISP modem """
@@ -164,44 +190,31 @@ class FailoverTestcase(aetest.Testcase):
         with steps.start("Shut down switch port Teng1/0/1 to simulate ISP link failure"):
             self.sw.configure(['interface Teng1/0/1', 'shutdown'])
             logger.info("Switch port Teng1/0/1 is now shut down.")
-            # Wait for a short period to allow failover to take effect
-            time.sleep(45)
-        # Check logs for EEM failover event on jey-isr1k-ce-03 using netconf parsers
-        with steps.start("check router log for eem failover event"):
-            syslog_messages = self.ce.get_syslog_messages(filter_text='Bascule automatique vers SIM1')
-            logger.info(f"Syslog messages for SIM switch: {json.dumps(syslog_messages, indent=2)}")
-            if not syslog_messages:
-                logger.warning("No SIM switch messages found in syslog after shutdown. This may indicate EEM script is not configured or triggered.")
-            else:
-                logger.info("SIM switch messages found in syslog.")
-            # Wait for a short period to allow failover to take effect
-            time.sleep(45)
-        # Check secondary route after failover on jey-isr1k-ce-03 using netconf parsers
+        # Poll the router until the secondary route is installed instead of sleeping a fixed time
         with steps.start("Check secondary route is active after failover"):
-            secondary_route = self.ce.get_routing_table_default_routes()
-            logger.info(f"Route after failover: {json.dumps(secondary_route, indent=2)}")
-            assert secondary_route, "No route found after failover."
-            # Confirm that the secondary route is via the LTE interface Cellular0/2/0
-            assert any(route['interface'] == 'Cellular0/2/0' for route in secondary_route), "Secondary route is not via the expected interface."
-            logger.info("Secondary route is active and correct after failover.")
-        with steps.start("check router log for eem failover event"):
-            syslog_messages = self.ce.get_syslog_messages(filter_text='Bascule automatique vers SIM1')
-            logger.info(f"Syslog messages for SIM switch: {json.dumps(syslog_messages, indent=2)}")
-            if not syslog_messages:
-                logger.warning("No SIM switch messages found in syslog after route check. This may indicate EEM script is not configured or triggered.")
-            else:
-                logger.info("SIM switch messages found in syslog.")
+            convergence = self.ce.wait_for_default_route(interface='Cellular0/2/0', timeout=120)
+            logger.info(f"Route after failover: {json.dumps(convergence.value, indent=2)}")
+            logger.info(f"Secondary route is active and correct after failover, converged in {convergence.elapsed:.1f}s.")
 
         with steps.start("Check SIM slot switched to 1 (Orange)"):
-            sim_config = self.ce.get_cellular_sim_config('Cellular0/2/0')
-            logger.info(f"SIM config after failover: {json.dumps(sim_config, indent=2)}")
-            if sim_config:
-                assert sim_config.get('slot') == 1, "SIM not switched to slot 1."
-                assert sim_config.get('data_profile') == 2, "Data profile not switched to 2."
-                logger.info("SIM switched to slot 1 (Orange) after failover.")
+            # Only wait for the switch when the SIM config can be read at all
+            if self.ce.get_cellular_sim_config('Cellular0/2/0'):
+                sim_switch = self.ce.wait_for_sim_slot('Cellular0/2/0', slot=1, data_profile=2, timeout=120)
+                logger.info(f"SIM config after failover: {json.dumps(sim_switch.value, indent=2)}")
+                logger.info(f"SIM switched to slot 1 (Orange) after failover, {sim_switch.elapsed:.1f}s after the route.")
             else:
                 logger.warning("No SIM config found after failover.")
 
+        # Check logs for EEM failover event on jey-isr1k-ce-03 using netconf parsers
+        with steps.start("check router log for eem failover event"):
+            # the EEM script logs before the route converges, the messages already received are searched too
+            sim_message = self.ce.wait_for_message('Bascule automatique vers SIM1', timeout=30, since=0)
+            logger.info(f"Syslog message for SIM switch: {json.dumps(sim_message, indent=2)}")
+            if not sim_message:
+                logger.warning("No SIM switch messages found in syslog after route check. This may indicate EEM script is not configured or triggered.")
+            else:
+                logger.info("SIM switch messages found in syslog.")
+
     @aetest.test
     def restore_primary_route(self, steps):
         """ Restore primary route by bringing the switch port back up """
@@ -210,33 +223,40 @@ class FailoverTestcase(aetest.Testcase):
         with steps.start("Bring up switch port Teng1/0/1 to restore ISP link"):
             self.sw.configure(['interface Teng1/0/1', 'no shutdown'])
             logger.info("Switch port Teng1/0/1 is now up.")
-            # Wait for a short period to allow route restoration to take effect
-            time.sleep(20)
-        # Check primary route after restoration on jey-isr1k-ce-03 using netconf parsers
+        # Poll the router until the primary route is restored instead of sleeping a fixed time
         with steps.start("Check primary route is active after restoration"):
-            restored_route = self.ce.get_routing_table_default_routes()
-            logger.info(f"Route after restoration: {json.dumps(restored_route, indent=2)}")
-            assert restored_route, "No route found after restoration."
-            # Confirm that the primary route is again via the FTTH gateway
-            assert any(route.get('next_hop') == '82.66.83.254' for route in restored_route), "Primary route is not via the expected next hop after restoration."
-            logger.info("Primary route is active and correct after restoration.")
+            convergence = self.ce.wait_for_default_route(next_hop='82.66.83.254', timeout=90)
+            logger.info(f"Route after restoration: {json.dumps(convergence.value, indent=2)}")
+            logger.info(f"Primary route is active and correct after restoration, converged in {convergence.elapsed:.1f}s.")
 
         with steps.start("Check syslog for FTTH restore message"):
-            syslog_messages = self.ce.get_syslog_messages(filter_text='FTTH restored')
-            logger.info(f"Syslog messages for FTTH restore: {json.dumps(syslog_messages, indent=2)}")
-            assert syslog_messages, "No EEM FTTH restore message found in syslog."
+            # the EEM script logs before the route converges, the messages already received are searched too
+            restore_message = self.ce.wait_for_message('FTTH restored', timeout=30, since=0)
+            logger.info(f"Syslog message for FTTH restore: {json.dumps(restore_message, indent=2)}")
+            assert restore_message, "No EEM FTTH restore message found in syslog."
             logger.info("EEM confirmed FTTH restoration.")
 
         with steps.start("Check SIM slot restored to 0 (Free)"):
-            sim_config = self.ce.get_cellular_sim_config('Cellular0/2/0')
-            logger.info(f"SIM config after restoration: {json.dumps(sim_config, indent=2)}")
-            if sim_config:
-                assert sim_config.get('slot') == 0, "SIM not restored to slot 0."
-                assert sim_config.get('data_profile') == 1, "Data profile not restored to 1."
-                logger.info("SIM restored to slot 0 (Free) after FTTH recovery.")
+            # Only wait for the switch when the SIM config can be read at all
+            if self.ce.get_cellular_sim_config('Cellular0/2/0'):
+                sim_switch = self.ce.wait_for_sim_slot('Cellular0/2/0', slot=0, data_profile=1, timeout=120)
+                logger.info(f"SIM config after restoration: {json.dumps(sim_switch.value, indent=2)}")
+                logger.info(f"SIM restored to slot 0 (Free) after FTTH recovery, {sim_switch.elapsed:.1f}s after the route.")
             else:
                 logger.warning("No SIM config found after restoration.")
 
+        with steps.start("Compare the routing tables with the initial snapshot"):
+            rib_after = RibSnapshot.capture(self.ce.get_routing_tables())
+            rib_before = getattr(self, 'rib_before', None)
+            if rib_before is None:
+                logger.warning("No initial routing tables snapshot, comparison skipped.")
+            else:
+                diff = rib_before.diff(rib_after)
+                for line in diff.report(rib_before, rib_after):
+                    logger.info(line)
+                if diff:
+                    logger.warning("The routing tables differ from the initial ones after restoration.")
+
 class common_teardown(aetest.CommonCleanup):
     """
     Common teardown for Jeylan failover tests.
@@ -249,10 +269,14 @@ class common_teardown(aetest.CommonCleanup):
         with steps.start("Disconnect from devices"):
             # Disconnect from devices
             if hasattr(self, 'ce') and self.ce:
+                if getattr(self.ce, 'event_subscription', None) is not None:
+                    self.ce.unsubscribe_events()
                 self.ce.disconnect()
             if hasattr(self, 'sw') and self.sw:
                 self.sw.disconnect()
             logger.info("Disconnected from all devices.")
+        with steps.start("RPC timing summary"):
+            logger.info(f"RPC timings of the job:\n{format_timing_summary(RPC_TIMINGS.summary())}")
         logger.info("Failover testcase teardown complete.")
 
 
@@ -16,6 +16,7 @@
 import logging
 import pprint
 from utils.netconf_connector import connect_netconf
+from utils.parallel_connect import connect_devices_in_parallel
 from parsers.xrd.xrd_interface_parser_nc_oc import get_interface_status_oc
 from parsers.xrd.xrd_interface_parser_nc_xr import get_interface_status_xr
 from pyats import aetest
@@ -27,35 +28,31 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(mess
 logger = logging.getLogger(__name__)
 
 
+def connect_netconf_device(device):
+    host = str(device.connections["netconf"]["ip"])
+    port = int(device.connections["netconf"].get("port", 830))
+    username = device.testbed.credentials["default"]["username"]
+    password = device.credentials.default.password.plaintext
+    logger.info(f"Connecting to {device.name} at {host}:{port} as user '{username}'")
+    conn = connect_netconf(host, port, username, password=password)
+    if not conn:
+        raise ConnectionError(f"Connection failed to {device.name}")
+    logger.info(f"Successfully connected to {device.name}")
+    return conn
+
+
 class CommonSetup(aetest.CommonSetup):
     @aetest.subsection
-    def connect_to_devices(self, testbed):
+    def connect_to_devices(self, testbed, connect_workers=32, connect_timeout=120):
         if isinstance(testbed, str):
             testbed = loader.load(testbed)
 
         self.parent.parameters["testbed"] = testbed
-        self.parent.parameters["connections"] = {}
-
-        for device_name, device in testbed.devices.items():
-            try:
-                host = str(device.connections["netconf"]["ip"])
-                port = int(device.connections["netconf"].get("port", 830))
-                username = testbed.credentials["default"]["username"]
-                tesbed_pwd = device.credentials.default.password.plaintext
-                password = tesbed_pwd
-                logger.info(f"Connecting to {host}:{port} as user '{username}' with password type {type(password)}")
-                logger.info(f"Connecting to {device_name} at {host}:{port}")
-                logger.info(f"Password repr: {repr(password)}")
-                conn = connect_netconf(host, port, username, password=password)
-                logger.debug(f"Using credentials for {device_name} (password hidden, type: {type(password)})")
-                if conn:
-                    self.parent.parameters["connections"][device_name] = conn
-                    logger.info(f"Successfully connected to {device_name}")
-                else:
-                    self.failed(f"Connection failed to {device_name}")
-            except Exception as e:
-                logger.error(f"Error during connection to {device_name}: {e}")
-                self.failed(f"Exception while connecting to {device_name}")
+        # publishes the NETCONF sessions in the "connections" parameter
+        connect_devices_in_parallel(
+            self, testbed.devices, connector=connect_netconf_device,
+            max_workers=connect_workers, timeout=connect_timeout,
+        )
 
 
 class VerifyInterfaces(aetest.Testcase):